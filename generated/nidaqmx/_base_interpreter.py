@@ -22,6 +22,24 @@ class BaseEventHandler(abc.ABC):
         raise NotImplementedError
 
 
+class BaseReadStream(abc.ABC):
+    """Interpreter-specific object that is returned from begin_read_*_stream()."""
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def read(self, read_array):
+        """Read the next samples into the given array.
+
+        Returns a tuple of the array and the number of samples per channel read.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Release resources used by the read stream."""
+        raise NotImplementedError
+
+
 class BaseInterpreter(abc.ABC):
     """
     Contains signature of functions for all DAQmx APIs.
@@ -1856,6 +1874,37 @@ class BaseInterpreter(abc.ABC):
     def hash_task_handle(self, task_handle):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def create_trusted_buffer(self, array, dtype, flags):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def begin_read_analog_f64_stream(
+            self, task, num_samps_per_chan, timeout, fill_mode, array_size_in_samps):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def begin_batch(self, task):
+        """Start issuing the attribute sets of the task without waiting for each one to complete.
+
+        A batch belongs to the thread that begins it, and only defers the attribute sets of the
+        task. Batches nest. The calls are complete when the outermost end_batch() returns.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def end_batch(self, task):
+        """Wait for the calls issued since begin_batch() and report their errors."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_chan_attributes(self, task, channels, attribute, value_type):
+        """Get a channel attribute of each of the channels.
+
+        value_type is the suffix of the get_chan_attribute_* function to use, such as "double".
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def read_analog_waveform(
         self,
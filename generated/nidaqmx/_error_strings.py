@@ -0,0 +1,163 @@
+"""Caching of NI-DAQmx error strings and coalescing of repeated warnings."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Mapping
+
+from decouple import AutoConfig
+
+from nidaqmx._dotenvpath import get_dotenv_search_path
+from nidaqmx.errors import DaqWarning
+
+# The interpreters return this error string when they fail to get the error string, so it is
+# not cached.
+_FAILED_TO_RETRIEVE_ERROR_DESCRIPTION = "Failed to retrieve error description."
+
+
+class ErrorStringCache:
+    """A bounded, thread-safe cache of NI-DAQmx error strings by error code.
+
+    When the cache is full, adding an error string evicts the least recently used one. The
+    initial error strings are never evicted.
+    """
+
+    __slots__ = ["_maxsize", "_initial", "_error_strings", "_lock"]
+
+    def __init__(self, maxsize: int = 256, initial: Mapping[Any, str] | None = None) -> None:
+        """Initialize a new ErrorStringCache.
+
+        Args:
+            maxsize: Specifies the maximum number of error strings to add to the cache.
+            initial: Specifies error strings that the cache returns without looking them up, by
+                error code. The error codes may be int enum members, such as DAQmxErrors.
+        """
+        self._maxsize = maxsize
+        self._initial = {
+            int(error_code): error_string for error_code, error_string in (initial or {}).items()
+        }
+        self._error_strings: OrderedDict[int, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, error_code: int) -> str | None:
+        """Returns the cached error string for the error code, or None if it is not cached."""
+        error_string = self._initial.get(error_code)
+        if error_string is not None:
+            return error_string
+        with self._lock:
+            error_string = self._error_strings.get(error_code)
+            if error_string is not None:
+                self._error_strings.move_to_end(error_code)
+            return error_string
+
+    def add(self, error_code: int, error_string: str) -> None:
+        """Adds the error string for the error code to the cache."""
+        if not error_string or error_string == _FAILED_TO_RETRIEVE_ERROR_DESCRIPTION:
+            return
+        with self._lock:
+            self._error_strings[error_code] = error_string
+            self._error_strings.move_to_end(error_code)
+            while len(self._error_strings) > self._maxsize:
+                self._error_strings.popitem(last=False)
+
+    def get_or_add(self, error_code: int, get_error_string: Callable[[int], str]) -> str:
+        """Returns the cached error string, or calls get_error_string and caches its result."""
+        error_string = self.get(error_code)
+        if error_string is None:
+            error_string = get_error_string(error_code)
+            self.add(error_code, error_string)
+        return error_string
+
+    async def get_or_add_async(
+        self, error_code: int, get_error_string: Callable[[int], Awaitable[str]]
+    ) -> str:
+        """Returns the cached error string, or awaits get_error_string and caches its result."""
+        error_string = self.get(error_code)
+        if error_string is None:
+            error_string = await get_error_string(error_code)
+            self.add(error_code, error_string)
+        return error_string
+
+
+class WarningCoalescer:
+    """Coalesces repeated NI-DAQmx warnings with the same error code.
+
+    After a warning is reported, more warnings with the same error code are counted instead of
+    reported until "interval" seconds have passed. The next warning with that error code is then
+    reported with the number of times that it occurred, and flush() reports the warnings that
+    were counted but not reported yet. The default interval of 0 reports every warning.
+    """
+
+    __slots__ = ["interval", "_states", "_lock"]
+
+    def __init__(self, interval: float = 0.0) -> None:
+        """Initialize a new WarningCoalescer.
+
+        Args:
+            interval: Specifies the minimum time, in seconds, between reports of warnings with
+                the same error code.
+        """
+        self.interval = interval
+        # The time of the last report and the number of unreported warnings, by error code.
+        self._states: dict[int, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def coalesce(self, error_code: int) -> int:
+        """Count a warning and return the number of occurrences to report.
+
+        Returns 0 if the warning should not be reported.
+        """
+        if self.interval <= 0 and not self._states:
+            return 1
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(error_code)
+            if state is None:
+                self._states[error_code] = (now, 0)
+                return 1
+            last_report_time, unreported_count = state
+            if now - last_report_time < self.interval:
+                self._states[error_code] = (last_report_time, unreported_count + 1)
+                return 0
+            self._states[error_code] = (now, 0)
+            return unreported_count + 1
+
+    def flush(self) -> None:
+        """Report the warnings that were counted but not reported, and reset the counts."""
+        with self._lock:
+            states, self._states = self._states, {}
+        for error_code, (_, unreported_count) in states.items():
+            if unreported_count > 0:
+                warnings.warn(
+                    DaqWarning(
+                        f"This warning occurred {unreported_count} more times after it was "
+                        "last reported.",
+                        error_code,
+                    )
+                )
+
+
+def add_occurrence_count(error_string: str, occurrence_count: int) -> str:
+    """Returns the error string of a coalesced warning with its number of occurrences."""
+    if occurrence_count <= 1:
+        return error_string
+    return (
+        f"{error_string}\n\nThis warning occurred {occurrence_count} times since it was "
+        "last reported."
+    )
+
+
+# The interpreters share one coalescer. Coalescing is off unless the
+# NIDAQMX_WARNING_COALESCING_INTERVAL environment variable or .env setting specifies an
+# interval in seconds. The counts are not per task, so the coalescer is flushed when the process
+# exits instead of when a task is closed.
+warning_coalescer = WarningCoalescer(
+    AutoConfig(str(get_dotenv_search_path()))(
+        "NIDAQMX_WARNING_COALESCING_INTERVAL", default=0.0, cast=float
+    )
+)
+atexit.register(warning_coalescer.flush)
@@ -0,0 +1,370 @@
+"""Conversion between NumPy arrays and the protobuf encoding of repeated numeric fields.
+
+The protobuf containers for repeated fields convert each element to or from a Python object, which
+dominates the cost of reading or writing large arrays over gRPC. This module decodes responses
+directly from the serialized bytes and appends arrays to serialized requests, so that NumPy
+converts each array as a whole.
+"""
+
+from __future__ import annotations
+
+import functools
+import struct
+import types
+from typing import Any, Callable, Mapping
+
+import numpy
+import numpy.typing
+from google.protobuf.descriptor import FieldDescriptor
+
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_I64 = 1
+_WIRE_TYPE_LEN = 2
+_WIRE_TYPE_I32 = 5
+
+_DOUBLE = struct.Struct("<d")
+_FLOAT = struct.Struct("<f")
+
+# The packed array methods of each service, by service name.
+_method_specs_cache: dict[str, list[tuple[Any, ...]]] = {}
+
+# Repeated field types that are packed by default, and the NumPy dtype of their elements. Varint
+# fields are decoded to 64 bits and then truncated, like the protobuf runtime does.
+_PACKED_FIELD_DTYPES: dict[int, numpy.dtype] = {
+    FieldDescriptor.TYPE_DOUBLE: numpy.dtype("<f8"),
+    FieldDescriptor.TYPE_FLOAT: numpy.dtype("<f4"),
+    FieldDescriptor.TYPE_INT32: numpy.dtype(numpy.int32),
+    FieldDescriptor.TYPE_UINT32: numpy.dtype(numpy.uint32),
+}
+
+
+class _UnsupportedEncodingError(Exception):
+    """The message uses an encoding that ArrayResponseDecoder does not decode itself."""
+
+
+def _to_int32(value: int) -> int:
+    value &= 0xFFFFFFFF
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+def _to_int64(value: int) -> int:
+    return value - (1 << 64) if value & (1 << 63) else value
+
+
+# Scalar field types, and the wire type, decode function, and default value of each.
+_SCALAR_FIELD_DECODERS: dict[int, tuple[int, Callable[[Any], Any], Any]] = {
+    FieldDescriptor.TYPE_INT32: (_WIRE_TYPE_VARINT, _to_int32, 0),
+    FieldDescriptor.TYPE_ENUM: (_WIRE_TYPE_VARINT, _to_int32, 0),
+    FieldDescriptor.TYPE_UINT32: (_WIRE_TYPE_VARINT, lambda value: value & 0xFFFFFFFF, 0),
+    FieldDescriptor.TYPE_INT64: (_WIRE_TYPE_VARINT, _to_int64, 0),
+    FieldDescriptor.TYPE_UINT64: (_WIRE_TYPE_VARINT, lambda value: value, 0),
+    FieldDescriptor.TYPE_BOOL: (_WIRE_TYPE_VARINT, bool, False),
+    FieldDescriptor.TYPE_DOUBLE: (_WIRE_TYPE_I64, lambda value: _DOUBLE.unpack(value)[0], 0.0),
+    FieldDescriptor.TYPE_FLOAT: (_WIRE_TYPE_I32, lambda value: _FLOAT.unpack(value)[0], 0.0),
+    FieldDescriptor.TYPE_BYTES: (_WIRE_TYPE_LEN, bytes, b""),
+    FieldDescriptor.TYPE_STRING: (_WIRE_TYPE_LEN, lambda value: str(value, "utf-8"), ""),
+}
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    # Newer versions of protobuf replace FieldDescriptor.label with FieldDescriptor.is_repeated.
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return getattr(field, "label", None) == FieldDescriptor.LABEL_REPEATED
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+        if shift >= 70:
+            raise _UnsupportedEncodingError()
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_varints(data: bytes | memoryview) -> numpy.typing.NDArray[numpy.uint64]:
+    """Decode a packed sequence of varints into an array of 64-bit values.
+
+    Each varint ends with the first byte that has the high bit clear, so the values are decoded
+    by shifting the low 7 bits of each byte by its position within its varint and combining the
+    bytes of each varint with a bitwise OR.
+    """
+    raw = numpy.frombuffer(data, dtype=numpy.uint8)
+    if raw.size == 0:
+        return numpy.empty(0, dtype=numpy.uint64)
+
+    is_last_byte = raw < 0x80
+    if not is_last_byte[-1]:
+        raise _UnsupportedEncodingError()
+    ends = numpy.flatnonzero(is_last_byte)
+    if ends.size == raw.size:
+        return raw.astype(numpy.uint64)
+
+    starts = numpy.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    if lengths.max() > 10:
+        raise _UnsupportedEncodingError()
+    byte_indices = numpy.arange(raw.size) - numpy.repeat(starts, lengths)
+    shifted = (raw & 0x7F).astype(numpy.uint64) << (7 * byte_indices).astype(numpy.uint64)
+    return numpy.bitwise_or.reduceat(shifted, starts)
+
+
+def encode_varints(values: numpy.typing.NDArray) -> bytes:
+    """Encode an array of integers as a packed sequence of varints.
+
+    Negative values are sign-extended to 64 bits, so they take 10 bytes each, like the protobuf
+    runtime encodes them.
+    """
+    unsigned = numpy.asarray(values).astype(numpy.int64, copy=False).ravel().view(numpy.uint64)
+    if unsigned.size == 0:
+        return b""
+    if numpy.all(unsigned < 0x80):
+        return unsigned.astype(numpy.uint8).tobytes()
+
+    lengths = numpy.ones(unsigned.shape, dtype=numpy.intp)
+    remaining = unsigned >> numpy.uint64(7)
+    while remaining.any():
+        lengths += remaining != 0
+        remaining >>= numpy.uint64(7)
+    starts = numpy.cumsum(lengths) - lengths
+    byte_indices = numpy.arange(lengths.sum()) - numpy.repeat(starts, lengths)
+    encoded = (
+        (numpy.repeat(unsigned, lengths) >> (7 * byte_indices).astype(numpy.uint64))
+        & numpy.uint64(0x7F)
+    ).astype(numpy.uint8)
+    encoded[byte_indices < numpy.repeat(lengths, lengths) - 1] |= 0x80
+    return encoded.tobytes()
+
+
+def _decode_packed_array(data: memoryview, dtype: numpy.dtype) -> numpy.typing.NDArray:
+    if dtype.kind == "f":
+        return numpy.frombuffer(data, dtype=dtype)
+    values = decode_varints(data)
+    if dtype == numpy.int32:
+        return values.view(numpy.int64).astype(numpy.int32)
+    return values.astype(dtype)
+
+
+def _encode_packed_array(values: Any, field: FieldDescriptor) -> bytes:
+    dtype = _PACKED_FIELD_DTYPES[field.type]
+    if dtype.kind == "f":
+        return numpy.ascontiguousarray(values, dtype=dtype).tobytes()
+    return encode_varints(values)
+
+
+class ArrayResponseDecoder:
+    """Decode serialized responses of a message type.
+
+    Repeated numeric fields are returned as read-only NumPy arrays that share memory with the
+    serialized response, and the other fields are returned as Python values. If the response
+    encodes a field in a way that this decoder does not handle, such as an unpacked repeated
+    field, the decoder parses the response with the message type instead.
+    """
+
+    __slots__ = ("_message_type", "_fields", "_defaults")
+
+    def __init__(self, message_type: Any) -> None:
+        """Initialize a new ArrayResponseDecoder.
+
+        Args:
+            message_type: Specifies the generated protobuf message class of the responses.
+        """
+        self._message_type = message_type
+        self._fields: dict[int, tuple[str, int, Callable[[Any], Any], bool]] = {}
+        self._defaults: dict[str, Any] = {}
+        for field in message_type.DESCRIPTOR.fields:
+            if _is_repeated(field):
+                dtype = _PACKED_FIELD_DTYPES[field.type]
+                self._fields[field.number] = (
+                    field.name,
+                    _WIRE_TYPE_LEN,
+                    functools.partial(_decode_packed_array, dtype=dtype),
+                    True,
+                )
+                self._defaults[field.name] = numpy.empty(0, dtype=dtype)
+            else:
+                wire_type, decode, default = _SCALAR_FIELD_DECODERS[field.type]
+                self._fields[field.number] = (field.name, wire_type, decode, False)
+                self._defaults[field.name] = default
+
+    @staticmethod
+    def supports(message_type: Any) -> bool:
+        """Returns True if the message type has a repeated numeric field and can be decoded."""
+        has_packed_field = False
+        for field in message_type.DESCRIPTOR.fields:
+            if _is_repeated(field):
+                if field.type not in _PACKED_FIELD_DTYPES:
+                    return False
+                has_packed_field = True
+            elif field.type not in _SCALAR_FIELD_DECODERS or field.containing_oneof is not None:
+                return False
+        return has_packed_field
+
+    def __call__(self, data: bytes) -> Any:
+        """Decode a serialized response."""
+        try:
+            return self._decode(data)
+        except (_UnsupportedEncodingError, IndexError, ValueError, struct.error):
+            return self._message_type.FromString(data)
+
+    def _decode(self, data: bytes) -> types.SimpleNamespace:
+        values = dict(self._defaults)
+        decoded_arrays = set()
+        view = memoryview(data)
+        position = 0
+        end = len(data)
+        while position < end:
+            tag, position = _read_varint(data, position)
+            wire_type = tag & 0x7
+            value: int | memoryview
+            if wire_type == _WIRE_TYPE_VARINT:
+                value, position = _read_varint(data, position)
+            elif wire_type == _WIRE_TYPE_LEN:
+                length, position = _read_varint(data, position)
+                value = view[position : position + length]
+                position += length
+            elif wire_type == _WIRE_TYPE_I64:
+                value = view[position : position + 8]
+                position += 8
+            elif wire_type == _WIRE_TYPE_I32:
+                value = view[position : position + 4]
+                position += 4
+            else:
+                raise _UnsupportedEncodingError()
+
+            field = self._fields.get(tag >> 3)
+            if field is None:
+                # Ignore fields that a newer server added, like the protobuf runtime does.
+                continue
+            name, expected_wire_type, decode, is_repeated = field
+            if wire_type != expected_wire_type:
+                raise _UnsupportedEncodingError()
+            if is_repeated:
+                # A serializer may split a packed field into several chunks.
+                if name in decoded_arrays:
+                    raise _UnsupportedEncodingError()
+                decoded_arrays.add(name)
+            values[name] = decode(value)
+
+        if position != end:
+            raise _UnsupportedEncodingError()
+        return types.SimpleNamespace(**values)
+
+
+class PackedArrayRequest:
+    """A request message and the NumPy arrays to serialize as its repeated numeric fields."""
+
+    __slots__ = ("message", "arrays")
+
+    def __init__(self, message: Any, arrays: Mapping[str, Any]) -> None:
+        """Initialize a new PackedArrayRequest.
+
+        Args:
+            message: Specifies the request message, without the repeated numeric fields.
+            arrays: Specifies the value of each repeated numeric field, by field name.
+        """
+        self.message = message
+        self.arrays = arrays
+
+
+def serialize_request(request: Any) -> bytes:
+    """Serialize a request message or a PackedArrayRequest.
+
+    Appending a field to a serialized message is equivalent to setting the field, so the arrays of
+    a PackedArrayRequest are encoded with NumPy and appended to the serialized message.
+    """
+    if not isinstance(request, PackedArrayRequest):
+        return request.SerializeToString()
+
+    fields_by_name = request.message.DESCRIPTOR.fields_by_name
+    chunks = [request.message.SerializeToString()]
+    for name, values in request.arrays.items():
+        field = fields_by_name[name]
+        payload = _encode_packed_array(values, field)
+        if payload:
+            chunks.append(_encode_varint((field.number << 3) | _WIRE_TYPE_LEN))
+            chunks.append(_encode_varint(len(payload)))
+            chunks.append(payload)
+    return b"".join(chunks)
+
+
+def _has_packed_field(message_descriptor: Any) -> bool:
+    return any(
+        _is_repeated(field) and field.type in _PACKED_FIELD_DTYPES
+        for field in message_descriptor.fields
+    )
+
+
+def _get_packed_array_method_specs(service: Any, types_module: Any) -> list[tuple[Any, ...]]:
+    method_specs = _method_specs_cache.get(service.full_name)
+    if method_specs is not None:
+        return method_specs
+
+    method_specs = []
+    for method in service.methods:
+        if getattr(method, "client_streaming", False) or getattr(method, "server_streaming", False):
+            continue
+        request_type = getattr(types_module, method.input_type.name)
+        response_type = getattr(types_module, method.output_type.name)
+        has_packed_request = _has_packed_field(method.input_type)
+        # Only read responses are decoded, because other responses, such as array attribute
+        # values, are converted to lists, which must contain Python values.
+        has_packed_response = method.name.startswith("Read") and ArrayResponseDecoder.supports(
+            response_type
+        )
+        if not has_packed_request and not has_packed_response:
+            continue
+        method_specs.append(
+            (
+                method.name,
+                f"/{service.full_name}/{method.name}",
+                serialize_request if has_packed_request else request_type.SerializeToString,
+                (
+                    ArrayResponseDecoder(response_type)
+                    if has_packed_response
+                    else response_type.FromString
+                ),
+            )
+        )
+    _method_specs_cache[service.full_name] = method_specs
+    return method_specs
+
+
+def create_packed_array_methods(channel: Any, service: Any, types_module: Any) -> dict[str, Any]:
+    """Create unary-unary methods that transfer repeated numeric fields with NumPy.
+
+    Args:
+        channel: Specifies the gRPC channel.
+        service: Specifies the protobuf service descriptor.
+        types_module: Specifies the generated protobuf module that contains the message classes.
+
+    Returns:
+        A dictionary of gRPC method callables, by method name, for the read methods that have a
+        repeated numeric response field and the methods that have a repeated numeric request
+        field. Replace the corresponding attributes of the generated stub with them.
+    """
+    return {
+        name: channel.unary_unary(
+            path, request_serializer=request_serializer, response_deserializer=response_deserializer
+        )
+        for name, path, request_serializer, response_deserializer in _get_packed_array_method_specs(
+            service, types_module
+        )
+    }
@@ -81,11 +81,42 @@ def wrapped_ndpointer(*args, **kwargs):
     def from_param(cls, obj):
         if obj is None:
             return obj
+        if type(obj) is TrustedBuffer:
+            return obj
         return base.from_param(obj)
 
     return type(base.__name__, (base,), {"from_param": classmethod(from_param)})
 
 
+class TrustedBuffer(ctypes.c_void_p):
+    """A NumPy array that has been verified once and is passed to the C API as a raw pointer.
+
+    wrapped_ndpointer passes a TrustedBuffer to the C API without verifying the dtype and flags of
+    the array again, which avoids that overhead when the same array is used for many calls. The
+    TrustedBuffer keeps a reference to the array, so the pointer remains valid as long as the
+    TrustedBuffer is alive. Do not resize or reshape the array after creating a TrustedBuffer for
+    it.
+    """
+
+    def __init__(self, array, dtype, flags):
+        """Initialize a new TrustedBuffer.
+
+        Args:
+            array (numpy.ndarray): Specifies the array to pass to the C API.
+            dtype: Specifies the dtype that the C API expects.
+            flags: Specifies the array flags that the C API requires, using the same format as
+                numpy.ctypeslib.ndpointer.
+
+        Raises:
+            TypeError: The array does not have the expected dtype or flags.
+        """
+        ndpointer(dtype=dtype, flags=flags).from_param(array)
+        super().__init__(array.ctypes.data)
+        self.array = array
+        self.size = array.size
+        self.shape = array.shape
+
+
 class DaqFunctionImporter:
     """Wraps the function getter function of a ctypes library.
 
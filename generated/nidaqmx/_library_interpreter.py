@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 import ctypes
+import functools
+import itertools
 import logging
 import numpy
 import platform
+import threading
 import warnings
-import sys
 from enum import Enum
 from datetime import timezone
 from hightime import datetime as ht_datetime
 from hightime import timedelta as ht_timedelta
-from typing import Any, Callable, List, Sequence, Tuple, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
 
-from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter
-from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32, wrapped_ndpointer, TaskHandle
+from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter, BaseReadStream
+from nidaqmx._error_strings import ErrorStringCache, add_occurrence_count, warning_coalescer
+from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32, wrapped_ndpointer, DaqFunctionImporter, DaqLibImporter, TaskHandle, TrustedBuffer
 from nidaqmx.constants import FillMode, WaveformAttributeMode
 from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
 from nidaqmx.errors import DaqError, DaqFunctionNotSupportedError, DaqReadError, DaqWarning, DaqWriteError
@@ -22,18 +25,22 @@ from nidaqmx._lib_time import AbsoluteTime
 from nitypes.waveform.typing import ExtendedPropertyValue
 from nitypes.waveform import AnalogWaveform, DigitalWaveform, SampleIntervalMode, Timing, ExtendedPropertyDictionary
 
-if TYPE_CHECKING:
-    if sys.version_info >= (3, 10):
-        from typing import TypeAlias
-    else:
-        from typing_extensions import TypeAlias
-
 _logger = logging.getLogger(__name__)
 _was_runtime_environment_set = None
 
+# The error strings of warnings, which check_for_error would otherwise get on every call.
+_ERROR_STRINGS = ErrorStringCache()
+
 _INT64_WFM_SEC_PER_TICK = 100e-9
 _T0_EPOCH = ht_datetime(1, 1, 1, tzinfo=timezone.utc)
 
+
+@functools.lru_cache(maxsize=16)
+def _get_sample_interval(dt: int) -> ht_timedelta:
+    """Returns the sample interval for a dt in ticks. The dt rarely changes between reads."""
+    return ht_timedelta(seconds=dt * _INT64_WFM_SEC_PER_TICK)
+
+
 # typedef int32 (CVICALLBACK *DAQmxSetWfmAttrCallbackPtr)(uInt32 channelIndex, const char attributeName[], int32 attributeType, const void* value, uInt32 valueSizeInBytes, void *callbackData);  # noqa: W505 - doc line too long
 CSetWfmAttrCallbackPtr = ctypes.CFUNCTYPE(
     ctypes.c_int32,  # return value (error code)
@@ -51,7 +58,70 @@ class WfmAttrType(Enum):
     INT32 = 3
     STRING = 4
 
-SetWfmAttrCallback: TypeAlias = Callable[[int, str, WfmAttrType, ExtendedPropertyValue, object], int]
+
+def _get_wfm_attr_bool32(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    assert value_size_in_bytes == 4
+    return ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0] != 0
+
+
+def _get_wfm_attr_float64(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    assert value_size_in_bytes == 8
+    return float(ctypes.cast(value, ctypes.POINTER(ctypes.c_double))[0])
+
+
+def _get_wfm_attr_int32(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    assert value_size_in_bytes == 4
+    return int(ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0])
+
+
+def _get_wfm_attr_string(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    value_bytes = ctypes.string_at(value, value_size_in_bytes)
+    assert value_bytes[-1] == 0
+    return value_bytes[:-1].decode(lib_importer.encoding)
+
+
+_WFM_ATTR_VALUE_GETTERS: Dict[int, Callable[[int, int], ExtendedPropertyValue]] = {
+    WfmAttrType.BOOL32.value: _get_wfm_attr_bool32,
+    WfmAttrType.FLOAT64.value: _get_wfm_attr_float64,
+    WfmAttrType.INT32.value: _get_wfm_attr_int32,
+    WfmAttrType.STRING.value: _get_wfm_attr_string,
+}
+
+# NI-DAQmx calls the set waveform attribute callback once per attribute per channel, so all
+# waveform reads share one callback function pointer instead of creating a closure and a CFUNCTYPE
+# thunk per read. Each read registers its extended property dictionaries and passes the
+# registration key as the callback data.
+_wfm_attr_properties: Dict[int, Sequence[ExtendedPropertyDictionary]] = {}
+_wfm_attr_keys = itertools.count(1)
+# The driver reports the same few attribute names on every read, so decode each one only once.
+_wfm_attr_names: Dict[bytes, str] = {}
+
+
+def _invoke_set_wfm_attr_callback(
+    channel_index: int,
+    attribute_name: bytes,
+    attribute_type: int,
+    value: int,
+    value_size_in_bytes: int,
+    callback_data: int,
+) -> int:
+    try:
+        name = _wfm_attr_names.get(attribute_name)
+        if name is None:
+            name = _wfm_attr_names[attribute_name] = attribute_name.decode(lib_importer.encoding)
+        get_value = _WFM_ATTR_VALUE_GETTERS.get(attribute_type)
+        if get_value is None:
+            raise ValueError(f"Unsupported attribute type {attribute_type}")
+        properties = _wfm_attr_properties[callback_data]
+        properties[channel_index][name] = get_value(value, value_size_in_bytes)
+        return 0
+    except Exception:
+        _logger.exception("Unhandled exception in set_wfm_attr_callback")
+        return -1
+
+
+_SET_WFM_ATTR_CALLBACK_PTR = CSetWfmAttrCallbackPtr(_invoke_set_wfm_attr_callback)
+_NULL_SET_WFM_ATTR_CALLBACK_PTR = CSetWfmAttrCallbackPtr()
 
 class LibraryEventHandler(BaseEventHandler):
     """Manage the lifetime of a ctypes callback method pointer.
@@ -68,6 +138,426 @@ class LibraryEventHandler(BaseEventHandler):
         self._callback_method_ptr = None
 
 
+class LibraryReadStream(BaseReadStream):
+    """Call a read function with the parameters that the stream was created with.
+
+    Reads from a local session do not have any per-read request setup to avoid, so each read calls
+    the read function directly.
+    """
+    __slots__ = ["_read_function", "_task_handle", "_num_samps_per_chan", "_timeout", "_fill_mode"]
+
+    def __init__(
+        self,
+        read_function: Callable[..., Tuple[Any, int]],
+        task_handle: object,
+        num_samps_per_chan: int,
+        timeout: float,
+        fill_mode: int,
+    ) -> None:
+        self._read_function = read_function
+        self._task_handle = task_handle
+        self._num_samps_per_chan = num_samps_per_chan
+        self._timeout = timeout
+        self._fill_mode = fill_mode
+
+    def read(self, read_array):
+        return self._read_function(
+            self._task_handle, self._num_samps_per_chan, self._timeout, self._fill_mode, read_array)
+
+    def close(self) -> None:
+        pass
+
+
+class _LibraryFunctionTable:
+    """
+    Table of C functions that are resolved and whose argtypes are set once per process.
+
+    Resolving a C function through lib_importer and checking its argtypes adds overhead to every
+    call, which matters for the interpreter methods that are called most often, such as reads and
+    writes. Those methods call the functions in this table directly instead.
+
+    The table is bound to the NI-DAQmx library the first time that one of its functions is
+    accessed, so errors such as DaqNotFoundError are still raised when a function is called.
+    """
+    __slots__ = (
+        "_is_bound",
+        "_lock",
+        "DAQmxIsTaskDone",
+        "DAQmxReadAnalogF64",
+        "DAQmxReadAnalogScalarF64",
+        "DAQmxReadBinaryI16",
+        "DAQmxReadBinaryI32",
+        "DAQmxReadBinaryU16",
+        "DAQmxReadBinaryU32",
+        "DAQmxReadCounterF64",
+        "DAQmxReadCounterF64Ex",
+        "DAQmxReadCounterScalarF64",
+        "DAQmxReadCounterScalarU32",
+        "DAQmxReadCounterU32",
+        "DAQmxReadCounterU32Ex",
+        "DAQmxReadCtrFreq",
+        "DAQmxReadCtrFreqScalar",
+        "DAQmxReadCtrTicks",
+        "DAQmxReadCtrTicksScalar",
+        "DAQmxReadCtrTime",
+        "DAQmxReadCtrTimeScalar",
+        "DAQmxReadDigitalLines",
+        "DAQmxReadDigitalScalarU32",
+        "DAQmxReadDigitalU16",
+        "DAQmxReadDigitalU32",
+        "DAQmxReadDigitalU8",
+        "DAQmxReadPowerScalarF64",
+        "DAQmxStartTask",
+        "DAQmxStopTask",
+        "DAQmxWaitUntilTaskDone",
+        "DAQmxWriteAnalogF64",
+        "DAQmxWriteAnalogScalarF64",
+        "DAQmxWriteBinaryI16",
+        "DAQmxWriteBinaryI32",
+        "DAQmxWriteBinaryU16",
+        "DAQmxWriteBinaryU32",
+        "DAQmxWriteCtrFreq",
+        "DAQmxWriteCtrFreqScalar",
+        "DAQmxWriteCtrTicks",
+        "DAQmxWriteCtrTicksScalar",
+        "DAQmxWriteCtrTime",
+        "DAQmxWriteCtrTimeScalar",
+        "DAQmxWriteDigitalLines",
+        "DAQmxWriteDigitalScalarU32",
+        "DAQmxWriteDigitalU16",
+        "DAQmxWriteDigitalU32",
+        "DAQmxWriteDigitalU8",
+    )
+
+    DAQmxIsTaskDone: Callable[..., int]
+    DAQmxReadAnalogF64: Callable[..., int]
+    DAQmxReadAnalogScalarF64: Callable[..., int]
+    DAQmxReadBinaryI16: Callable[..., int]
+    DAQmxReadBinaryI32: Callable[..., int]
+    DAQmxReadBinaryU16: Callable[..., int]
+    DAQmxReadBinaryU32: Callable[..., int]
+    DAQmxReadCounterF64: Callable[..., int]
+    DAQmxReadCounterF64Ex: Callable[..., int]
+    DAQmxReadCounterScalarF64: Callable[..., int]
+    DAQmxReadCounterScalarU32: Callable[..., int]
+    DAQmxReadCounterU32: Callable[..., int]
+    DAQmxReadCounterU32Ex: Callable[..., int]
+    DAQmxReadCtrFreq: Callable[..., int]
+    DAQmxReadCtrFreqScalar: Callable[..., int]
+    DAQmxReadCtrTicks: Callable[..., int]
+    DAQmxReadCtrTicksScalar: Callable[..., int]
+    DAQmxReadCtrTime: Callable[..., int]
+    DAQmxReadCtrTimeScalar: Callable[..., int]
+    DAQmxReadDigitalLines: Callable[..., int]
+    DAQmxReadDigitalScalarU32: Callable[..., int]
+    DAQmxReadDigitalU16: Callable[..., int]
+    DAQmxReadDigitalU32: Callable[..., int]
+    DAQmxReadDigitalU8: Callable[..., int]
+    DAQmxReadPowerScalarF64: Callable[..., int]
+    DAQmxStartTask: Callable[..., int]
+    DAQmxStopTask: Callable[..., int]
+    DAQmxWaitUntilTaskDone: Callable[..., int]
+    DAQmxWriteAnalogF64: Callable[..., int]
+    DAQmxWriteAnalogScalarF64: Callable[..., int]
+    DAQmxWriteBinaryI16: Callable[..., int]
+    DAQmxWriteBinaryI32: Callable[..., int]
+    DAQmxWriteBinaryU16: Callable[..., int]
+    DAQmxWriteBinaryU32: Callable[..., int]
+    DAQmxWriteCtrFreq: Callable[..., int]
+    DAQmxWriteCtrFreqScalar: Callable[..., int]
+    DAQmxWriteCtrTicks: Callable[..., int]
+    DAQmxWriteCtrTicksScalar: Callable[..., int]
+    DAQmxWriteCtrTime: Callable[..., int]
+    DAQmxWriteCtrTimeScalar: Callable[..., int]
+    DAQmxWriteDigitalLines: Callable[..., int]
+    DAQmxWriteDigitalScalarU32: Callable[..., int]
+    DAQmxWriteDigitalU16: Callable[..., int]
+    DAQmxWriteDigitalU32: Callable[..., int]
+    DAQmxWriteDigitalU8: Callable[..., int]
+
+    def __init__(self) -> None:
+        self._is_bound = False
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Callable[..., int]:
+        # Only called for functions that have not been bound yet.
+        if self._is_bound or not name.startswith("DAQmx"):
+            raise AttributeError(name)
+        self.bind(lib_importer)
+        return getattr(self, name)
+
+    def bind(self, importer: DaqLibImporter) -> None:
+        with self._lock:
+            if self._is_bound:
+                return
+            self.DAQmxIsTaskDone = _bind_function(
+                importer.windll, "DAQmxIsTaskDone", [
+                    lib_importer.task_handle, ctypes.POINTER(c_bool32)])
+            self.DAQmxReadAnalogF64 = _bind_function(
+                importer.windll, "DAQmxReadAnalogF64", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadAnalogScalarF64 = _bind_function(
+                importer.windll, "DAQmxReadAnalogScalarF64", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadBinaryI16 = _bind_function(
+                importer.windll, "DAQmxReadBinaryI16", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.int16,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadBinaryI32 = _bind_function(
+                importer.windll, "DAQmxReadBinaryI32", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.int32,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadBinaryU16 = _bind_function(
+                importer.windll, "DAQmxReadBinaryU16", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint16,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadBinaryU32 = _bind_function(
+                importer.windll, "DAQmxReadBinaryU32", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCounterF64 = _bind_function(
+                importer.windll, "DAQmxReadCounterF64", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
+                    ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                    ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCounterF64Ex = _bind_function(
+                importer.windll, "DAQmxReadCounterF64Ex", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCounterScalarF64 = _bind_function(
+                importer.windll, "DAQmxReadCounterScalarF64", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCounterScalarU32 = _bind_function(
+                importer.windll, "DAQmxReadCounterScalarU32", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCounterU32 = _bind_function(
+                importer.windll, "DAQmxReadCounterU32", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C','W')),
+                    ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
+                    ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCounterU32Ex = _bind_function(
+                importer.windll, "DAQmxReadCounterU32Ex", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCtrFreq = _bind_function(
+                importer.windll, "DAQmxReadCtrFreq", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                    flags=('C','W')), wrapped_ndpointer(dtype=numpy.float64,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCtrFreqScalar = _bind_function(
+                importer.windll, "DAQmxReadCtrFreqScalar", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_double),
+                    ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCtrTicks = _bind_function(
+                importer.windll, "DAQmxReadCtrTicks", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                    flags=('C','W')), wrapped_ndpointer(dtype=numpy.uint32,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCtrTicksScalar = _bind_function(
+                importer.windll, "DAQmxReadCtrTicksScalar", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_uint32),
+                    ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCtrTime = _bind_function(
+                importer.windll, "DAQmxReadCtrTime", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.float64,
+                    flags=('C','W')), wrapped_ndpointer(dtype=numpy.float64,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadCtrTimeScalar = _bind_function(
+                importer.windll, "DAQmxReadCtrTimeScalar", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_double),
+                    ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadDigitalLines = _bind_function(
+                importer.windll, "DAQmxReadDigitalLines", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=bool,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadDigitalScalarU32 = _bind_function(
+                importer.windll, "DAQmxReadDigitalScalarU32", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadDigitalU16 = _bind_function(
+                importer.windll, "DAQmxReadDigitalU16", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint16,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadDigitalU32 = _bind_function(
+                importer.windll, "DAQmxReadDigitalU32", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint32,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadDigitalU8 = _bind_function(
+                importer.windll, "DAQmxReadDigitalU8", [
+                    lib_importer.task_handle, ctypes.c_int, ctypes.c_double,
+                    ctypes.c_int, wrapped_ndpointer(dtype=numpy.uint8,
+                    flags=('C','W')), ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxReadPowerScalarF64 = _bind_function(
+                importer.windll, "DAQmxReadPowerScalarF64", [
+                    lib_importer.task_handle, ctypes.c_double,
+                    ctypes.POINTER(ctypes.c_double),
+                    ctypes.POINTER(ctypes.c_double), ctypes.POINTER(c_bool32)])
+            self.DAQmxStartTask = _bind_function(
+                importer.windll, "DAQmxStartTask", [
+                    lib_importer.task_handle])
+            self.DAQmxStopTask = _bind_function(
+                importer.windll, "DAQmxStopTask", [
+                    lib_importer.task_handle])
+            self.DAQmxWaitUntilTaskDone = _bind_function(
+                importer.windll, "DAQmxWaitUntilTaskDone", [
+                    lib_importer.task_handle, ctypes.c_double])
+            self.DAQmxWriteAnalogF64 = _bind_function(
+                importer.windll, "DAQmxWriteAnalogF64", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteAnalogScalarF64 = _bind_function(
+                importer.windll, "DAQmxWriteAnalogScalarF64", [
+                    lib_importer.task_handle, c_bool32, ctypes.c_double,
+                    ctypes.c_double, ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteBinaryI16 = _bind_function(
+                importer.windll, "DAQmxWriteBinaryI16", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.int16, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteBinaryI32 = _bind_function(
+                importer.windll, "DAQmxWriteBinaryI32", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteBinaryU16 = _bind_function(
+                importer.windll, "DAQmxWriteBinaryU16", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteBinaryU32 = _bind_function(
+                importer.windll, "DAQmxWriteBinaryU32", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteCtrFreq = _bind_function(
+                importer.windll, "DAQmxWriteCtrFreq", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteCtrFreqScalar = _bind_function(
+                importer.windll, "DAQmxWriteCtrFreqScalar", [
+                    lib_importer.task_handle, c_bool32, ctypes.c_double,
+                    ctypes.c_double, ctypes.c_double, ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteCtrTicks = _bind_function(
+                importer.windll, "DAQmxWriteCtrTicks", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteCtrTicksScalar = _bind_function(
+                importer.windll, "DAQmxWriteCtrTicksScalar", [
+                    lib_importer.task_handle, c_bool32, ctypes.c_double,
+                    ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteCtrTime = _bind_function(
+                importer.windll, "DAQmxWriteCtrTime", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                    wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteCtrTimeScalar = _bind_function(
+                importer.windll, "DAQmxWriteCtrTimeScalar", [
+                    lib_importer.task_handle, c_bool32, ctypes.c_double,
+                    ctypes.c_double, ctypes.c_double, ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteDigitalLines = _bind_function(
+                importer.windll, "DAQmxWriteDigitalLines", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=bool, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteDigitalScalarU32 = _bind_function(
+                importer.windll, "DAQmxWriteDigitalScalarU32", [
+                    lib_importer.task_handle, c_bool32, ctypes.c_double,
+                    ctypes.c_uint, ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteDigitalU16 = _bind_function(
+                importer.windll, "DAQmxWriteDigitalU16", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteDigitalU32 = _bind_function(
+                importer.windll, "DAQmxWriteDigitalU32", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self.DAQmxWriteDigitalU8 = _bind_function(
+                importer.windll, "DAQmxWriteDigitalU8", [
+                    lib_importer.task_handle, ctypes.c_int, c_bool32,
+                    ctypes.c_double, ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
+                    ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)])
+            self._is_bound = True
+
+
+def _bind_function(
+    library: DaqFunctionImporter, function_name: str, argtypes: List[Any]
+) -> Callable[..., int]:
+    try:
+        cfunc = getattr(library, function_name)
+    except DaqFunctionNotSupportedError as e:
+        # Preserve the existing behavior of raising this error when the function is called.
+        message = e.args[0]
+
+        def function_not_supported(*args: Any) -> int:
+            raise DaqFunctionNotSupportedError(message)
+
+        return function_not_supported
+
+    with cfunc.arglock:
+        cfunc.argtypes = argtypes
+    return cfunc
+
+
+_functions = _LibraryFunctionTable()
+
+
 class LibraryInterpreter(BaseInterpreter):
     """
     Library C<->Python interpreter.
@@ -4123,12 +4613,7 @@ class LibraryInterpreter(BaseInterpreter):
     def is_task_done(self, task):
         is_task_done = c_bool32()
 
-        cfunc = lib_importer.windll.DAQmxIsTaskDone
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxIsTaskDone
 
         error_code = cfunc(
             task, ctypes.byref(is_task_done))
@@ -4221,16 +4706,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadAnalogF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadAnalogF64
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4241,14 +4717,7 @@ class LibraryInterpreter(BaseInterpreter):
     def read_analog_scalar_f64(self, task, timeout):
         value = ctypes.c_double()
 
-        cfunc = lib_importer.windll.DAQmxReadAnalogScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadAnalogScalarF64
 
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
@@ -4259,16 +4728,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadBinaryI16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadBinaryI16
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4280,16 +4740,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadBinaryI32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadBinaryI32
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4301,16 +4752,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadBinaryU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadBinaryU16
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4322,16 +4764,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadBinaryU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadBinaryU32
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4342,16 +4775,7 @@ class LibraryInterpreter(BaseInterpreter):
     def read_counter_f64(self, task, num_samps_per_chan, timeout, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCounterF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCounterF64
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, read_array, read_array.size,
@@ -4363,16 +4787,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCounterF64Ex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCounterF64Ex
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4383,14 +4798,7 @@ class LibraryInterpreter(BaseInterpreter):
     def read_counter_scalar_f64(self, task, timeout):
         value = ctypes.c_double()
 
-        cfunc = lib_importer.windll.DAQmxReadCounterScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCounterScalarF64
 
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
@@ -4400,14 +4808,7 @@ class LibraryInterpreter(BaseInterpreter):
     def read_counter_scalar_u32(self, task, timeout):
         value = ctypes.c_uint()
 
-        cfunc = lib_importer.windll.DAQmxReadCounterScalarU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_uint),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCounterScalarU32
 
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
@@ -4417,15 +4818,7 @@ class LibraryInterpreter(BaseInterpreter):
     def read_counter_u32(self, task, num_samps_per_chan, timeout, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCounterU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCounterU32
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, read_array, read_array.size,
@@ -4437,16 +4830,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCounterU32Ex
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCounterU32Ex
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4459,18 +4843,7 @@ class LibraryInterpreter(BaseInterpreter):
             read_array_frequency, read_array_duty_cycle):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCtrFreq
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')),
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCtrFreq
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, interleaved,
@@ -4484,15 +4857,7 @@ class LibraryInterpreter(BaseInterpreter):
         frequency = ctypes.c_double()
         duty_cycle = ctypes.c_double()
 
-        cfunc = lib_importer.windll.DAQmxReadCtrFreqScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCtrFreqScalar
 
         error_code = cfunc(
             task, timeout, ctypes.byref(frequency), ctypes.byref(duty_cycle),
@@ -4505,18 +4870,7 @@ class LibraryInterpreter(BaseInterpreter):
             read_array_high_ticks, read_array_low_ticks):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCtrTicks
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')),
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCtrTicks
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, interleaved,
@@ -4529,15 +4883,7 @@ class LibraryInterpreter(BaseInterpreter):
         high_ticks = ctypes.c_uint32()
         low_ticks = ctypes.c_uint32()
 
-        cfunc = lib_importer.windll.DAQmxReadCtrTicksScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_uint32),
-                        ctypes.POINTER(ctypes.c_uint32),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCtrTicksScalar
 
         error_code = cfunc(
             task, timeout, ctypes.byref(high_ticks), ctypes.byref(low_ticks),
@@ -4550,18 +4896,7 @@ class LibraryInterpreter(BaseInterpreter):
             read_array_high_time, read_array_low_time):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadCtrTime
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')),
-                        wrapped_ndpointer(dtype=numpy.float64,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCtrTime
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, interleaved,
@@ -4574,15 +4909,7 @@ class LibraryInterpreter(BaseInterpreter):
         high_time = ctypes.c_double()
         low_time = ctypes.c_double()
 
-        cfunc = lib_importer.windll.DAQmxReadCtrTimeScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadCtrTimeScalar
 
         error_code = cfunc(
             task, timeout, ctypes.byref(high_time), ctypes.byref(low_time),
@@ -4595,16 +4922,7 @@ class LibraryInterpreter(BaseInterpreter):
         samps_per_chan_read = ctypes.c_int()
         num_bytes_per_samp = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadDigitalLines
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=bool, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadDigitalLines
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4616,14 +4934,7 @@ class LibraryInterpreter(BaseInterpreter):
     def read_digital_scalar_u32(self, task, timeout):
         value = ctypes.c_uint()
 
-        cfunc = lib_importer.windll.DAQmxReadDigitalScalarU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_uint),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadDigitalScalarU32
 
         error_code = cfunc(
             task, timeout, ctypes.byref(value), None)
@@ -4634,16 +4945,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadDigitalU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadDigitalU16
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4655,16 +4957,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadDigitalU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32,
-                        flags=('C','W')), ctypes.c_uint,
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadDigitalU32
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4676,16 +4969,7 @@ class LibraryInterpreter(BaseInterpreter):
             self, task, num_samps_per_chan, timeout, fill_mode, read_array):
         samps_per_chan_read = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxReadDigitalU8
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint8, flags=('C','W')),
-                        ctypes.c_uint, ctypes.POINTER(ctypes.c_int),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadDigitalU8
 
         error_code = cfunc(
             task, num_samps_per_chan, timeout, fill_mode, read_array,
@@ -4697,15 +4981,7 @@ class LibraryInterpreter(BaseInterpreter):
         voltage = ctypes.c_double()
         current = ctypes.c_double()
 
-        cfunc = lib_importer.windll.DAQmxReadPowerScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double,
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(ctypes.c_double),
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxReadPowerScalarF64
 
         error_code = cfunc(
             task, timeout, ctypes.byref(voltage), ctypes.byref(current), None)
@@ -5829,24 +6105,14 @@ class LibraryInterpreter(BaseInterpreter):
         self.check_for_error(error_code)
 
     def start_task(self, task):
-        cfunc = lib_importer.windll.DAQmxStartTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
+        cfunc = _functions.DAQmxStartTask
 
         error_code = cfunc(
             task)
         self.check_for_error(error_code)
 
     def stop_task(self, task):
-        cfunc = lib_importer.windll.DAQmxStopTask
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle]
+        cfunc = _functions.DAQmxStopTask
 
         error_code = cfunc(
             task)
@@ -5974,12 +6240,7 @@ class LibraryInterpreter(BaseInterpreter):
         return timestamp.to_datetime()
 
     def wait_until_task_done(self, task, time_to_wait):
-        cfunc = lib_importer.windll.DAQmxWaitUntilTaskDone
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_double]
+        cfunc = _functions.DAQmxWaitUntilTaskDone
 
         error_code = cfunc(
             task, time_to_wait)
@@ -5990,15 +6251,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteAnalogF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteAnalogF64
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6007,13 +6260,7 @@ class LibraryInterpreter(BaseInterpreter):
         return samps_per_chan_written.value
 
     def write_analog_scalar_f64(self, task, auto_start, timeout, value):
-        cfunc = lib_importer.windll.DAQmxWriteAnalogScalarF64
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_double, ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteAnalogScalarF64
 
         error_code = cfunc(
             task, auto_start, timeout, value, None)
@@ -6024,15 +6271,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteBinaryI16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int16, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteBinaryI16
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6045,15 +6284,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteBinaryI32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.int32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteBinaryI32
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6066,15 +6297,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteBinaryU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteBinaryU16
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6087,15 +6310,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteBinaryU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteBinaryU32
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6108,16 +6323,7 @@ class LibraryInterpreter(BaseInterpreter):
             frequency, duty_cycle):
         num_samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteCtrFreq
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteCtrFreq
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6128,14 +6334,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_ctr_freq_scalar(
             self, task, auto_start, timeout, frequency, duty_cycle):
-        cfunc = lib_importer.windll.DAQmxWriteCtrFreqScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double,
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteCtrFreqScalar
 
         error_code = cfunc(
             task, auto_start, timeout, frequency, duty_cycle, None)
@@ -6146,16 +6345,7 @@ class LibraryInterpreter(BaseInterpreter):
             high_ticks, low_ticks):
         num_samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteCtrTicks
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteCtrTicks
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6166,14 +6356,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_ctr_ticks_scalar(
             self, task, auto_start, timeout, high_ticks, low_ticks):
-        cfunc = lib_importer.windll.DAQmxWriteCtrTicksScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_uint32, ctypes.c_uint32,
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteCtrTicksScalar
 
         error_code = cfunc(
             task, auto_start, timeout, high_ticks, low_ticks, None)
@@ -6184,16 +6367,7 @@ class LibraryInterpreter(BaseInterpreter):
             high_time, low_time):
         num_samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteCtrTime
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        wrapped_ndpointer(dtype=numpy.float64, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteCtrTime
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6204,14 +6378,7 @@ class LibraryInterpreter(BaseInterpreter):
 
     def write_ctr_time_scalar(
             self, task, auto_start, timeout, high_time, low_time):
-        cfunc = lib_importer.windll.DAQmxWriteCtrTimeScalar
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_double, ctypes.c_double,
-                        ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteCtrTimeScalar
 
         error_code = cfunc(
             task, auto_start, timeout, high_time, low_time, None)
@@ -6222,15 +6389,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteDigitalLines
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=bool, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteDigitalLines
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6239,13 +6398,7 @@ class LibraryInterpreter(BaseInterpreter):
         return samps_per_chan_written.value
 
     def write_digital_scalar_u32(self, task, auto_start, timeout, value):
-        cfunc = lib_importer.windll.DAQmxWriteDigitalScalarU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, c_bool32, ctypes.c_double,
-                        ctypes.c_uint, ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteDigitalScalarU32
 
         error_code = cfunc(
             task, auto_start, timeout, value, None)
@@ -6256,15 +6409,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteDigitalU16
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint16, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteDigitalU16
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6277,15 +6422,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteDigitalU32
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint32, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteDigitalU32
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6298,15 +6435,7 @@ class LibraryInterpreter(BaseInterpreter):
             write_array):
         samps_per_chan_written = ctypes.c_int()
 
-        cfunc = lib_importer.windll.DAQmxWriteDigitalU8
-        if cfunc.argtypes is None:
-            with cfunc.arglock:
-                if cfunc.argtypes is None:
-                    cfunc.argtypes = [
-                        lib_importer.task_handle, ctypes.c_int, c_bool32,
-                        ctypes.c_double, ctypes.c_int,
-                        wrapped_ndpointer(dtype=numpy.uint8, flags=('C')),
-                        ctypes.POINTER(ctypes.c_int), ctypes.POINTER(c_bool32)]
+        cfunc = _functions.DAQmxWriteDigitalU8
 
         error_code = cfunc(
             task, num_samps_per_chan, auto_start, timeout, data_layout,
@@ -6508,21 +6637,26 @@ class LibraryInterpreter(BaseInterpreter):
                         ctypes.POINTER(c_bool32),
                     ]
 
-        error_code = cfunc(
-            task_handle,
-            number_of_samples_per_channel,
-            timeout,
-            fill_mode,
-            t0_array,
-            dt_array,
-            0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
-            None,
-            read_array,
-            read_array.size,
-            ctypes.byref(samps_per_chan_read),
-            None,
-        )
+        callback_ptr, callback_data = self._register_wfm_attr_properties(properties)
+        try:
+            error_code = cfunc(
+                task_handle,
+                number_of_samples_per_channel,
+                timeout,
+                fill_mode,
+                t0_array,
+                dt_array,
+                0 if t0_array is None else t0_array.size,
+                callback_ptr,
+                callback_data,
+                read_array,
+                read_array.size,
+                ctypes.byref(samps_per_chan_read),
+                None,
+            )
+        finally:
+            if callback_data is not None:
+                del _wfm_attr_properties[callback_data]
 
         return error_code, samps_per_chan_read.value
 
@@ -6571,83 +6705,39 @@ class LibraryInterpreter(BaseInterpreter):
         for i, read_array in enumerate(read_arrays):
             read_array_ptrs[i] = read_array.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
 
-        error_code = cfunc(
-            task_handle,
-            num_samps_per_chan,
-            timeout,
-            t0_array,
-            dt_array,
-            0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
-            None,
-            read_array_ptrs,
-            channel_count,
-            array_size,
-            ctypes.byref(samps_per_chan_read),
-            None,
-        )
+        callback_ptr, callback_data = self._register_wfm_attr_properties(properties)
+        try:
+            error_code = cfunc(
+                task_handle,
+                num_samps_per_chan,
+                timeout,
+                t0_array,
+                dt_array,
+                0 if t0_array is None else t0_array.size,
+                callback_ptr,
+                callback_data,
+                read_array_ptrs,
+                channel_count,
+                array_size,
+                ctypes.byref(samps_per_chan_read),
+                None,
+            )
+        finally:
+            if callback_data is not None:
+                del _wfm_attr_properties[callback_data]
         self.check_for_error(error_code, samps_per_chan_read=samps_per_chan_read.value)
 
         return error_code, samps_per_chan_read.value
 
-    def _get_wfm_attr_callback(self, properties):
-        if properties is not None:
-            def set_wfm_attr_callback(
-                channel_index: int,
-                attribute_name: str,
-                attribute_type: WfmAttrType,
-                value: ExtendedPropertyValue,
-                callback_data: object,
-            ) -> int:
-                properties[channel_index][attribute_name] = value
-                return 0
-            return self._get_wfm_attr_callback_ptr(set_wfm_attr_callback)
-        else:
-            return CSetWfmAttrCallbackPtr()
-
-    def _get_wfm_attr_value(
-        self, attribute_type: int, value: ctypes.c_void_p, value_size_in_bytes: int
-    ) -> ExtendedPropertyValue:
-        if attribute_type == WfmAttrType.BOOL32.value:
-            assert value_size_in_bytes == 4
-            return ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0] != 0
-        elif attribute_type == WfmAttrType.FLOAT64.value:
-            assert value_size_in_bytes == 8
-            return float(ctypes.cast(value, ctypes.POINTER(ctypes.c_double))[0])
-        elif attribute_type == WfmAttrType.INT32.value:
-            assert value_size_in_bytes == 4
-            return int(ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0])
-        elif attribute_type == WfmAttrType.STRING.value:
-            value_c_bytes = ctypes.cast(value, ctypes.POINTER(ctypes.c_byte))
-            assert value_c_bytes[value_size_in_bytes - 1] == 0
-            return bytes(value_c_bytes[0 : value_size_in_bytes - 1]).decode(lib_importer.encoding)
-        else:
-            raise ValueError(f"Unsupported attribute type {attribute_type}")
-
-    def _get_wfm_attr_callback_ptr(
-        self, set_wfm_attr_callback: SetWfmAttrCallback
-    ) -> ctypes._FuncPointer:
-        def _invoke_callback(
-            channel_index: int,
-            attribute_name: bytes,
-            attribute_type: int,
-            value: ctypes.c_void_p,
-            value_size_in_bytes: int,
-            callback_data: object,
-        ) -> int:
-            try:
-                return set_wfm_attr_callback(
-                    channel_index,
-                    attribute_name.decode(lib_importer.encoding),
-                    WfmAttrType(attribute_type),
-                    self._get_wfm_attr_value(attribute_type, value, value_size_in_bytes),
-                    callback_data,
-                )
-            except Exception:
-                _logger.exception("Unhandled exception in set_wfm_attr_callback")
-                return -1
-
-        return CSetWfmAttrCallbackPtr(_invoke_callback)
+    def _register_wfm_attr_properties(
+        self, properties: Sequence[ExtendedPropertyDictionary] | None
+    ) -> Tuple[ctypes._FuncPointer, int | None]:
+        """Returns the callback function pointer and callback data that fill in the properties."""
+        if properties is None:
+            return _NULL_SET_WFM_ATTR_CALLBACK_PTR, None
+        callback_data = next(_wfm_attr_keys)
+        _wfm_attr_properties[callback_data] = properties
+        return _SET_WFM_ATTR_CALLBACK_PTR, callback_data
 
     def _set_waveform_timings(
         self, 
@@ -6655,12 +6745,18 @@ class LibraryInterpreter(BaseInterpreter):
         t0_array: numpy.typing.NDArray[numpy.int64], 
         dt_array: numpy.typing.NDArray[numpy.int64]
     ) -> None:
-        for i, waveform in enumerate(waveforms):
-            waveform.timing = Timing(
-                sample_interval_mode=SampleIntervalMode.REGULAR,
-                timestamp=_T0_EPOCH + ht_timedelta(seconds=t0_array[i] * _INT64_WFM_SEC_PER_TICK),
-                sample_interval=ht_timedelta(seconds=dt_array[i] * _INT64_WFM_SEC_PER_TICK),
-            )
+        # Timing objects are immutable, so waveforms that have the same t0 and dt (usually all of
+        # the channels in a task) share one Timing object instead of creating one per channel.
+        timings: Dict[Tuple[int, int], Timing] = {}
+        for waveform, t0, dt in zip(waveforms, t0_array.tolist(), dt_array.tolist()):
+            timing = timings.get((t0, dt))
+            if timing is None:
+                timing = timings[(t0, dt)] = Timing(
+                    sample_interval_mode=SampleIntervalMode.REGULAR,
+                    timestamp=_T0_EPOCH + ht_timedelta(seconds=t0 * _INT64_WFM_SEC_PER_TICK),
+                    sample_interval=_get_sample_interval(dt),
+                )
+            waveform.timing = timing
 
     def read_digital_waveform(
         self,
@@ -6866,24 +6962,29 @@ class LibraryInterpreter(BaseInterpreter):
                         ctypes.POINTER(c_bool32),
                     ]
 
-        error_code = cfunc(
-            task_handle,
-            number_of_samples_per_channel,
-            timeout,
-            fill_mode,
-            t0_array,
-            dt_array,
-            0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
-            None,
-            read_array,
-            read_array.size,
-            ctypes.byref(samps_per_chan_read),
-            ctypes.byref(num_bytes_per_samp),
-            bytes_per_chan_array,
-            0 if bytes_per_chan_array is None else bytes_per_chan_array.size,
-            None,
-        )
+        callback_ptr, callback_data = self._register_wfm_attr_properties(properties)
+        try:
+            error_code = cfunc(
+                task_handle,
+                number_of_samples_per_channel,
+                timeout,
+                fill_mode,
+                t0_array,
+                dt_array,
+                0 if t0_array is None else t0_array.size,
+                callback_ptr,
+                callback_data,
+                read_array,
+                read_array.size,
+                ctypes.byref(samps_per_chan_read),
+                ctypes.byref(num_bytes_per_samp),
+                bytes_per_chan_array,
+                0 if bytes_per_chan_array is None else bytes_per_chan_array.size,
+                None,
+            )
+        finally:
+            if callback_data is not None:
+                del _wfm_attr_properties[callback_data]
 
         return error_code, samps_per_chan_read.value
 
@@ -7240,6 +7341,24 @@ class LibraryInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.value)
 
+    def create_trusted_buffer(self, array, dtype, flags):
+        """Verify a NumPy array once so that it can be passed as a raw pointer."""
+        return TrustedBuffer(array, dtype, flags)
+
+    def begin_read_analog_f64_stream(
+            self, task, num_samps_per_chan, timeout, fill_mode, array_size_in_samps):
+        return LibraryReadStream(self.read_analog_f64, task, num_samps_per_chan, timeout, fill_mode)
+
+    def begin_batch(self, task):
+        """NI-DAQmx calls are local, so there is no latency to hide by batching them."""
+
+    def end_batch(self, task):
+        pass
+
+    def get_chan_attributes(self, task, channels, attribute, value_type):
+        get_chan_attribute = getattr(self, f"get_chan_attribute_{value_type}")
+        return [get_chan_attribute(task, channel, attribute) for channel in channels]
+
     def check_for_error(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
         if not error_code:
             return
@@ -7255,9 +7374,13 @@ class LibraryInterpreter(BaseInterpreter):
                 raise DaqError(extended_error_info, error_code)
 
         elif error_code > 0:
-            error_string = self.get_error_string(error_code)
+            occurrence_count = warning_coalescer.coalesce(error_code)
+            if occurrence_count == 0:
+                return
+
+            error_string = _ERROR_STRINGS.get_or_add(error_code, self.get_error_string)
 
-            warnings.warn(DaqWarning(error_string, error_code))
+            warnings.warn(DaqWarning(add_occurrence_count(error_string, occurrence_count), error_code))
 
 
 def is_string_buffer_too_small(error_code):
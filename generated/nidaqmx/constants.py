@@ -1031,6 +1031,17 @@ class ReallocationPolicy(Enum):
     TO_GROW = 1  #: Reallocate waveforms to grow when needed.
 
 
+class ReadReturnType(Enum):
+    LIST = 0  #: Return samples as Python scalars, lists, and lists of lists.
+    NUMPY = 1  #: Return samples as NumPy scalars and arrays without converting them to lists.
+
+
+class StreamOverflowPolicy(Enum):
+    BLOCK = 0  #: Wait for the consumer to take a block from the queue.
+    DROP_OLDEST = 1  #: Discard the oldest queued block to make room for the new block.
+    DROP_NEWEST = 2  #: Discard the new block.
+
+
 class WaveformAttributeMode(Flag):
     NONE = 0
     TIMING = 1
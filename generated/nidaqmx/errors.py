@@ -6,7 +6,14 @@ import deprecation
 
 from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
 
-__all__ = ["DaqError", "DaqReadError", "DaqWriteError", "DaqWarning", "DaqResourceWarning"]
+__all__ = [
+    "DaqError",
+    "DaqReadError",
+    "DaqWriteError",
+    "DaqTaskGroupReadError",
+    "DaqWarning",
+    "DaqResourceWarning",
+]
 
 
 class Error(Exception):
@@ -115,6 +122,38 @@ class DaqWriteError(DaqError):
         return self._samps_per_chan_written
 
 
+class DaqTaskGroupReadError(DaqError):
+    """Error raised by TaskGroup.read_all that includes the results of each task in the group."""
+
+    def __init__(self, message, error_code, samps_per_chan_read, errors):
+        """Initialize a new DaqTaskGroupReadError.
+
+        Args:
+            message (string): Specifies the error message.
+            error_code (int): Specifies the NI-DAQmx error code of the
+                first task that failed.
+            samps_per_chan_read (List[int]): Specifies the number of
+                samples read for each task in the group.
+            errors (List[Optional[DaqError]]): Specifies the error raised
+                for each task in the group, or None for tasks that did not
+                fail.
+        """
+        super().__init__(message, error_code)
+
+        self._samps_per_chan_read = samps_per_chan_read
+        self._errors = errors
+
+    @property
+    def samps_per_chan_read(self):
+        """List[int]: Indicates the number of samples successfully read for each task."""
+        return self._samps_per_chan_read
+
+    @property
+    def errors(self):
+        """List[Optional[DaqError]]: Indicates the error for each task, or None if it succeeded."""
+        return self._errors
+
+
 class DaqWarning(Warning):
     """Warning raised by any NI-DAQmx method."""
 
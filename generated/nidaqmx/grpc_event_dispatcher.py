@@ -0,0 +1,291 @@
+"""NI-DAQmx gRPC event dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, Sequence
+
+import google.protobuf.message
+import grpc
+import grpc.aio
+
+from nidaqmx._base_interpreter import BaseEventHandler
+from nidaqmx._grpc_interpreter import _is_cancelled
+from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError
+
+_logger = logging.getLogger(__name__)
+
+
+class EventStreamStatistics(NamedTuple):
+    """Represents the dispatch latency counters of an event stream.
+
+    The dispatch latency of an event is the time from when the dispatcher receives the event
+    to when its callback starts running on the executor.
+    """
+
+    event_name: str
+    """The name of the event, such as "every n samples event"."""
+
+    event_count: int
+    """The number of events whose callbacks have started."""
+
+    total_dispatch_latency: float
+    """The sum of the dispatch latencies of the events, in seconds."""
+
+    max_dispatch_latency: float
+    """The largest dispatch latency of the events, in seconds."""
+
+
+class GrpcEventDispatcher:
+    """Reads the event streams of many gRPC sessions on one thread.
+
+    By default, each done, every N samples, or signal event that you register on a gRPC task
+    reads its event stream on its own thread. When the GrpcSessionOptions of a task specify a
+    GrpcEventDispatcher, the dispatcher reads the event streams of the task on its asyncio event
+    loop thread over its own grpc.aio channel, and runs the event callbacks on an executor. You
+    can share one dispatcher between the sessions of many tasks.
+
+    The callbacks of each event stream run one at a time, in the order of the events. With the
+    default executor, which has one worker thread, the callbacks of all event streams run one at
+    a time, so a slow callback delays the events of the other streams. The dispatch latency
+    counters in the "stream_statistics" property measure this delay.
+
+    Unregister the events or close the tasks before you close the dispatcher.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        *,
+        credentials: grpc.ChannelCredentials | None = None,
+        options: Sequence[tuple[str, Any]] | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize a new GrpcEventDispatcher and start its event loop thread.
+
+        Args:
+            target (str): Specifies the address of the NI gRPC Device Server, such as
+                "localhost:31763".
+            credentials (grpc.ChannelCredentials): Specifies the credentials of a secure
+                channel. If None, the dispatcher uses an insecure channel.
+            options (Sequence[tuple[str, Any]]): Specifies the gRPC channel options.
+            executor (concurrent.futures.Executor): Specifies the executor that runs the event
+                callbacks. If None, the dispatcher runs the event callbacks on its own thread
+                pool with one worker thread.
+        """
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="nidaqmx event callback"
+            )
+        self._executor = executor
+        self._handlers: set[_DispatchedEventHandler] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._thread_main, name="nidaqmx event dispatcher thread", daemon=True
+        )
+        self._thread.start()
+        self._channel = self._run(_create_channel(target, credentials, options))
+        self._client = nidaqmx_grpc.NiDAQmxStub(self._channel)
+
+    def __enter__(self) -> GrpcEventDispatcher:
+        """Returns the GrpcEventDispatcher instance."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Closes the GrpcEventDispatcher instance."""
+        self.close()
+
+    @property
+    def stream_statistics(self) -> list[EventStreamStatistics]:
+        """list[EventStreamStatistics]: Indicates the dispatch latency counters of each event
+        stream that is registered with the dispatcher.
+        """
+        with self._lock:
+            handlers = list(self._handlers)
+        return [handler.statistics for handler in handlers]
+
+    def close(self) -> None:
+        """Cancel the event streams, close the channel, and stop the event loop thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            handlers = list(self._handlers)
+            self._handlers.clear()
+        for handler in handlers:
+            handler._closed = True
+        asyncio.run_coroutine_threadsafe(
+            self._shutdown([handler._task for handler in handlers]), self._loop
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        if self._owns_executor:
+            # Do not wait, because close() may be called by an event callback.
+            self._executor.shutdown(wait=False)
+
+    def _register(
+        self,
+        event_name: str,
+        method_name: str,
+        request: google.protobuf.message.Message,
+        event_callback: Callable[[Any], None],
+    ) -> BaseEventHandler:
+        """Open an event stream and dispatch its events to event_callback.
+
+        Raises grpc.RpcError if the server fails to register the event.
+        """
+        handler = _DispatchedEventHandler(self, event_name, event_callback)
+        self._run(self._open(getattr(self._client, method_name), request, handler))
+        with self._lock:
+            self._handlers.add(handler)
+        return handler
+
+    def _unregister(self, handler: _DispatchedEventHandler) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._handlers.discard(handler)
+        asyncio.run_coroutine_threadsafe(_cancel(handler._task), self._loop).result()
+
+    def _run(self, coroutine):
+        if self._closed:
+            coroutine.close()
+            raise DaqError("The gRPC event dispatcher is closed.", DAQmxErrors.UNKNOWN)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _thread_main(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _open(self, method, request, handler: _DispatchedEventHandler) -> None:
+        call = method(request)
+        # Wait for initial metadata to ensure that the server has called the event registration
+        # function, like GrpcStubInterpreter._check_for_event_registration_error.
+        await call.initial_metadata()
+        if call.done():
+            code = await call.code()
+            if code != grpc.StatusCode.OK:
+                raise grpc.aio.AioRpcError(
+                    code,
+                    await call.initial_metadata(),
+                    await call.trailing_metadata(),
+                    await call.details(),
+                )
+        handler._task = self._loop.create_task(self._dispatch(call, handler))
+
+    async def _dispatch(self, call, handler: _DispatchedEventHandler) -> None:
+        try:
+            async for event_response in call:
+                received = time.perf_counter()
+                await self._loop.run_in_executor(
+                    self._executor, handler._invoke_callback, event_response, received
+                )
+        except Exception as ex:
+            if _is_cancelled(ex):
+                return
+            _logger.exception(
+                "Unhandled exception raised while reading nidaqmx %s stream.", handler.event_name
+            )
+            # Save the exception and re-raise it at the end of close().
+            handler._event_stream_exception = ex
+        finally:
+            call.cancel()
+
+    async def _shutdown(self, tasks: list[asyncio.Task | None]) -> None:
+        for task in tasks:
+            await _cancel(task)
+        await self._channel.close()
+
+
+class _DispatchedEventHandler(BaseEventHandler):
+    """Manage the lifetime of an event stream that a GrpcEventDispatcher reads."""
+
+    __slots__ = [
+        "event_name",
+        "_dispatcher",
+        "_event_callback",
+        "_event_stream_exception",
+        "_task",
+        "_closed",
+        "_lock",
+        "_event_count",
+        "_total_dispatch_latency",
+        "_max_dispatch_latency",
+    ]
+
+    def __init__(
+        self,
+        dispatcher: GrpcEventDispatcher,
+        event_name: str,
+        event_callback: Callable[[Any], None],
+    ) -> None:
+        self.event_name = event_name
+        self._dispatcher = dispatcher
+        self._event_callback = event_callback
+        self._event_stream_exception: Exception | None = None
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._event_count = 0
+        self._total_dispatch_latency = 0.0
+        self._max_dispatch_latency = 0.0
+
+    @property
+    def statistics(self) -> EventStreamStatistics:
+        with self._lock:
+            return EventStreamStatistics(
+                self.event_name,
+                self._event_count,
+                self._total_dispatch_latency,
+                self._max_dispatch_latency,
+            )
+
+    def close(self) -> None:
+        self._closed = True
+        self._dispatcher._unregister(self)
+        if self._event_stream_exception is not None:
+            raise self._event_stream_exception
+
+    def _invoke_callback(self, event_response: Any, received: float) -> None:
+        # A callback that was queued before close() does not run.
+        if self._closed:
+            return
+        dispatch_latency = time.perf_counter() - received
+        with self._lock:
+            self._event_count += 1
+            self._total_dispatch_latency += dispatch_latency
+            self._max_dispatch_latency = max(self._max_dispatch_latency, dispatch_latency)
+        self._event_callback(event_response)
+
+
+async def _create_channel(
+    target: str,
+    credentials: grpc.ChannelCredentials | None,
+    options: Sequence[tuple[str, Any]] | None,
+) -> grpc.aio.Channel:
+    # Create the channel on the event loop thread, which the channel uses for its calls.
+    if credentials is None:
+        return grpc.aio.insecure_channel(target, options)
+    return grpc.aio.secure_channel(target, credentials, options)
+
+
+async def _cancel(task: asyncio.Task | None) -> None:
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy
+
 from nidaqmx.constants import READ_ALL_AVAILABLE, FillMode
 from nidaqmx.stream_readers._channel_reader_base import ChannelReaderBase
 
@@ -81,14 +83,12 @@ class AnalogUnscaledReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.int16, number_of_samples_per_channel, True, True
+        )
 
-        _, samps_per_chan_read = self._interpreter.read_binary_i16(
-            self._handle,
-            number_of_samples_per_channel,
-            timeout,
-            FillMode.GROUP_BY_CHANNEL.value,
-            data,
+        _, samps_per_chan_read = self._read_binary(
+            self._interpreter.read_binary_i16, read_array, number_of_samples_per_channel, timeout
         )
 
         return samps_per_chan_read
@@ -167,14 +167,16 @@ class AnalogUnscaledReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.int32, number_of_samples_per_channel, True, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_binary_i32(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
@@ -253,14 +255,12 @@ class AnalogUnscaledReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.uint16, number_of_samples_per_channel, True, True
+        )
 
-        _, samps_per_chan_read = self._interpreter.read_binary_u16(
-            self._handle,
-            number_of_samples_per_channel,
-            timeout,
-            FillMode.GROUP_BY_CHANNEL.value,
-            data,
+        _, samps_per_chan_read = self._read_binary(
+            self._interpreter.read_binary_u16, read_array, number_of_samples_per_channel, timeout
         )
 
         return samps_per_chan_read
@@ -339,14 +339,16 @@ class AnalogUnscaledReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.uint32, number_of_samples_per_channel, True, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_binary_u32(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
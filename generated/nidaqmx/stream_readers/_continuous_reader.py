@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import NamedTuple
+
+import numpy
+import numpy.typing
+
+from nidaqmx import DaqError
+from nidaqmx.constants import READ_ALL_AVAILABLE, FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_readers._channel_reader_base import ChannelReaderBase
+
+
+class ContinuousReaderBlock(NamedTuple):
+    """Represents a block of samples returned by ContinuousReader.read."""
+
+    data: numpy.typing.NDArray[numpy.float64]
+    """A read-only 2D view of the samples, with one row per channel."""
+
+    first_sample_index: int
+    """The index of the first sample in the block, counted from the first read."""
+
+
+class ContinuousReader(ChannelReaderBase):
+    """Reads samples from one or more analog input channels into a ring buffer.
+
+    This reader owns a preallocated ring buffer that holds up to "capacity"
+    samples per channel. Each call to the read method reads directly into
+    the next contiguous region of the ring buffer and returns a read-only
+    view of that region, so samples are never copied after NI-DAQmx
+    returns them.
+
+    Each block is tagged with a sample index that increases monotonically
+    across reads, which allows consumers to detect gaps and to correlate
+    blocks with each other.
+
+    A returned block remains valid until the ring buffer wraps around and
+    a later read overwrites it. Use the "is_block_valid" method to detect
+    whether a block that you held on to has been overwritten.
+    """
+
+    def __init__(self, task_in_stream, capacity):
+        """Initialize a new ContinuousReader.
+
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an NI-DAQmx task from which to read samples.
+            capacity (int): Specifies the number of samples per channel
+                that the ring buffer can hold. Each read can return at
+                most this many samples per channel.
+        """
+        super().__init__(task_in_stream)
+
+        if capacity <= 0:
+            raise ValueError("The capacity of the ring buffer must be greater than 0.")
+
+        self._number_of_channels = task_in_stream.num_chans
+        self._capacity = capacity
+        # Samples are stored interleaved so that each region of the ring buffer is contiguous
+        # and can be passed to NI-DAQmx directly. Blocks are returned as transposed views.
+        self._buffer = numpy.zeros((capacity, self._number_of_channels), dtype=numpy.float64)
+        self._write_position = 0
+        self._next_sample_index = 0
+        # (first_sample_index, start, stop) for each block that is still in the ring buffer,
+        # oldest first.
+        self._blocks: deque[tuple[int, int, int]] = deque()
+
+    @property
+    def capacity(self):
+        """int: Indicates the number of samples per channel that the ring buffer can hold."""
+        return self._capacity
+
+    @property
+    def number_of_channels(self):
+        """int: Indicates the number of channels in the ring buffer."""
+        return self._number_of_channels
+
+    @property
+    def next_sample_index(self):
+        """int: Indicates the sample index of the first sample returned by the next read."""
+        return self._next_sample_index
+
+    @property
+    def oldest_sample_index(self):
+        """int: Indicates the sample index of the oldest sample still in the ring buffer."""
+        if self._blocks:
+            return self._blocks[0][0]
+        return self._next_sample_index
+
+    def is_block_valid(self, block):
+        """Indicates whether a block has not yet been overwritten by a later read.
+
+        Args:
+            block (ContinuousReaderBlock): Specifies a block returned by
+                the read method of this reader.
+
+        Returns:
+            bool:
+
+            Indicates whether the samples in the block are still in the
+            ring buffer.
+        """
+        return self.oldest_sample_index <= block.first_sample_index < self._next_sample_index
+
+    def read(self, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
+        """Reads one or more floating-point samples from one or more analog input channels.
+
+        Args:
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. This value must not exceed
+                the capacity of the ring buffer.
+
+                If you set this input to nidaqmx.constants.
+                READ_ALL_AVAILABLE, NI-DAQmx determines how many samples
+                to read based on if the task acquires samples
+                continuously or acquires a finite number of samples.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to read the requested samples and returns an error
+                if it is unable to.
+
+        Returns:
+            nidaqmx.stream_readers.ContinuousReaderBlock:
+
+            Contains a read-only view of the samples read, with one row
+            per channel, and the sample index of the first sample.
+        """
+        number_of_samples_per_channel = self._task._calculate_num_samps_per_chan(
+            number_of_samples_per_channel
+        )
+
+        self._verify_ring_buffer(number_of_samples_per_channel)
+
+        start = self._write_position
+        if start + number_of_samples_per_channel > self._capacity:
+            # Skip the end of the ring buffer so that the block is contiguous. Blocks that are in
+            # the skipped region are the oldest blocks, so they are discarded first.
+            while self._blocks and self._blocks[0][1] >= start:
+                self._blocks.popleft()
+            start = 0
+        stop = start + number_of_samples_per_channel
+
+        while self._blocks and self._blocks[0][1] < stop and self._blocks[0][2] > start:
+            self._blocks.popleft()
+
+        _, samps_per_chan_read = self._interpreter.read_analog_f64(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_SCAN_NUMBER.value,
+            self._buffer[start:stop],
+        )
+
+        stop = start + samps_per_chan_read
+        first_sample_index = self._next_sample_index
+        if samps_per_chan_read > 0:
+            self._blocks.append((first_sample_index, start, stop))
+        self._write_position = stop
+        self._next_sample_index += samps_per_chan_read
+
+        data = self._buffer[start:stop].T
+        data.flags.writeable = False
+        return ContinuousReaderBlock(data, first_sample_index)
+
+    def _verify_ring_buffer(self, number_of_samples_per_channel):
+        """Verify that the ring buffer can hold the requested samples.
+
+        The number of channels is only verified if the
+        "verify_array_shape" property is set to True.
+        """
+        if number_of_samples_per_channel > self._capacity:
+            raise DaqError(
+                "Read cannot be performed because the number of samples per "
+                "channel requested is larger than the capacity of the ring "
+                "buffer.\n\n"
+                "Number of samples per channel requested: {}\n"
+                "Capacity of the ring buffer: {}".format(
+                    number_of_samples_per_channel, self._capacity
+                ),
+                DAQmxErrors.UNKNOWN,
+                task_name=self._task.name,
+            )
+
+        if not self._verify_array_shape:
+            return
+
+        number_of_channels = self._in_stream.num_chans
+        if number_of_channels != self._number_of_channels:
+            raise DaqError(
+                "Read cannot be performed because the number of channels to "
+                "read changed after the ring buffer was created. Create a new "
+                "ContinuousReader after changing the channels to read.\n\n"
+                "Number of channels in the ring buffer: {}\n"
+                "Number of channels to read: {}".format(
+                    self._number_of_channels, number_of_channels
+                ),
+                DAQmxErrors.UNKNOWN,
+                task_name=self._task.name,
+            )
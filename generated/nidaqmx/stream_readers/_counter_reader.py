@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import numpy
+
 from nidaqmx.constants import READ_ALL_AVAILABLE, FillMode
 from nidaqmx.stream_readers._channel_reader_base import ChannelReaderBase
-from nidaqmx.types import CtrFreq, CtrTick, CtrTime
+from nidaqmx.types import (
+    CTR_FREQ_DTYPE,
+    CTR_TICK_DTYPE,
+    CTR_TIME_DTYPE,
+    CtrFreq,
+    CtrTick,
+    CtrTime,
+)
 
 
 class CounterReader(ChannelReaderBase):
@@ -71,18 +80,93 @@ class CounterReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, False, True)
+        read_array = self._get_read_array(
+            data, numpy.float64, number_of_samples_per_channel, False, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_counter_f64_ex(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
 
+    def read_many_sample_pulse(
+        self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0
+    ):
+        """Reads one or more pulse samples from a single counter input channel into a structured array.
+
+        This read method accepts a preallocated NumPy structured array
+        whose dtype selects the kind of pulse samples to read:
+
+        - nidaqmx.types.CTR_FREQ_DTYPE: Pulse samples in terms of
+          frequency.
+        - nidaqmx.types.CTR_TIME_DTYPE: Pulse samples in terms of time.
+        - nidaqmx.types.CTR_TICK_DTYPE: Pulse samples in terms of ticks.
+
+        Each field of the structured array can be accessed as a column,
+        e.g. data["freq"], or each element can be accessed like the
+        corresponding namedtuple, e.g. data[0]["freq"].
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 1D NumPy
+                structured array to hold the pulse samples requested.
+
+                Each element in the array corresponds to a sample from
+                the channel. The size of the array must be large enough
+                to hold all requested samples from the channel in the
+                task; otherwise, an error is thrown.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. See the
+                read_many_sample_pulse_frequency method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. See the
+                read_many_sample_pulse_frequency method.
+
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+            NI-DAQmx returns a single value because this value is the
+            same for all channels.
+        """  # noqa: W505 - doc line too long (103 > 100 characters) (auto-generated noqa)
+        if data.dtype == CTR_FREQ_DTYPE:
+            read_function = self._interpreter.read_ctr_freq
+        elif data.dtype == CTR_TIME_DTYPE:
+            read_function = self._interpreter.read_ctr_time
+        elif data.dtype == CTR_TICK_DTYPE:
+            read_function = self._interpreter.read_ctr_ticks
+        else:
+            raise TypeError(
+                "The NumPy array must have the CTR_FREQ_DTYPE, CTR_TIME_DTYPE, or "
+                f"CTR_TICK_DTYPE structured dtype, not {data.dtype}."
+            )
+
+        number_of_samples_per_channel = self._task._calculate_num_samps_per_chan(
+            number_of_samples_per_channel
+        )
+
+        self._verify_array(data, number_of_samples_per_channel, False, True)
+
+        # NI-DAQmx reads each field into a separate contiguous array.
+        columns = [numpy.empty(data.shape, dtype=data.dtype[name]) for name in data.dtype.names]
+
+        _, _, samps_per_chan_read = read_function(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            *columns,
+        )
+
+        for name, column in zip(data.dtype.names, columns):
+            data[name][:samps_per_chan_read] = column[:samps_per_chan_read]
+
+        return samps_per_chan_read
+
     def read_many_sample_pulse_frequency(
         self,
         frequencies,
@@ -405,14 +489,16 @@ class CounterReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, False, True)
+        read_array = self._get_read_array(
+            data, numpy.uint32, number_of_samples_per_channel, False, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_counter_u32_ex(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
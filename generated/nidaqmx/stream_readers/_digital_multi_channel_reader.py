@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy
 from nitypes.waveform import DigitalWaveform
 
 from nidaqmx import DaqError
@@ -92,14 +93,16 @@ class DigitalMultiChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.uint8, number_of_samples_per_channel, True, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_digital_u8(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
@@ -182,14 +185,16 @@ class DigitalMultiChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.uint16, number_of_samples_per_channel, True, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_digital_u16(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
@@ -272,14 +277,16 @@ class DigitalMultiChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.uint32, number_of_samples_per_channel, True, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_digital_u32(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
@@ -80,14 +80,16 @@ class DigitalSingleChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, False, True)
+        read_array = self._get_read_array(
+            data, numpy.uint8, number_of_samples_per_channel, False, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_digital_u8(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
@@ -157,14 +159,16 @@ class DigitalSingleChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, False, True)
+        read_array = self._get_read_array(
+            data, numpy.uint16, number_of_samples_per_channel, False, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_digital_u16(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
@@ -234,14 +238,16 @@ class DigitalSingleChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, False, True)
+        read_array = self._get_read_array(
+            data, numpy.uint32, number_of_samples_per_channel, False, True
+        )
 
         _, samps_per_chan_read = self._interpreter.read_digital_u32(
             self._handle,
             number_of_samples_per_channel,
             timeout,
             FillMode.GROUP_BY_CHANNEL.value,
-            data,
+            read_array,
         )
 
         return samps_per_chan_read
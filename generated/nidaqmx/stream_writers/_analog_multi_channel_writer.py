@@ -3,8 +3,10 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any
 
+import numpy
 from nitypes.waveform import AnalogWaveform
 
+from nidaqmx import _async
 from nidaqmx._feature_toggles import WAVEFORM_SUPPORT, requires_feature
 from nidaqmx.constants import FillMode
 from nidaqmx.stream_writers._channel_writer_base import (
@@ -52,14 +54,44 @@ class AnalogMultiChannelWriter(ChannelWriterBase):
             int: Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """  # noqa: W505 - doc line too long (101 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.float64, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_analog_f64(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
+    async def write_many_sample_async(self, data, timeout=10.0):
+        """Writes one or more floating-point samples without blocking the asyncio event loop.
+
+        This method is the awaitable counterpart of the write_many_sample
+        method. It runs the write on a dedicated thread pool with a
+        bounded number of threads, so the event loop can run other
+        coroutines while NI-DAQmx waits for space in the buffer. Do not
+        modify the data until this method returns.
+
+        Args:
+            data (numpy.ndarray): Contains a 2D NumPy array of
+                floating-point samples to write to the task. See the
+                write_many_sample method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples. See
+                the write_many_sample method.
+
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote to each channel in the task.
+        """
+        return await _async.run_blocking(self.write_many_sample, data, timeout)
+
     def write_one_sample(self, data, timeout=10):
         """Writes a single floating-point sample to one or more analog output channels in a task.
 
@@ -1,6 +1,10 @@
 from nidaqmx import DaqError
 from nidaqmx.error_codes import DAQmxErrors
 
+# The maximum number of arrays that a writer keeps verified at once. Continuous generations
+# typically alternate between one or two arrays.
+_MAX_TRUSTED_BUFFERS = 8
+
 
 class UnsetAutoStartSentinel:
     """Sentinel class for unset auto_start parameter."""
@@ -39,6 +43,8 @@ class ChannelWriterBase:
         self._interpreter = task_out_stream._task._interpreter
 
         self._verify_array_shape = True
+        self._use_trusted_buffers = False
+        self._trusted_buffers = {}
         self._auto_start = auto_start
 
     @property
@@ -76,6 +82,60 @@ class ChannelWriterBase:
     def verify_array_shape(self, val):
         self._verify_array_shape = val
 
+    @property
+    def use_trusted_buffers(self):
+        """bool: Specifies whether to verify each NumPy array only once.
+
+        Defaults to False when this object is instantiated.
+
+        If you set this property to True, the write methods that write
+        many samples from a NumPy array verify the shape, dtype, and
+        flags of the array the first time you pass it. When you pass
+        the same array again, the write method passes it to NI-DAQmx as
+        a raw pointer without verifying it again, which reduces the
+        overhead of writing from the same arrays repeatedly.
+
+        Do not resize or reshape an array, or change the channels in
+        the task, while this writer uses it.
+        """
+        return self._use_trusted_buffers
+
+    @use_trusted_buffers.setter
+    def use_trusted_buffers(self, val):
+        self._use_trusted_buffers = val
+        self._trusted_buffers.clear()
+
+    def _get_write_array(self, data, dtype, is_many_chan, is_many_samp):
+        """Verify a NumPy array and return the object to pass to the interpreter.
+
+        If the "use_trusted_buffers" property is set to True, this
+        method returns a trusted buffer for arrays that it already
+        verified.
+
+        Args:
+            data (numpy.ndarray): Specifies the NumPy array to verify.
+            dtype: Specifies the dtype that the write method requires.
+            is_many_chan (bool): Specifies if the write method is a many
+                channel version.
+            is_many_samp (bool): Specifies if the write method is a many
+                sample version.
+        """
+        if not self._use_trusted_buffers:
+            self._verify_array(data, is_many_chan, is_many_samp)
+            return data
+
+        entry = self._trusted_buffers.get(id(data))
+        if entry is not None and entry[0] is data:
+            return entry[1]
+
+        self._verify_array(data, is_many_chan, is_many_samp)
+        trusted_buffer = self._interpreter.create_trusted_buffer(data, dtype, ("C",))
+
+        if len(self._trusted_buffers) >= _MAX_TRUSTED_BUFFERS:
+            self._trusted_buffers.clear()
+        self._trusted_buffers[id(data)] = (data, trusted_buffer)
+        return trusted_buffer
+
     def _verify_array(self, data, is_many_chan, is_many_samp):
         """Verifies the shape of a NumPy array.
 
@@ -1,13 +1,76 @@
+import numpy
+
 from nidaqmx.constants import FillMode
 from nidaqmx.stream_writers._channel_writer_base import (
     AUTO_START_UNSET,
     ChannelWriterBase,
 )
+from nidaqmx.types import CTR_FREQ_DTYPE, CTR_TICK_DTYPE, CTR_TIME_DTYPE
 
 
 class CounterWriter(ChannelWriterBase):
     """Writes samples to a counter output channel in an NI-DAQmx task."""
 
+    def write_many_sample_pulse(self, data, timeout=10.0):
+        """Writes one or more pulse samples from a structured array to a single counter output channel.
+
+        This write method accepts a NumPy structured array whose dtype
+        selects the kind of pulse samples to write:
+
+        - nidaqmx.types.CTR_FREQ_DTYPE: Pulse samples in terms of
+          frequency.
+        - nidaqmx.types.CTR_TIME_DTYPE: Pulse samples in terms of time.
+        - nidaqmx.types.CTR_TICK_DTYPE: Pulse samples in terms of ticks.
+
+        If the task uses on-demand timing, this method returns only
+        after the device generates all samples. On-demand is the default
+        timing type if you do not use the timing property on the task to
+        configure a sample timing type. If the task uses any timing type
+        other than on-demand, this method returns immediately and does
+        not wait for the device to generate all samples. Your
+        application must determine if the task is done to ensure that
+        the device generated all samples.
+
+        Args:
+            data (numpy.ndarray): Contains a 1D NumPy structured array
+                that holds the pulse samples to write to the task. Each
+                element of the array corresponds to a sample to write.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples. See
+                the write_many_sample_pulse_frequency method.
+
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote.
+        """  # noqa: W505 - doc line too long (103 > 100 characters) (auto-generated noqa)
+        if data.dtype == CTR_FREQ_DTYPE:
+            write_function = self._interpreter.write_ctr_freq
+        elif data.dtype == CTR_TIME_DTYPE:
+            write_function = self._interpreter.write_ctr_time
+        elif data.dtype == CTR_TICK_DTYPE:
+            write_function = self._interpreter.write_ctr_ticks
+        else:
+            raise TypeError(
+                "The NumPy array must have the CTR_FREQ_DTYPE, CTR_TIME_DTYPE, or "
+                f"CTR_TICK_DTYPE structured dtype, not {data.dtype}."
+            )
+
+        self._verify_array(data, False, True)
+
+        auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
+
+        # NI-DAQmx writes each field from a separate contiguous array.
+        return write_function(
+            self._handle,
+            data.shape[0],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            *(numpy.ascontiguousarray(data[name]) for name in data.dtype.names),
+        )
+
     def write_many_sample_pulse_frequency(self, frequencies, duty_cycles, timeout=10.0):
         """Writes one or more pulse samples in terms of frequency to a single counter output channel in a task.
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Sequence
 
+import numpy
 from nitypes.waveform import DigitalWaveform
 
 from nidaqmx._feature_toggles import WAVEFORM_SUPPORT, requires_feature
@@ -55,12 +56,17 @@ class DigitalMultiChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.uint8, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_digital_u8(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_many_sample_port_uint16(self, data, timeout=10.0):
@@ -103,12 +109,17 @@ class DigitalMultiChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.uint16, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_digital_u16(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_many_sample_port_uint32(self, data, timeout=10.0):
@@ -151,12 +162,17 @@ class DigitalMultiChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.uint32, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_digital_u32(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_one_sample_multi_line(self, data, timeout=10):
@@ -52,12 +52,17 @@ class DigitalSingleChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote.
         """  # noqa: W505 - doc line too long (106 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, False, True)
+        write_array = self._get_write_array(data, numpy.uint8, False, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_digital_u8(
-            self._handle, data.shape[0], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[0],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_many_sample_port_uint16(self, data, timeout=10.0):
@@ -96,12 +101,17 @@ class DigitalSingleChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote.
         """  # noqa: W505 - doc line too long (107 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, False, True)
+        write_array = self._get_write_array(data, numpy.uint16, False, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_digital_u16(
-            self._handle, data.shape[0], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[0],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_many_sample_port_uint32(self, data, timeout=10.0):
@@ -140,12 +150,17 @@ class DigitalSingleChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote.
         """  # noqa: W505 - doc line too long (107 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, False, True)
+        write_array = self._get_write_array(data, numpy.uint32, False, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_digital_u32(
-            self._handle, data.shape[0], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[0],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_one_sample_multi_line(self, data, timeout=10):
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import NamedTuple
+
+import numpy
+import numpy.typing
+
+from nidaqmx.constants import WAIT_INFINITELY, FillMode, StreamOverflowPolicy
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError
+
+# Returned by BlockStream._take_block_locked when the stream is closed and no blocks are queued.
+_END_OF_STREAM = object()
+
+
+class StreamBlock(NamedTuple):
+    """Represents a block of samples delivered by a BlockStream."""
+
+    data: numpy.typing.NDArray
+    """A 2D array of the samples, with one row per channel."""
+
+    first_sample_index: int
+    """The index of the first sample in the block, counted from the first block read."""
+
+
+class BlockStream:
+    """Delivers blocks of samples read by an every N samples acquired into buffer event.
+
+    A BlockStream registers an every N samples acquired into buffer event
+    on the task. The event callback only reads each block of samples into
+    a preallocated buffer and adds it to a bounded queue. Your application
+    takes blocks from the queue by iterating over the BlockStream, either
+    with a for loop on its own thread or with an async for loop on an
+    asyncio event loop, so application code never runs on the NI-DAQmx
+    callback thread.
+
+    The overflow policy specifies what happens when the queue is full.
+    StreamOverflowPolicy.BLOCK makes the callback wait for the consumer,
+    which applies backpressure to the NI-DAQmx buffer. If the consumer
+    does not take a block within the timeout, the callback discards the
+    new block.
+    StreamOverflowPolicy.DROP_OLDEST and StreamOverflowPolicy.DROP_NEWEST
+    discard a block and count it in the "dropped_blocks" property. The
+    sample indices of the blocks that follow a discarded block skip the
+    discarded samples.
+
+    Each block is valid until the next iteration, when its buffer is
+    reused for a later block. Copy the data if you need to keep it.
+
+    Create the BlockStream before you start the task. Stopping the task
+    or closing the BlockStream ends the stream, and so does leaving a for
+    loop over the BlockStream: the callback stops queueing blocks, and
+    iteration ends after the queued blocks are delivered. Close the
+    BlockStream after you stop the task to unregister the event.
+    """
+
+    __slots__ = (
+        "_task",
+        "_handle",
+        "_read_function",
+        "_samples_per_block",
+        "_queue_depth",
+        "_overflow_policy",
+        "_timeout",
+        "_condition",
+        "_queue",
+        "_free_buffers",
+        "_held_buffer",
+        "_async_waiters",
+        "_closed",
+        "_unregistered",
+        "_error",
+        "_next_sample_index",
+        "_received_blocks",
+        "_dropped_blocks",
+        "_max_queued_blocks",
+        "__weakref__",
+    )
+
+    def __init__(self, task, samples_per_block, queue_depth, overflow_policy, timeout):
+        """Initialize a new BlockStream.
+
+        Use the Task.stream_blocks method instead of creating a
+        BlockStream directly.
+
+        Args:
+            task (nidaqmx.Task): Specifies the task to read from.
+            samples_per_block (int): Specifies the number of samples per
+                channel in each block.
+            queue_depth (int): Specifies the maximum number of blocks
+                that the queue holds.
+            overflow_policy (nidaqmx.constants.StreamOverflowPolicy):
+                Specifies what happens when the queue is full.
+            timeout (float): Specifies the amount of time in seconds to
+                wait for each block to be read.
+        """
+        if samples_per_block <= 0:
+            raise ValueError("The number of samples per block must be greater than 0.")
+        if queue_depth <= 0:
+            raise ValueError("The queue depth must be greater than 0.")
+
+        read_plan = task._get_read_plan()
+        if read_plan.read_function is None:
+            raise DaqError(
+                "Block streams only support reading analog, digital, or non-pulse "
+                "counter samples.",
+                DAQmxErrors.UNKNOWN,
+                task_name=task.name,
+            )
+
+        self._task = task
+        self._handle = task._handle
+        self._read_function = read_plan.read_function
+        self._samples_per_block = samples_per_block
+        self._queue_depth = queue_depth
+        self._overflow_policy = overflow_policy
+        self._timeout = timeout
+        self._condition = threading.Condition()
+        self._queue: deque[tuple[numpy.typing.NDArray, StreamBlock]] = deque()
+        # Each buffer is either free, queued, held by the consumer, or being read into by the
+        # callback, so queue_depth + 2 buffers are always enough.
+        self._free_buffers = [
+            numpy.zeros((read_plan.number_of_channels, samples_per_block), dtype=read_plan.dtype)
+            for _ in range(queue_depth + 2)
+        ]
+        self._held_buffer: numpy.typing.NDArray | None = None
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._closed = False
+        self._unregistered = False
+        self._error: DaqError | None = None
+        self._next_sample_index = 0
+        self._received_blocks = 0
+        self._dropped_blocks = 0
+        self._max_queued_blocks = 0
+
+        task._stop_listeners.add(self)
+        try:
+            task.register_every_n_samples_acquired_into_buffer_event(
+                samples_per_block, self._on_every_n_samples
+            )
+        except Exception:
+            task._stop_listeners.discard(self)
+            raise
+
+    def __enter__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return self
+
+    def __exit__(  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        self, type, value, traceback
+    ):
+        self.close()
+
+    def __iter__(self):
+        """Yields blocks until the stream ends, and ends the stream if the loop stops early."""
+        try:
+            while True:
+                try:
+                    block = next(self)
+                except StopIteration:
+                    return
+                yield block
+        finally:
+            # Leaving the loop early would otherwise leave the callback waiting for queue space.
+            self._end_stream()
+
+    def __next__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        with self._condition:
+            while True:
+                block = self._take_block_locked()
+                if block is _END_OF_STREAM:
+                    raise StopIteration
+                if block is not None:
+                    return block
+                self._condition.wait()
+
+    def __aiter__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return self
+
+    async def __anext__(self):
+        """Waits for the next block without blocking the asyncio event loop."""
+        while True:
+            with self._condition:
+                block = self._take_block_locked()
+                if block is None:
+                    loop = asyncio.get_running_loop()
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+            if block is _END_OF_STREAM:
+                raise StopAsyncIteration
+            if block is not None:
+                return block
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                self._remove_async_waiter(waiter)
+                raise
+
+    @property
+    def samples_per_block(self):
+        """int: Indicates the number of samples per channel in each block."""
+        return self._samples_per_block
+
+    @property
+    def queue_depth(self):
+        """int: Indicates the maximum number of blocks that the queue holds."""
+        return self._queue_depth
+
+    @property
+    def overflow_policy(self):
+        """:class:`nidaqmx.constants.StreamOverflowPolicy`: Indicates the overflow policy."""
+        return self._overflow_policy
+
+    @property
+    def queued_blocks(self):
+        """int: Indicates the number of blocks that the consumer has not taken yet."""
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def max_queued_blocks(self):
+        """int: Indicates the largest number of blocks that were queued at the same time."""
+        with self._condition:
+            return self._max_queued_blocks
+
+    @property
+    def received_blocks(self):
+        """int: Indicates the number of blocks that the callback read, including dropped blocks."""
+        with self._condition:
+            return self._received_blocks
+
+    @property
+    def dropped_blocks(self):
+        """int: Indicates the number of blocks that were discarded because the queue was full."""
+        with self._condition:
+            return self._dropped_blocks
+
+    def close(self):
+        """Unregisters the event and ends iteration after the queued blocks are delivered."""
+        self._end_stream()
+        with self._condition:
+            if self._unregistered:
+                return
+            self._unregistered = True
+
+        self._task._stop_listeners.discard(self)
+        self._task.register_every_n_samples_acquired_into_buffer_event(
+            self._samples_per_block, None
+        )
+
+    def _on_task_stop(self):
+        self._end_stream()
+
+    def _end_stream(self):
+        """Stops queueing blocks and wakes the callback and the consumers."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._notify_consumers_locked()
+
+    def _on_every_n_samples(
+        self, task_handle, every_n_samples_event_type, number_of_samples, callback_data
+    ):
+        with self._condition:
+            if self._closed or self._error is not None:
+                return 0
+            buffer = self._free_buffers.pop()
+
+        try:
+            samples_read = self._read_function(
+                self._handle,
+                self._samples_per_block,
+                self._timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                buffer,
+            )[1]
+        except DaqError as e:
+            with self._condition:
+                self._free_buffers.append(buffer)
+                self._error = e
+                self._notify_consumers_locked()
+            return 0
+
+        block = StreamBlock(buffer[:, :samples_read], self._next_sample_index)
+        self._next_sample_index += samples_read
+
+        with self._condition:
+            self._received_blocks += 1
+            if len(self._queue) >= self._queue_depth:
+                if self._overflow_policy == StreamOverflowPolicy.DROP_NEWEST:
+                    self._free_buffers.append(buffer)
+                    self._dropped_blocks += 1
+                    return 0
+                elif self._overflow_policy == StreamOverflowPolicy.DROP_OLDEST:
+                    oldest_buffer, _ = self._queue.popleft()
+                    self._free_buffers.append(oldest_buffer)
+                    self._dropped_blocks += 1
+                elif not self._wait_for_queue_space_locked():
+                    self._free_buffers.append(buffer)
+                    return 0
+
+            self._queue.append((buffer, block))
+            self._max_queued_blocks = max(self._max_queued_blocks, len(self._queue))
+            self._notify_consumers_locked()
+        return 0
+
+    def _wait_for_queue_space_locked(self):
+        """Wait for space in the queue. Returns False if the stream closed or the wait timed out."""
+        self._condition.wait_for(
+            lambda: len(self._queue) < self._queue_depth or self._closed,
+            None if self._timeout == WAIT_INFINITELY else self._timeout,
+        )
+        if self._closed:
+            return False
+        if len(self._queue) >= self._queue_depth:
+            self._dropped_blocks += 1
+            return False
+        return True
+
+    def _take_block_locked(self):
+        """Take the next queued block.
+
+        Returns None if no block is queued yet, or _END_OF_STREAM if the stream is closed and
+        every queued block has been delivered.
+        """
+        if self._held_buffer is not None:
+            self._free_buffers.append(self._held_buffer)
+            self._held_buffer = None
+
+        if self._queue:
+            self._held_buffer, block = self._queue.popleft()
+            # Wake the callback if it is waiting for space in the queue.
+            self._condition.notify_all()
+            return block
+
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            return _END_OF_STREAM
+        return None
+
+    def _remove_async_waiter(self, waiter):
+        with self._condition:
+            self._async_waiters = [(loop, w) for loop, w in self._async_waiters if w is not waiter]
+
+    def _notify_consumers_locked(self):
+        self._condition.notify_all()
+        for loop, waiter in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            except RuntimeError:
+                # The event loop is closed, so nothing is waiting on it anymore.
+                pass
+        self._async_waiters.clear()
+
+
+def _wake_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,56 @@
+"""Cached virtual channel names and channel objects of a task."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from nidaqmx.task.channels._channel import Channel
+from nidaqmx.utils import unflatten_channel_string
+
+
+class _ChannelIndex:
+    """Per-task channel metadata that the channel collections would otherwise query on every call.
+
+    The index holds the names of the virtual channels in the task and the channel objects that
+    were created for them, so the type of each channel is queried from the driver once. It stays
+    valid until channels are added to the task or ``in_stream.channels_to_read`` changes.
+    """
+
+    __slots__ = ("_handle", "_interpreter", "_channel_names", "_channel_name_set", "_channels")
+
+    def __init__(self, task_handle: Any, interpreter: Any) -> None:
+        self._handle = task_handle
+        self._interpreter = interpreter
+        self._channel_names = unflatten_channel_string(
+            interpreter.get_task_attribute_string(task_handle, 0x1273)
+        )
+        self._channel_name_set = frozenset(self._channel_names)
+        self._channels: dict[str, Channel] = {}
+
+    def __repr__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return f"_ChannelIndex(channel_names={self._channel_names})"
+
+    @property
+    def channel_names(self) -> list[str]:
+        """Returns a copy of the names of the virtual channels in the task."""
+        return list(self._channel_names)
+
+    def __len__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return len(self._channel_names)
+
+    def contains(self, channel_names: list[str]) -> bool:
+        """Returns whether all of the channel names are in the task."""
+        return self._channel_name_set.issuperset(channel_names)
+
+    def get_channel_name(self, index: int | slice) -> str | list[str]:
+        """Returns the channel name at the index, or the list of names for a slice."""
+        return self._channel_names[index]
+
+    def get_channel(self, virtual_or_physical_name: str) -> Channel:
+        """Returns the cached channel object for the flattened name, creating it if necessary."""
+        channel = self._channels.get(virtual_or_physical_name)
+        if channel is None:
+            channel = self._channels[virtual_or_physical_name] = Channel._factory(
+                self._handle, virtual_or_physical_name, self._interpreter
+            )
+        return channel
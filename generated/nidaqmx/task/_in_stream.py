@@ -12,7 +12,7 @@ from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
     AcquisitionType, LoggingMode, LoggingOperation, OverwriteMode,
     READ_ALL_AVAILABLE, ReadRelativeTo, WaitMode)
-from nidaqmx.constants import WaveformAttributeMode
+from nidaqmx.constants import ReadReturnType, WaveformAttributeMode
 
 class InStream:
     """
@@ -22,7 +22,7 @@ class InStream:
     used in conjunction with reader classes to read samples from an
     NI-DAQmx task.
     """
-    __slots__ = ('_task', '_handle', '_interpreter', '_timeout', '_waveform_attribute_mode')
+    __slots__ = ('_task', '_handle', '_interpreter', '_timeout', '_waveform_attribute_mode', '_read_return_type')
 
     def __init__(self, task, interpreter):
         self._task = task
@@ -30,6 +30,7 @@ class InStream:
         self._interpreter = interpreter
         self._timeout = 10.0
         self._waveform_attribute_mode = WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
+        self._read_return_type = ReadReturnType.LIST
 
         super().__init__()
 
@@ -169,10 +170,12 @@ class InStream:
     def channels_to_read(self, val):
         val = val.name
         self._interpreter.set_read_attribute_string(self._handle, 0x1823, val)
+        self._task._invalidate_channel_caches()
 
     @channels_to_read.deleter
     def channels_to_read(self):
         self._interpreter.reset_read_attribute(self._handle, 0x1823)
+        self._task._invalidate_channel_caches()
 
     @property
     def common_mode_range_error_chans(self):
@@ -1278,4 +1281,24 @@ class InStream:
 
     @waveform_attribute_mode.deleter
     def waveform_attribute_mode(self):
-        self._waveform_attribute_mode = WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
\ No newline at end of file
+        self._waveform_attribute_mode = WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
+
+    @property
+    def read_return_type(self):
+        """
+        :class:`nidaqmx.constants.ReadReturnType`: Specifies the type of
+            data that :meth:`nidaqmx.Task.read` returns when you do not
+            specify the **return_type** parameter. The default is
+            **ReadReturnType.LIST**. **ReadReturnType.NUMPY** returns the
+            NumPy array that the samples were read into, which avoids
+            converting every sample to a Python object.
+        """
+        return self._read_return_type
+
+    @read_return_type.setter
+    def read_return_type(self, val):
+        self._read_return_type = val
+
+    @read_return_type.deleter
+    def read_return_type(self):
+        self._read_return_type = ReadReturnType.LIST
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""Cached channel metadata used by Task.read."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy
+import numpy.typing
+
+from nidaqmx.constants import ChannelType, UsageTypeAI, UsageTypeCI
+
+if TYPE_CHECKING:
+    from nidaqmx.task._task import Task
+
+
+class _ReadKind(Enum):
+    """Internal enum describing how Task.read reads and returns data."""
+
+    NO_INPUT_CHANNELS = 0
+    ANALOG = 1
+    POWER = 2
+    DIGITAL_LINES = 3
+    DIGITAL_U32 = 4
+    COUNTER = 5
+    COUNTER_PULSE = 6
+
+
+class _ReadPlan:
+    """Per-task read metadata that Task.read would otherwise query from the driver on every call.
+
+    A read plan only contains values derived from the channels to read, so it stays valid until
+    channels are added to the task or ``in_stream.channels_to_read`` changes. Values that depend
+    on timing or on the task state, such as the number of available samples, are not cached.
+
+    ``read_function`` is the interpreter method used for analog, digital, and non-pulse counter
+    reads. Power and counter pulse reads have dedicated code paths and leave it unset.
+    """
+
+    __slots__ = ("number_of_channels", "kind", "dtype", "read_function", "ci_meas_type")
+
+    def __init__(
+        self,
+        number_of_channels: int,
+        kind: _ReadKind,
+        dtype: numpy.typing.DTypeLike | None = None,
+        read_function: Callable[..., Any] | None = None,
+        ci_meas_type: UsageTypeCI | None = None,
+    ) -> None:
+        self.number_of_channels = number_of_channels
+        self.kind = kind
+        self.dtype = dtype
+        self.read_function = read_function
+        self.ci_meas_type = ci_meas_type
+
+    def __repr__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return (
+            f"_ReadPlan(number_of_channels={self.number_of_channels}, kind={self.kind}, "
+            f"dtype={self.dtype})"
+        )
+
+
+_COUNTER_PULSE_MEAS_TYPES = (
+    UsageTypeCI.PULSE_FREQ,
+    UsageTypeCI.PULSE_TIME,
+    UsageTypeCI.PULSE_TICKS,
+)
+
+
+def _create_read_plan(task: Task) -> _ReadPlan:
+    """Query the driver for the metadata that Task.read needs and return it as a read plan."""
+    interpreter = task._interpreter
+    channels_to_read = task.in_stream.channels_to_read
+    number_of_channels = len(channels_to_read.channel_names)
+    read_chan_type = channels_to_read.chan_type
+
+    if read_chan_type == ChannelType.ANALOG_INPUT:
+        if any(chan.ai_meas_type == UsageTypeAI.POWER for chan in channels_to_read):
+            return _ReadPlan(number_of_channels, _ReadKind.POWER)
+        return _ReadPlan(
+            number_of_channels, _ReadKind.ANALOG, numpy.float64, interpreter.read_analog_f64
+        )
+
+    elif (
+        read_chan_type == ChannelType.DIGITAL_INPUT or read_chan_type == ChannelType.DIGITAL_OUTPUT
+    ):
+        if task.in_stream.di_num_booleans_per_chan == 1:
+            return _ReadPlan(
+                number_of_channels, _ReadKind.DIGITAL_LINES, bool, interpreter.read_digital_lines
+            )
+        return _ReadPlan(
+            number_of_channels, _ReadKind.DIGITAL_U32, numpy.uint32, interpreter.read_digital_u32
+        )
+
+    elif read_chan_type == ChannelType.COUNTER_INPUT:
+        meas_type = channels_to_read.ci_meas_type
+
+        if meas_type in _COUNTER_PULSE_MEAS_TYPES:
+            return _ReadPlan(number_of_channels, _ReadKind.COUNTER_PULSE, ci_meas_type=meas_type)
+        return _ReadPlan(
+            number_of_channels,
+            _ReadKind.COUNTER,
+            numpy.float64,
+            interpreter.read_counter_f64_ex,
+            meas_type,
+        )
+
+    return _ReadPlan(number_of_channels, _ReadKind.NO_INPUT_CHANNELS)
@@ -0,0 +1,157 @@
+"""Snapshots of the configurable properties of a task."""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any
+
+from nidaqmx.errors import Error
+
+if TYPE_CHECKING:
+    from nidaqmx.task._task import Task
+
+# The sections of a task configuration other than its channels, in the order that
+# Task.apply_config() sets them. Each section is the attribute path of the object that owns the
+# properties.
+_TASK_SECTIONS = (
+    "timing",
+    "triggers",
+    "triggers.start_trigger",
+    "triggers.reference_trigger",
+    "triggers.pause_trigger",
+    "triggers.arm_start_trigger",
+    "triggers.handshake_trigger",
+)
+
+# Channel sections are named after the virtual channel with this prefix.
+_CHANNEL_SECTION_PREFIX = "channels/"
+
+# Task.apply_config() sets the properties with these suffixes before the other properties of the
+# same section, and reads the section again after one of them changes, because the driver may
+# reset or recompute the other properties when they change.
+_SELECTOR_SUFFIXES = ("_type", "_mode", "_units")
+
+
+class TaskConfig:
+    """A snapshot of the configurable properties of a task.
+
+    Use the Task.snapshot_config method to create a TaskConfig and the
+    Task.apply_config method to apply it to a task. A TaskConfig holds
+    the values of the read-write channel, timing, and trigger properties
+    that the task supports, grouped into sections. It contains only
+    strings, numbers, and enums, so you can pickle it or copy it.
+    """
+
+    __slots__ = ("_sections",)
+
+    def __init__(self, sections: dict[str, dict[str, Any]]) -> None:
+        """Initialize a new TaskConfig.
+
+        Args:
+            sections: Specifies the property values by property name,
+                by section. A section is "channels/" followed by a
+                virtual channel name, "timing", "triggers", or
+                "triggers." followed by the name of a trigger.
+        """
+        self._sections = {section: dict(values) for section, values in sections.items()}
+
+    def __eq__(self, other: object) -> bool:
+        """Returns whether the configurations have the same property values."""
+        if isinstance(other, TaskConfig):
+            return self._sections == other._sections
+        return NotImplemented
+
+    def __len__(self) -> int:
+        """Returns the number of property values in the configuration."""
+        return sum(len(values) for values in self._sections.values())
+
+    def __repr__(self) -> str:
+        """Returns a string that lists the sections of the configuration."""
+        return f"TaskConfig(sections={list(self._sections)})"
+
+    @property
+    def sections(self) -> list[str]:
+        """List[str]: Indicates the names of the sections of the configuration."""
+        return list(self._sections)
+
+    def get(self, section: str, property_name: str, default: Any = None) -> Any:
+        """Returns the value of a property, or **default** if the configuration does not have it."""
+        return self._sections.get(section, {}).get(property_name, default)
+
+    def set(self, section: str, property_name: str, value: Any) -> None:
+        """Sets the value of a property in the configuration.
+
+        Use this method to change a snapshot before you apply it. It
+        does not change the task.
+        """
+        self._sections.setdefault(section, {})[property_name] = value
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Returns a copy of the property values by property name, by section."""
+        return copy.deepcopy(self._sections)
+
+
+def snapshot_task_config(task: Task) -> TaskConfig:
+    """Gets the values of the configurable properties of the task.
+
+    Properties that the task does not support are skipped.
+    """
+    sections: dict[str, dict[str, Any]] = {}
+    channel_index = task._get_channel_index()
+    for channel_name in channel_index.channel_names:
+        sections[_CHANNEL_SECTION_PREFIX + channel_name] = _get_property_values(
+            channel_index.get_channel(channel_name)
+        )
+    for section in _TASK_SECTIONS:
+        sections[section] = _get_property_values(_get_section_object(task, section))
+    return TaskConfig(sections)
+
+
+def apply_task_config(task: Task, config: TaskConfig, current: TaskConfig) -> int:
+    """Sets the properties of the configuration that differ from **current**.
+
+    Updates **current** to match the task. After a property with a selector suffix changes, the
+    rest of its section is read from the task again, so that only the properties that differ
+    from the values the driver reset or recomputed are set.
+
+    Returns the number of properties that were set.
+    """
+    property_count = 0
+    with task.configuration_batch():
+        for section, values in config._sections.items():
+            current_values = current._sections.setdefault(section, {})
+            obj = None
+            for property_name, value in values.items():
+                if property_name in current_values and current_values[property_name] == value:
+                    continue
+                if obj is None:
+                    obj = _get_section_object(task, section)
+                setattr(obj, property_name, value)
+                current_values[property_name] = value
+                property_count += 1
+                if property_name.endswith(_SELECTOR_SUFFIXES):
+                    current_values.clear()
+                    current_values.update(_get_property_values(obj))
+    return property_count
+
+
+def _get_section_object(task: Task, section: str) -> Any:
+    if section.startswith(_CHANNEL_SECTION_PREFIX):
+        return task._get_channel_index().get_channel(section[len(_CHANNEL_SECTION_PREFIX) :])
+    obj: Any = task
+    for name in section.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _get_property_values(obj: Any) -> dict[str, Any]:
+    values = {}
+    for property_name in type(obj)._CONFIG_PROPERTIES:
+        try:
+            values[property_name] = getattr(obj, property_name)
+        except Error:
+            # The task does not support the property, e.g. because it belongs to another
+            # measurement type or trigger type. gRPC sessions may raise RpcError instead of
+            # DaqError.
+            pass
+    return values
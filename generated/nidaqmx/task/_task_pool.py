@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import NamedTuple
+
+from nidaqmx.constants import TaskMode
+from nidaqmx.task._task import Task
+
+
+class TaskPoolMetrics(NamedTuple):
+    """Represents how much task setup a TaskPool has avoided."""
+
+    hits: int
+    """The number of tasks that were handed out from the pool."""
+
+    misses: int
+    """The number of tasks that were created and set up because the pool had none."""
+
+    hit_rate: float
+    """The fraction of acquired tasks that were handed out from the pool."""
+
+    setup_time: float
+    """The time in seconds spent creating, configuring, and committing tasks."""
+
+    avoided_setup_time: float
+    """The estimated time in seconds that the hits saved.
+
+    Each hit is counted as the average setup time of its template.
+    """
+
+
+class TaskPool:
+    """Reuses committed tasks that have the same configuration.
+
+    Creating a task, adding its channels, and configuring its timing
+    and triggers takes many driver calls, and so does verifying and
+    committing it when it starts. Code that creates and closes a task
+    with the same configuration over and over, such as once per image
+    or per sequence step, repeats that work every time. A TaskPool
+    keeps the tasks that were released and hands them out again for
+    the same template, so only the first task of each template is set
+    up.
+
+    A template is any hashable value that identifies a configuration,
+    such as a string or a tuple of parameters. The first time you
+    acquire a task for a template, the pool creates a task, calls the
+    configure function to set it up, and commits it. When you release
+    the task, the pool stops it, which returns it to the committed
+    state without unreserving its resources, and keeps it for the
+    next acquire of the same template.
+
+    Do not change the configuration of an acquired task, because the
+    next user of the template gets the task as you left it. Use a
+    different template instead. If the body of the acquire context
+    manager raises an exception, the pool closes the task instead of
+    keeping it.
+
+    Close the TaskPool, or use it as a context manager, to close the
+    tasks that it keeps.
+
+    Example:
+        >>> def configure(task):
+        ...     task.ci_channels.add_ci_count_edges_chan("Dev1/ctr0")
+        >>> with TaskPool() as pool:
+        ...     for image in images:
+        ...         with pool.acquire("counter", configure) as task:
+        ...             task.start()
+        ...             count = task.read()
+    """
+
+    __slots__ = (
+        "_grpc_options",
+        "_max_idle_tasks",
+        "_lock",
+        "_idle_tasks",
+        "_setup_times",
+        "_hits",
+        "_misses",
+        "_setup_time",
+        "_avoided_setup_time",
+        "_closed",
+    )
+
+    def __init__(self, *, max_idle_tasks=1, grpc_options=None):
+        """Initialize a new TaskPool.
+
+        Args:
+            max_idle_tasks (Optional[int]): Specifies the number of
+                released tasks to keep per template. The pool closes
+                tasks that are released while it already keeps this
+                many tasks for their template. Increase it if you
+                acquire several tasks for the same template at the same
+                time.
+            grpc_options (Optional[:class:`~nidaqmx.GrpcSessionOptions`]):
+                Specifies the gRPC session options of the tasks that
+                the pool creates.
+        """
+        if max_idle_tasks < 1:
+            raise ValueError("A TaskPool must keep at least one task per template.")
+
+        self._grpc_options = grpc_options
+        self._max_idle_tasks = max_idle_tasks
+        self._lock = threading.Lock()
+        self._idle_tasks: dict[object, list[Task]] = {}
+        # The total setup time and the number of tasks set up, by template.
+        self._setup_times: dict[object, tuple[float, int]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._setup_time = 0.0
+        self._avoided_setup_time = 0.0
+        self._closed = False
+
+    def __enter__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return self
+
+    def __exit__(  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        self, type, value, traceback
+    ):
+        self.close()
+
+    def __repr__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return f"TaskPool(templates={list(self._idle_tasks)})"
+
+    @property
+    def max_idle_tasks(self):
+        """int: Indicates the number of released tasks to keep per template."""
+        return self._max_idle_tasks
+
+    @property
+    def idle_task_count(self):
+        """int: Indicates the number of released tasks that the pool keeps."""
+        with self._lock:
+            return sum(len(tasks) for tasks in self._idle_tasks.values())
+
+    @property
+    def metrics(self):
+        """:class:`nidaqmx.task.TaskPoolMetrics`: Indicates how much task setup the pool avoided."""
+        with self._lock:
+            acquired = self._hits + self._misses
+            return TaskPoolMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=self._hits / acquired if acquired else 0.0,
+                setup_time=self._setup_time,
+                avoided_setup_time=self._avoided_setup_time,
+            )
+
+    @contextlib.contextmanager
+    def acquire(self, template, configure):
+        """Returns a context manager that hands out a committed task for the template.
+
+        Args:
+            template (Hashable): Specifies the configuration of the
+                task.
+            configure (Callable[[nidaqmx.Task], None]): Specifies the
+                function that adds the channels to a new task and
+                configures it. The pool calls it only when it has no
+                released task for the template.
+
+        Returns:
+            ContextManager[nidaqmx.Task]:
+
+            Indicates a context manager that returns the task and
+            releases it to the pool on exit.
+        """
+        task = self._take_task(template)
+        if task is None:
+            task = self._create_task(template, configure)
+
+        try:
+            yield task
+        except BaseException:
+            _close_task(task)
+            raise
+        self._release_task(template, task)
+
+    def close(self):
+        """Closes the tasks that the pool keeps.
+
+        Tasks that are released after the pool is closed are closed as
+        well.
+        """
+        with self._lock:
+            self._closed = True
+            idle_tasks = self._idle_tasks
+            self._idle_tasks = {}
+
+        first_exception = None
+        for tasks in idle_tasks.values():
+            for task in tasks:
+                try:
+                    task.close()
+                except Exception as ex:
+                    first_exception = first_exception or ex
+
+        if first_exception:
+            raise first_exception
+
+    def _take_task(self, template):
+        """Returns a released task for the template, or None if there is none."""
+        with self._lock:
+            tasks = self._idle_tasks.get(template)
+            if not tasks:
+                return None
+            self._hits += 1
+            total_time, count = self._setup_times[template]
+            self._avoided_setup_time += total_time / count
+            return tasks.pop()
+
+    def _create_task(self, template, configure):
+        """Creates, configures, and commits a task for the template."""
+        start_time = time.perf_counter()
+        task = Task(grpc_options=self._grpc_options)
+        try:
+            configure(task)
+            task.control(TaskMode.TASK_COMMIT)
+        except BaseException:
+            _close_task(task)
+            raise
+        elapsed_time = time.perf_counter() - start_time
+
+        with self._lock:
+            self._misses += 1
+            self._setup_time += elapsed_time
+            total_time, count = self._setup_times.get(template, (0.0, 0))
+            self._setup_times[template] = (total_time + elapsed_time, count + 1)
+        return task
+
+    def _release_task(self, template, task):
+        """Stops the task and keeps it for the template, or closes it if the pool is full."""
+        try:
+            task.stop()
+        except BaseException:
+            _close_task(task)
+            raise
+
+        with self._lock:
+            if not self._closed:
+                tasks = self._idle_tasks.setdefault(template, [])
+                if len(tasks) < self._max_idle_tasks:
+                    tasks.append(task)
+                    return
+        task.close()
+
+
+def _close_task(task):
+    """Closes a task whose state is unknown without hiding the exception being handled."""
+    with contextlib.suppress(Exception):
+        task.close()
@@ -21,6 +21,63 @@ class Timing:
     """
     __slots__ = ('_handle', '_interpreter', '_active_devs')
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+        'delay_from_samp_clk_delay_units',
+        'samp_quant_samp_mode',
+        'samp_timing_type',
+        'sync_pulse_type',
+        'ai_conv_active_edge',
+        'ai_conv_dig_fltr_enable',
+        'ai_conv_dig_fltr_min_pulse_width',
+        'ai_conv_dig_fltr_timebase_rate',
+        'ai_conv_dig_fltr_timebase_src',
+        'ai_conv_dig_sync_enable',
+        'ai_conv_rate',
+        'ai_conv_src',
+        'ai_conv_timebase_div',
+        'ai_conv_timebase_src',
+        'change_detect_di_tristate',
+        'delay_from_samp_clk_delay',
+        'first_samp_clk_offset',
+        'first_samp_clk_timescale',
+        'first_samp_timestamp_enable',
+        'first_samp_timestamp_timescale',
+        'hshk_delay_after_xfer',
+        'hshk_sample_input_data_when',
+        'hshk_start_cond',
+        'implicit_underflow_behavior',
+        'master_timebase_rate',
+        'master_timebase_src',
+        'ref_clk_rate',
+        'ref_clk_src',
+        'samp_clk_active_edge',
+        'samp_clk_dig_fltr_enable',
+        'samp_clk_dig_fltr_min_pulse_width',
+        'samp_clk_dig_fltr_timebase_rate',
+        'samp_clk_dig_fltr_timebase_src',
+        'samp_clk_dig_sync_enable',
+        'samp_clk_overrun_behavior',
+        'samp_clk_rate',
+        'samp_clk_src',
+        'samp_clk_timebase_active_edge',
+        'samp_clk_timebase_div',
+        'samp_clk_timebase_master_timebase_div',
+        'samp_clk_timebase_rate',
+        'samp_clk_timebase_src',
+        'samp_clk_underflow_behavior',
+        'samp_clk_write_wfm_use_initial_wfm_dt',
+        'samp_quant_samp_per_chan',
+        'samp_timing_engine',
+        'simultaneous_ao_enable',
+        'sync_clk_interval',
+        'sync_pulse_min_delay_to_start',
+        'sync_pulse_reset_delay',
+        'sync_pulse_src',
+        'sync_pulse_time_timescale',
+    )
+
     def __init__(self, task_handle, interpreter, active_devs: str | Device | None = None):
         if isinstance(active_devs, Device):
             active_devs = active_devs.name
@@ -34,6 +34,178 @@ class AIChannel(Channel):
     """
     __slots__ = ()
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES = Channel._CONFIG_PROPERTIES + (
+        'ai_ac_excit_wire_mode',
+        'ai_accel_4_wire_dc_voltage_sensitivity_units',
+        'ai_accel_charge_sensitivity_units',
+        'ai_accel_sensitivity_units',
+        'ai_accel_units',
+        'ai_adc_custom_timing_mode',
+        'ai_adc_timing_mode',
+        'ai_auto_zero_mode',
+        'ai_bridge_electrical_units',
+        'ai_bridge_physical_units',
+        'ai_bridge_scale_type',
+        'ai_bridge_units',
+        'ai_charge_units',
+        'ai_current_acrms_units',
+        'ai_current_units',
+        'ai_dig_fltr_type',
+        'ai_eddy_current_prox_sensitivity_units',
+        'ai_eddy_current_prox_units',
+        'ai_filter_delay_units',
+        'ai_force_iepe_sensor_sensitivity_units',
+        'ai_force_units',
+        'ai_freq_units',
+        'ai_lvdt_sensitivity_units',
+        'ai_lvdt_units',
+        'ai_pressure_units',
+        'ai_raw_data_compression_type',
+        'ai_resistance_units',
+        'ai_rosette_strain_gage_rosette_meas_type',
+        'ai_rtd_type',
+        'ai_rvdt_sensitivity_units',
+        'ai_rvdt_units',
+        'ai_sensor_power_type',
+        'ai_sound_pressure_units',
+        'ai_strain_units',
+        'ai_temp_units',
+        'ai_thrmcpl_scale_type',
+        'ai_thrmcpl_type',
+        'ai_torque_units',
+        'ai_velocity_iepe_sensor_sensitivity_units',
+        'ai_velocity_units',
+        'ai_voltage_acrms_units',
+        'ai_voltage_units',
+        'ai_ac_excit_freq',
+        'ai_ac_excit_sync_enable',
+        'ai_accel_4_wire_dc_voltage_sensitivity',
+        'ai_accel_charge_sensitivity',
+        'ai_accel_db_ref',
+        'ai_accel_sensitivity',
+        'ai_atten',
+        'ai_averaging_win_size',
+        'ai_bridge_balance_coarse_pot',
+        'ai_bridge_balance_fine_pot',
+        'ai_bridge_cfg',
+        'ai_bridge_initial_ratio',
+        'ai_bridge_initial_voltage',
+        'ai_bridge_nom_resistance',
+        'ai_bridge_shunt_cal_enable',
+        'ai_bridge_shunt_cal_gain_adjust',
+        'ai_bridge_shunt_cal_select',
+        'ai_bridge_shunt_cal_shunt_cal_a_actual_resistance',
+        'ai_bridge_shunt_cal_shunt_cal_a_resistance',
+        'ai_bridge_shunt_cal_shunt_cal_a_src',
+        'ai_bridge_shunt_cal_shunt_cal_b_actual_resistance',
+        'ai_bridge_shunt_cal_shunt_cal_b_resistance',
+        'ai_bridge_two_point_lin_first_electrical_val',
+        'ai_bridge_two_point_lin_first_physical_val',
+        'ai_bridge_two_point_lin_second_electrical_val',
+        'ai_bridge_two_point_lin_second_physical_val',
+        'ai_chop_enable',
+        'ai_coupling',
+        'ai_current_shunt_loc',
+        'ai_current_shunt_resistance',
+        'ai_data_xfer_custom_threshold',
+        'ai_data_xfer_max_rate',
+        'ai_data_xfer_mech',
+        'ai_data_xfer_req_cond',
+        'ai_dc_offset',
+        'ai_dig_fltr_bandpass_center_freq',
+        'ai_dig_fltr_bandpass_width',
+        'ai_dig_fltr_enable',
+        'ai_dig_fltr_highpass_cutoff_freq',
+        'ai_dig_fltr_lowpass_cutoff_freq',
+        'ai_dig_fltr_notch_center_freq',
+        'ai_dig_fltr_notch_width',
+        'ai_dig_fltr_order',
+        'ai_dig_fltr_response',
+        'ai_dither_enable',
+        'ai_eddy_current_prox_sensitivity',
+        'ai_enhanced_alias_rejection_enable',
+        'ai_excit_actual_val',
+        'ai_excit_d_cor_ac',
+        'ai_excit_idle_output_behavior',
+        'ai_excit_sense',
+        'ai_excit_src',
+        'ai_excit_use_for_scaling',
+        'ai_excit_use_multiplexed',
+        'ai_excit_val',
+        'ai_excit_voltage_or_current',
+        'ai_filter_delay_adjustment',
+        'ai_filter_enable',
+        'ai_filter_freq',
+        'ai_filter_order',
+        'ai_filter_response',
+        'ai_force_iepe_sensor_sensitivity',
+        'ai_force_read_from_chan',
+        'ai_freq_hyst',
+        'ai_freq_thresh_voltage',
+        'ai_gain',
+        'ai_impedance',
+        'ai_input_limits_fault_detect_enable',
+        'ai_input_limits_fault_detect_lower_limit',
+        'ai_input_limits_fault_detect_upper_limit',
+        'ai_input_src',
+        'ai_lead_wire_resistance',
+        'ai_lossy_lsb_removal_compressed_samp_size',
+        'ai_lowpass_cutoff_freq',
+        'ai_lowpass_enable',
+        'ai_lowpass_switch_cap_clk_src',
+        'ai_lowpass_switch_cap_ext_clk_div',
+        'ai_lowpass_switch_cap_ext_clk_freq',
+        'ai_lowpass_switch_cap_out_clk_div',
+        'ai_lvdt_sensitivity',
+        'ai_max',
+        'ai_mem_map_enable',
+        'ai_microphone_sensitivity',
+        'ai_min',
+        'ai_open_chan_detect_enable',
+        'ai_open_thrmcpl_detect_enable',
+        'ai_overcurrent_detect_enable',
+        'ai_power_supply_fault_detect_enable',
+        'ai_probe_atten',
+        'ai_remove_filter_delay',
+        'ai_resistance_cfg',
+        'ai_rng_high',
+        'ai_rng_low',
+        'ai_rosette_strain_gage_gage_orientation',
+        'ai_rtd_a',
+        'ai_rtd_b',
+        'ai_rtd_c',
+        'ai_rtd_r0',
+        'ai_rvdt_sensitivity',
+        'ai_samp_and_hold_enable',
+        'ai_sensor_power_cfg',
+        'ai_sensor_power_voltage',
+        'ai_sound_pressure_db_ref',
+        'ai_sound_pressure_max_sound_pressure_lvl',
+        'ai_strain_force_read_from_chan',
+        'ai_strain_gage_cfg',
+        'ai_strain_gage_gage_factor',
+        'ai_strain_gage_poisson_ratio',
+        'ai_term_cfg',
+        'ai_thrmcpl_cjc_val',
+        'ai_thrmcpl_lead_offset_voltage',
+        'ai_thrmstr_a',
+        'ai_thrmstr_b',
+        'ai_thrmstr_c',
+        'ai_thrmstr_r1',
+        'ai_usb_xfer_req_count',
+        'ai_usb_xfer_req_size',
+        'ai_velocity_iepe_sensor_db_ref',
+        'ai_velocity_iepe_sensor_sensitivity',
+        'ai_voltage_db_ref',
+        'pwr_current_setpoint',
+        'pwr_idle_output_behavior',
+        'pwr_output_enable',
+        'pwr_remote_sense',
+        'pwr_voltage_setpoint',
+    )
+
     def __repr__(self):
         return f'AIChannel(name={self._name})'
 
@@ -15,6 +15,52 @@ class AOChannel(Channel):
     """
     __slots__ = ()
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES = Channel._CONFIG_PROPERTIES + (
+        'ao_current_units',
+        'ao_filter_delay_units',
+        'ao_func_gen_modulation_type',
+        'ao_func_gen_type',
+        'ao_resolution_units',
+        'ao_voltage_units',
+        'ao_common_mode_offset',
+        'ao_dac_offset_ext_src',
+        'ao_dac_offset_src',
+        'ao_dac_offset_val',
+        'ao_dac_ref_allow_conn_to_gnd',
+        'ao_dac_ref_conn_to_gnd',
+        'ao_dac_ref_ext_src',
+        'ao_dac_ref_src',
+        'ao_dac_ref_val',
+        'ao_dac_rng_high',
+        'ao_dac_rng_low',
+        'ao_data_xfer_mech',
+        'ao_data_xfer_req_cond',
+        'ao_enhanced_image_rejection_enable',
+        'ao_filter_delay',
+        'ao_filter_delay_adjustment',
+        'ao_func_gen_amplitude',
+        'ao_func_gen_fm_deviation',
+        'ao_func_gen_freq',
+        'ao_func_gen_offset',
+        'ao_func_gen_square_duty_cycle',
+        'ao_func_gen_start_phase',
+        'ao_gain',
+        'ao_idle_output_behavior',
+        'ao_load_impedance',
+        'ao_max',
+        'ao_mem_map_enable',
+        'ao_min',
+        'ao_output_impedance',
+        'ao_reglitch_enable',
+        'ao_term_cfg',
+        'ao_usb_xfer_req_count',
+        'ao_usb_xfer_req_size',
+        'ao_use_only_on_brd_mem',
+        'ao_voltage_current_limit',
+    )
+
     def __repr__(self):
         return f'AOChannel(name={self._name})'
 
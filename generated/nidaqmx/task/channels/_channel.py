@@ -13,6 +13,13 @@ class Channel:
     """
     __slots__ = ['_handle', '_name', '_interpreter', '__weakref__']
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+        'description',
+        'sync_unlock_behavior',
+    )
+
     def __init__(self, task_handle, virtual_or_physical_name, interpreter):
         """
         Args:
@@ -17,6 +17,252 @@ class CIChannel(Channel):
     """
     __slots__ = ()
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES = Channel._CONFIG_PROPERTIES + (
+        'ci_ang_encoder_units',
+        'ci_encoder_decoding_type',
+        'ci_filter_delay_units',
+        'ci_freq_units',
+        'ci_lin_encoder_units',
+        'ci_period_units',
+        'ci_pulse_freq_units',
+        'ci_pulse_time_units',
+        'ci_pulse_width_units',
+        'ci_semi_period_units',
+        'ci_timestamp_units',
+        'ci_two_edge_sep_units',
+        'ci_velocity_ang_encoder_units',
+        'ci_velocity_encoder_decoding_type',
+        'ci_velocity_lin_encoder_units',
+        'ci_ang_encoder_initial_angle',
+        'ci_ang_encoder_pulses_per_rev',
+        'ci_count_edges_active_edge',
+        'ci_count_edges_count_dir_dig_fltr_enable',
+        'ci_count_edges_count_dir_dig_fltr_min_pulse_width',
+        'ci_count_edges_count_dir_dig_fltr_timebase_rate',
+        'ci_count_edges_count_dir_dig_fltr_timebase_src',
+        'ci_count_edges_count_dir_dig_sync_enable',
+        'ci_count_edges_count_dir_hyst',
+        'ci_count_edges_count_dir_logic_lvl_behavior',
+        'ci_count_edges_count_dir_term_cfg',
+        'ci_count_edges_count_dir_thresh_voltage',
+        'ci_count_edges_count_reset_active_edge',
+        'ci_count_edges_count_reset_dig_fltr_enable',
+        'ci_count_edges_count_reset_dig_fltr_min_pulse_width',
+        'ci_count_edges_count_reset_dig_fltr_timebase_rate',
+        'ci_count_edges_count_reset_dig_fltr_timebase_src',
+        'ci_count_edges_count_reset_dig_sync_enable',
+        'ci_count_edges_count_reset_enable',
+        'ci_count_edges_count_reset_hyst',
+        'ci_count_edges_count_reset_logic_lvl_behavior',
+        'ci_count_edges_count_reset_reset_cnt',
+        'ci_count_edges_count_reset_term',
+        'ci_count_edges_count_reset_term_cfg',
+        'ci_count_edges_count_reset_thresh_voltage',
+        'ci_count_edges_dig_fltr_enable',
+        'ci_count_edges_dig_fltr_min_pulse_width',
+        'ci_count_edges_dig_fltr_timebase_rate',
+        'ci_count_edges_dig_fltr_timebase_src',
+        'ci_count_edges_dig_sync_enable',
+        'ci_count_edges_dir',
+        'ci_count_edges_dir_term',
+        'ci_count_edges_gate_dig_fltr_enable',
+        'ci_count_edges_gate_dig_fltr_min_pulse_width',
+        'ci_count_edges_gate_dig_fltr_timebase_rate',
+        'ci_count_edges_gate_dig_fltr_timebase_src',
+        'ci_count_edges_gate_enable',
+        'ci_count_edges_gate_hyst',
+        'ci_count_edges_gate_logic_lvl_behavior',
+        'ci_count_edges_gate_term',
+        'ci_count_edges_gate_term_cfg',
+        'ci_count_edges_gate_thresh_voltage',
+        'ci_count_edges_gate_when',
+        'ci_count_edges_hyst',
+        'ci_count_edges_initial_cnt',
+        'ci_count_edges_logic_lvl_behavior',
+        'ci_count_edges_term',
+        'ci_count_edges_term_cfg',
+        'ci_count_edges_thresh_voltage',
+        'ci_ctr_timebase_active_edge',
+        'ci_ctr_timebase_dig_fltr_enable',
+        'ci_ctr_timebase_dig_fltr_min_pulse_width',
+        'ci_ctr_timebase_dig_fltr_timebase_rate',
+        'ci_ctr_timebase_dig_fltr_timebase_src',
+        'ci_ctr_timebase_dig_sync_enable',
+        'ci_ctr_timebase_master_timebase_div',
+        'ci_ctr_timebase_rate',
+        'ci_ctr_timebase_src',
+        'ci_data_xfer_mech',
+        'ci_data_xfer_req_cond',
+        'ci_dup_count_prevention',
+        'ci_duty_cycle_dig_fltr_enable',
+        'ci_duty_cycle_dig_fltr_min_pulse_width',
+        'ci_duty_cycle_dig_fltr_timebase_rate',
+        'ci_duty_cycle_dig_fltr_timebase_src',
+        'ci_duty_cycle_logic_lvl_behavior',
+        'ci_duty_cycle_starting_edge',
+        'ci_duty_cycle_term',
+        'ci_duty_cycle_term_cfg',
+        'ci_encoder_a_input_dig_fltr_enable',
+        'ci_encoder_a_input_dig_fltr_min_pulse_width',
+        'ci_encoder_a_input_dig_fltr_timebase_rate',
+        'ci_encoder_a_input_dig_fltr_timebase_src',
+        'ci_encoder_a_input_dig_sync_enable',
+        'ci_encoder_a_input_logic_lvl_behavior',
+        'ci_encoder_a_input_term',
+        'ci_encoder_a_input_term_cfg',
+        'ci_encoder_b_input_dig_fltr_enable',
+        'ci_encoder_b_input_dig_fltr_min_pulse_width',
+        'ci_encoder_b_input_dig_fltr_timebase_rate',
+        'ci_encoder_b_input_dig_fltr_timebase_src',
+        'ci_encoder_b_input_dig_sync_enable',
+        'ci_encoder_b_input_logic_lvl_behavior',
+        'ci_encoder_b_input_term',
+        'ci_encoder_b_input_term_cfg',
+        'ci_encoder_z_index_enable',
+        'ci_encoder_z_index_phase',
+        'ci_encoder_z_index_val',
+        'ci_encoder_z_input_dig_fltr_enable',
+        'ci_encoder_z_input_dig_fltr_min_pulse_width',
+        'ci_encoder_z_input_dig_fltr_timebase_rate',
+        'ci_encoder_z_input_dig_fltr_timebase_src',
+        'ci_encoder_z_input_dig_sync_enable',
+        'ci_encoder_z_input_logic_lvl_behavior',
+        'ci_encoder_z_input_term',
+        'ci_encoder_z_input_term_cfg',
+        'ci_filter_enable',
+        'ci_filter_freq',
+        'ci_filter_order',
+        'ci_filter_response',
+        'ci_freq_dig_fltr_enable',
+        'ci_freq_dig_fltr_min_pulse_width',
+        'ci_freq_dig_fltr_timebase_rate',
+        'ci_freq_dig_fltr_timebase_src',
+        'ci_freq_dig_sync_enable',
+        'ci_freq_div',
+        'ci_freq_enable_averaging',
+        'ci_freq_hyst',
+        'ci_freq_logic_lvl_behavior',
+        'ci_freq_meas_meth',
+        'ci_freq_meas_time',
+        'ci_freq_starting_edge',
+        'ci_freq_term',
+        'ci_freq_term_cfg',
+        'ci_freq_thresh_voltage',
+        'ci_gps_sync_method',
+        'ci_gps_sync_src',
+        'ci_lin_encoder_dist_per_pulse',
+        'ci_lin_encoder_initial_pos',
+        'ci_max',
+        'ci_max_meas_period',
+        'ci_mem_map_enable',
+        'ci_min',
+        'ci_period_dig_fltr_enable',
+        'ci_period_dig_fltr_min_pulse_width',
+        'ci_period_dig_fltr_timebase_rate',
+        'ci_period_dig_fltr_timebase_src',
+        'ci_period_dig_sync_enable',
+        'ci_period_div',
+        'ci_period_enable_averaging',
+        'ci_period_hyst',
+        'ci_period_logic_lvl_behavior',
+        'ci_period_meas_meth',
+        'ci_period_meas_time',
+        'ci_period_starting_edge',
+        'ci_period_term',
+        'ci_period_term_cfg',
+        'ci_period_thresh_voltage',
+        'ci_prescaler',
+        'ci_pulse_freq_dig_fltr_enable',
+        'ci_pulse_freq_dig_fltr_min_pulse_width',
+        'ci_pulse_freq_dig_fltr_timebase_rate',
+        'ci_pulse_freq_dig_fltr_timebase_src',
+        'ci_pulse_freq_dig_sync_enable',
+        'ci_pulse_freq_logic_lvl_behavior',
+        'ci_pulse_freq_starting_edge',
+        'ci_pulse_freq_term',
+        'ci_pulse_freq_term_cfg',
+        'ci_pulse_ticks_dig_fltr_enable',
+        'ci_pulse_ticks_dig_fltr_min_pulse_width',
+        'ci_pulse_ticks_dig_fltr_timebase_rate',
+        'ci_pulse_ticks_dig_fltr_timebase_src',
+        'ci_pulse_ticks_dig_sync_enable',
+        'ci_pulse_ticks_logic_lvl_behavior',
+        'ci_pulse_ticks_starting_edge',
+        'ci_pulse_ticks_term',
+        'ci_pulse_ticks_term_cfg',
+        'ci_pulse_time_dig_fltr_enable',
+        'ci_pulse_time_dig_fltr_min_pulse_width',
+        'ci_pulse_time_dig_fltr_timebase_rate',
+        'ci_pulse_time_dig_fltr_timebase_src',
+        'ci_pulse_time_dig_sync_enable',
+        'ci_pulse_time_logic_lvl_behavior',
+        'ci_pulse_time_starting_edge',
+        'ci_pulse_time_term',
+        'ci_pulse_time_term_cfg',
+        'ci_pulse_width_dig_fltr_enable',
+        'ci_pulse_width_dig_fltr_min_pulse_width',
+        'ci_pulse_width_dig_fltr_timebase_rate',
+        'ci_pulse_width_dig_fltr_timebase_src',
+        'ci_pulse_width_dig_sync_enable',
+        'ci_pulse_width_logic_lvl_behavior',
+        'ci_pulse_width_starting_edge',
+        'ci_pulse_width_term',
+        'ci_pulse_width_term_cfg',
+        'ci_samp_clk_overrun_behavior',
+        'ci_samp_clk_overrun_sentinel_val',
+        'ci_semi_period_dig_fltr_enable',
+        'ci_semi_period_dig_fltr_min_pulse_width',
+        'ci_semi_period_dig_fltr_timebase_rate',
+        'ci_semi_period_dig_fltr_timebase_src',
+        'ci_semi_period_dig_sync_enable',
+        'ci_semi_period_logic_lvl_behavior',
+        'ci_semi_period_starting_edge',
+        'ci_semi_period_term',
+        'ci_semi_period_term_cfg',
+        'ci_thresh_voltage',
+        'ci_timestamp_initial_seconds',
+        'ci_two_edge_sep_first_dig_fltr_enable',
+        'ci_two_edge_sep_first_dig_fltr_min_pulse_width',
+        'ci_two_edge_sep_first_dig_fltr_timebase_rate',
+        'ci_two_edge_sep_first_dig_fltr_timebase_src',
+        'ci_two_edge_sep_first_dig_sync_enable',
+        'ci_two_edge_sep_first_edge',
+        'ci_two_edge_sep_first_logic_lvl_behavior',
+        'ci_two_edge_sep_first_term',
+        'ci_two_edge_sep_first_term_cfg',
+        'ci_two_edge_sep_second_dig_fltr_enable',
+        'ci_two_edge_sep_second_dig_fltr_min_pulse_width',
+        'ci_two_edge_sep_second_dig_fltr_timebase_rate',
+        'ci_two_edge_sep_second_dig_fltr_timebase_src',
+        'ci_two_edge_sep_second_dig_sync_enable',
+        'ci_two_edge_sep_second_edge',
+        'ci_two_edge_sep_second_logic_lvl_behavior',
+        'ci_two_edge_sep_second_term',
+        'ci_two_edge_sep_second_term_cfg',
+        'ci_usb_xfer_req_count',
+        'ci_usb_xfer_req_size',
+        'ci_velocity_a_input_dig_fltr_enable',
+        'ci_velocity_a_input_dig_fltr_min_pulse_width',
+        'ci_velocity_a_input_dig_fltr_timebase_rate',
+        'ci_velocity_a_input_dig_fltr_timebase_src',
+        'ci_velocity_a_input_logic_lvl_behavior',
+        'ci_velocity_a_input_term',
+        'ci_velocity_a_input_term_cfg',
+        'ci_velocity_ang_encoder_pulses_per_rev',
+        'ci_velocity_b_input_dig_fltr_enable',
+        'ci_velocity_b_input_dig_fltr_min_pulse_width',
+        'ci_velocity_b_input_dig_fltr_timebase_rate',
+        'ci_velocity_b_input_dig_fltr_timebase_src',
+        'ci_velocity_b_input_logic_lvl_behavior',
+        'ci_velocity_b_input_term',
+        'ci_velocity_b_input_term_cfg',
+        'ci_velocity_div',
+        'ci_velocity_lin_encoder_dist_per_pulse',
+        'ci_velocity_meas_time',
+    )
+
     def __repr__(self):
         return f'CIChannel(name={self._name})'
 
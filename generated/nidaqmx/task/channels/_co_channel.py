@@ -12,6 +12,43 @@ class COChannel(Channel):
     """
     __slots__ = ()
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES = Channel._CONFIG_PROPERTIES + (
+        'co_constrained_gen_mode',
+        'co_pulse_freq_units',
+        'co_pulse_time_units',
+        'co_auto_incr_cnt',
+        'co_ctr_timebase_active_edge',
+        'co_ctr_timebase_dig_fltr_enable',
+        'co_ctr_timebase_dig_fltr_min_pulse_width',
+        'co_ctr_timebase_dig_fltr_timebase_rate',
+        'co_ctr_timebase_dig_fltr_timebase_src',
+        'co_ctr_timebase_dig_sync_enable',
+        'co_ctr_timebase_master_timebase_div',
+        'co_ctr_timebase_rate',
+        'co_ctr_timebase_src',
+        'co_data_xfer_mech',
+        'co_data_xfer_req_cond',
+        'co_enable_initial_delay_on_retrigger',
+        'co_mem_map_enable',
+        'co_prescaler',
+        'co_pulse_duty_cyc',
+        'co_pulse_freq',
+        'co_pulse_freq_initial_delay',
+        'co_pulse_high_ticks',
+        'co_pulse_high_time',
+        'co_pulse_idle_state',
+        'co_pulse_low_ticks',
+        'co_pulse_low_time',
+        'co_pulse_term',
+        'co_pulse_ticks_initial_delay',
+        'co_pulse_time_initial_delay',
+        'co_usb_xfer_req_count',
+        'co_usb_xfer_req_size',
+        'co_use_only_on_brd_mem',
+    )
+
     def __repr__(self):
         return f'COChannel(name={self._name})'
 
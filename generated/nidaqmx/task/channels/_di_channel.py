@@ -12,6 +12,26 @@ class DIChannel(Channel):
     """
     __slots__ = ()
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES = Channel._CONFIG_PROPERTIES + (
+        'di_dig_fltr_enable_bus_mode',
+        'di_acquire_on',
+        'di_data_xfer_mech',
+        'di_data_xfer_req_cond',
+        'di_dig_fltr_enable',
+        'di_dig_fltr_min_pulse_width',
+        'di_dig_fltr_timebase_rate',
+        'di_dig_fltr_timebase_src',
+        'di_dig_sync_enable',
+        'di_invert_lines',
+        'di_logic_family',
+        'di_mem_map_enable',
+        'di_tristate',
+        'di_usb_xfer_req_count',
+        'di_usb_xfer_req_size',
+    )
+
     def __repr__(self):
         return f'DIChannel(name={self._name})'
 
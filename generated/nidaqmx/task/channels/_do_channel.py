@@ -12,6 +12,28 @@ class DOChannel(Channel):
     """
     __slots__ = ()
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES = Channel._CONFIG_PROPERTIES + (
+        'do_output_drive_type',
+        'do_data_xfer_mech',
+        'do_data_xfer_req_cond',
+        'do_generate_on',
+        'do_invert_lines',
+        'do_line_states_done_state',
+        'do_line_states_paused_state',
+        'do_line_states_start_state',
+        'do_logic_family',
+        'do_mem_map_enable',
+        'do_overcurrent_auto_reenable',
+        'do_overcurrent_limit',
+        'do_overcurrent_reenable_period',
+        'do_tristate',
+        'do_usb_xfer_req_count',
+        'do_usb_xfer_req_size',
+        'do_use_only_on_brd_mem',
+    )
+
     def __repr__(self):
         return f'DOChannel(name={self._name})'
 
@@ -4,21 +4,28 @@ import numpy
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._ai_channel import AIChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
-    ACExcitWireMode, AccelChargeSensitivityUnits, AccelSensitivityUnits,
-    AccelUnits, AngleUnits, BridgeConfiguration, BridgeElectricalUnits,
-    BridgePhysicalUnits, BridgeUnits, CJCSource, ChargeUnits,
-    CurrentShuntResistorLocation, CurrentUnits,
-    EddyCurrentProxProbeSensitivityUnits, ExcitationSource,
-    ForceIEPESensorSensitivityUnits, ForceUnits, FrequencyUnits,
-    LVDTSensitivityUnits, LengthUnits, PressureUnits, RTDType,
-    RVDTSensitivityUnits, ResistanceConfiguration, ResistanceUnits,
-    SoundPressureUnits, StrainGageBridgeType,
-    StrainGageRosetteMeasurementType, StrainGageRosetteType, StrainUnits,
-    TEDSUnits, TemperatureUnits, TerminalConfiguration, ThermocoupleType,
-    TorqueUnits, VelocityIEPESensorSensitivityUnits, VelocityUnits,
+    ACExcitWireMode, ADCTimingMode, AccelChargeSensitivityUnits,
+    AccelSensitivityUnits, AccelUnits, AngleUnits, AutoZeroType,
+    BridgeConfiguration, BridgeElectricalUnits, BridgePhysicalUnits,
+    BridgeShuntCalSource, BridgeUnits, CJCSource, ChannelType, ChargeUnits,
+    Coupling, CurrentShuntResistorLocation, CurrentUnits, DataJustification,
+    DataTransferActiveTransferMode, DigitalWidthUnits,
+    EddyCurrentProxProbeSensitivityUnits, ExcitationDCorAC,
+    ExcitationIdleOutputBehavior, ExcitationSource,
+    ExcitationVoltageOrCurrent, FilterResponse, FilterType,
+    ForceIEPESensorSensitivityUnits, ForceUnits, FrequencyUnits, Impedance1,
+    InputDataTransferCondition, LVDTSensitivityUnits, LengthUnits,
+    PowerIdleOutputBehavior, PowerOutputState, PressureUnits, RTDType,
+    RVDTSensitivityUnits, RawDataCompressionType, ResistanceConfiguration,
+    ResistanceUnits, ResolutionType, ScaleType, Sense, SensorPowerCfg,
+    SensorPowerType, ShuntCalSelect, SoundPressureUnits, SourceSelection,
+    StrainGageBridgeType, StrainGageRosetteMeasurementType,
+    StrainGageRosetteType, StrainUnits, SyncUnlockBehavior, TEDSUnits,
+    TemperatureUnits, TerminalConfiguration, ThermocoupleType, TorqueUnits,
+    UsageTypeAI, VelocityIEPESensorSensitivityUnits, VelocityUnits,
     VoltageUnits)
 
 
@@ -26,11 +33,380 @@ class AIChannelCollection(ChannelCollection):
     """
     Contains the collection of analog input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+        'ai_ac_excit_freq':
+            _ChannelAttribute(0x101, 'double', None, True, True),
+        'ai_ac_excit_sync_enable':
+            _ChannelAttribute(0x102, 'bool', None, True, True),
+        'ai_ac_excit_wire_mode':
+            _ChannelAttribute(0x18cd, 'int32', ACExcitWireMode, True, True),
+        'ai_accel_4_wire_dc_voltage_sensitivity':
+            _ChannelAttribute(0x3115, 'double', None, True, True),
+        'ai_accel_4_wire_dc_voltage_sensitivity_units':
+            _ChannelAttribute(0x3116, 'int32', AccelSensitivityUnits, True, True),
+        'ai_accel_charge_sensitivity':
+            _ChannelAttribute(0x3113, 'double', None, True, True),
+        'ai_accel_charge_sensitivity_units':
+            _ChannelAttribute(0x3114, 'int32', AccelChargeSensitivityUnits, True, True),
+        'ai_accel_db_ref':
+            _ChannelAttribute(0x29b2, 'double', None, True, True),
+        'ai_accel_sensitivity':
+            _ChannelAttribute(0x692, 'double', None, True, True),
+        'ai_accel_sensitivity_units':
+            _ChannelAttribute(0x219c, 'int32', AccelSensitivityUnits, True, True),
+        'ai_accel_units':
+            _ChannelAttribute(0x673, 'int32', AccelUnits, True, True),
+        'ai_adc_custom_timing_mode':
+            _ChannelAttribute(0x2f6b, 'uint32', None, True, True),
+        'ai_adc_timing_mode':
+            _ChannelAttribute(0x29f9, 'int32', ADCTimingMode, True, True),
+        'ai_atten':
+            _ChannelAttribute(0x1801, 'double', None, True, True),
+        'ai_auto_zero_mode':
+            _ChannelAttribute(0x1760, 'int32', AutoZeroType, True, True),
+        'ai_averaging_win_size':
+            _ChannelAttribute(0x2fee, 'uint32', None, True, True),
+        'ai_bridge_balance_coarse_pot':
+            _ChannelAttribute(0x17f1, 'int32', None, True, True),
+        'ai_bridge_balance_fine_pot':
+            _ChannelAttribute(0x18f4, 'int32', None, True, True),
+        'ai_bridge_cfg':
+            _ChannelAttribute(0x87, 'int32', BridgeConfiguration, True, True),
+        'ai_bridge_electrical_units':
+            _ChannelAttribute(0x2f87, 'int32', BridgeElectricalUnits, True, True),
+        'ai_bridge_initial_ratio':
+            _ChannelAttribute(0x2f86, 'double', None, True, True),
+        'ai_bridge_initial_voltage':
+            _ChannelAttribute(0x17ed, 'double', None, True, True),
+        'ai_bridge_nom_resistance':
+            _ChannelAttribute(0x17ec, 'double', None, True, True),
+        'ai_bridge_physical_units':
+            _ChannelAttribute(0x2f88, 'int32', BridgePhysicalUnits, True, True),
+        'ai_bridge_scale_type':
+            _ChannelAttribute(0x2f89, 'int32', ScaleType, True, True),
+        'ai_bridge_shunt_cal_enable':
+            _ChannelAttribute(0x94, 'bool', None, True, True),
+        'ai_bridge_shunt_cal_gain_adjust':
+            _ChannelAttribute(0x193f, 'double', None, True, True),
+        'ai_bridge_shunt_cal_select':
+            _ChannelAttribute(0x21d5, 'int32', ShuntCalSelect, True, True),
+        'ai_bridge_shunt_cal_shunt_cal_a_actual_resistance':
+            _ChannelAttribute(0x2f79, 'double', None, True, True),
+        'ai_bridge_shunt_cal_shunt_cal_a_resistance':
+            _ChannelAttribute(0x2f78, 'double', None, True, True),
+        'ai_bridge_shunt_cal_shunt_cal_a_src':
+            _ChannelAttribute(0x30ca, 'int32', BridgeShuntCalSource, True, True),
+        'ai_bridge_shunt_cal_shunt_cal_b_actual_resistance':
+            _ChannelAttribute(0x2f7b, 'double', None, True, True),
+        'ai_bridge_shunt_cal_shunt_cal_b_resistance':
+            _ChannelAttribute(0x2f7a, 'double', None, True, True),
+        'ai_bridge_two_point_lin_first_electrical_val':
+            _ChannelAttribute(0x2f8a, 'double', None, True, True),
+        'ai_bridge_two_point_lin_first_physical_val':
+            _ChannelAttribute(0x2f8b, 'double', None, True, True),
+        'ai_bridge_two_point_lin_second_electrical_val':
+            _ChannelAttribute(0x2f8c, 'double', None, True, True),
+        'ai_bridge_two_point_lin_second_physical_val':
+            _ChannelAttribute(0x2f8d, 'double', None, True, True),
+        'ai_bridge_units':
+            _ChannelAttribute(0x2f92, 'int32', BridgeUnits, True, True),
+        'ai_charge_units':
+            _ChannelAttribute(0x3112, 'int32', ChargeUnits, True, True),
+        'ai_chop_enable':
+            _ChannelAttribute(0x3143, 'bool', None, True, True),
+        'ai_coupling':
+            _ChannelAttribute(0x64, 'int32', Coupling, True, True),
+        'ai_current_acrms_units':
+            _ChannelAttribute(0x17e3, 'int32', CurrentUnits, True, True),
+        'ai_current_shunt_loc':
+            _ChannelAttribute(0x17f2, 'int32', CurrentShuntResistorLocation, True, True),
+        'ai_current_shunt_resistance':
+            _ChannelAttribute(0x17f3, 'double', None, True, True),
+        'ai_current_units':
+            _ChannelAttribute(0x701, 'int32', CurrentUnits, True, True),
+        'ai_data_xfer_custom_threshold':
+            _ChannelAttribute(0x230c, 'uint32', None, True, True),
+        'ai_data_xfer_max_rate':
+            _ChannelAttribute(0x3117, 'double', None, True, True),
+        'ai_data_xfer_mech':
+            _ChannelAttribute(0x1821, 'int32', DataTransferActiveTransferMode, True, True),
+        'ai_data_xfer_req_cond':
+            _ChannelAttribute(0x188b, 'int32', InputDataTransferCondition, True, True),
+        'ai_dc_offset':
+            _ChannelAttribute(0x2a89, 'double', None, True, True),
+        'ai_dig_fltr_bandpass_center_freq':
+            _ChannelAttribute(0x30c3, 'double', None, True, True),
+        'ai_dig_fltr_bandpass_width':
+            _ChannelAttribute(0x30c4, 'double', None, True, True),
+        'ai_dig_fltr_enable':
+            _ChannelAttribute(0x30bd, 'bool', None, True, True),
+        'ai_dig_fltr_highpass_cutoff_freq':
+            _ChannelAttribute(0x30c2, 'double', None, True, True),
+        'ai_dig_fltr_lowpass_cutoff_freq':
+            _ChannelAttribute(0x30c1, 'double', None, True, True),
+        'ai_dig_fltr_notch_center_freq':
+            _ChannelAttribute(0x30c5, 'double', None, True, True),
+        'ai_dig_fltr_notch_width':
+            _ChannelAttribute(0x30c6, 'double', None, True, True),
+        'ai_dig_fltr_order':
+            _ChannelAttribute(0x30c0, 'uint32', None, True, True),
+        'ai_dig_fltr_response':
+            _ChannelAttribute(0x30bf, 'int32', FilterResponse, True, True),
+        'ai_dig_fltr_type':
+            _ChannelAttribute(0x30be, 'int32', FilterType, True, True),
+        'ai_dither_enable':
+            _ChannelAttribute(0x68, 'bool', None, True, True),
+        'ai_eddy_current_prox_sensitivity':
+            _ChannelAttribute(0x2abe, 'double', None, True, True),
+        'ai_eddy_current_prox_sensitivity_units':
+            _ChannelAttribute(0x2abf, 'int32', EddyCurrentProxProbeSensitivityUnits, True, True),
+        'ai_eddy_current_prox_units':
+            _ChannelAttribute(0x2ac0, 'int32', LengthUnits, True, True),
+        'ai_enhanced_alias_rejection_enable':
+            _ChannelAttribute(0x2294, 'bool', None, True, True),
+        'ai_excit_actual_val':
+            _ChannelAttribute(0x1883, 'double', None, True, True),
+        'ai_excit_d_cor_ac':
+            _ChannelAttribute(0x17fb, 'int32', ExcitationDCorAC, True, True),
+        'ai_excit_idle_output_behavior':
+            _ChannelAttribute(0x30b8, 'int32', ExcitationIdleOutputBehavior, True, True),
+        'ai_excit_sense':
+            _ChannelAttribute(0x30fd, 'int32', Sense, True, True),
+        'ai_excit_src':
+            _ChannelAttribute(0x17f4, 'int32', ExcitationSource, True, True),
+        'ai_excit_use_for_scaling':
+            _ChannelAttribute(0x17fc, 'bool', None, True, True),
+        'ai_excit_use_multiplexed':
+            _ChannelAttribute(0x2180, 'bool', None, True, True),
+        'ai_excit_val':
+            _ChannelAttribute(0x17f5, 'double', None, True, True),
+        'ai_excit_voltage_or_current':
+            _ChannelAttribute(0x17f6, 'int32', ExcitationVoltageOrCurrent, True, True),
+        'ai_filter_delay':
+            _ChannelAttribute(0x2fed, 'double', None, True, False),
+        'ai_filter_delay_adjustment':
+            _ChannelAttribute(0x3074, 'double', None, True, True),
+        'ai_filter_delay_units':
+            _ChannelAttribute(0x3071, 'int32', DigitalWidthUnits, True, True),
+        'ai_filter_enable':
+            _ChannelAttribute(0x3173, 'bool', None, True, True),
+        'ai_filter_freq':
+            _ChannelAttribute(0x3174, 'double', None, True, True),
+        'ai_filter_order':
+            _ChannelAttribute(0x3176, 'uint32', None, True, True),
+        'ai_filter_response':
+            _ChannelAttribute(0x3175, 'int32', FilterResponse, True, True),
+        'ai_force_iepe_sensor_sensitivity':
+            _ChannelAttribute(0x2f81, 'double', None, True, True),
+        'ai_force_iepe_sensor_sensitivity_units':
+            _ChannelAttribute(0x2f82, 'int32', ForceIEPESensorSensitivityUnits, True, True),
+        'ai_force_read_from_chan':
+            _ChannelAttribute(0x18f8, 'bool', None, True, True),
+        'ai_force_units':
+            _ChannelAttribute(0x2f75, 'int32', ForceUnits, True, True),
+        'ai_freq_hyst':
+            _ChannelAttribute(0x814, 'double', None, True, True),
+        'ai_freq_thresh_voltage':
+            _ChannelAttribute(0x815, 'double', None, True, True),
+        'ai_freq_units':
+            _ChannelAttribute(0x806, 'int32', FrequencyUnits, True, True),
+        'ai_gain':
+            _ChannelAttribute(0x1818, 'double', None, True, True),
+        'ai_impedance':
+            _ChannelAttribute(0x62, 'double', Impedance1, True, True),
+        'ai_input_limits_fault_detect_enable':
+            _ChannelAttribute(0x318e, 'bool', None, True, True),
+        'ai_input_limits_fault_detect_lower_limit':
+            _ChannelAttribute(0x318d, 'double', None, True, True),
+        'ai_input_limits_fault_detect_upper_limit':
+            _ChannelAttribute(0x318c, 'double', None, True, True),
+        'ai_input_src':
+            _ChannelAttribute(0x2198, 'string', None, True, True),
+        'ai_lead_wire_resistance':
+            _ChannelAttribute(0x17ee, 'double', None, True, True),
+        'ai_lossy_lsb_removal_compressed_samp_size':
+            _ChannelAttribute(0x22d9, 'uint32', None, True, True),
+        'ai_lowpass_cutoff_freq':
+            _ChannelAttribute(0x1803, 'double', None, True, True),
+        'ai_lowpass_enable':
+            _ChannelAttribute(0x1802, 'bool', None, True, True),
+        'ai_lowpass_switch_cap_clk_src':
+            _ChannelAttribute(0x1884, 'int32', SourceSelection, True, True),
+        'ai_lowpass_switch_cap_ext_clk_div':
+            _ChannelAttribute(0x1886, 'uint32', None, True, True),
+        'ai_lowpass_switch_cap_ext_clk_freq':
+            _ChannelAttribute(0x1885, 'double', None, True, True),
+        'ai_lowpass_switch_cap_out_clk_div':
+            _ChannelAttribute(0x1887, 'uint32', None, True, True),
+        'ai_lvdt_sensitivity':
+            _ChannelAttribute(0x939, 'double', None, True, True),
+        'ai_lvdt_sensitivity_units':
+            _ChannelAttribute(0x219a, 'int32', LVDTSensitivityUnits, True, True),
+        'ai_lvdt_units':
+            _ChannelAttribute(0x910, 'int32', LengthUnits, True, True),
+        'ai_max':
+            _ChannelAttribute(0x17dd, 'double', None, True, True),
+        'ai_meas_type':
+            _ChannelAttribute(0x695, 'int32', UsageTypeAI, True, False),
+        'ai_mem_map_enable':
+            _ChannelAttribute(0x188c, 'bool', None, True, True),
+        'ai_microphone_sensitivity':
+            _ChannelAttribute(0x1536, 'double', None, True, True),
+        'ai_min':
+            _ChannelAttribute(0x17de, 'double', None, True, True),
+        'ai_open_chan_detect_enable':
+            _ChannelAttribute(0x30ff, 'bool', None, True, True),
+        'ai_open_thrmcpl_detect_enable':
+            _ChannelAttribute(0x2f72, 'bool', None, True, True),
+        'ai_overcurrent_detect_enable':
+            _ChannelAttribute(0x3194, 'bool', None, True, True),
+        'ai_power_supply_fault_detect_enable':
+            _ChannelAttribute(0x3191, 'bool', None, True, True),
+        'ai_pressure_units':
+            _ChannelAttribute(0x2f76, 'int32', PressureUnits, True, True),
+        'ai_probe_atten':
+            _ChannelAttribute(0x2a88, 'double', None, True, True),
+        'ai_raw_data_compression_type':
+            _ChannelAttribute(0x22d8, 'int32', RawDataCompressionType, True, True),
+        'ai_raw_samp_justification':
+            _ChannelAttribute(0x50, 'int32', DataJustification, True, False),
+        'ai_raw_samp_size':
+            _ChannelAttribute(0x22da, 'uint32', None, True, False),
+        'ai_remove_filter_delay':
+            _ChannelAttribute(0x2fbd, 'bool', None, True, True),
+        'ai_resistance_cfg':
+            _ChannelAttribute(0x1881, 'int32', ResistanceConfiguration, True, True),
+        'ai_resistance_units':
+            _ChannelAttribute(0x955, 'int32', ResistanceUnits, True, True),
+        'ai_resolution':
+            _ChannelAttribute(0x1765, 'double', None, True, False),
+        'ai_resolution_units':
+            _ChannelAttribute(0x1764, 'int32', ResolutionType, True, False),
+        'ai_rng_high':
+            _ChannelAttribute(0x1815, 'double', None, True, True),
+        'ai_rng_low':
+            _ChannelAttribute(0x1816, 'double', None, True, True),
+        'ai_rosette_strain_gage_gage_orientation':
+            _ChannelAttribute(0x2ffc, 'double', None, True, True),
+        'ai_rosette_strain_gage_rosette_meas_type':
+            _ChannelAttribute(0x2ffd, 'int32', StrainGageRosetteMeasurementType, True, True),
+        'ai_rosette_strain_gage_rosette_type':
+            _ChannelAttribute(0x2ffe, 'int32', StrainGageRosetteType, True, False),
+        'ai_rtd_a':
+            _ChannelAttribute(0x1010, 'double', None, True, True),
+        'ai_rtd_b':
+            _ChannelAttribute(0x1011, 'double', None, True, True),
+        'ai_rtd_c':
+            _ChannelAttribute(0x1013, 'double', None, True, True),
+        'ai_rtd_r0':
+            _ChannelAttribute(0x1030, 'double', None, True, True),
+        'ai_rtd_type':
+            _ChannelAttribute(0x1032, 'int32', RTDType, True, True),
+        'ai_rvdt_sensitivity':
+            _ChannelAttribute(0x903, 'double', None, True, True),
+        'ai_rvdt_sensitivity_units':
+            _ChannelAttribute(0x219b, 'int32', RVDTSensitivityUnits, True, True),
+        'ai_rvdt_units':
+            _ChannelAttribute(0x877, 'int32', AngleUnits, True, True),
+        'ai_samp_and_hold_enable':
+            _ChannelAttribute(0x181a, 'bool', None, True, True),
+        'ai_sensor_power_cfg':
+            _ChannelAttribute(0x316a, 'int32', SensorPowerCfg, True, True),
+        'ai_sensor_power_type':
+            _ChannelAttribute(0x316b, 'int32', SensorPowerType, True, True),
+        'ai_sensor_power_voltage':
+            _ChannelAttribute(0x3169, 'double', None, True, True),
+        'ai_sound_pressure_db_ref':
+            _ChannelAttribute(0x29b1, 'double', None, True, True),
+        'ai_sound_pressure_max_sound_pressure_lvl':
+            _ChannelAttribute(0x223a, 'double', None, True, True),
+        'ai_sound_pressure_units':
+            _ChannelAttribute(0x1528, 'int32', SoundPressureUnits, True, True),
+        'ai_strain_force_read_from_chan':
+            _ChannelAttribute(0x2ffa, 'bool', None, True, True),
+        'ai_strain_gage_cfg':
+            _ChannelAttribute(0x982, 'int32', StrainGageBridgeType, True, True),
+        'ai_strain_gage_gage_factor':
+            _ChannelAttribute(0x994, 'double', None, True, True),
+        'ai_strain_gage_poisson_ratio':
+            _ChannelAttribute(0x998, 'double', None, True, True),
+        'ai_strain_units':
+            _ChannelAttribute(0x981, 'int32', StrainUnits, True, True),
+        'ai_teds_is_teds':
+            _ChannelAttribute(0x2983, 'bool', None, True, False),
+        'ai_teds_units':
+            _ChannelAttribute(0x21e0, 'string', None, True, False),
+        'ai_temp_units':
+            _ChannelAttribute(0x1033, 'int32', TemperatureUnits, True, True),
+        'ai_term_cfg':
+            _ChannelAttribute(0x1097, 'int32', TerminalConfiguration, True, True),
+        'ai_thrmcpl_cjc_src':
+            _ChannelAttribute(0x1035, 'int32', CJCSource, True, False),
+        'ai_thrmcpl_cjc_val':
+            _ChannelAttribute(0x1036, 'double', None, True, True),
+        'ai_thrmcpl_lead_offset_voltage':
+            _ChannelAttribute(0x2fb8, 'double', None, True, True),
+        'ai_thrmcpl_scale_type':
+            _ChannelAttribute(0x29d0, 'int32', ScaleType, True, True),
+        'ai_thrmcpl_type':
+            _ChannelAttribute(0x1050, 'int32', ThermocoupleType, True, True),
+        'ai_thrmstr_a':
+            _ChannelAttribute(0x18c9, 'double', None, True, True),
+        'ai_thrmstr_b':
+            _ChannelAttribute(0x18cb, 'double', None, True, True),
+        'ai_thrmstr_c':
+            _ChannelAttribute(0x18ca, 'double', None, True, True),
+        'ai_thrmstr_r1':
+            _ChannelAttribute(0x1061, 'double', None, True, True),
+        'ai_torque_units':
+            _ChannelAttribute(0x2f77, 'int32', TorqueUnits, True, True),
+        'ai_usb_xfer_req_count':
+            _ChannelAttribute(0x3000, 'uint32', None, True, True),
+        'ai_usb_xfer_req_size':
+            _ChannelAttribute(0x2a8e, 'uint32', None, True, True),
+        'ai_velocity_iepe_sensor_db_ref':
+            _ChannelAttribute(0x2ff5, 'double', None, True, True),
+        'ai_velocity_iepe_sensor_sensitivity':
+            _ChannelAttribute(0x2ff6, 'double', None, True, True),
+        'ai_velocity_iepe_sensor_sensitivity_units':
+            _ChannelAttribute(0x2ff7, 'int32', VelocityIEPESensorSensitivityUnits, True, True),
+        'ai_velocity_units':
+            _ChannelAttribute(0x2ff4, 'int32', VelocityUnits, True, True),
+        'ai_voltage_acrms_units':
+            _ChannelAttribute(0x17e2, 'int32', VoltageUnits, True, True),
+        'ai_voltage_db_ref':
+            _ChannelAttribute(0x29b0, 'double', None, True, True),
+        'ai_voltage_units':
+            _ChannelAttribute(0x1094, 'int32', VoltageUnits, True, True),
+        'chan_type':
+            _ChannelAttribute(0x187f, 'int32', ChannelType, True, False),
+        'description':
+            _ChannelAttribute(0x1926, 'string', None, True, True),
+        'is_global':
+            _ChannelAttribute(0x2304, 'bool', None, True, False),
+        'pwr_current_setpoint':
+            _ChannelAttribute(0x31d5, 'double', None, True, True),
+        'pwr_idle_output_behavior':
+            _ChannelAttribute(0x31d8, 'int32', PowerIdleOutputBehavior, True, True),
+        'pwr_output_enable':
+            _ChannelAttribute(0x31d6, 'bool', None, True, True),
+        'pwr_output_state':
+            _ChannelAttribute(0x31d7, 'int32', PowerOutputState, True, False),
+        'pwr_remote_sense':
+            _ChannelAttribute(0x31db, 'int32', Sense, True, True),
+        'pwr_voltage_setpoint':
+            _ChannelAttribute(0x31d4, 'double', None, True, True),
+        'sync_unlock_behavior':
+            _ChannelAttribute(0x313c, 'int32', SyncUnlockBehavior, True, True),
+    }
+
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ai_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -67,6 +443,7 @@ class AIChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = physical_channel
 
+        self._notify_channels_changed()
         return AIChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_ai_accel_4_wire_dc_voltage_chan(
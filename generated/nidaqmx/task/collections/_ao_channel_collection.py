@@ -2,21 +2,124 @@
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._ao_channel import AOChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
-    CurrentUnits, FuncGenType, VoltageUnits)
+    AOIdleOutputBehavior, ChannelType, CurrentUnits,
+    DataTransferActiveTransferMode, DigitalWidthUnits, FuncGenType,
+    ModulationType, OutputDataTransferCondition, ResolutionType,
+    SourceSelection, SyncUnlockBehavior, TerminalConfiguration, UsageTypeAO,
+    VoltageUnits)
 
 
 class AOChannelCollection(ChannelCollection):
     """
     Contains the collection of analog output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+        'ao_common_mode_offset':
+            _ChannelAttribute(0x31cc, 'double', None, True, True),
+        'ao_current_units':
+            _ChannelAttribute(0x1109, 'int32', CurrentUnits, True, True),
+        'ao_dac_offset_ext_src':
+            _ChannelAttribute(0x2254, 'string', None, True, True),
+        'ao_dac_offset_src':
+            _ChannelAttribute(0x2253, 'int32', SourceSelection, True, True),
+        'ao_dac_offset_val':
+            _ChannelAttribute(0x2255, 'double', None, True, True),
+        'ao_dac_ref_allow_conn_to_gnd':
+            _ChannelAttribute(0x1830, 'bool', None, True, True),
+        'ao_dac_ref_conn_to_gnd':
+            _ChannelAttribute(0x130, 'bool', None, True, True),
+        'ao_dac_ref_ext_src':
+            _ChannelAttribute(0x2252, 'string', None, True, True),
+        'ao_dac_ref_src':
+            _ChannelAttribute(0x132, 'int32', SourceSelection, True, True),
+        'ao_dac_ref_val':
+            _ChannelAttribute(0x1832, 'double', None, True, True),
+        'ao_dac_rng_high':
+            _ChannelAttribute(0x182e, 'double', None, True, True),
+        'ao_dac_rng_low':
+            _ChannelAttribute(0x182d, 'double', None, True, True),
+        'ao_data_xfer_mech':
+            _ChannelAttribute(0x134, 'int32', DataTransferActiveTransferMode, True, True),
+        'ao_data_xfer_req_cond':
+            _ChannelAttribute(0x183c, 'int32', OutputDataTransferCondition, True, True),
+        'ao_enhanced_image_rejection_enable':
+            _ChannelAttribute(0x2241, 'bool', None, True, True),
+        'ao_filter_delay':
+            _ChannelAttribute(0x3075, 'double', None, True, True),
+        'ao_filter_delay_adjustment':
+            _ChannelAttribute(0x3072, 'double', None, True, True),
+        'ao_filter_delay_units':
+            _ChannelAttribute(0x3076, 'int32', DigitalWidthUnits, True, True),
+        'ao_func_gen_amplitude':
+            _ChannelAttribute(0x2a1a, 'double', None, True, True),
+        'ao_func_gen_fm_deviation':
+            _ChannelAttribute(0x2a23, 'double', None, True, True),
+        'ao_func_gen_freq':
+            _ChannelAttribute(0x2a19, 'double', None, True, True),
+        'ao_func_gen_modulation_type':
+            _ChannelAttribute(0x2a22, 'int32', ModulationType, True, True),
+        'ao_func_gen_offset':
+            _ChannelAttribute(0x2a1b, 'double', None, True, True),
+        'ao_func_gen_square_duty_cycle':
+            _ChannelAttribute(0x2a1c, 'double', None, True, True),
+        'ao_func_gen_start_phase':
+            _ChannelAttribute(0x31c4, 'double', None, True, True),
+        'ao_func_gen_type':
+            _ChannelAttribute(0x2a18, 'int32', FuncGenType, True, True),
+        'ao_gain':
+            _ChannelAttribute(0x118, 'double', None, True, True),
+        'ao_idle_output_behavior':
+            _ChannelAttribute(0x2240, 'int32', AOIdleOutputBehavior, True, True),
+        'ao_load_impedance':
+            _ChannelAttribute(0x121, 'double', None, True, True),
+        'ao_max':
+            _ChannelAttribute(0x1186, 'double', None, True, True),
+        'ao_mem_map_enable':
+            _ChannelAttribute(0x188f, 'bool', None, True, True),
+        'ao_min':
+            _ChannelAttribute(0x1187, 'double', None, True, True),
+        'ao_output_impedance':
+            _ChannelAttribute(0x1490, 'double', None, True, True),
+        'ao_output_type':
+            _ChannelAttribute(0x1108, 'int32', UsageTypeAO, True, False),
+        'ao_reglitch_enable':
+            _ChannelAttribute(0x133, 'bool', None, True, True),
+        'ao_resolution':
+            _ChannelAttribute(0x182c, 'double', None, True, False),
+        'ao_resolution_units':
+            _ChannelAttribute(0x182b, 'int32', ResolutionType, True, True),
+        'ao_term_cfg':
+            _ChannelAttribute(0x188e, 'int32', TerminalConfiguration, True, True),
+        'ao_usb_xfer_req_count':
+            _ChannelAttribute(0x3001, 'uint32', None, True, True),
+        'ao_usb_xfer_req_size':
+            _ChannelAttribute(0x2a8f, 'uint32', None, True, True),
+        'ao_use_only_on_brd_mem':
+            _ChannelAttribute(0x183a, 'bool', None, True, True),
+        'ao_voltage_current_limit':
+            _ChannelAttribute(0x2a1d, 'double', None, True, True),
+        'ao_voltage_units':
+            _ChannelAttribute(0x1184, 'int32', VoltageUnits, True, True),
+        'chan_type':
+            _ChannelAttribute(0x187f, 'int32', ChannelType, True, False),
+        'description':
+            _ChannelAttribute(0x1926, 'string', None, True, True),
+        'is_global':
+            _ChannelAttribute(0x2304, 'bool', None, True, False),
+        'sync_unlock_behavior':
+            _ChannelAttribute(0x313c, 'int32', SyncUnlockBehavior, True, True),
+    }
+
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ao_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -53,6 +156,7 @@ class AOChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = physical_channel
 
+        self._notify_channels_changed()
         return AOChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_ao_current_chan(
@@ -2,23 +2,533 @@
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._ci_channel import CIChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
-    AngleUnits, AngularVelocityUnits, CountDirection, CounterFrequencyMethod,
-    Edge, EncoderType, EncoderZIndexPhase, FrequencyUnits, GpsSignalType,
-    LengthUnits, TimeUnits, VelocityUnits)
+    AngleUnits, AngularVelocityUnits, ChannelType, CountDirection,
+    CounterFrequencyMethod, DataTransferActiveTransferMode, DigitalWidthUnits,
+    Edge, EncoderType, EncoderZIndexPhase, FilterResponse, FrequencyUnits,
+    GpsSignalType, InputDataTransferCondition, LengthUnits, Level,
+    LogicLvlBehavior, SampClkOverrunBehavior, SyncUnlockBehavior,
+    TerminalConfiguration, TimeUnits, UsageTypeCI, VelocityUnits)
 
 
 class CIChannelCollection(ChannelCollection):
     """
     Contains the collection of counter input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+        'chan_type':
+            _ChannelAttribute(0x187f, 'int32', ChannelType, True, False),
+        'ci_ang_encoder_initial_angle':
+            _ChannelAttribute(0x881, 'double', None, True, True),
+        'ci_ang_encoder_pulses_per_rev':
+            _ChannelAttribute(0x875, 'uint32', None, True, True),
+        'ci_ang_encoder_units':
+            _ChannelAttribute(0x18a6, 'int32', AngleUnits, True, True),
+        'ci_count':
+            _ChannelAttribute(0x148, 'uint32', None, True, False),
+        'ci_count_edges_active_edge':
+            _ChannelAttribute(0x697, 'int32', Edge, True, True),
+        'ci_count_edges_count_dir_dig_fltr_enable':
+            _ChannelAttribute(0x21f1, 'bool', None, True, True),
+        'ci_count_edges_count_dir_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x21f2, 'double', None, True, True),
+        'ci_count_edges_count_dir_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x21f4, 'double', None, True, True),
+        'ci_count_edges_count_dir_dig_fltr_timebase_src':
+            _ChannelAttribute(0x21f3, 'string', None, True, True),
+        'ci_count_edges_count_dir_dig_sync_enable':
+            _ChannelAttribute(0x21f5, 'bool', None, True, True),
+        'ci_count_edges_count_dir_hyst':
+            _ChannelAttribute(0x31b2, 'double', None, True, True),
+        'ci_count_edges_count_dir_logic_lvl_behavior':
+            _ChannelAttribute(0x309e, 'int32', LogicLvlBehavior, True, True),
+        'ci_count_edges_count_dir_term_cfg':
+            _ChannelAttribute(0x309d, 'int32', TerminalConfiguration, True, True),
+        'ci_count_edges_count_dir_thresh_voltage':
+            _ChannelAttribute(0x31b1, 'double', None, True, True),
+        'ci_count_edges_count_reset_active_edge':
+            _ChannelAttribute(0x2fb2, 'int32', Edge, True, True),
+        'ci_count_edges_count_reset_dig_fltr_enable':
+            _ChannelAttribute(0x2fb3, 'bool', None, True, True),
+        'ci_count_edges_count_reset_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2fb4, 'double', None, True, True),
+        'ci_count_edges_count_reset_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2fb6, 'double', None, True, True),
+        'ci_count_edges_count_reset_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2fb5, 'string', None, True, True),
+        'ci_count_edges_count_reset_dig_sync_enable':
+            _ChannelAttribute(0x2fb7, 'bool', None, True, True),
+        'ci_count_edges_count_reset_enable':
+            _ChannelAttribute(0x2faf, 'bool', None, True, True),
+        'ci_count_edges_count_reset_hyst':
+            _ChannelAttribute(0x31b4, 'double', None, True, True),
+        'ci_count_edges_count_reset_logic_lvl_behavior':
+            _ChannelAttribute(0x30a0, 'int32', LogicLvlBehavior, True, True),
+        'ci_count_edges_count_reset_reset_cnt':
+            _ChannelAttribute(0x2fb0, 'uint32', None, True, True),
+        'ci_count_edges_count_reset_term':
+            _ChannelAttribute(0x2fb1, 'string', None, True, True),
+        'ci_count_edges_count_reset_term_cfg':
+            _ChannelAttribute(0x309f, 'int32', TerminalConfiguration, True, True),
+        'ci_count_edges_count_reset_thresh_voltage':
+            _ChannelAttribute(0x31b3, 'double', None, True, True),
+        'ci_count_edges_dig_fltr_enable':
+            _ChannelAttribute(0x21f6, 'bool', None, True, True),
+        'ci_count_edges_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x21f7, 'double', None, True, True),
+        'ci_count_edges_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x21f9, 'double', None, True, True),
+        'ci_count_edges_dig_fltr_timebase_src':
+            _ChannelAttribute(0x21f8, 'string', None, True, True),
+        'ci_count_edges_dig_sync_enable':
+            _ChannelAttribute(0x21fa, 'bool', None, True, True),
+        'ci_count_edges_dir':
+            _ChannelAttribute(0x696, 'int32', CountDirection, True, True),
+        'ci_count_edges_dir_term':
+            _ChannelAttribute(0x21e1, 'string', None, True, True),
+        'ci_count_edges_gate_dig_fltr_enable':
+            _ChannelAttribute(0x30f1, 'bool', None, True, True),
+        'ci_count_edges_gate_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x30f2, 'double', None, True, True),
+        'ci_count_edges_gate_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x30f4, 'double', None, True, True),
+        'ci_count_edges_gate_dig_fltr_timebase_src':
+            _ChannelAttribute(0x30f3, 'string', None, True, True),
+        'ci_count_edges_gate_enable':
+            _ChannelAttribute(0x30ed, 'bool', None, True, True),
+        'ci_count_edges_gate_hyst':
+            _ChannelAttribute(0x31b6, 'double', None, True, True),
+        'ci_count_edges_gate_logic_lvl_behavior':
+            _ChannelAttribute(0x30f0, 'int32', LogicLvlBehavior, True, True),
+        'ci_count_edges_gate_term':
+            _ChannelAttribute(0x30ee, 'string', None, True, True),
+        'ci_count_edges_gate_term_cfg':
+            _ChannelAttribute(0x30ef, 'int32', TerminalConfiguration, True, True),
+        'ci_count_edges_gate_thresh_voltage':
+            _ChannelAttribute(0x31b5, 'double', None, True, True),
+        'ci_count_edges_gate_when':
+            _ChannelAttribute(0x30f5, 'int32', Level, True, True),
+        'ci_count_edges_hyst':
+            _ChannelAttribute(0x31b0, 'double', None, True, True),
+        'ci_count_edges_initial_cnt':
+            _ChannelAttribute(0x698, 'uint32', None, True, True),
+        'ci_count_edges_logic_lvl_behavior':
+            _ChannelAttribute(0x309c, 'int32', LogicLvlBehavior, True, True),
+        'ci_count_edges_term':
+            _ChannelAttribute(0x18c7, 'string', None, True, True),
+        'ci_count_edges_term_cfg':
+            _ChannelAttribute(0x309b, 'int32', TerminalConfiguration, True, True),
+        'ci_count_edges_thresh_voltage':
+            _ChannelAttribute(0x31af, 'double', None, True, True),
+        'ci_ctr_timebase_active_edge':
+            _ChannelAttribute(0x142, 'int32', Edge, True, True),
+        'ci_ctr_timebase_dig_fltr_enable':
+            _ChannelAttribute(0x2271, 'bool', None, True, True),
+        'ci_ctr_timebase_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2272, 'double', None, True, True),
+        'ci_ctr_timebase_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2274, 'double', None, True, True),
+        'ci_ctr_timebase_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2273, 'string', None, True, True),
+        'ci_ctr_timebase_dig_sync_enable':
+            _ChannelAttribute(0x2275, 'bool', None, True, True),
+        'ci_ctr_timebase_master_timebase_div':
+            _ChannelAttribute(0x18b3, 'uint32', None, True, True),
+        'ci_ctr_timebase_rate':
+            _ChannelAttribute(0x18b2, 'double', None, True, True),
+        'ci_ctr_timebase_src':
+            _ChannelAttribute(0x143, 'string', None, True, True),
+        'ci_data_xfer_mech':
+            _ChannelAttribute(0x200, 'int32', DataTransferActiveTransferMode, True, True),
+        'ci_data_xfer_req_cond':
+            _ChannelAttribute(0x2efb, 'int32', InputDataTransferCondition, True, True),
+        'ci_dup_count_prevention':
+            _ChannelAttribute(0x21ac, 'bool', None, True, True),
+        'ci_duty_cycle_dig_fltr_enable':
+            _ChannelAttribute(0x308e, 'bool', None, True, True),
+        'ci_duty_cycle_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x308f, 'double', None, True, True),
+        'ci_duty_cycle_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x3091, 'double', None, True, True),
+        'ci_duty_cycle_dig_fltr_timebase_src':
+            _ChannelAttribute(0x3090, 'string', None, True, True),
+        'ci_duty_cycle_logic_lvl_behavior':
+            _ChannelAttribute(0x30a2, 'int32', LogicLvlBehavior, True, True),
+        'ci_duty_cycle_starting_edge':
+            _ChannelAttribute(0x3092, 'int32', Edge, True, True),
+        'ci_duty_cycle_term':
+            _ChannelAttribute(0x308d, 'string', None, True, True),
+        'ci_duty_cycle_term_cfg':
+            _ChannelAttribute(0x30a1, 'int32', TerminalConfiguration, True, True),
+        'ci_encoder_a_input_dig_fltr_enable':
+            _ChannelAttribute(0x21fb, 'bool', None, True, True),
+        'ci_encoder_a_input_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x21fc, 'double', None, True, True),
+        'ci_encoder_a_input_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x21fe, 'double', None, True, True),
+        'ci_encoder_a_input_dig_fltr_timebase_src':
+            _ChannelAttribute(0x21fd, 'string', None, True, True),
+        'ci_encoder_a_input_dig_sync_enable':
+            _ChannelAttribute(0x21ff, 'bool', None, True, True),
+        'ci_encoder_a_input_logic_lvl_behavior':
+            _ChannelAttribute(0x30a4, 'int32', LogicLvlBehavior, True, True),
+        'ci_encoder_a_input_term':
+            _ChannelAttribute(0x219d, 'string', None, True, True),
+        'ci_encoder_a_input_term_cfg':
+            _ChannelAttribute(0x30a3, 'int32', TerminalConfiguration, True, True),
+        'ci_encoder_b_input_dig_fltr_enable':
+            _ChannelAttribute(0x2200, 'bool', None, True, True),
+        'ci_encoder_b_input_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2201, 'double', None, True, True),
+        'ci_encoder_b_input_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2203, 'double', None, True, True),
+        'ci_encoder_b_input_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2202, 'string', None, True, True),
+        'ci_encoder_b_input_dig_sync_enable':
+            _ChannelAttribute(0x2204, 'bool', None, True, True),
+        'ci_encoder_b_input_logic_lvl_behavior':
+            _ChannelAttribute(0x30a6, 'int32', LogicLvlBehavior, True, True),
+        'ci_encoder_b_input_term':
+            _ChannelAttribute(0x219e, 'string', None, True, True),
+        'ci_encoder_b_input_term_cfg':
+            _ChannelAttribute(0x30a5, 'int32', TerminalConfiguration, True, True),
+        'ci_encoder_decoding_type':
+            _ChannelAttribute(0x21e6, 'int32', EncoderType, True, True),
+        'ci_encoder_z_index_enable':
+            _ChannelAttribute(0x890, 'bool', None, True, True),
+        'ci_encoder_z_index_phase':
+            _ChannelAttribute(0x889, 'int32', EncoderZIndexPhase, True, True),
+        'ci_encoder_z_index_val':
+            _ChannelAttribute(0x888, 'double', None, True, True),
+        'ci_encoder_z_input_dig_fltr_enable':
+            _ChannelAttribute(0x2205, 'bool', None, True, True),
+        'ci_encoder_z_input_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2206, 'double', None, True, True),
+        'ci_encoder_z_input_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2208, 'double', None, True, True),
+        'ci_encoder_z_input_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2207, 'string', None, True, True),
+        'ci_encoder_z_input_dig_sync_enable':
+            _ChannelAttribute(0x2209, 'bool', None, True, True),
+        'ci_encoder_z_input_logic_lvl_behavior':
+            _ChannelAttribute(0x30a8, 'int32', LogicLvlBehavior, True, True),
+        'ci_encoder_z_input_term':
+            _ChannelAttribute(0x219f, 'string', None, True, True),
+        'ci_encoder_z_input_term_cfg':
+            _ChannelAttribute(0x30a7, 'int32', TerminalConfiguration, True, True),
+        'ci_filter_delay':
+            _ChannelAttribute(0x31bb, 'double', None, True, False),
+        'ci_filter_delay_units':
+            _ChannelAttribute(0x31bc, 'int32', DigitalWidthUnits, True, True),
+        'ci_filter_enable':
+            _ChannelAttribute(0x31b7, 'bool', None, True, True),
+        'ci_filter_freq':
+            _ChannelAttribute(0x31b8, 'double', None, True, True),
+        'ci_filter_order':
+            _ChannelAttribute(0x31ba, 'uint32', None, True, True),
+        'ci_filter_response':
+            _ChannelAttribute(0x31b9, 'int32', FilterResponse, True, True),
+        'ci_freq_dig_fltr_enable':
+            _ChannelAttribute(0x21e7, 'bool', None, True, True),
+        'ci_freq_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x21e8, 'double', None, True, True),
+        'ci_freq_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x21ea, 'double', None, True, True),
+        'ci_freq_dig_fltr_timebase_src':
+            _ChannelAttribute(0x21e9, 'string', None, True, True),
+        'ci_freq_dig_sync_enable':
+            _ChannelAttribute(0x21eb, 'bool', None, True, True),
+        'ci_freq_div':
+            _ChannelAttribute(0x147, 'uint32', None, True, True),
+        'ci_freq_enable_averaging':
+            _ChannelAttribute(0x2ed0, 'bool', None, True, True),
+        'ci_freq_hyst':
+            _ChannelAttribute(0x31ac, 'double', None, True, True),
+        'ci_freq_logic_lvl_behavior':
+            _ChannelAttribute(0x3098, 'int32', LogicLvlBehavior, True, True),
+        'ci_freq_meas_meth':
+            _ChannelAttribute(0x144, 'int32', CounterFrequencyMethod, True, True),
+        'ci_freq_meas_time':
+            _ChannelAttribute(0x145, 'double', None, True, True),
+        'ci_freq_starting_edge':
+            _ChannelAttribute(0x799, 'int32', Edge, True, True),
+        'ci_freq_term':
+            _ChannelAttribute(0x18a2, 'string', None, True, True),
+        'ci_freq_term_cfg':
+            _ChannelAttribute(0x3097, 'int32', TerminalConfiguration, True, True),
+        'ci_freq_thresh_voltage':
+            _ChannelAttribute(0x31ab, 'double', None, True, True),
+        'ci_freq_units':
+            _ChannelAttribute(0x18a1, 'int32', FrequencyUnits, True, True),
+        'ci_gps_sync_method':
+            _ChannelAttribute(0x1092, 'int32', GpsSignalType, True, True),
+        'ci_gps_sync_src':
+            _ChannelAttribute(0x1093, 'string', None, True, True),
+        'ci_lin_encoder_dist_per_pulse':
+            _ChannelAttribute(0x911, 'double', None, True, True),
+        'ci_lin_encoder_initial_pos':
+            _ChannelAttribute(0x915, 'double', None, True, True),
+        'ci_lin_encoder_units':
+            _ChannelAttribute(0x18a9, 'int32', LengthUnits, True, True),
+        'ci_max':
+            _ChannelAttribute(0x189c, 'double', None, True, True),
+        'ci_max_meas_period':
+            _ChannelAttribute(0x3095, 'double', None, True, True),
+        'ci_meas_type':
+            _ChannelAttribute(0x18a0, 'int32', UsageTypeCI, True, False),
+        'ci_mem_map_enable':
+            _ChannelAttribute(0x2ed2, 'bool', None, True, True),
+        'ci_min':
+            _ChannelAttribute(0x189d, 'double', None, True, True),
+        'ci_num_possibly_invalid_samps':
+            _ChannelAttribute(0x193c, 'uint32', None, True, False),
+        'ci_output_state':
+            _ChannelAttribute(0x149, 'int32', Level, True, False),
+        'ci_period_dig_fltr_enable':
+            _ChannelAttribute(0x21ec, 'bool', None, True, True),
+        'ci_period_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x21ed, 'double', None, True, True),
+        'ci_period_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x21ef, 'double', None, True, True),
+        'ci_period_dig_fltr_timebase_src':
+            _ChannelAttribute(0x21ee, 'string', None, True, True),
+        'ci_period_dig_sync_enable':
+            _ChannelAttribute(0x21f0, 'bool', None, True, True),
+        'ci_period_div':
+            _ChannelAttribute(0x192e, 'uint32', None, True, True),
+        'ci_period_enable_averaging':
+            _ChannelAttribute(0x2ed1, 'bool', None, True, True),
+        'ci_period_hyst':
+            _ChannelAttribute(0x31ae, 'double', None, True, True),
+        'ci_period_logic_lvl_behavior':
+            _ChannelAttribute(0x309a, 'int32', LogicLvlBehavior, True, True),
+        'ci_period_meas_meth':
+            _ChannelAttribute(0x192c, 'int32', CounterFrequencyMethod, True, True),
+        'ci_period_meas_time':
+            _ChannelAttribute(0x192d, 'double', None, True, True),
+        'ci_period_starting_edge':
+            _ChannelAttribute(0x852, 'int32', Edge, True, True),
+        'ci_period_term':
+            _ChannelAttribute(0x18a4, 'string', None, True, True),
+        'ci_period_term_cfg':
+            _ChannelAttribute(0x3099, 'int32', TerminalConfiguration, True, True),
+        'ci_period_thresh_voltage':
+            _ChannelAttribute(0x31ad, 'double', None, True, True),
+        'ci_period_units':
+            _ChannelAttribute(0x18a3, 'int32', TimeUnits, True, True),
+        'ci_prescaler':
+            _ChannelAttribute(0x2239, 'uint32', None, True, True),
+        'ci_pulse_freq_dig_fltr_enable':
+            _ChannelAttribute(0x2f06, 'bool', None, True, True),
+        'ci_pulse_freq_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2f07, 'double', None, True, True),
+        'ci_pulse_freq_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2f09, 'double', None, True, True),
+        'ci_pulse_freq_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2f08, 'string', None, True, True),
+        'ci_pulse_freq_dig_sync_enable':
+            _ChannelAttribute(0x2f0a, 'bool', None, True, True),
+        'ci_pulse_freq_logic_lvl_behavior':
+            _ChannelAttribute(0x30b2, 'int32', LogicLvlBehavior, True, True),
+        'ci_pulse_freq_starting_edge':
+            _ChannelAttribute(0x2f05, 'int32', Edge, True, True),
+        'ci_pulse_freq_term':
+            _ChannelAttribute(0x2f04, 'string', None, True, True),
+        'ci_pulse_freq_term_cfg':
+            _ChannelAttribute(0x30b1, 'int32', TerminalConfiguration, True, True),
+        'ci_pulse_freq_units':
+            _ChannelAttribute(0x2f0b, 'int32', FrequencyUnits, True, True),
+        'ci_pulse_ticks_dig_fltr_enable':
+            _ChannelAttribute(0x2f16, 'bool', None, True, True),
+        'ci_pulse_ticks_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2f17, 'double', None, True, True),
+        'ci_pulse_ticks_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2f19, 'double', None, True, True),
+        'ci_pulse_ticks_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2f18, 'string', None, True, True),
+        'ci_pulse_ticks_dig_sync_enable':
+            _ChannelAttribute(0x2f1a, 'bool', None, True, True),
+        'ci_pulse_ticks_logic_lvl_behavior':
+            _ChannelAttribute(0x30b6, 'int32', LogicLvlBehavior, True, True),
+        'ci_pulse_ticks_starting_edge':
+            _ChannelAttribute(0x2f15, 'int32', Edge, True, True),
+        'ci_pulse_ticks_term':
+            _ChannelAttribute(0x2f14, 'string', None, True, True),
+        'ci_pulse_ticks_term_cfg':
+            _ChannelAttribute(0x30b5, 'int32', TerminalConfiguration, True, True),
+        'ci_pulse_time_dig_fltr_enable':
+            _ChannelAttribute(0x2f0e, 'bool', None, True, True),
+        'ci_pulse_time_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2f0f, 'double', None, True, True),
+        'ci_pulse_time_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2f11, 'double', None, True, True),
+        'ci_pulse_time_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2f10, 'string', None, True, True),
+        'ci_pulse_time_dig_sync_enable':
+            _ChannelAttribute(0x2f12, 'bool', None, True, True),
+        'ci_pulse_time_logic_lvl_behavior':
+            _ChannelAttribute(0x30b4, 'int32', LogicLvlBehavior, True, True),
+        'ci_pulse_time_starting_edge':
+            _ChannelAttribute(0x2f0d, 'int32', Edge, True, True),
+        'ci_pulse_time_term':
+            _ChannelAttribute(0x2f0c, 'string', None, True, True),
+        'ci_pulse_time_term_cfg':
+            _ChannelAttribute(0x30b3, 'int32', TerminalConfiguration, True, True),
+        'ci_pulse_time_units':
+            _ChannelAttribute(0x2f13, 'int32', TimeUnits, True, True),
+        'ci_pulse_width_dig_fltr_enable':
+            _ChannelAttribute(0x220a, 'bool', None, True, True),
+        'ci_pulse_width_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x220b, 'double', None, True, True),
+        'ci_pulse_width_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x220d, 'double', None, True, True),
+        'ci_pulse_width_dig_fltr_timebase_src':
+            _ChannelAttribute(0x220c, 'string', None, True, True),
+        'ci_pulse_width_dig_sync_enable':
+            _ChannelAttribute(0x220e, 'bool', None, True, True),
+        'ci_pulse_width_logic_lvl_behavior':
+            _ChannelAttribute(0x30aa, 'int32', LogicLvlBehavior, True, True),
+        'ci_pulse_width_starting_edge':
+            _ChannelAttribute(0x825, 'int32', Edge, True, True),
+        'ci_pulse_width_term':
+            _ChannelAttribute(0x18aa, 'string', None, True, True),
+        'ci_pulse_width_term_cfg':
+            _ChannelAttribute(0x30a9, 'int32', TerminalConfiguration, True, True),
+        'ci_pulse_width_units':
+            _ChannelAttribute(0x823, 'int32', TimeUnits, True, True),
+        'ci_samp_clk_overrun_behavior':
+            _ChannelAttribute(0x3093, 'int32', SampClkOverrunBehavior, True, True),
+        'ci_samp_clk_overrun_sentinel_val':
+            _ChannelAttribute(0x3094, 'int32', None, True, True),
+        'ci_semi_period_dig_fltr_enable':
+            _ChannelAttribute(0x2219, 'bool', None, True, True),
+        'ci_semi_period_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x221a, 'double', None, True, True),
+        'ci_semi_period_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x221c, 'double', None, True, True),
+        'ci_semi_period_dig_fltr_timebase_src':
+            _ChannelAttribute(0x221b, 'string', None, True, True),
+        'ci_semi_period_dig_sync_enable':
+            _ChannelAttribute(0x221d, 'bool', None, True, True),
+        'ci_semi_period_logic_lvl_behavior':
+            _ChannelAttribute(0x30b0, 'int32', LogicLvlBehavior, True, True),
+        'ci_semi_period_starting_edge':
+            _ChannelAttribute(0x22fe, 'int32', Edge, True, True),
+        'ci_semi_period_term':
+            _ChannelAttribute(0x18b0, 'string', None, True, True),
+        'ci_semi_period_term_cfg':
+            _ChannelAttribute(0x30af, 'int32', TerminalConfiguration, True, True),
+        'ci_semi_period_units':
+            _ChannelAttribute(0x18af, 'int32', TimeUnits, True, True),
+        'ci_tc_reached':
+            _ChannelAttribute(0x150, 'bool', None, True, False),
+        'ci_thresh_voltage':
+            _ChannelAttribute(0x30b7, 'double', None, True, True),
+        'ci_timestamp_initial_seconds':
+            _ChannelAttribute(0x22b4, 'uint32', None, True, True),
+        'ci_timestamp_units':
+            _ChannelAttribute(0x22b3, 'int32', TimeUnits, True, True),
+        'ci_two_edge_sep_first_dig_fltr_enable':
+            _ChannelAttribute(0x220f, 'bool', None, True, True),
+        'ci_two_edge_sep_first_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2210, 'double', None, True, True),
+        'ci_two_edge_sep_first_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2212, 'double', None, True, True),
+        'ci_two_edge_sep_first_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2211, 'string', None, True, True),
+        'ci_two_edge_sep_first_dig_sync_enable':
+            _ChannelAttribute(0x2213, 'bool', None, True, True),
+        'ci_two_edge_sep_first_edge':
+            _ChannelAttribute(0x833, 'int32', Edge, True, True),
+        'ci_two_edge_sep_first_logic_lvl_behavior':
+            _ChannelAttribute(0x30ac, 'int32', LogicLvlBehavior, True, True),
+        'ci_two_edge_sep_first_term':
+            _ChannelAttribute(0x18ad, 'string', None, True, True),
+        'ci_two_edge_sep_first_term_cfg':
+            _ChannelAttribute(0x30ab, 'int32', TerminalConfiguration, True, True),
+        'ci_two_edge_sep_second_dig_fltr_enable':
+            _ChannelAttribute(0x2214, 'bool', None, True, True),
+        'ci_two_edge_sep_second_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2215, 'double', None, True, True),
+        'ci_two_edge_sep_second_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2217, 'double', None, True, True),
+        'ci_two_edge_sep_second_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2216, 'string', None, True, True),
+        'ci_two_edge_sep_second_dig_sync_enable':
+            _ChannelAttribute(0x2218, 'bool', None, True, True),
+        'ci_two_edge_sep_second_edge':
+            _ChannelAttribute(0x834, 'int32', Edge, True, True),
+        'ci_two_edge_sep_second_logic_lvl_behavior':
+            _ChannelAttribute(0x30ae, 'int32', LogicLvlBehavior, True, True),
+        'ci_two_edge_sep_second_term':
+            _ChannelAttribute(0x18ae, 'string', None, True, True),
+        'ci_two_edge_sep_second_term_cfg':
+            _ChannelAttribute(0x30ad, 'int32', TerminalConfiguration, True, True),
+        'ci_two_edge_sep_units':
+            _ChannelAttribute(0x18ac, 'int32', TimeUnits, True, True),
+        'ci_usb_xfer_req_count':
+            _ChannelAttribute(0x3004, 'uint32', None, True, True),
+        'ci_usb_xfer_req_size':
+            _ChannelAttribute(0x2a92, 'uint32', None, True, True),
+        'ci_velocity_a_input_dig_fltr_enable':
+            _ChannelAttribute(0x30e0, 'bool', None, True, True),
+        'ci_velocity_a_input_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x30e1, 'double', None, True, True),
+        'ci_velocity_a_input_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x30e3, 'double', None, True, True),
+        'ci_velocity_a_input_dig_fltr_timebase_src':
+            _ChannelAttribute(0x30e2, 'string', None, True, True),
+        'ci_velocity_a_input_logic_lvl_behavior':
+            _ChannelAttribute(0x30df, 'int32', LogicLvlBehavior, True, True),
+        'ci_velocity_a_input_term':
+            _ChannelAttribute(0x30dd, 'string', None, True, True),
+        'ci_velocity_a_input_term_cfg':
+            _ChannelAttribute(0x30de, 'int32', TerminalConfiguration, True, True),
+        'ci_velocity_ang_encoder_pulses_per_rev':
+            _ChannelAttribute(0x30d9, 'uint32', None, True, True),
+        'ci_velocity_ang_encoder_units':
+            _ChannelAttribute(0x30d8, 'int32', AngularVelocityUnits, True, True),
+        'ci_velocity_b_input_dig_fltr_enable':
+            _ChannelAttribute(0x30e7, 'bool', None, True, True),
+        'ci_velocity_b_input_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x30e8, 'double', None, True, True),
+        'ci_velocity_b_input_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x30ea, 'double', None, True, True),
+        'ci_velocity_b_input_dig_fltr_timebase_src':
+            _ChannelAttribute(0x30e9, 'string', None, True, True),
+        'ci_velocity_b_input_logic_lvl_behavior':
+            _ChannelAttribute(0x30e6, 'int32', LogicLvlBehavior, True, True),
+        'ci_velocity_b_input_term':
+            _ChannelAttribute(0x30e4, 'string', None, True, True),
+        'ci_velocity_b_input_term_cfg':
+            _ChannelAttribute(0x30e5, 'int32', TerminalConfiguration, True, True),
+        'ci_velocity_div':
+            _ChannelAttribute(0x30ec, 'uint32', None, True, True),
+        'ci_velocity_encoder_decoding_type':
+            _ChannelAttribute(0x30dc, 'int32', EncoderType, True, True),
+        'ci_velocity_lin_encoder_dist_per_pulse':
+            _ChannelAttribute(0x30db, 'double', None, True, True),
+        'ci_velocity_lin_encoder_units':
+            _ChannelAttribute(0x30da, 'int32', VelocityUnits, True, True),
+        'ci_velocity_meas_time':
+            _ChannelAttribute(0x30eb, 'double', None, True, True),
+        'description':
+            _ChannelAttribute(0x1926, 'string', None, True, True),
+        'is_global':
+            _ChannelAttribute(0x2304, 'bool', None, True, False),
+        'sync_unlock_behavior':
+            _ChannelAttribute(0x313c, 'int32', SyncUnlockBehavior, True, True),
+    }
+
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ci_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -55,6 +565,7 @@ class CIChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = counter
 
+        self._notify_channels_changed()
         return CIChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_ci_ang_encoder_chan(
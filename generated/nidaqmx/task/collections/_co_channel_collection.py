@@ -2,21 +2,110 @@
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._co_channel import COChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
-    FrequencyUnits, Level, TimeUnits)
+    ChannelType, ConstrainedGenMode, DataTransferActiveTransferMode, Edge,
+    FrequencyUnits, Level, OutputDataTransferCondition, SyncUnlockBehavior,
+    TimeUnits, UsageTypeCO)
 
 
 class COChannelCollection(ChannelCollection):
     """
     Contains the collection of counter output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+        'chan_type':
+            _ChannelAttribute(0x187f, 'int32', ChannelType, True, False),
+        'co_auto_incr_cnt':
+            _ChannelAttribute(0x295, 'uint32', None, True, True),
+        'co_constrained_gen_mode':
+            _ChannelAttribute(0x29f2, 'int32', ConstrainedGenMode, True, True),
+        'co_count':
+            _ChannelAttribute(0x293, 'uint32', None, True, False),
+        'co_ctr_timebase_active_edge':
+            _ChannelAttribute(0x341, 'int32', Edge, True, True),
+        'co_ctr_timebase_dig_fltr_enable':
+            _ChannelAttribute(0x2276, 'bool', None, True, True),
+        'co_ctr_timebase_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x2277, 'double', None, True, True),
+        'co_ctr_timebase_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2279, 'double', None, True, True),
+        'co_ctr_timebase_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2278, 'string', None, True, True),
+        'co_ctr_timebase_dig_sync_enable':
+            _ChannelAttribute(0x227a, 'bool', None, True, True),
+        'co_ctr_timebase_master_timebase_div':
+            _ChannelAttribute(0x18c3, 'uint32', None, True, True),
+        'co_ctr_timebase_rate':
+            _ChannelAttribute(0x18c2, 'double', None, True, True),
+        'co_ctr_timebase_src':
+            _ChannelAttribute(0x339, 'string', None, True, True),
+        'co_data_xfer_mech':
+            _ChannelAttribute(0x2ecc, 'int32', DataTransferActiveTransferMode, True, True),
+        'co_data_xfer_req_cond':
+            _ChannelAttribute(0x2ecd, 'int32', OutputDataTransferCondition, True, True),
+        'co_enable_initial_delay_on_retrigger':
+            _ChannelAttribute(0x2ec9, 'bool', None, True, True),
+        'co_mem_map_enable':
+            _ChannelAttribute(0x2ed3, 'bool', None, True, True),
+        'co_output_state':
+            _ChannelAttribute(0x294, 'int32', Level, True, False),
+        'co_output_type':
+            _ChannelAttribute(0x18b5, 'int32', UsageTypeCO, True, False),
+        'co_prescaler':
+            _ChannelAttribute(0x226d, 'uint32', None, True, True),
+        'co_pulse_done':
+            _ChannelAttribute(0x190e, 'bool', None, True, False),
+        'co_pulse_duty_cyc':
+            _ChannelAttribute(0x1176, 'double', None, True, True),
+        'co_pulse_freq':
+            _ChannelAttribute(0x1178, 'double', None, True, True),
+        'co_pulse_freq_initial_delay':
+            _ChannelAttribute(0x299, 'double', None, True, True),
+        'co_pulse_freq_units':
+            _ChannelAttribute(0x18d5, 'int32', FrequencyUnits, True, True),
+        'co_pulse_high_ticks':
+            _ChannelAttribute(0x1169, 'uint32', None, True, True),
+        'co_pulse_high_time':
+            _ChannelAttribute(0x18ba, 'double', None, True, True),
+        'co_pulse_idle_state':
+            _ChannelAttribute(0x1170, 'int32', Level, True, True),
+        'co_pulse_low_ticks':
+            _ChannelAttribute(0x1171, 'uint32', None, True, True),
+        'co_pulse_low_time':
+            _ChannelAttribute(0x18bb, 'double', None, True, True),
+        'co_pulse_term':
+            _ChannelAttribute(0x18e1, 'string', None, True, True),
+        'co_pulse_ticks_initial_delay':
+            _ChannelAttribute(0x298, 'uint32', None, True, True),
+        'co_pulse_time_initial_delay':
+            _ChannelAttribute(0x18bc, 'double', None, True, True),
+        'co_pulse_time_units':
+            _ChannelAttribute(0x18d6, 'int32', TimeUnits, True, True),
+        'co_rdy_for_new_val':
+            _ChannelAttribute(0x22ff, 'bool', None, True, False),
+        'co_usb_xfer_req_count':
+            _ChannelAttribute(0x3005, 'uint32', None, True, True),
+        'co_usb_xfer_req_size':
+            _ChannelAttribute(0x2a93, 'uint32', None, True, True),
+        'co_use_only_on_brd_mem':
+            _ChannelAttribute(0x2ecb, 'bool', None, True, True),
+        'description':
+            _ChannelAttribute(0x1926, 'string', None, True, True),
+        'is_global':
+            _ChannelAttribute(0x2304, 'bool', None, True, False),
+        'sync_unlock_behavior':
+            _ChannelAttribute(0x313c, 'int32', SyncUnlockBehavior, True, True),
+    }
+
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.co_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, counter, name_to_assign_to_channel=''):
         """
@@ -53,6 +142,7 @@ class COChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = counter
 
+        self._notify_channels_changed()
         return COChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_co_pulse_chan_freq(
@@ -2,21 +2,68 @@
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._di_channel import DIChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
-    LineGrouping)
+    ActiveOrInactiveEdgeSelection, ChannelType,
+    DataTransferActiveTransferMode, InputDataTransferCondition, LineGrouping,
+    LogicFamily, SyncUnlockBehavior)
 
 
 class DIChannelCollection(ChannelCollection):
     """
     Contains the collection of digital input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+        'chan_type':
+            _ChannelAttribute(0x187f, 'int32', ChannelType, True, False),
+        'description':
+            _ChannelAttribute(0x1926, 'string', None, True, True),
+        'di_acquire_on':
+            _ChannelAttribute(0x2966, 'int32', ActiveOrInactiveEdgeSelection, True, True),
+        'di_data_xfer_mech':
+            _ChannelAttribute(0x2263, 'int32', DataTransferActiveTransferMode, True, True),
+        'di_data_xfer_req_cond':
+            _ChannelAttribute(0x2264, 'int32', InputDataTransferCondition, True, True),
+        'di_dig_fltr_enable':
+            _ChannelAttribute(0x21d6, 'bool', None, True, True),
+        'di_dig_fltr_enable_bus_mode':
+            _ChannelAttribute(0x2efe, 'bool', None, True, True),
+        'di_dig_fltr_min_pulse_width':
+            _ChannelAttribute(0x21d7, 'double', None, True, True),
+        'di_dig_fltr_timebase_rate':
+            _ChannelAttribute(0x2ed5, 'double', None, True, True),
+        'di_dig_fltr_timebase_src':
+            _ChannelAttribute(0x2ed4, 'string', None, True, True),
+        'di_dig_sync_enable':
+            _ChannelAttribute(0x2ed6, 'bool', None, True, True),
+        'di_invert_lines':
+            _ChannelAttribute(0x793, 'bool', None, True, True),
+        'di_logic_family':
+            _ChannelAttribute(0x296d, 'int32', LogicFamily, True, True),
+        'di_mem_map_enable':
+            _ChannelAttribute(0x296a, 'bool', None, True, True),
+        'di_num_lines':
+            _ChannelAttribute(0x2178, 'uint32', None, True, False),
+        'di_tristate':
+            _ChannelAttribute(0x1890, 'bool', None, True, True),
+        'di_usb_xfer_req_count':
+            _ChannelAttribute(0x3002, 'uint32', None, True, True),
+        'di_usb_xfer_req_size':
+            _ChannelAttribute(0x2a90, 'uint32', None, True, True),
+        'is_global':
+            _ChannelAttribute(0x2304, 'bool', None, True, False),
+        'sync_unlock_behavior':
+            _ChannelAttribute(0x313c, 'int32', SyncUnlockBehavior, True, True),
+    }
+
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.di_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, lines, line_grouping, name_to_assign_to_lines=''):
         """
@@ -65,6 +112,7 @@ class DIChannelCollection(ChannelCollection):
                 else:
                     virtual_channel_name = lines
 
+        self._notify_channels_changed()
         return DIChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_di_chan(
@@ -2,21 +2,72 @@
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._do_channel import DOChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
-    LineGrouping)
+    ActiveOrInactiveEdgeSelection, ChannelType,
+    DataTransferActiveTransferMode, DigitalDriveType, Level, LineGrouping,
+    LogicFamily, OutputDataTransferCondition, SyncUnlockBehavior)
 
 
 class DOChannelCollection(ChannelCollection):
     """
     Contains the collection of digital output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+        'chan_type':
+            _ChannelAttribute(0x187f, 'int32', ChannelType, True, False),
+        'description':
+            _ChannelAttribute(0x1926, 'string', None, True, True),
+        'do_data_xfer_mech':
+            _ChannelAttribute(0x2266, 'int32', DataTransferActiveTransferMode, True, True),
+        'do_data_xfer_req_cond':
+            _ChannelAttribute(0x2267, 'int32', OutputDataTransferCondition, True, True),
+        'do_generate_on':
+            _ChannelAttribute(0x2969, 'int32', ActiveOrInactiveEdgeSelection, True, True),
+        'do_invert_lines':
+            _ChannelAttribute(0x1133, 'bool', None, True, True),
+        'do_line_states_done_state':
+            _ChannelAttribute(0x2968, 'int32', Level, True, True),
+        'do_line_states_paused_state':
+            _ChannelAttribute(0x2967, 'int32', Level, True, True),
+        'do_line_states_start_state':
+            _ChannelAttribute(0x2972, 'int32', Level, True, True),
+        'do_logic_family':
+            _ChannelAttribute(0x296e, 'int32', LogicFamily, True, True),
+        'do_mem_map_enable':
+            _ChannelAttribute(0x296b, 'bool', None, True, True),
+        'do_num_lines':
+            _ChannelAttribute(0x2179, 'uint32', None, True, False),
+        'do_output_drive_type':
+            _ChannelAttribute(0x1137, 'int32', DigitalDriveType, True, True),
+        'do_overcurrent_auto_reenable':
+            _ChannelAttribute(0x2a86, 'bool', None, True, True),
+        'do_overcurrent_limit':
+            _ChannelAttribute(0x2a85, 'double', None, True, True),
+        'do_overcurrent_reenable_period':
+            _ChannelAttribute(0x2a87, 'double', None, True, True),
+        'do_tristate':
+            _ChannelAttribute(0x18f3, 'bool', None, True, True),
+        'do_usb_xfer_req_count':
+            _ChannelAttribute(0x3003, 'uint32', None, True, True),
+        'do_usb_xfer_req_size':
+            _ChannelAttribute(0x2a91, 'uint32', None, True, True),
+        'do_use_only_on_brd_mem':
+            _ChannelAttribute(0x2265, 'bool', None, True, True),
+        'is_global':
+            _ChannelAttribute(0x2304, 'bool', None, True, False),
+        'sync_unlock_behavior':
+            _ChannelAttribute(0x313c, 'int32', SyncUnlockBehavior, True, True),
+    }
+
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.do_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, lines, line_grouping, name_to_assign_to_lines=''):
         """
@@ -65,6 +116,7 @@ class DOChannelCollection(ChannelCollection):
                 else:
                     virtual_channel_name = lines
 
+        self._notify_channels_changed()
         return DOChannel(self._handle, virtual_channel_name, self._interpreter)
 
     def add_do_chan(
@@ -10,6 +10,22 @@ class ArmStartTrigger:
     """
     __slots__ = ('_handle', '_interpreter')
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+        'trig_type',
+        'dig_edge_dig_fltr_enable',
+        'dig_edge_dig_fltr_min_pulse_width',
+        'dig_edge_dig_fltr_timebase_rate',
+        'dig_edge_dig_fltr_timebase_src',
+        'dig_edge_dig_sync_enable',
+        'dig_edge_edge',
+        'dig_edge_src',
+        'time_timescale',
+        'timestamp_enable',
+        'timestamp_timescale',
+    )
+
     def __init__(self, task_handle, interpreter):
         self._handle = task_handle
         self._interpreter = interpreter
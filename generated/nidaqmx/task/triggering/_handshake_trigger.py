@@ -10,6 +10,14 @@ class HandshakeTrigger:
     """
     __slots__ = ('_handle', '_interpreter')
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+        'trig_type',
+        'interlocked_asserted_lvl',
+        'interlocked_src',
+    )
+
     def __init__(self, task_handle, interpreter):
         self._handle = task_handle
         self._interpreter = interpreter
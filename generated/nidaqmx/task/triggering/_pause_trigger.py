@@ -12,6 +12,41 @@ class PauseTrigger:
     """
     __slots__ = ('_handle', '_interpreter')
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+        'trig_type',
+        'anlg_lvl_coupling',
+        'anlg_lvl_dig_fltr_enable',
+        'anlg_lvl_dig_fltr_min_pulse_width',
+        'anlg_lvl_dig_fltr_timebase_rate',
+        'anlg_lvl_dig_fltr_timebase_src',
+        'anlg_lvl_dig_sync_enable',
+        'anlg_lvl_hyst',
+        'anlg_lvl_lvl',
+        'anlg_lvl_src',
+        'anlg_lvl_when',
+        'anlg_win_btm',
+        'anlg_win_coupling',
+        'anlg_win_dig_fltr_enable',
+        'anlg_win_dig_fltr_min_pulse_width',
+        'anlg_win_dig_fltr_timebase_rate',
+        'anlg_win_dig_fltr_timebase_src',
+        'anlg_win_dig_sync_enable',
+        'anlg_win_src',
+        'anlg_win_top',
+        'anlg_win_when',
+        'dig_lvl_dig_fltr_enable',
+        'dig_lvl_dig_fltr_min_pulse_width',
+        'dig_lvl_dig_fltr_timebase_rate',
+        'dig_lvl_dig_fltr_timebase_src',
+        'dig_lvl_dig_sync_enable',
+        'dig_lvl_src',
+        'dig_lvl_when',
+        'dig_pattern_pattern',
+        'dig_pattern_when',
+    )
+
     def __init__(self, task_handle, interpreter):
         self._handle = task_handle
         self._interpreter = interpreter
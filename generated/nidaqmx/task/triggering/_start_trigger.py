@@ -15,6 +15,51 @@ class StartTrigger:
     """
     __slots__ = ('_handle', '_interpreter')
 
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+        'delay_units',
+        'trig_type',
+        'anlg_edge_coupling',
+        'anlg_edge_dig_fltr_enable',
+        'anlg_edge_dig_fltr_min_pulse_width',
+        'anlg_edge_dig_fltr_timebase_rate',
+        'anlg_edge_dig_fltr_timebase_src',
+        'anlg_edge_dig_sync_enable',
+        'anlg_edge_hyst',
+        'anlg_edge_lvl',
+        'anlg_edge_slope',
+        'anlg_edge_src',
+        'anlg_multi_edge_srcs',
+        'anlg_win_btm',
+        'anlg_win_coupling',
+        'anlg_win_dig_fltr_enable',
+        'anlg_win_dig_fltr_min_pulse_width',
+        'anlg_win_dig_fltr_timebase_rate',
+        'anlg_win_dig_fltr_timebase_src',
+        'anlg_win_dig_sync_enable',
+        'anlg_win_src',
+        'anlg_win_top',
+        'anlg_win_trig_when',
+        'delay',
+        'dig_edge_dig_fltr_enable',
+        'dig_edge_dig_fltr_min_pulse_width',
+        'dig_edge_dig_fltr_timebase_rate',
+        'dig_edge_dig_fltr_timebase_src',
+        'dig_edge_dig_sync_enable',
+        'dig_edge_edge',
+        'dig_edge_src',
+        'dig_pattern_pattern',
+        'dig_pattern_trig_when',
+        'max_num_trigs_to_detect',
+        'retrigger_win',
+        'retriggerable',
+        'time_timescale',
+        'timestamp_enable',
+        'timestamp_timescale',
+        'trig_win',
+    )
+
     def __init__(self, task_handle, interpreter):
         self._handle = task_handle
         self._interpreter = interpreter
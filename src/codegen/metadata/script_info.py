@@ -12,6 +12,10 @@ script_info = {
             "relativeOutputPath": "_grpc_interpreter.py",
             "templateFile": "_grpc_interpreter.py.mako",
         },
+        {
+            "relativeOutputPath": "_grpc_aio_interpreter.py",
+            "templateFile": "_grpc_aio_interpreter.py.mako",
+        },
         {
             "relativeOutputPath": "task\\channels\\_channel.py",
             "templateFile": "task\\channels\\_channel.py.mako",
@@ -0,0 +1,187 @@
+<%
+    from codegen.utilities.interpreter_helpers import (
+        get_interpreter_functions,
+        get_interpreter_parameter_signature,
+        get_output_params,
+        get_params_for_function_signature,
+        get_response_parameters,
+        is_event_function,
+        GRPC_INTERPRETER_IGNORED_FUNCTIONS,
+        INCLUDE_SIZE_HINT_FUNCTIONS,
+    )
+    from codegen.utilities.function_helpers import order_function_parameters_by_optional
+    from codegen.utilities.text_wrappers import wrap
+
+    functions = get_interpreter_functions(data)
+%>\
+# Do not edit this file; it was automatically generated.
+
+from __future__ import annotations
+import logging
+import typing
+import warnings
+
+import grpc
+import numpy
+
+from . import errors as errors
+from nidaqmx._grpc_arrays import PackedArrayRequest, create_packed_array_methods
+from nidaqmx._error_strings import add_occurrence_count, warning_coalescer
+from nidaqmx._grpc_interpreter import (
+    _ERROR_STRINGS,
+    _UNABLE_TO_LOCATE_ERROR_RESOURCES_ERROR_MESSAGE,
+    _assign_numpy_array,
+    _validate_array_dtype,
+)
+from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+from nidaqmx._grpc_time import convert_time_to_timestamp, convert_timestamp_to_time
+
+_logger = logging.getLogger(__name__)
+
+
+class GrpcAioStubInterpreter:
+    '''Interpreter for interacting with a gRPC Stub class over a grpc.aio channel
+
+    Each function is a coroutine that takes the same parameters and returns the same values as
+    the corresponding GrpcStubInterpreter function, so concurrent calls on many tasks share the
+    thread of the asyncio event loop. The grpc_channel of the session options must be a
+    grpc.aio.Channel. Use GrpcEventDispatcher for events.
+    '''
+    # Do not add per-task state to the interpreter class.
+    __slots__ = [
+        '_grpc_options',
+        '_client',
+    ]
+
+    def __init__(self, grpc_options):
+        self._grpc_options = grpc_options
+        # The stub of a grpc.aio channel returns awaitables, like NiDAQmxAsyncStub describes.
+        self._client = typing.cast(
+            "nidaqmx_grpc.NiDAQmxAsyncStub", nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_channel))
+        # Transfer the arrays of reads and writes with NumPy instead of the protobuf containers.
+        for name, method in create_packed_array_methods(
+            grpc_options.grpc_channel, grpc_types.DESCRIPTOR.services_by_name['NiDAQmx'], grpc_types
+        ).items():
+            setattr(self._client, name, method)
+
+    async def _invoke(self, func, request, metadata=None, packed_arrays=None):
+        if packed_arrays is not None:
+            request = PackedArrayRequest(request, packed_arrays)
+        try:
+            response = await func(request, metadata=metadata)
+        except grpc.RpcError as rpc_error:
+            await self._handle_rpc_error(rpc_error)
+        return response
+
+    async def _handle_rpc_error(self, rpc_error):
+        error_message = rpc_error.details()
+        error_code = None
+        samps_per_chan_read = None
+        samps_per_chan_written = None
+        for key, value in rpc_error.trailing_metadata() or []:
+            if key == 'ni-error':
+                try:
+                    error_code = int(typing.cast(str, value))
+                except ValueError:
+                    error_message += f'\nError status: {value}'
+            elif key == "ni-samps-per-chan-read":
+                try:
+                    samps_per_chan_read = int(typing.cast(str, value))
+                except ValueError:
+                    error_message += f'\nSamples per channel read: {value}'
+            elif key == "ni-samps-per-chan-written":
+                try:
+                    samps_per_chan_written = int(typing.cast(str, value))
+                except ValueError:
+                    error_message += f'\nSamples per channel written: {value}'
+        grpc_error = rpc_error.code()
+        if grpc_error == grpc.StatusCode.UNAVAILABLE:
+            error_message = 'Failed to connect to server'
+        elif grpc_error == grpc.StatusCode.UNIMPLEMENTED:
+            error_message = (
+                'This operation is not supported by the NI gRPC Device Server being used. Upgrade NI gRPC Device Server.'
+            )
+        if error_code is None:
+            raise errors.RpcError(grpc_error, error_message) from None
+        else:
+            await self._raise_error(error_code, error_message, samps_per_chan_written, samps_per_chan_read)
+
+    async def _check_for_error_from_response(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
+        if error_code != 0:
+            # _raise_error gets the error strings of warnings, unless they are coalesced.
+            error_message = None
+            if error_code < 0:
+                error_message = await _ERROR_STRINGS.get_or_add_async(error_code, self.get_error_string)
+            await self._raise_error(error_code, error_message, samps_per_chan_written=samps_per_chan_written, samps_per_chan_read=samps_per_chan_read)
+
+    async def _raise_error(self, error_code, error_message, samps_per_chan_written=None, samps_per_chan_read=None):
+        if error_code < 0:
+            if samps_per_chan_read is not None:
+                raise errors.DaqReadError(error_message, error_code, samps_per_chan_read) from None
+            elif samps_per_chan_written is not None:
+                raise errors.DaqWriteError(error_message, error_code, samps_per_chan_written) from None
+            else:
+                raise errors.DaqError(error_message, error_code) from None
+        elif error_code > 0:
+            occurrence_count = warning_coalescer.coalesce(error_code)
+            if occurrence_count == 0:
+                return
+            if not error_message:
+                error_message = await _ERROR_STRINGS.get_or_add_async(error_code, self.get_error_string)
+            warnings.warn(
+                errors.DaqWarning(add_occurrence_count(error_message, occurrence_count), error_code))
+
+%for func in functions:
+<%
+    if func.function_name in GRPC_INTERPRETER_IGNORED_FUNCTIONS or is_event_function(func):
+        continue
+    params = get_params_for_function_signature(func)
+    sorted_params = order_function_parameters_by_optional(params)
+    parameter_signature = get_interpreter_parameter_signature(is_python_factory, sorted_params)
+    if func.function_name in INCLUDE_SIZE_HINT_FUNCTIONS:
+        parameter_signature = ", ".join([parameter_signature, "size_hint=0"])
+    output_parameters = get_output_params(func)
+%>\
+    %if (len(func.function_name) + len(parameter_signature)) > 68:
+    async def ${func.function_name}(
+            ${parameter_signature + '):' | wrap(12, 12)}
+    %else:
+    async def ${func.function_name}(${parameter_signature}):
+    %endif
+\
+<%include file="/grpc_interpreter/default_grpc_function_call.py.mako" args="function=func, is_async=True" />\
+    %if len(output_parameters)  > 0:
+        return ${get_response_parameters(func)}
+    %endif
+
+%endfor
+    def hash_task_handle(self, task_handle):
+        return hash(task_handle.name)
+
+    ## get_error_string has special error handling.
+    async def get_error_string(self, error_code):
+        try:
+            # Do not use self._invoke() because it may call back into self.get_error_string().
+            response = await self._client.GetErrorString(
+                grpc_types.GetErrorStringRequest(error_code=error_code))
+            if not response.error_string:
+                return _UNABLE_TO_LOCATE_ERROR_RESOURCES_ERROR_MESSAGE
+            return response.error_string
+        except grpc.RpcError:
+            _logger.exception('Failed to get error string for error code %d.', error_code)
+            return 'Failed to retrieve error description.'
+
+    ## DAQmxReadIDPinMemory returns the size if given a 0 for arraySize.
+    ## So, we read 1st time to get the size, then read 2nd time to get the data.
+    async def read_id_pin_memory(self, device_name, id_pin_name):
+        response = await self._invoke(
+            self._client.ReadIDPinMemory,
+            grpc_types.ReadIDPinMemoryRequest(device_name=device_name, id_pin_name=id_pin_name, array_size=0))
+        if response.status <= 0:
+            await self._check_for_error_from_response(response.status)
+        response = await self._invoke(
+            self._client.ReadIDPinMemory,
+            grpc_types.ReadIDPinMemoryRequest(device_name=device_name, id_pin_name=id_pin_name, array_size=response.status))
+        await self._check_for_error_from_response(response.status)
+        return list(response.data), response.data_length_read, response.format_code
@@ -19,10 +19,14 @@
 
 from __future__ import annotations
 import logging
+import queue
 import threading
+import contextvars
 import typing
 import warnings
-from nitypes.waveform import AnalogWaveform, DigitalWaveform
+import weakref
+from hightime import timedelta as ht_timedelta
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, Timing
 from typing import Any, Callable, Generic, Sequence, TypeVar
 
 import google.protobuf.message
@@ -31,12 +35,21 @@ import grpc
 import numpy
 
 from . import errors as errors
-from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter
+from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter, BaseReadStream
+from nidaqmx._error_strings import ErrorStringCache, add_occurrence_count, warning_coalescer
+from nidaqmx._grpc_arrays import (
+    ArrayResponseDecoder,
+    PackedArrayRequest,
+    create_packed_array_methods,
+)
+from nidaqmx._stubs import data_moniker_pb2 as data_moniker_types
+from nidaqmx._stubs import data_moniker_pb2_grpc as data_moniker_grpc
 from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
 from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
-from nidaqmx.constants import WaveformAttributeMode
+from nidaqmx.constants import FillMode, WaveformAttributeMode
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx._grpc_time import convert_time_to_timestamp, convert_timestamp_to_time
+from nidaqmx.utils import unflatten_channel_string
 
 _logger = logging.getLogger(__name__)
 
@@ -96,19 +109,169 @@ class GrpcEventHandler(BaseEventHandler, Generic[TEventResponse]):
             return
 
 
+class GrpcMonikerReadStream(BaseReadStream):
+    """Read data for a data moniker over a single DataMoniker.StreamReadWrite stream.
+
+    The server calls the read function that the moniker was created for once for each request
+    on the stream, so each read costs one message in each direction instead of a unary RPC.
+    Only one thread at a time may read from the stream.
+    """
+    __slots__ = [
+        "_interpreter",
+        "_requests",
+        "_responses",
+        "_decode_response",
+        "_convert_response",
+        "_end_requests",
+        "__weakref__",
+    ]
+
+    def __init__(
+        self,
+        interpreter: GrpcStubInterpreter,
+        moniker: data_moniker_types.Moniker,
+        decode_response: Callable[[bytes], Any],
+        convert_response: Callable[[Any, Any], tuple[Any, int]],
+    ) -> None:
+        requests: queue.SimpleQueue[data_moniker_types.MonikerWriteRequest | None] = (
+            queue.SimpleQueue()
+        )
+        requests.put(
+            data_moniker_types.MonikerWriteRequest(
+                monikers=data_moniker_types.MonikerList(read_monikers=[moniker])
+            )
+        )
+        self._interpreter = interpreter
+        self._requests = requests
+        self._responses = interpreter._moniker_client.StreamReadWrite(iter(requests.get, None))
+        self._decode_response = decode_response
+        self._convert_response = convert_response
+        # gRPC consumes the request iterator on its own thread, so end the iterator even if the
+        # stream is garbage collected without being closed.
+        self._end_requests = weakref.finalize(self, requests.put, None)
+
+    def read(self, read_array):
+        self._requests.put(_READ_NEXT_REQUEST)
+        try:
+            read_response = next(self._responses)
+        except grpc.RpcError as rpc_error:
+            self._interpreter._handle_rpc_error(rpc_error)
+        except StopIteration:
+            raise errors.RpcError(
+                grpc.StatusCode.ABORTED, "The data moniker stream ended unexpectedly."
+            ) from None
+        response = self._decode_response(read_response.data.values[0].value)
+        return self._convert_response(response, read_array)
+
+    def close(self) -> None:
+        self._end_requests()
+        self._responses.cancel()
+
+
+class GrpcCallBatch:
+    """Issue the attribute sets of a task as gRPC futures and report their errors in order.
+
+    The server may run concurrent calls in any order, and NI-DAQmx may coerce a value based on
+    the values set before it, so a channel attribute set waits for the pending sets whose channels
+    overlap its channels, and any other set waits for the previous set that is not a channel
+    attribute set.
+    """
+    __slots__ = [
+        "interpreter",
+        "task_name",
+        "previous",
+        "_futures",
+        "_latest_future",
+        "_channel_futures",
+        "depth",
+    ]
+
+    def __init__(
+        self, interpreter: GrpcStubInterpreter, task_name: str, previous: GrpcCallBatch | None
+    ) -> None:
+        self.interpreter = interpreter
+        self.task_name = task_name
+        self.previous = previous
+        self._futures: list[grpc.Future] = []
+        self._latest_future: grpc.Future | None = None
+        self._channel_futures: list[tuple[frozenset[str] | None, grpc.Future]] = []
+        self.depth = 0
+
+    def submit(self, func, request, metadata=None) -> None:
+        if 'channel' in request.DESCRIPTOR.fields_by_name:
+            channels = _get_batch_channels(request.channel)
+            pending = self._channel_futures
+            for pending_channels, previous in pending:
+                if channels is None or pending_channels is None or not channels.isdisjoint(
+                    pending_channels
+                ):
+                    # flush() reports the error, if any.
+                    previous.exception()
+            pending[:] = [entry for entry in pending if not entry[1].done()]
+            future = func.future(request, metadata=metadata)
+            pending.append((channels, future))
+        else:
+            if self._latest_future is not None:
+                # flush() reports the error, if any.
+                self._latest_future.exception()
+            future = func.future(request, metadata=metadata)
+            self._latest_future = future
+        self._futures.append(future)
+
+    def flush(self) -> None:
+        futures, self._futures = self._futures, []
+        self._latest_future = None
+        self._channel_futures.clear()
+        first_error = None
+        for future in futures:
+            rpc_error = future.exception()
+            if rpc_error is None:
+                continue
+            if first_error is None:
+                first_error = rpc_error
+            else:
+                _logger.warning(
+                    "Ignoring error from a batched call after an earlier error: %s", rpc_error)
+        if first_error is not None:
+            self.interpreter._handle_rpc_error(first_error)
+
+
+# The innermost configuration batch of the current thread or asyncio task. Each thread has its own
+# batch, so the batch of one thread does not defer or flush the calls of another thread.
+_current_batch: contextvars.ContextVar[GrpcCallBatch | None] = contextvars.ContextVar(
+    "_current_batch", default=None
+)
+
+
 class GrpcStubInterpreter(BaseInterpreter):
     '''Interpreter for interacting with a gRPC Stub class'''
     # Do not add per-task state to the interpreter class.
     __slots__ = [
         '_grpc_options',
         '_client',
+        '_moniker_client',
     ]
 
     def __init__(self, grpc_options):
         self._grpc_options = grpc_options
         self._client = nidaqmx_grpc.NiDAQmxStub(grpc_options.grpc_channel)
-
-    def _invoke(self, func, request, metadata=None):
+        # Transfer the arrays of reads and writes with NumPy instead of the protobuf containers.
+        for name, method in create_packed_array_methods(
+            grpc_options.grpc_channel, grpc_types.DESCRIPTOR.services_by_name['NiDAQmx'], grpc_types
+        ).items():
+            setattr(self._client, name, method)
+        self._moniker_client = data_moniker_grpc.DataMonikerStub(grpc_options.grpc_channel)
+
+    def _invoke(self, func, request, metadata=None, packed_arrays=None):
+        batch = self._get_batch()
+        if batch is not None:
+            if type(request) in _BATCHED_REQUEST_TYPES and request.task.name == batch.task_name:
+                # The set functions do not use the response.
+                batch.submit(func, request, metadata)
+                return None
+            batch.flush()
+        if packed_arrays is not None:
+            request = PackedArrayRequest(request, packed_arrays)
         try:
             response = func(request, metadata=metadata)
         except grpc.RpcError as rpc_error:
@@ -120,22 +283,23 @@ class GrpcStubInterpreter(BaseInterpreter):
         error_code = None
         samps_per_chan_read = None
         samps_per_chan_written = None
-        for entry in rpc_error.trailing_metadata() or []:
-            if entry.key == 'ni-error':
+        # grpc.aio returns the metadata as (key, value) tuples instead of _Metadatum objects.
+        for key, value in rpc_error.trailing_metadata() or []:
+            if key == 'ni-error':
                 try:
-                    error_code = int(typing.cast(str, entry.value))
+                    error_code = int(typing.cast(str, value))
                 except ValueError:
-                    error_message += f'\nError status: {entry.value}'
-            elif entry.key == "ni-samps-per-chan-read":
+                    error_message += f'\nError status: {value}'
+            elif key == "ni-samps-per-chan-read":
                 try:
-                    samps_per_chan_read = int(typing.cast(str, entry.value))
+                    samps_per_chan_read = int(typing.cast(str, value))
                 except ValueError:
-                    error_message += f'\nSamples per channel read: {entry.value}'
-            elif entry.key == "ni-samps-per-chan-written":
+                    error_message += f'\nSamples per channel read: {value}'
+            elif key == "ni-samps-per-chan-written":
                 try:
-                    samps_per_chan_written = int(typing.cast(str, entry.value))
+                    samps_per_chan_written = int(typing.cast(str, value))
                 except ValueError:
-                    error_message += f'\nSamples per channel written: {entry.value}'
+                    error_message += f'\nSamples per channel written: {value}'
         grpc_error = rpc_error.code()
         if grpc_error == grpc.StatusCode.UNAVAILABLE:
             error_message = 'Failed to connect to server'
@@ -150,10 +314,12 @@ class GrpcStubInterpreter(BaseInterpreter):
 
     def _check_for_error_from_response(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
         if error_code != 0:
-            # This is an optimization for the partial read operation.
-            error_message = _ERROR_MESSAGES.get(error_code, None)
-            if not error_message:
-                error_message = self.get_error_string(error_code)
+            # _raise_error gets the error strings of warnings, unless they are coalesced.
+            error_message = None
+            if error_code < 0:
+                # _ERROR_STRINGS starts with _ERROR_MESSAGES, which is an optimization for the
+                # partial read operation.
+                error_message = _ERROR_STRINGS.get_or_add(error_code, self.get_error_string)
             self._raise_error(error_code, error_message, samps_per_chan_written=samps_per_chan_written, samps_per_chan_read=samps_per_chan_read)
 
     def _raise_error(self, error_code, error_message, samps_per_chan_written=None, samps_per_chan_read=None):
@@ -165,9 +331,13 @@ class GrpcStubInterpreter(BaseInterpreter):
             else:
                 raise errors.DaqError(error_message, error_code) from None
         elif error_code > 0:
+            occurrence_count = warning_coalescer.coalesce(error_code)
+            if occurrence_count == 0:
+                return
             if not error_message:
-                error_message = self.get_error_string(error_code)
-            warnings.warn(errors.DaqWarning(error_message, error_code))
+                error_message = _ERROR_STRINGS.get_or_add(error_code, self.get_error_string)
+            warnings.warn(
+                errors.DaqWarning(add_occurrence_count(error_message, occurrence_count), error_code))
 
     def _check_for_event_registration_error(self, event_stream):
         try:
@@ -185,6 +355,18 @@ class GrpcStubInterpreter(BaseInterpreter):
         except grpc.RpcError as rpc_error:
             self._handle_rpc_error(rpc_error)
 
+    def _register_event(self, event_name, method_name, request, event_callback):
+        event_dispatcher = self._grpc_options.event_dispatcher
+        if event_dispatcher is None:
+            event_stream = self._invoke(getattr(self._client, method_name), request)
+            self._check_for_event_registration_error(event_stream)
+            return GrpcEventHandler(event_name, self, event_stream, event_callback)
+        self._flush_batch()
+        try:
+            return event_dispatcher._register(event_name, method_name, request, event_callback)
+        except grpc.RpcError as rpc_error:
+            self._handle_rpc_error(rpc_error)
+
 %for func in functions:
 <%
     if func.function_name in GRPC_INTERPRETER_IGNORED_FUNCTIONS:
@@ -212,6 +394,80 @@ class GrpcStubInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.name)
 
+    def create_trusted_buffer(self, array, dtype, flags):
+        """gRPC requests copy the array, so there is no raw pointer to pass."""
+        return array
+
+    ## Create the moniker once, then read over a single data moniker stream.
+    def begin_read_analog_f64_stream(
+            self, task, num_samps_per_chan, timeout, fill_mode, array_size_in_samps):
+        response = self._invoke(
+            self._client.BeginReadAnalogF64,
+            grpc_types.BeginReadAnalogF64Request(
+                task=task, num_samps_per_chan=num_samps_per_chan,
+                timeout=timeout, fill_mode_raw=fill_mode,
+                array_size_in_samps=array_size_in_samps))
+        self._check_for_error_from_response(response.status)
+        return GrpcMonikerReadStream(
+            self, response.moniker, _MONIKER_READ_ANALOG_F64_RESPONSE_DECODER,
+            self._convert_read_analog_f64_response)
+
+    def begin_batch(self, task):
+        batch = _current_batch.get()
+        if batch is None or batch.interpreter is not self or batch.task_name != task.name:
+            # The calls of the outer batch precede the calls of this batch.
+            if batch is not None:
+                batch.flush()
+            batch = GrpcCallBatch(self, task.name, batch)
+            _current_batch.set(batch)
+        batch.depth += 1
+
+    def end_batch(self, task):
+        batch = _current_batch.get()
+        assert batch is not None and batch.interpreter is self and batch.task_name == task.name
+        batch.depth -= 1
+        if batch.depth == 0:
+            _current_batch.set(batch.previous)
+            batch.flush()
+
+    def _get_batch(self):
+        """Returns the configuration batch of the current thread, if it uses this interpreter."""
+        batch = _current_batch.get()
+        return batch if batch is not None and batch.interpreter is self else None
+
+    def _flush_batch(self):
+        batch = self._get_batch()
+        if batch is not None:
+            batch.flush()
+
+    def get_chan_attributes(self, task, channels, attribute, value_type):
+        """Get a channel attribute of each of the channels with concurrent requests."""
+        self._flush_batch()
+        rpc_name, value_field = _GET_CHAN_ATTRIBUTE_RPCS[value_type]
+        func = getattr(self._client, rpc_name)
+        request_type = getattr(grpc_types, f"{rpc_name}Request")
+        futures = [
+            func.future(request_type(task=task, channel=channel, attribute_raw=attribute))
+            for channel in channels]
+        values = []
+        try:
+            for future in futures:
+                try:
+                    response = future.result()
+                except grpc.RpcError as rpc_error:
+                    self._handle_rpc_error(rpc_error)
+                values.append(getattr(response, value_field))
+        finally:
+            for future in futures:
+                future.cancel()
+        return values
+
+    def _convert_read_analog_f64_response(self, response, read_array):
+        _validate_array_dtype(read_array, numpy.float64)
+        _assign_numpy_array(read_array, response.read_array)
+        self._check_for_error_from_response(response.status, samps_per_chan_read=response.samps_per_chan_read)
+        return read_array, response.samps_per_chan_read
+
     ## get_error_string has special error handling.
     def get_error_string(self, error_code):
         try:
@@ -254,7 +510,27 @@ class GrpcStubInterpreter(BaseInterpreter):
         waveform: AnalogWaveform[numpy.float64],
         waveform_attribute_mode: WaveformAttributeMode
     ) -> int:
-        raise NotImplementedError
+        """Read an analog waveform with timing."""
+        waveform.sample_count = number_of_samples_per_channel
+        read_array = waveform.raw_data
+
+        response, timing = self._invoke_waveform_read(
+            self._client.ReadAnalogF64,
+            grpc_types.ReadAnalogF64Request(
+                task=task_handle, num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout, fill_mode_raw=FillMode.GROUP_BY_CHANNEL.value,
+                array_size_in_samps=read_array.size),
+            waveform_attribute_mode)
+        samples_read = response.samps_per_chan_read
+
+        _assign_numpy_array(read_array, response.read_array[:samples_read])
+        waveform.sample_count = samples_read
+
+        if timing is not None:
+            waveform.timing = timing
+
+        self._check_for_error_from_response(response.status, samps_per_chan_read=samples_read)
+        return samples_read
 
     def read_analog_waveforms(
         self,
@@ -264,7 +540,30 @@ class GrpcStubInterpreter(BaseInterpreter):
         waveforms: Sequence[AnalogWaveform[numpy.float64]],
         waveform_attribute_mode: WaveformAttributeMode
     ) -> int:
-        raise NotImplementedError
+        """Read a set of analog waveforms with timing. All of the waveforms must be the same size."""
+        channel_count = len(waveforms)
+        assert channel_count > 0
+
+        # GROUP_BY_SCAN_NUMBER places the samples of a short read at the start of the array.
+        response, timing = self._invoke_waveform_read(
+            self._client.ReadAnalogF64,
+            grpc_types.ReadAnalogF64Request(
+                task=task_handle, num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout, fill_mode_raw=FillMode.GROUP_BY_SCAN_NUMBER.value,
+                array_size_in_samps=channel_count * number_of_samples_per_channel),
+            waveform_attribute_mode)
+        samples_read = response.samps_per_chan_read
+        read_array = numpy.asarray(response.read_array)[:samples_read * channel_count]
+        read_array = read_array.reshape(samples_read, channel_count)
+
+        for i, waveform in enumerate(waveforms):
+            waveform.sample_count = samples_read
+            waveform.raw_data[:] = read_array[:, i]
+            if timing is not None:
+                waveform.timing = timing
+
+        self._check_for_error_from_response(response.status, samps_per_chan_read=samples_read)
+        return samples_read
 
     def read_digital_waveform(
         self,
@@ -274,7 +573,23 @@ class GrpcStubInterpreter(BaseInterpreter):
         waveform: DigitalWaveform[Any],
         waveform_attribute_mode: WaveformAttributeMode
     ) -> int:
-        raise NotImplementedError
+        """Read a digital waveform with timing."""
+        waveform.sample_count = number_of_samples_per_channel
+
+        response, timing = self._invoke_waveform_read(
+            self._client.ReadDigitalLines,
+            grpc_types.ReadDigitalLinesRequest(
+                task=task_handle, num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout, fill_mode_raw=FillMode.GROUP_BY_SCAN_NUMBER.value,
+                array_size_in_bytes=waveform.data.size),
+            waveform_attribute_mode)
+        samples_read = response.samps_per_chan_read
+
+        self._assign_digital_waveforms(
+            [waveform], _get_digital_read_samples(response, 1), timing)
+
+        self._check_for_error_from_response(response.status, samps_per_chan_read=samples_read)
+        return samples_read
 
     def read_digital_waveforms(
         self,
@@ -286,7 +601,25 @@ class GrpcStubInterpreter(BaseInterpreter):
         waveforms: Sequence[DigitalWaveform[Any]],
         waveform_attribute_mode: WaveformAttributeMode,
     ) -> int:
-        raise NotImplementedError
+        """Read a set of digital waveforms with timing."""
+        for waveform in waveforms:
+            waveform.sample_count = number_of_samples_per_channel
+
+        response, timing = self._invoke_waveform_read(
+            self._client.ReadDigitalLines,
+            grpc_types.ReadDigitalLinesRequest(
+                task=task_handle, num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout, fill_mode_raw=FillMode.GROUP_BY_SCAN_NUMBER.value,
+                array_size_in_bytes=(
+                    number_of_samples_per_channel * channel_count * number_of_signals_per_sample)),
+            waveform_attribute_mode)
+        samples_read = response.samps_per_chan_read
+
+        self._assign_digital_waveforms(
+            waveforms, _get_digital_read_samples(response, channel_count), timing)
+
+        self._check_for_error_from_response(response.status, samps_per_chan_read=samples_read)
+        return samples_read
 
     def read_new_digital_waveforms(
         self,
@@ -297,7 +630,87 @@ class GrpcStubInterpreter(BaseInterpreter):
         timeout: float,
         waveform_attribute_mode: WaveformAttributeMode,
     ) -> Sequence[DigitalWaveform[numpy.uint8]]:
-        raise NotImplementedError
+        """Read a set of digital waveforms with timing.
+
+        ReadDigitalLines does not return the number of lines in each channel, so each waveform
+        has a signal for each of the number_of_signals_per_sample lines of a sample.
+        """
+        response, timing = self._invoke_waveform_read(
+            self._client.ReadDigitalLines,
+            grpc_types.ReadDigitalLinesRequest(
+                task=task_handle, num_samps_per_chan=number_of_samples_per_channel,
+                timeout=timeout, fill_mode_raw=FillMode.GROUP_BY_SCAN_NUMBER.value,
+                array_size_in_bytes=(
+                    number_of_samples_per_channel * channel_count * number_of_signals_per_sample)),
+            waveform_attribute_mode)
+        samples_read = response.samps_per_chan_read
+
+        # The samples share memory with the response, which is read-only.
+        read_array = _get_digital_read_samples(response, channel_count).copy()
+        waveforms = []
+        for i in range(channel_count):
+            waveform = DigitalWaveform(
+                sample_count=samples_read,
+                data=read_array[:, i, :],
+                timing=timing)
+            waveforms.append(waveform)
+
+        self._check_for_error_from_response(response.status, samps_per_chan_read=samples_read)
+        return waveforms
+
+    def _invoke_waveform_read(self, func, request, waveform_attribute_mode):
+        """Invoke a read and return its response and the timing of its samples.
+
+        The timing is None unless waveform_attribute_mode includes TIMING. The sample clock rate
+        does not depend on the read, so it is requested as a future alongside the read instead of
+        in another round trip.
+
+        The NI gRPC Device Server does not return the time of the first sample of a read, so the
+        timing has a sample interval but no timestamp.
+        """
+        if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
+            raise NotImplementedError(
+                'Reading waveforms with extended properties is not supported over gRPC. Set '
+                'waveform_attribute_mode to exclude WaveformAttributeMode.EXTENDED_PROPERTIES.')
+        if WaveformAttributeMode.TIMING not in waveform_attribute_mode:
+            return self._invoke(func, request), None
+        self._flush_batch()
+        rate_future = self._client.GetTimingAttributeDouble.future(
+            grpc_types.GetTimingAttributeDoubleRequest(
+                task=request.task, attribute=grpc_types.TIMING_ATTRIBUTE_SAMP_CLK_RATE))
+        try:
+            response = self._invoke(func, request)
+        except BaseException:
+            rate_future.cancel()
+            raise
+        return response, self._get_waveform_timing(rate_future)
+
+    def _get_waveform_timing(self, rate_future):
+        try:
+            rate_response = rate_future.result()
+        except grpc.RpcError as rpc_error:
+            try:
+                self._handle_rpc_error(rpc_error)
+            except errors.DaqError:
+                # Tasks that do not use a sample clock do not have a sample clock rate.
+                pass
+        else:
+            if rate_response.status >= 0 and rate_response.value > 0:
+                return Timing.create_with_regular_interval(
+                    ht_timedelta(seconds=1 / rate_response.value))
+        return Timing.empty
+
+    def _assign_digital_waveforms(self, waveforms, read_array, timing):
+        samples_read, _, signals_per_sample = read_array.shape
+        for i, waveform in enumerate(waveforms):
+            waveform.sample_count = samples_read
+            if samples_read > 0:
+                signal_count = waveform.signal_count
+                if signal_count > signals_per_sample:
+                    raise ValueError(f"waveforms[{i}].data has {signal_count} signals, but expected {signals_per_sample}")
+                waveform.data[:] = read_array[:, i, :signal_count]
+            if timing is not None:
+                waveform.timing = timing
 
     def write_analog_waveform(
         self,
@@ -306,7 +719,15 @@ class GrpcStubInterpreter(BaseInterpreter):
         auto_start: bool,
         timeout: float
     ) -> int:
-        raise NotImplementedError
+        """Write an analog waveform."""
+        return self.write_analog_f64(
+            task_handle,
+            waveform.sample_count,
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            waveform.scaled_data,
+        )
 
     def write_analog_waveforms(
         self,
@@ -315,7 +736,29 @@ class GrpcStubInterpreter(BaseInterpreter):
         auto_start: bool,
         timeout: float
     ) -> int:
-        raise NotImplementedError
+        """Write analog waveforms."""
+        assert len(waveforms) > 0
+        num_samps_per_chan = waveforms[0].sample_count
+
+        for waveform in waveforms:
+            if waveform.sample_count != num_samps_per_chan:
+                raise errors.DaqError(
+                    "The waveforms must all have the same sample count.",
+                    DAQmxErrors.UNKNOWN
+                )
+
+        write_array = numpy.empty((len(waveforms), num_samps_per_chan), dtype=numpy.float64)
+        for i, waveform in enumerate(waveforms):
+            write_array[i] = waveform.scaled_data
+
+        return self.write_analog_f64(
+            task_handle,
+            num_samps_per_chan,
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
+        )
 
     def write_digital_waveform(
         self,
@@ -324,30 +767,75 @@ class GrpcStubInterpreter(BaseInterpreter):
         auto_start: bool,
         timeout: float,
     ) -> int:
-        raise NotImplementedError
+        """Write a digital waveform."""
+        return self._write_digital_lines_bytes(
+            task_handle,
+            waveform.sample_count,
+            auto_start,
+            timeout,
+            _get_digital_write_array(waveform).tobytes(),
+        )
 
     def write_digital_waveforms(
         self,
         task_handle: object,
-        waveform: Sequence[DigitalWaveform[Any]],
+        waveforms: Sequence[DigitalWaveform[Any]],
         auto_start: bool,
         timeout: float,
     ) -> int:
-        raise NotImplementedError
+        """Write digital waveforms."""
+        channel_count = len(waveforms)
+        assert channel_count > 0
+        sample_count = waveforms[0].sample_count
+
+        for waveform in waveforms:
+            if waveform.sample_count != sample_count:
+                raise errors.DaqError(
+                    "The waveforms must all have the same sample count.",
+                    DAQmxErrors.UNKNOWN
+                )
+
+        # WriteDigitalLines takes the same number of lines from each channel, so pad the
+        # channels with fewer lines.
+        write_array = numpy.zeros(
+            (channel_count, sample_count, max(wf.signal_count for wf in waveforms)),
+            dtype=numpy.uint8,
+        )
+        for i, waveform in enumerate(waveforms):
+            write_array[i, :, :waveform.signal_count] = _get_digital_write_array(waveform)
+
+        return self._write_digital_lines_bytes(
+            task_handle, sample_count, auto_start, timeout, write_array.tobytes())
+
+    def _write_digital_lines_bytes(self, task, num_samps_per_chan, auto_start, timeout, write_array):
+        # The bytes of a uint8 array of line states are the same as the bytes of a bool array.
+        response = self._invoke(
+            self._client.WriteDigitalLines,
+            grpc_types.WriteDigitalLinesRequest(
+                task=task, num_samps_per_chan=num_samps_per_chan,
+                auto_start=auto_start, timeout=timeout,
+                data_layout_raw=FillMode.GROUP_BY_CHANNEL.value,
+                write_array=write_array))
+        return response.samps_per_chan_written
 
 def _assign_numpy_array(numpy_array, grpc_array):
     """
     Assigns grpc array to numpy array maintaining the original shape.
 
     Checks for the instance of grpc_array with bytes, if validated to True,
-    the numpy array is assigned to a 1D array of the grpc arrray.
+    the bytes are interpreted as elements of the numpy array's dtype.
     """
-    grpc_array_size = len(grpc_array)
     if isinstance(grpc_array, bytes):
-        assert numpy_array.nbytes >= grpc_array_size
-        numpy_array.flat[:grpc_array_size] = numpy.frombuffer(grpc_array, dtype=numpy_array.dtype)
+        assert numpy_array.nbytes >= len(grpc_array)
+        grpc_array = numpy.frombuffer(
+            grpc_array, dtype=numpy_array.dtype, count=len(grpc_array) // numpy_array.itemsize)
+    grpc_array_size = len(grpc_array)
+    assert numpy_array.size >= grpc_array_size
+    if isinstance(grpc_array, numpy.ndarray) and numpy_array.flags.c_contiguous:
+        # Arrays decoded from bytes or by ArrayResponseDecoder are copied without iterating in
+        # Python.
+        numpy_array.reshape(-1)[:grpc_array_size] = grpc_array
     else:
-        assert numpy_array.size >= grpc_array_size
         numpy_array.flat[:grpc_array_size] = grpc_array
 
 def _validate_array_dtype(numpy_array, expected_numpy_array_dtype):
@@ -355,6 +843,25 @@ def _validate_array_dtype(numpy_array, expected_numpy_array_dtype):
     if expected_numpy_array_dtype != numpy.generic and numpy_array.dtype != expected_numpy_array_dtype:
         raise TypeError(f"array must have data type {expected_numpy_array_dtype}")
 
+def _get_digital_read_samples(response, channel_count):
+    """Returns the samples of a GROUP_BY_SCAN_NUMBER ReadDigitalLines response.
+
+    The array has the shape (samples, channels, lines) and shares memory with the response.
+    """
+    samples_read = response.samps_per_chan_read
+    num_bytes_per_samp = response.num_bytes_per_samp
+    return numpy.frombuffer(
+        response.read_array, dtype=numpy.uint8,
+        count=samples_read * channel_count * num_bytes_per_samp,
+    ).reshape(samples_read, channel_count, num_bytes_per_samp)
+
+def _get_digital_write_array(waveform):
+    """Returns the line states of a digital waveform as uint8 values."""
+    data = waveform.data
+    if data.dtype != numpy.uint8:
+        data = data.view(numpy.uint8)
+    return data
+
 def _is_cancelled(ex: Exception) -> bool:
     """Returns True if the given exception is a cancelled RPC exception."""
     return (
@@ -362,6 +869,44 @@ def _is_cancelled(ex: Exception) -> bool:
         or (isinstance(ex, errors.RpcError) and ex.rpc_code == grpc.StatusCode.CANCELLED)
     )
 
+def _get_batch_channels(channel):
+    """Returns the channel names in a channel string, or None if it may refer to any channel.
+
+    An empty string refers to every channel in the task. DAQmx channel names are not case
+    sensitive, so the names are lowercase.
+    """
+    try:
+        channels = frozenset(name.lower() for name in unflatten_channel_string(channel))
+    except errors.DaqError:
+        return None
+    return channels or None
+
+# The request types of the task attribute set functions, which GrpcCallBatch issues as futures.
+_BATCHED_REQUEST_TYPES = frozenset(
+    getattr(grpc_types, method.input_type.name)
+    for method in grpc_types.DESCRIPTOR.services_by_name['NiDAQmx'].methods
+    if method.name.startswith('Set') and 'Attribute' in method.name
+    and 'task' in method.input_type.fields_by_name
+)
+
+# The RPC and the response field that GrpcStubInterpreter.get_chan_attributes uses, by value type.
+_GET_CHAN_ATTRIBUTE_RPCS = {
+    'bool': ('GetChanAttributeBool', 'value'),
+    'double': ('GetChanAttributeDouble', 'value'),
+    'int32': ('GetChanAttributeInt32', 'value_raw'),
+    'string': ('GetChanAttributeString', 'value'),
+    'uint32': ('GetChanAttributeUInt32', 'value'),
+}
+
+_MONIKER_READ_ANALOG_F64_RESPONSE_DECODER = ArrayResponseDecoder(
+    grpc_types.MonikerReadAnalogF64Response)
+
+# Each request on a data moniker stream makes the server call the read functions once.
+_READ_NEXT_REQUEST = data_moniker_types.MonikerWriteRequest(data=data_moniker_types.MonikerValues())
+
 _ERROR_MESSAGES = {
     DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE: 'Some or all of the samples requested have not yet been acquired.\n\nTo wait for the samples to become available use a longer read timeout or read later in your program. To make the samples available sooner, increase the sample rate. If your task uses a start trigger, make sure that your start trigger is configured correctly. It is also possible that you configured the task for external timing, and no clock was supplied. If this is the case, supply an external clock.'
 }
+
+# The error strings that the gRPC interpreters have retrieved from the server.
+_ERROR_STRINGS = ErrorStringCache(initial=_ERROR_MESSAGES)
@@ -3,8 +3,10 @@
     from codegen.utilities.interpreter_helpers import (
         get_c_function_call_template,
         get_instantiation_lines_for_output,
+        get_argument_types,
         get_interpreter_functions,
         get_interpreter_parameter_signature,
+        get_library_interpreter_prebound_functions,
         get_params_for_function_signature,
         get_return_values,
         is_event_register_function,
@@ -14,24 +16,28 @@
     from codegen.utilities.text_wrappers import wrap, docstring_wrap
 
     functions = get_interpreter_functions(data)
+    prebound_functions = get_library_interpreter_prebound_functions(functions)
 %>\
 # Do not edit this file; it was automatically generated.
 
 from __future__ import annotations
 import ctypes
+import functools
+import itertools
 import logging
 import numpy
 import platform
+import threading
 import warnings
-import sys
 from enum import Enum
 from datetime import timezone
 from hightime import datetime as ht_datetime
 from hightime import timedelta as ht_timedelta
-from typing import Any, Callable, List, Sequence, Tuple, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
 
-from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter
-from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32, wrapped_ndpointer, TaskHandle
+from nidaqmx._base_interpreter import BaseEventHandler, BaseInterpreter, BaseReadStream
+from nidaqmx._error_strings import ErrorStringCache, add_occurrence_count, warning_coalescer
+from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32, wrapped_ndpointer, DaqFunctionImporter, DaqLibImporter, TaskHandle, TrustedBuffer
 from nidaqmx.constants import FillMode, WaveformAttributeMode
 from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
 from nidaqmx.errors import DaqError, DaqFunctionNotSupportedError, DaqReadError, DaqWarning, DaqWriteError
@@ -39,18 +45,22 @@ from nidaqmx._lib_time import AbsoluteTime
 from nitypes.waveform.typing import ExtendedPropertyValue
 from nitypes.waveform import AnalogWaveform, DigitalWaveform, SampleIntervalMode, Timing, ExtendedPropertyDictionary
 
-if TYPE_CHECKING:
-    if sys.version_info >= (3, 10):
-        from typing import TypeAlias
-    else:
-        from typing_extensions import TypeAlias
-
 _logger = logging.getLogger(__name__)
 _was_runtime_environment_set = None
 
+# The error strings of warnings, which check_for_error would otherwise get on every call.
+_ERROR_STRINGS = ErrorStringCache()
+
 _INT64_WFM_SEC_PER_TICK = 100e-9
 _T0_EPOCH = ht_datetime(1, 1, 1, tzinfo=timezone.utc)
 
+
+@functools.lru_cache(maxsize=16)
+def _get_sample_interval(dt: int) -> ht_timedelta:
+    """Returns the sample interval for a dt in ticks. The dt rarely changes between reads."""
+    return ht_timedelta(seconds=dt * _INT64_WFM_SEC_PER_TICK)
+
+
 # typedef int32 (CVICALLBACK *DAQmxSetWfmAttrCallbackPtr)(uInt32 channelIndex, const char attributeName[], int32 attributeType, const void* value, uInt32 valueSizeInBytes, void *callbackData);  # noqa: W505 - doc line too long
 CSetWfmAttrCallbackPtr = ctypes.CFUNCTYPE(
     ctypes.c_int32,  # return value (error code)
@@ -68,7 +78,70 @@ class WfmAttrType(Enum):
     INT32 = 3
     STRING = 4
 
-SetWfmAttrCallback: TypeAlias = Callable[[int, str, WfmAttrType, ExtendedPropertyValue, object], int]
+
+def _get_wfm_attr_bool32(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    assert value_size_in_bytes == 4
+    return ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0] != 0
+
+
+def _get_wfm_attr_float64(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    assert value_size_in_bytes == 8
+    return float(ctypes.cast(value, ctypes.POINTER(ctypes.c_double))[0])
+
+
+def _get_wfm_attr_int32(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    assert value_size_in_bytes == 4
+    return int(ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0])
+
+
+def _get_wfm_attr_string(value: int, value_size_in_bytes: int) -> ExtendedPropertyValue:
+    value_bytes = ctypes.string_at(value, value_size_in_bytes)
+    assert value_bytes[-1] == 0
+    return value_bytes[:-1].decode(lib_importer.encoding)
+
+
+_WFM_ATTR_VALUE_GETTERS: Dict[int, Callable[[int, int], ExtendedPropertyValue]] = {
+    WfmAttrType.BOOL32.value: _get_wfm_attr_bool32,
+    WfmAttrType.FLOAT64.value: _get_wfm_attr_float64,
+    WfmAttrType.INT32.value: _get_wfm_attr_int32,
+    WfmAttrType.STRING.value: _get_wfm_attr_string,
+}
+
+# NI-DAQmx calls the set waveform attribute callback once per attribute per channel, so all
+# waveform reads share one callback function pointer instead of creating a closure and a CFUNCTYPE
+# thunk per read. Each read registers its extended property dictionaries and passes the
+# registration key as the callback data.
+_wfm_attr_properties: Dict[int, Sequence[ExtendedPropertyDictionary]] = {}
+_wfm_attr_keys = itertools.count(1)
+# The driver reports the same few attribute names on every read, so decode each one only once.
+_wfm_attr_names: Dict[bytes, str] = {}
+
+
+def _invoke_set_wfm_attr_callback(
+    channel_index: int,
+    attribute_name: bytes,
+    attribute_type: int,
+    value: int,
+    value_size_in_bytes: int,
+    callback_data: int,
+) -> int:
+    try:
+        name = _wfm_attr_names.get(attribute_name)
+        if name is None:
+            name = _wfm_attr_names[attribute_name] = attribute_name.decode(lib_importer.encoding)
+        get_value = _WFM_ATTR_VALUE_GETTERS.get(attribute_type)
+        if get_value is None:
+            raise ValueError(f"Unsupported attribute type {attribute_type}")
+        properties = _wfm_attr_properties[callback_data]
+        properties[channel_index][name] = get_value(value, value_size_in_bytes)
+        return 0
+    except Exception:
+        _logger.exception("Unhandled exception in set_wfm_attr_callback")
+        return -1
+
+
+_SET_WFM_ATTR_CALLBACK_PTR = CSetWfmAttrCallbackPtr(_invoke_set_wfm_attr_callback)
+_NULL_SET_WFM_ATTR_CALLBACK_PTR = CSetWfmAttrCallbackPtr()
 
 class LibraryEventHandler(BaseEventHandler):
     """Manage the lifetime of a ctypes callback method pointer.
@@ -85,6 +158,104 @@ class LibraryEventHandler(BaseEventHandler):
         self._callback_method_ptr = None
 
 
+class LibraryReadStream(BaseReadStream):
+    """Call a read function with the parameters that the stream was created with.
+
+    Reads from a local session do not have any per-read request setup to avoid, so each read calls
+    the read function directly.
+    """
+    __slots__ = ["_read_function", "_task_handle", "_num_samps_per_chan", "_timeout", "_fill_mode"]
+
+    def __init__(
+        self,
+        read_function: Callable[..., Tuple[Any, int]],
+        task_handle: object,
+        num_samps_per_chan: int,
+        timeout: float,
+        fill_mode: int,
+    ) -> None:
+        self._read_function = read_function
+        self._task_handle = task_handle
+        self._num_samps_per_chan = num_samps_per_chan
+        self._timeout = timeout
+        self._fill_mode = fill_mode
+
+    def read(self, read_array):
+        return self._read_function(
+            self._task_handle, self._num_samps_per_chan, self._timeout, self._fill_mode, read_array)
+
+    def close(self) -> None:
+        pass
+
+
+class _LibraryFunctionTable:
+    """
+    Table of C functions that are resolved and whose argtypes are set once per process.
+
+    Resolving a C function through lib_importer and checking its argtypes adds overhead to every
+    call, which matters for the interpreter methods that are called most often, such as reads and
+    writes. Those methods call the functions in this table directly instead.
+
+    The table is bound to the NI-DAQmx library the first time that one of its functions is
+    accessed, so errors such as DaqNotFoundError are still raised when a function is called.
+    """
+    __slots__ = (
+        "_is_bound",
+        "_lock",
+% for func in prebound_functions:
+        "DAQmx${func.c_function_name}",
+% endfor
+    )
+
+% for func in prebound_functions:
+    DAQmx${func.c_function_name}: Callable[..., int]
+% endfor
+
+    def __init__(self) -> None:
+        self._is_bound = False
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Callable[..., int]:
+        # Only called for functions that have not been bound yet.
+        if self._is_bound or not name.startswith("DAQmx"):
+            raise AttributeError(name)
+        self.bind(lib_importer)
+        return getattr(self, name)
+
+    def bind(self, importer: DaqLibImporter) -> None:
+        with self._lock:
+            if self._is_bound:
+                return
+% for func in prebound_functions:
+            self.DAQmx${func.c_function_name} = _bind_function(
+                importer.${'windll' if func.calling_convention == 'StdCall' else 'cdll'}, "DAQmx${func.c_function_name}", [
+                    ${', '.join(get_argument_types(func)) | wrap(20, 20)}])
+% endfor
+            self._is_bound = True
+
+
+def _bind_function(
+    library: DaqFunctionImporter, function_name: str, argtypes: List[Any]
+) -> Callable[..., int]:
+    try:
+        cfunc = getattr(library, function_name)
+    except DaqFunctionNotSupportedError as e:
+        # Preserve the existing behavior of raising this error when the function is called.
+        message = e.args[0]
+
+        def function_not_supported(*args: Any) -> int:
+            raise DaqFunctionNotSupportedError(message)
+
+        return function_not_supported
+
+    with cfunc.arglock:
+        cfunc.argtypes = argtypes
+    return cfunc
+
+
+_functions = _LibraryFunctionTable()
+
+
 class LibraryInterpreter(BaseInterpreter):
     """
     Library C<->Python interpreter.
@@ -313,21 +484,26 @@ class LibraryInterpreter(BaseInterpreter):
                         ctypes.POINTER(c_bool32),
                     ]
 
-        error_code = cfunc(
-            task_handle,
-            number_of_samples_per_channel,
-            timeout,
-            fill_mode,
-            t0_array,
-            dt_array,
-            0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
-            None,
-            read_array,
-            read_array.size,
-            ctypes.byref(samps_per_chan_read),
-            None,
-        )
+        callback_ptr, callback_data = self._register_wfm_attr_properties(properties)
+        try:
+            error_code = cfunc(
+                task_handle,
+                number_of_samples_per_channel,
+                timeout,
+                fill_mode,
+                t0_array,
+                dt_array,
+                0 if t0_array is None else t0_array.size,
+                callback_ptr,
+                callback_data,
+                read_array,
+                read_array.size,
+                ctypes.byref(samps_per_chan_read),
+                None,
+            )
+        finally:
+            if callback_data is not None:
+                del _wfm_attr_properties[callback_data]
 
         return error_code, samps_per_chan_read.value
 
@@ -376,83 +552,39 @@ class LibraryInterpreter(BaseInterpreter):
         for i, read_array in enumerate(read_arrays):
             read_array_ptrs[i] = read_array.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
 
-        error_code = cfunc(
-            task_handle,
-            num_samps_per_chan,
-            timeout,
-            t0_array,
-            dt_array,
-            0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
-            None,
-            read_array_ptrs,
-            channel_count,
-            array_size,
-            ctypes.byref(samps_per_chan_read),
-            None,
-        )
+        callback_ptr, callback_data = self._register_wfm_attr_properties(properties)
+        try:
+            error_code = cfunc(
+                task_handle,
+                num_samps_per_chan,
+                timeout,
+                t0_array,
+                dt_array,
+                0 if t0_array is None else t0_array.size,
+                callback_ptr,
+                callback_data,
+                read_array_ptrs,
+                channel_count,
+                array_size,
+                ctypes.byref(samps_per_chan_read),
+                None,
+            )
+        finally:
+            if callback_data is not None:
+                del _wfm_attr_properties[callback_data]
         self.check_for_error(error_code, samps_per_chan_read=samps_per_chan_read.value)
 
         return error_code, samps_per_chan_read.value
 
-    def _get_wfm_attr_callback(self, properties):
-        if properties is not None:
-            def set_wfm_attr_callback(
-                channel_index: int,
-                attribute_name: str,
-                attribute_type: WfmAttrType,
-                value: ExtendedPropertyValue,
-                callback_data: object,
-            ) -> int:
-                properties[channel_index][attribute_name] = value
-                return 0
-            return self._get_wfm_attr_callback_ptr(set_wfm_attr_callback)
-        else:
-            return CSetWfmAttrCallbackPtr()
-
-    def _get_wfm_attr_value(
-        self, attribute_type: int, value: ctypes.c_void_p, value_size_in_bytes: int
-    ) -> ExtendedPropertyValue:
-        if attribute_type == WfmAttrType.BOOL32.value:
-            assert value_size_in_bytes == 4
-            return ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0] != 0
-        elif attribute_type == WfmAttrType.FLOAT64.value:
-            assert value_size_in_bytes == 8
-            return float(ctypes.cast(value, ctypes.POINTER(ctypes.c_double))[0])
-        elif attribute_type == WfmAttrType.INT32.value:
-            assert value_size_in_bytes == 4
-            return int(ctypes.cast(value, ctypes.POINTER(ctypes.c_int32))[0])
-        elif attribute_type == WfmAttrType.STRING.value:
-            value_c_bytes = ctypes.cast(value, ctypes.POINTER(ctypes.c_byte))
-            assert value_c_bytes[value_size_in_bytes - 1] == 0
-            return bytes(value_c_bytes[0 : value_size_in_bytes - 1]).decode(lib_importer.encoding)
-        else:
-            raise ValueError(f"Unsupported attribute type {attribute_type}")
-
-    def _get_wfm_attr_callback_ptr(
-        self, set_wfm_attr_callback: SetWfmAttrCallback
-    ) -> ctypes._FuncPointer:
-        def _invoke_callback(
-            channel_index: int,
-            attribute_name: bytes,
-            attribute_type: int,
-            value: ctypes.c_void_p,
-            value_size_in_bytes: int,
-            callback_data: object,
-        ) -> int:
-            try:
-                return set_wfm_attr_callback(
-                    channel_index,
-                    attribute_name.decode(lib_importer.encoding),
-                    WfmAttrType(attribute_type),
-                    self._get_wfm_attr_value(attribute_type, value, value_size_in_bytes),
-                    callback_data,
-                )
-            except Exception:
-                _logger.exception("Unhandled exception in set_wfm_attr_callback")
-                return -1
-
-        return CSetWfmAttrCallbackPtr(_invoke_callback)
+    def _register_wfm_attr_properties(
+        self, properties: Sequence[ExtendedPropertyDictionary] | None
+    ) -> Tuple[ctypes._FuncPointer, int | None]:
+        """Returns the callback function pointer and callback data that fill in the properties."""
+        if properties is None:
+            return _NULL_SET_WFM_ATTR_CALLBACK_PTR, None
+        callback_data = next(_wfm_attr_keys)
+        _wfm_attr_properties[callback_data] = properties
+        return _SET_WFM_ATTR_CALLBACK_PTR, callback_data
 
     def _set_waveform_timings(
         self, 
@@ -460,12 +592,18 @@ class LibraryInterpreter(BaseInterpreter):
         t0_array: numpy.typing.NDArray[numpy.int64], 
         dt_array: numpy.typing.NDArray[numpy.int64]
     ) -> None:
-        for i, waveform in enumerate(waveforms):
-            waveform.timing = Timing(
-                sample_interval_mode=SampleIntervalMode.REGULAR,
-                timestamp=_T0_EPOCH + ht_timedelta(seconds=t0_array[i] * _INT64_WFM_SEC_PER_TICK),
-                sample_interval=ht_timedelta(seconds=dt_array[i] * _INT64_WFM_SEC_PER_TICK),
-            )
+        # Timing objects are immutable, so waveforms that have the same t0 and dt (usually all of
+        # the channels in a task) share one Timing object instead of creating one per channel.
+        timings: Dict[Tuple[int, int], Timing] = {}
+        for waveform, t0, dt in zip(waveforms, t0_array.tolist(), dt_array.tolist()):
+            timing = timings.get((t0, dt))
+            if timing is None:
+                timing = timings[(t0, dt)] = Timing(
+                    sample_interval_mode=SampleIntervalMode.REGULAR,
+                    timestamp=_T0_EPOCH + ht_timedelta(seconds=t0 * _INT64_WFM_SEC_PER_TICK),
+                    sample_interval=_get_sample_interval(dt),
+                )
+            waveform.timing = timing
 
     ## read_digital_waveform has special handling for waveform attributes and callbacks
     def read_digital_waveform(
@@ -672,24 +810,29 @@ class LibraryInterpreter(BaseInterpreter):
                         ctypes.POINTER(c_bool32),
                     ]
 
-        error_code = cfunc(
-            task_handle,
-            number_of_samples_per_channel,
-            timeout,
-            fill_mode,
-            t0_array,
-            dt_array,
-            0 if t0_array is None else t0_array.size,
-            self._get_wfm_attr_callback(properties),
-            None,
-            read_array,
-            read_array.size,
-            ctypes.byref(samps_per_chan_read),
-            ctypes.byref(num_bytes_per_samp),
-            bytes_per_chan_array,
-            0 if bytes_per_chan_array is None else bytes_per_chan_array.size,
-            None,
-        )
+        callback_ptr, callback_data = self._register_wfm_attr_properties(properties)
+        try:
+            error_code = cfunc(
+                task_handle,
+                number_of_samples_per_channel,
+                timeout,
+                fill_mode,
+                t0_array,
+                dt_array,
+                0 if t0_array is None else t0_array.size,
+                callback_ptr,
+                callback_data,
+                read_array,
+                read_array.size,
+                ctypes.byref(samps_per_chan_read),
+                ctypes.byref(num_bytes_per_samp),
+                bytes_per_chan_array,
+                0 if bytes_per_chan_array is None else bytes_per_chan_array.size,
+                None,
+            )
+        finally:
+            if callback_data is not None:
+                del _wfm_attr_properties[callback_data]
 
         return error_code, samps_per_chan_read.value
 
@@ -1054,6 +1197,24 @@ class LibraryInterpreter(BaseInterpreter):
     def hash_task_handle(self, task_handle):
         return hash(task_handle.value)
 
+    def create_trusted_buffer(self, array, dtype, flags):
+        """Verify a NumPy array once so that it can be passed as a raw pointer."""
+        return TrustedBuffer(array, dtype, flags)
+
+    def begin_read_analog_f64_stream(
+            self, task, num_samps_per_chan, timeout, fill_mode, array_size_in_samps):
+        return LibraryReadStream(self.read_analog_f64, task, num_samps_per_chan, timeout, fill_mode)
+
+    def begin_batch(self, task):
+        """NI-DAQmx calls are local, so there is no latency to hide by batching them."""
+
+    def end_batch(self, task):
+        pass
+
+    def get_chan_attributes(self, task, channels, attribute, value_type):
+        get_chan_attribute = getattr(self, f"get_chan_attribute_{value_type}")
+        return [get_chan_attribute(task, channel, attribute) for channel in channels]
+
     def check_for_error(self, error_code, samps_per_chan_written=None, samps_per_chan_read=None):
         if not error_code:
             return
@@ -1069,9 +1230,13 @@ class LibraryInterpreter(BaseInterpreter):
                 raise DaqError(extended_error_info, error_code)
 
         elif error_code > 0:
-            error_string = self.get_error_string(error_code)
+            occurrence_count = warning_coalescer.coalesce(error_code)
+            if occurrence_count == 0:
+                return
+
+            error_string = _ERROR_STRINGS.get_or_add(error_code, self.get_error_string)
 
-            warnings.warn(DaqWarning(error_string, error_code))
+            warnings.warn(DaqWarning(add_occurrence_count(error_string, occurrence_count), error_code))
 
 
 def is_string_buffer_too_small(error_code):
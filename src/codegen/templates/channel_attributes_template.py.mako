@@ -0,0 +1,12 @@
+<%def name="script_channel_attributes(attributes)">\
+<%
+        from codegen.utilities.attribute_helpers import get_generic_attribute_function_type
+    %>\
+    # The channel properties that get() and set() access for all channels in the collection.
+    _CHANNEL_ATTRIBUTES = {
+%for attribute in attributes:
+        '${attribute.name}':
+            _ChannelAttribute(${hex(attribute.id)}, '${get_generic_attribute_function_type(attribute)}', ${attribute.enum if attribute.is_enum else None}, ${attribute.access != "write"}, ${attribute.access != "read"}),
+%endfor
+    }
+</%def>
@@ -0,0 +1,17 @@
+<%def name="script_config_properties(attributes, base_class=None)">\
+<%
+        from codegen.utilities.attribute_helpers import get_config_attributes
+        config_attributes = get_config_attributes(attributes)
+    %>\
+    # The properties that Task.snapshot_config() captures, in the order that Task.apply_config()
+    # sets them.
+%if base_class:
+    _CONFIG_PROPERTIES = ${base_class}._CONFIG_PROPERTIES + (
+%else:
+    _CONFIG_PROPERTIES: tuple[str, ...] = (
+%endif
+%for attribute in config_attributes:
+        '${attribute.name}',
+%endfor
+    )
+</%def>
@@ -1,4 +1,4 @@
-<%page args="function"/>\
+<%page args="function, is_async=False"/>\
 <%
     from codegen.utilities.interpreter_helpers import (
         check_if_parameters_contain_read_array,
@@ -6,6 +6,7 @@
         get_compound_parameter,
         get_event_name,
         get_grpc_interpreter_call_params,
+        get_grpc_packed_arrays_argument,
         get_input_arguments_for_compound_params,
         get_numpy_array_params,
         get_output_params,
@@ -25,6 +26,10 @@
     compound_parameter = get_compound_parameter(function.base_parameters)
     grpc_interpreter_params = get_grpc_interpreter_call_params(function, sorted_params)
     is_read_method = check_if_parameters_contain_read_array(function.base_parameters)
+    invoke_argument = get_grpc_packed_arrays_argument(function, sorted_params)
+    if function.is_init_method:
+        invoke_argument = "metadata=metadata"
+    await_ = "await " if is_async else ""
 %>\
 %if compound_parameter is not None:
         ${compound_parameter.parameter_name} = []
@@ -41,20 +46,20 @@
         _validate_array_dtype(${parameter_name}, ${parameter_dtype})
     %endfor
 %endif
-        response = self._invoke(
+        response = ${await_}self._invoke(
             self._client.${snake_to_pascal(function.function_name)},
 %if (len(function.function_name) + len(grpc_interpreter_params)) > 68:
             grpc_types.${snake_to_pascal(function.function_name)}Request(
-    %if function.is_init_method:
+    %if invoke_argument:
                 ${grpc_interpreter_params | wrap(16, 16)}),
-            metadata=metadata)
+            ${invoke_argument})
     %else:
                 ${grpc_interpreter_params + ')' | wrap(16, 16)})
     %endif
 %else:
-    %if function.is_init_method:
+    %if invoke_argument:
             grpc_types.${snake_to_pascal(function.function_name)}Request(${grpc_interpreter_params + ')'},
-            metadata=metadata)
+            ${invoke_argument})
     %else:
             grpc_types.${snake_to_pascal(function.function_name)}Request(${grpc_interpreter_params + ')'})
     %endif
@@ -66,5 +71,5 @@
     %for param in get_read_array_parameters(function):
         _assign_numpy_array(${param}, response.${param})
     %endfor
-        self._check_for_error_from_response(response.status, samps_per_chan_read=response.${samps_per_chan_param})
+        ${await_}self._check_for_error_from_response(response.status, samps_per_chan_read=response.${samps_per_chan_param})
 %endif
@@ -34,17 +34,13 @@
         assert options == 0
         assert callback_function is not None
 
-        event_stream = self._invoke(
-            self._client.${snake_to_pascal(function.function_name)},
 %if (len(function.function_name) + len(grpc_interpreter_params)) > 68:
-            grpc_types.${snake_to_pascal(function.function_name)}Request(
-                ${grpc_interpreter_params + ')' | wrap(16)})
+        request = grpc_types.${snake_to_pascal(function.function_name)}Request(
+            ${grpc_interpreter_params + ')' | wrap(12)}
 %else:
-            grpc_types.${snake_to_pascal(function.function_name)}Request(${grpc_interpreter_params + ')'})
+        request = grpc_types.${snake_to_pascal(function.function_name)}Request(${grpc_interpreter_params})
 %endif
 
-        self._check_for_event_registration_error(event_stream)
-
         def invoke_callback(response):
             try:
                 callback_function(
@@ -55,9 +51,9 @@
                     callback_function,
                 )
 
-        return GrpcEventHandler(
+        return self._register_event(
             "${event_display_name}",
-            self,
-            event_stream,
+            "${snake_to_pascal(function.function_name)}",
+            request,
             invoke_callback,
         )
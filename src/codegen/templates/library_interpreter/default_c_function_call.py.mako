@@ -4,6 +4,7 @@
         generate_interpreter_function_call_args,
         get_argument_types,
         get_samps_per_chan_read_or_write_param,
+        is_library_interpreter_prebound_function,
     )
     from codegen.utilities.text_wrappers import wrap, docstring_wrap
 
@@ -13,12 +14,16 @@
     # or samps_per_chan_written=)
     samps_per_chan_param = get_samps_per_chan_read_or_write_param(function.base_parameters)
 %>\
+%if is_library_interpreter_prebound_function(function):
+        cfunc = _functions.DAQmx${function.c_function_name}
+%else:
         cfunc = lib_importer.${'windll' if function.calling_convention == 'StdCall' else 'cdll'}.DAQmx${function.c_function_name}
         if cfunc.argtypes is None:
             with cfunc.arglock:
                 if cfunc.argtypes is None:
                     cfunc.argtypes = [
                         ${', '.join(get_argument_types(function)) | wrap(24, 24)}]
+%endif
 
         error_code = cfunc(
             ${', '.join(function_call_args) | wrap(12, 12)})
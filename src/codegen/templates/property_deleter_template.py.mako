@@ -1,6 +1,6 @@
 <%def name="script_property_deleter(attribute)">\
 <%
-        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, has_attribute_with_filter
+        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, has_attribute_with_filter, invalidates_channel_caches
     %>\
     @${attribute.name}.deleter
     def ${attribute.name}(self):
@@ -35,4 +35,7 @@
     %else:
         self._interpreter.reset_${generic_attribute_func}(${', '.join(function_call_args)})
     %endif
+    %if invalidates_channel_caches(attribute):
+        self._task._invalidate_channel_caches()
+    %endif
 </%def>
\ No newline at end of file
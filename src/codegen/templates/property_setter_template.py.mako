@@ -1,6 +1,6 @@
 <%def name="script_property_setter(attribute)">\
 <%
-        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, get_generic_attribute_function_type, has_attribute_with_filter, ATTRIBUTE_WITH_FILE_PATH_TYPE
+        from codegen.utilities.attribute_helpers import get_generic_attribute_function_name, get_generic_attribute_function_type, has_attribute_with_filter, invalidates_channel_caches, ATTRIBUTE_WITH_FILE_PATH_TYPE
     %>\
     @${attribute.name}.setter
     %if attribute.name in ATTRIBUTE_WITH_FILE_PATH_TYPE:
@@ -62,4 +62,7 @@
     %else:
         self._interpreter.set_${generic_attribute_func}(${', '.join(function_call_args)})
     %endif
+    %if invalidates_channel_caches(attribute):
+        self._task._invalidate_channel_caches()
+    %endif
 </%def>
\ No newline at end of file
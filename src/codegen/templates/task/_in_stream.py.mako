@@ -17,7 +17,7 @@ from nidaqmx.task.channels import Channel
 from nidaqmx.utils import unflatten_channel_string
 from nidaqmx.constants import (
     ${', '.join([c for c in enums_used]) | wrap(4, 4)})
-from nidaqmx.constants import WaveformAttributeMode
+from nidaqmx.constants import ReadReturnType, WaveformAttributeMode
 
 class InStream:
     """
@@ -27,7 +27,7 @@ class InStream:
     used in conjunction with reader classes to read samples from an
     NI-DAQmx task.
     """
-    __slots__ = ('_task', '_handle', '_interpreter', '_timeout', '_waveform_attribute_mode')
+    __slots__ = ('_task', '_handle', '_interpreter', '_timeout', '_waveform_attribute_mode', '_read_return_type')
 
     def __init__(self, task, interpreter):
         self._task = task
@@ -35,6 +35,7 @@ class InStream:
         self._interpreter = interpreter
         self._timeout = 10.0
         self._waveform_attribute_mode = WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
+        self._read_return_type = ReadReturnType.LIST
 
         super().__init__()
 
@@ -366,4 +367,24 @@ ${deprecated_template.script_deprecated_property(attributes)}\
 
     @waveform_attribute_mode.deleter
     def waveform_attribute_mode(self):
-        self._waveform_attribute_mode = WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
\ No newline at end of file
+        self._waveform_attribute_mode = WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES
+
+    @property
+    def read_return_type(self):
+        """
+        :class:`nidaqmx.constants.ReadReturnType`: Specifies the type of
+            data that :meth:`nidaqmx.Task.read` returns when you do not
+            specify the **return_type** parameter. The default is
+            **ReadReturnType.LIST**. **ReadReturnType.NUMPY** returns the
+            NumPy array that the samples were read into, which avoids
+            converting every sample to a Python object.
+        """
+        return self._read_return_type
+
+    @read_return_type.setter
+    def read_return_type(self, val):
+        self._read_return_type = val
+
+    @read_return_type.deleter
+    def read_return_type(self):
+        self._read_return_type = ReadReturnType.LIST
\ No newline at end of file
@@ -33,6 +33,9 @@ class Timing:
     """
     __slots__ = ('_handle', '_interpreter', '_active_devs')
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes)}\
+
     def __init__(self, task_handle, interpreter, active_devs: str | Device | None = None):
         if isinstance(active_devs, Device):
             active_devs = active_devs.name
@@ -22,6 +22,9 @@ class AIChannel(Channel):
     """
     __slots__ = ()
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes, "Channel")}\
+
     def __repr__(self):
         return f'AIChannel(name={self._name})'
 
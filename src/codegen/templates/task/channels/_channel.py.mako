@@ -19,6 +19,9 @@ class Channel:
     """
     __slots__ = ['_handle', '_name', '_interpreter', '__weakref__']
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes)}\
+
     def __init__(self, task_handle, virtual_or_physical_name, interpreter):
         """
         Args:
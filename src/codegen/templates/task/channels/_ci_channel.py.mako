@@ -18,6 +18,9 @@ class CIChannel(Channel):
     """
     __slots__ = ()
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes, "Channel")}\
+
     def __repr__(self):
         return f'CIChannel(name={self._name})'
 
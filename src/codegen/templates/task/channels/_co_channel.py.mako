@@ -17,6 +17,9 @@ class COChannel(Channel):
     """
     __slots__ = ()
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes, "Channel")}\
+
     def __repr__(self):
         return f'COChannel(name={self._name})'
 
@@ -17,6 +17,9 @@ class DIChannel(Channel):
     """
     __slots__ = ()
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes, "Channel")}\
+
     def __repr__(self):
         return f'DIChannel(name={self._name})'
 
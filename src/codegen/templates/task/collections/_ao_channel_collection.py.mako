@@ -1,14 +1,16 @@
 <%
     from codegen.utilities.text_wrappers import wrap
     from codegen.utilities.function_helpers import get_functions,  get_enums_used
+    from codegen.utilities.attribute_helpers import get_collection_attributes, get_collection_attribute_enums
     functions = get_functions(data, "AOChannelCollection")
-    enums_used = get_enums_used(functions)
+    attributes = get_collection_attributes(data, "AOChannel")
+    enums_used = sorted(set(get_enums_used(functions)) | set(get_collection_attribute_enums(attributes)))
 %>\
 # Do not edit this file; it was automatically generated.
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._ao_channel import AOChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 %if enums_used:
 from nidaqmx.constants import (
@@ -20,11 +22,14 @@ class AOChannelCollection(ChannelCollection):
     """
     Contains the collection of analog output channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+<%namespace name="channel_attributes_template" file="/channel_attributes_template.py.mako"/>\
+${channel_attributes_template.script_channel_attributes(attributes)}
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.ao_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, physical_channel, name_to_assign_to_channel=''):
         """
@@ -61,6 +66,7 @@ class AOChannelCollection(ChannelCollection):
             else:
                 virtual_channel_name = physical_channel
 
+        self._notify_channels_changed()
         return AOChannel(self._handle, virtual_channel_name, self._interpreter)
 
 <%namespace name="function_template" file="/function_template.py.mako"/>\
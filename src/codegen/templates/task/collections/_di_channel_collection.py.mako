@@ -1,14 +1,16 @@
 <%
     from codegen.utilities.text_wrappers import wrap
     from codegen.utilities.function_helpers import get_functions,  get_enums_used
+    from codegen.utilities.attribute_helpers import get_collection_attributes, get_collection_attribute_enums
     functions = get_functions(data, "DIChannelCollection")
-    enums_used = get_enums_used(functions)
+    attributes = get_collection_attributes(data, "DIChannel")
+    enums_used = sorted(set(get_enums_used(functions)) | set(get_collection_attribute_enums(attributes)))
 %>\
 # Do not edit this file; it was automatically generated.
 
 from nidaqmx.errors import DaqFunctionNotSupportedError
 from nidaqmx.task.channels._di_channel import DIChannel
-from nidaqmx.task.collections._channel_collection import ChannelCollection
+from nidaqmx.task.collections._channel_collection import ChannelCollection, _ChannelAttribute
 from nidaqmx.utils import unflatten_channel_string
 %if enums_used:
 from nidaqmx.constants import (
@@ -20,11 +22,14 @@ class DIChannelCollection(ChannelCollection):
     """
     Contains the collection of digital input channels for a DAQmx Task.
     """
-    def __init__(self, task_handle, interpreter):
+<%namespace name="channel_attributes_template" file="/channel_attributes_template.py.mako"/>\
+${channel_attributes_template.script_channel_attributes(attributes)}
+
+    def __init__(self, task_handle, interpreter, task=None):
         """
         Do not construct this object directly; instead, construct a nidaqmx.Task and use the task.di_channels property.
         """
-        super().__init__(task_handle, interpreter)
+        super().__init__(task_handle, interpreter, task)
 
     def _create_chan(self, lines, line_grouping, name_to_assign_to_lines=''):
         """
@@ -73,6 +78,7 @@ class DIChannelCollection(ChannelCollection):
                 else:
                     virtual_channel_name = lines
 
+        self._notify_channels_changed()
         return DIChannel(self._handle, virtual_channel_name, self._interpreter)
 
 <%namespace name="function_template" file="/function_template.py.mako"/>\
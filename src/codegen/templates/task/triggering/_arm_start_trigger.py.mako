@@ -24,6 +24,9 @@ class ArmStartTrigger:
     """
     __slots__ = ('_handle', '_interpreter')
 
+<%namespace name="config_properties_template" file="/config_properties_template.py.mako"/>\
+${config_properties_template.script_config_properties(attributes)}\
+
     def __init__(self, task_handle, interpreter):
         self._handle = task_handle
         self._interpreter = interpreter
@@ -225,6 +225,23 @@ GENERIC_ATTRIBUTE_GROUP_NAME_MAP = {
 
 ATTRIBUTE_WITH_FILE_PATH_TYPE = ("logging_file_path",)
 
+# The interpreter value types of the channel attributes that ChannelCollection.get() and set()
+# access. The collections do not access lists, objects, or bitfields.
+COLLECTION_ATTRIBUTE_TYPES = ("bool", "double", "int32", "string", "uint32")
+
+# The interpreter value types of the attributes that Task.snapshot_config() captures.
+CONFIG_ATTRIBUTE_TYPES = COLLECTION_ATTRIBUTE_TYPES + ("uint64",)
+
+# Task.apply_config() sets the attributes with these suffixes before the other attributes of the
+# same object.
+CONFIG_SELECTOR_SUFFIXES = ("_type", "_mode", "_units")
+
+# Setting or resetting these attributes changes which channels the task reads or writes, so the
+# generated setters and deleters tell the task to discard metadata derived from its channels.
+ATTRIBUTES_INVALIDATING_CHANNEL_CACHES = {
+    "InStream": ("channels_to_read",),
+}
+
 
 def get_attributes(metadata, class_name):
     """Converts the scrapigen metadata into a list of attributes."""
@@ -291,6 +308,57 @@ def get_generic_attribute_function_type(attribute):
     return mapped_attribute_type
 
 
+def get_collection_attributes(metadata, channel_class_name):
+    """Gets the scalar channel attributes that a channel collection accesses for all channels."""
+    attributes = get_attributes(metadata, "Channel") + get_attributes(metadata, channel_class_name)
+    return sorted(
+        [
+            attribute
+            for attribute in attributes
+            if not attribute.is_list
+            and not attribute.is_object
+            and attribute.bitfield_enum is None
+            and get_generic_attribute_function_name(attribute) == "chan_attribute"
+            and get_generic_attribute_function_type(attribute) in COLLECTION_ATTRIBUTE_TYPES
+        ],
+        key=lambda x: x.name,
+    )
+
+
+def get_collection_attribute_enums(attributes):
+    """Gets the list of enums used by the channel attributes of a channel collection."""
+    return sorted({attribute.enum for attribute in attributes if attribute.is_enum})
+
+
+def get_config_attributes(attributes):
+    """Gets the attributes that Task.snapshot_config() captures, in the order to set them.
+
+    Attributes that select a type, mode, or units come first, because setting them can change
+    the valid values of the other attributes.
+    """
+    config_attributes = [
+        attribute
+        for attribute in attributes
+        if attribute.access == "read-write"
+        and not attribute.is_list
+        and not attribute.is_object
+        and attribute.bitfield_enum is None
+        and attribute.name not in ATTRIBUTE_WITH_FILE_PATH_TYPE
+        and get_generic_attribute_function_type(attribute) in CONFIG_ATTRIBUTE_TYPES
+    ]
+    return sorted(
+        config_attributes,
+        key=lambda x: (not x.name.endswith(CONFIG_SELECTOR_SUFFIXES), x.name),
+    )
+
+
+def invalidates_channel_caches(attribute):
+    """Checks if setting or resetting the attribute invalidates the task's channel caches."""
+    return attribute.name in ATTRIBUTES_INVALIDATING_CHANNEL_CACHES.get(
+        attribute.python_class_name, ()
+    )
+
+
 def has_attribute_with_filter(attribute, group_name, filter_name):
     """Checks if the given attribute in the group has the specified filter name in its lv_filter."""
     metadata = scrapigen_metadata.attributes
@@ -81,6 +81,15 @@ LIBRARY_INTERPRETER_IGNORED_FUNCTIONS = [
     "write_raw",
 ]
 
+# Task control functions that the library interpreter calls through its prebound function table,
+# in addition to the task read and write functions.
+LIBRARY_INTERPRETER_PREBOUND_FUNCTIONS = [
+    "is_task_done",
+    "start_task",
+    "stop_task",
+    "wait_until_task_done",
+]
+
 INCLUDE_SIZE_PARAMETER_IN_SIGNATURE_FUNCTIONS = [
     "get_analog_power_up_states_with_output_type",
 ]
@@ -359,8 +368,9 @@ def get_grpc_interpreter_call_params(func, params):
             else:
                 if is_write_bytes_param(param):
                     grpc_params.append(f"{name}={param.parameter_name}.tobytes()")
-                elif is_write_function:
-                    grpc_params.append(get_write_array_param(param))
+                elif is_write_function and is_numpy_array_datatype(param):
+                    # Packed arrays are passed to _invoke() separately.
+                    continue
                 else:
                     grpc_params.append(f"{name}={param.parameter_name}")
 
@@ -468,6 +478,31 @@ def get_c_function_call_template(func):
     return "/default_c_function_call.py.mako"
 
 
+def is_library_interpreter_prebound_function(func):
+    """Returns True if the library interpreter calls the c function through its function table.
+
+    Prebound functions are resolved and their argtypes are set once, instead of on every call.
+    """
+    if func.function_name in LIBRARY_INTERPRETER_IGNORED_FUNCTIONS:
+        return False
+    if not func.is_python_codegen_method:
+        return False
+    if get_c_function_call_template(func) != "/default_c_function_call.py.mako":
+        return False
+    if func.function_name in LIBRARY_INTERPRETER_PREBOUND_FUNCTIONS:
+        return True
+    return (
+        func.function_name.startswith(("read_", "write_"))
+        and len(func.base_parameters) > 0
+        and func.base_parameters[0].parameter_name == "task"
+    )
+
+
+def get_library_interpreter_prebound_functions(functions):
+    """Gets the functions that the library interpreter calls through its function table."""
+    return [func for func in functions if is_library_interpreter_prebound_function(func)]
+
+
 def get_grpc_function_call_template(func):
     """Gets the template to use for generating the logic of calling the grpc functions."""
     if func.stream_response:
@@ -725,8 +760,19 @@ def get_numpy_array_params(func):
     return numpy_params
 
 
-def get_write_array_param(param):
-    """Assigns the numpy array to a flattened numpy array."""
-    if is_numpy_array_datatype(param):
-        return f"{param.parameter_name}={param.parameter_name}.flat"
-    return f"{param.parameter_name}={param.parameter_name}"
+def get_grpc_packed_arrays_argument(func, params):
+    """Gets the packed_arrays argument that passes the numeric write arrays to _invoke()."""
+    if not is_custom_write_function(func):
+        return ""
+    compound_params = get_input_arguments_for_compound_params(func)
+    packed_arrays = [
+        f'"{param.parameter_name}": {param.parameter_name}'
+        for param in params
+        if param.include_in_proto
+        and param.parameter_name not in compound_params
+        and is_numpy_array_datatype(param)
+        and not is_write_bytes_param(param)
+    ]
+    if not packed_arrays:
+        return ""
+    return "packed_arrays={" + ", ".join(packed_arrays) + "}"
@@ -4,6 +4,7 @@ from nidaqmx.errors import (
     DaqError,
     DaqReadError,
     DaqResourceWarning,
+    DaqTaskGroupReadError,
     DaqWarning,
     DaqWriteError,
 )
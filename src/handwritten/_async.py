@@ -0,0 +1,42 @@
+"""Support for the asyncio counterparts of blocking NI-DAQmx methods."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+# NI-DAQmx reads, writes, and waits block in the driver until they complete or time out, so each
+# pending call occupies one worker thread. Calls beyond this limit wait for a free worker.
+_MAX_WORKERS = 8
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    executor = _executor
+    if executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_MAX_WORKERS, thread_name_prefix="nidaqmx-async"
+                )
+            executor = _executor
+    return executor
+
+
+async def run_blocking(function: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a blocking NI-DAQmx call on the NI-DAQmx executor and await its result.
+
+    Cancelling the awaiting coroutine does not interrupt the call. The call keeps its worker
+    thread until it completes or its timeout elapses.
+    """
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        return await loop.run_in_executor(_get_executor(), lambda: function(*args, **kwargs))
+    return await loop.run_in_executor(_get_executor(), function, *args)
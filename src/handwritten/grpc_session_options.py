@@ -7,6 +7,9 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import grpc
+    import grpc.aio
+
+    from nidaqmx.grpc_event_dispatcher import GrpcEventDispatcher
 
 
 # This constant specifies the gRPC package and service used by this API.
@@ -51,16 +54,18 @@ class GrpcSessionOptions:
 
     def __init__(
         self,
-        grpc_channel: grpc.Channel,
+        grpc_channel: grpc.Channel | grpc.aio.Channel,
         session_name: str,
         *,
         api_key=MEASUREMENTLINK_23Q1_NIDAQMX_PYTHON_API_KEY,
         initialization_behavior=SessionInitializationBehavior.AUTO,
+        event_dispatcher: GrpcEventDispatcher | None = None,
     ):
         """Initialize a new GrpcSessionOptions.
 
         Args:
             grpc_channel (grpc.Channel): Specifies the channel to the NI gRPC Device Server.
+                The asyncio interpreter requires a grpc.aio.Channel.
             session_name (str): User-specified name that identifies the driver session on the NI gRPC Device
                 Server. This is different from the resource name parameter many APIs take as a separate
                 parameter. Specifying a name makes it easy to share sessions across multiple gRPC clients.
@@ -70,8 +75,12 @@ class GrpcSessionOptions:
             initialization_behavior (enum): Specifies whether it is acceptable to initialize a new
                 session or attach to an existing one, or if only one of the behaviors is desired.
                 The driver session exists on the NI gRPC Device Server.
+            event_dispatcher (GrpcEventDispatcher): Specifies a dispatcher that reads the event
+                streams of the session on one shared thread. If None, each registered event
+                reads its event stream on its own thread.
         """  # noqa: W505 - doc line too long (108 > 100 characters) (auto-generated noqa)
         self.grpc_channel = grpc_channel
         self.session_name = session_name
         self.api_key = api_key
         self.initialization_behavior = initialization_behavior
+        self.event_dispatcher = event_dispatcher
@@ -11,6 +11,10 @@ from nidaqmx.stream_readers._analog_single_channel_reader import (
     AnalogSingleChannelReader,
 )
 from nidaqmx.stream_readers._analog_unscaled_reader import AnalogUnscaledReader
+from nidaqmx.stream_readers._continuous_reader import (
+    ContinuousReader,
+    ContinuousReaderBlock,
+)
 from nidaqmx.stream_readers._counter_reader import CounterReader
 from nidaqmx.stream_readers._digital_multi_channel_reader import (
     DigitalMultiChannelReader,
@@ -28,6 +32,8 @@ __all__ = [
     "AnalogSingleChannelReader",
     "AnalogMultiChannelReader",
     "AnalogUnscaledReader",
+    "ContinuousReader",
+    "ContinuousReaderBlock",
     "CounterReader",
     "DigitalSingleChannelReader",
     "DigitalMultiChannelReader",
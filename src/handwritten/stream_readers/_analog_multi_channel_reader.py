@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy
 from nitypes.waveform import AnalogWaveform
 
-from nidaqmx import DaqError
+from nidaqmx import DaqError, _async
 from nidaqmx._feature_toggles import WAVEFORM_SUPPORT, requires_feature
 from nidaqmx.constants import READ_ALL_AVAILABLE, FillMode, ReallocationPolicy
 from nidaqmx.error_codes import DAQmxErrors
@@ -89,18 +89,47 @@ class AnalogMultiChannelReader(ChannelReaderBase):
             number_of_samples_per_channel
         )
 
-        self._verify_array(data, number_of_samples_per_channel, True, True)
+        read_array = self._get_read_array(
+            data, numpy.float64, number_of_samples_per_channel, True, True
+        )
 
-        _, samps_per_chan_read = self._interpreter.read_analog_f64(
-            self._handle,
-            number_of_samples_per_channel,
-            timeout,
-            FillMode.GROUP_BY_CHANNEL.value,
-            data,
+        _, samps_per_chan_read = self._read_analog_f64(
+            read_array, number_of_samples_per_channel, timeout
         )
 
         return samps_per_chan_read
 
+    async def read_many_sample_async(
+        self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0
+    ):
+        """Reads one or more floating-point samples without blocking the asyncio event loop.
+
+        This method is the awaitable counterpart of the read_many_sample
+        method. It runs the read on a dedicated thread pool with a bounded
+        number of threads, so the event loop can run other coroutines
+        while NI-DAQmx waits for samples. Do not access the data until
+        this method returns.
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 2D NumPy
+                array of floating-point values to hold the samples
+                requested. See the read_many_sample method.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. See the read_many_sample
+                method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. See the
+                read_many_sample method.
+
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+        """
+        return await _async.run_blocking(
+            self.read_many_sample, data, number_of_samples_per_channel, timeout
+        )
+
     def read_one_sample(self, data, timeout=10):
         """Reads a single floating-point sample from one or more analog input channels in a task.
 
@@ -1,7 +1,24 @@
 from __future__ import annotations
 
+import numpy
+
 from nidaqmx import DaqError
+from nidaqmx.constants import DataJustification, FillMode
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import RpcError
+from nidaqmx.task.channels import AIChannel
+
+try:
+    import grpc
+except ImportError:
+    grpc = None  # type: ignore
+
+# The maximum number of arrays that a reader keeps verified at once. Continuous acquisitions
+# typically alternate between one or two arrays.
+_MAX_TRUSTED_BUFFERS = 8
+
+# The raw sample dtype of tasks whose raw samples cannot be read in place of unscaled samples.
+_NO_RAW_SAMPLES = numpy.dtype(numpy.void)
 
 
 class ChannelReaderBase:
@@ -20,6 +37,14 @@ class ChannelReaderBase:
         self._interpreter = task_in_stream._task._interpreter
 
         self._verify_array_shape = True
+        self._use_trusted_buffers = False
+        self._trusted_buffers = {}
+        self._use_data_moniker_stream = False
+        self._read_stream = None
+        self._read_stream_parameters = None
+        self._use_raw_samples = False
+        self._raw_sample_dtype = None
+        self._raw_array = None
 
     @property
     def verify_array_shape(self):
@@ -36,6 +61,251 @@ class ChannelReaderBase:
     def verify_array_shape(self, val):
         self._verify_array_shape = val
 
+    @property
+    def use_trusted_buffers(self):
+        """bool: Specifies whether to verify each NumPy array only once.
+
+        Defaults to False when this object is instantiated.
+
+        If you set this property to True, the read methods that accept
+        a preallocated NumPy array verify the shape, dtype, and flags
+        of the array the first time you pass it with a given number of
+        samples per channel. When you pass the same array again, the
+        read method passes it to NI-DAQmx as a raw pointer without
+        verifying it again, which reduces the overhead of reading into
+        the same arrays repeatedly.
+
+        Do not resize or reshape an array, or change the channels to
+        read, while this reader uses it.
+        """
+        return self._use_trusted_buffers
+
+    @use_trusted_buffers.setter
+    def use_trusted_buffers(self, val):
+        self._use_trusted_buffers = val
+        self._trusted_buffers.clear()
+
+    @property
+    def use_data_moniker_stream(self):
+        """bool: Specifies whether to read over a gRPC data moniker stream.
+
+        Defaults to False when this object is instantiated.
+
+        If you set this property to True, the read methods of analog
+        readers that accept a preallocated NumPy array set up a data
+        moniker on the NI gRPC Device Server the first time you read
+        with a given number of samples per channel, timeout, and array
+        size. Later reads with the same values pull samples over a
+        single bidirectional stream instead of sending a separate
+        request for each read, which reduces the latency of continuous
+        acquisitions from a remote device. Reading with different
+        values sets up a new data moniker.
+
+        Setting this property to False, or stopping or closing the
+        task, closes the stream. This property does not affect tasks
+        that do not use a gRPC session.
+        """
+        return self._use_data_moniker_stream
+
+    @use_data_moniker_stream.setter
+    def use_data_moniker_stream(self, val):
+        self._use_data_moniker_stream = val
+        self._close_read_stream()
+
+    @property
+    def use_raw_samples(self):
+        """bool: Specifies whether to read unscaled samples as raw samples over gRPC.
+
+        Defaults to False when this object is instantiated.
+
+        gRPC sessions transfer 16-bit unscaled samples as 32-bit
+        integers, but transfer raw samples as bytes. If you set this
+        property to True, the read_int16 method of an analog unscaled
+        reader reads raw samples and groups them by channel, which
+        halves the amount of data sent by the NI gRPC Device Server.
+        It only does so if the task uses one device, and the raw
+        samples of every channel are right-justified signed integers
+        with the same width as the samples to read. Otherwise, or if
+        the NI gRPC Device Server does not implement ReadRaw, it reads
+        unscaled samples as usual.
+
+        NI-DAQmx does not report whether raw samples are signed. Only
+        set this property to True for devices whose raw samples are
+        two's complement integers, such as most multifunction I/O
+        devices. This property does not affect tasks that do not use a
+        gRPC session.
+        """
+        return self._use_raw_samples
+
+    @use_raw_samples.setter
+    def use_raw_samples(self, val):
+        self._use_raw_samples = val
+        self._raw_sample_dtype = None
+        self._raw_array = None
+
+    def _on_task_stop(self):
+        self._close_read_stream()
+
+    def _close_read_stream(self):
+        """Close the data moniker stream, if the reader has one open."""
+        if self._read_stream is not None:
+            read_stream = self._read_stream
+            self._read_stream = None
+            self._read_stream_parameters = None
+            self._task._stop_listeners.discard(self)
+            read_stream.close()
+
+    def _read_analog_f64(self, read_array, number_of_samples_per_channel, timeout):
+        """Read analog samples, over a data moniker stream if the reader uses one.
+
+        Args:
+            read_array: Specifies the object returned by _get_read_array.
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to read.
+            timeout (float): Specifies the amount of time in seconds to
+                wait for samples to become available.
+        """
+        if not self._use_data_moniker_stream:
+            return self._interpreter.read_analog_f64(
+                self._handle,
+                number_of_samples_per_channel,
+                timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                read_array,
+            )
+
+        parameters = (number_of_samples_per_channel, timeout, read_array.size)
+        read_stream = self._read_stream
+        if read_stream is None or self._read_stream_parameters != parameters:
+            self._close_read_stream()
+            read_stream = self._read_stream = self._interpreter.begin_read_analog_f64_stream(
+                self._handle,
+                number_of_samples_per_channel,
+                timeout,
+                FillMode.GROUP_BY_CHANNEL.value,
+                read_array.size,
+            )
+            self._read_stream_parameters = parameters
+            # Close the stream when the task stops, so the server stops sending samples.
+            self._task._stop_listeners.add(self)
+        return read_stream.read(read_array)
+
+    def _read_binary(self, read_function, read_array, number_of_samples_per_channel, timeout):
+        """Read unscaled samples, as raw samples if the reader uses them.
+
+        If the "use_raw_samples" property is set to True and the raw
+        samples of the task have the same dtype as the read array, this
+        method reads raw samples, which NI-DAQmx interleaves by scan for
+        a single device, and groups them by channel. If the NI gRPC
+        Device Server does not implement ReadRaw, this method uses the
+        read function instead.
+
+        Args:
+            read_function: Specifies the interpreter method that reads
+                unscaled samples grouped by channel.
+            read_array: Specifies the object returned by _get_read_array.
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel to read.
+            timeout (float): Specifies the amount of time in seconds to
+                wait for samples to become available.
+        """
+        # Library sessions may pass a trusted buffer, which is not a NumPy array, so check for a
+        # gRPC session before looking at the array.
+        if (
+            self._use_raw_samples
+            and self._task._grpc_options is not None
+            and number_of_samples_per_channel > 0
+            and self._get_raw_sample_dtype() == read_array.dtype
+        ):
+            try:
+                return self._read_raw_by_channel(read_array, number_of_samples_per_channel, timeout)
+            except RpcError as e:
+                if grpc is None or e.rpc_code != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                self._raw_sample_dtype = _NO_RAW_SAMPLES
+
+        return read_function(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            read_array,
+        )
+
+    def _get_raw_sample_dtype(self):
+        """Get the dtype of a raw sample, which use_raw_samples assumes to be signed.
+
+        Returns _NO_RAW_SAMPLES if the task uses more than one device,
+        because NI-DAQmx returns the raw samples of each device in a
+        separate block, or if the raw samples are not right-justified.
+        """
+        if self._raw_sample_dtype is None:
+            self._raw_sample_dtype = _NO_RAW_SAMPLES
+            try:
+                if self._task.number_of_devices == 1:
+                    # Passing a blank string means all channels.
+                    justification = AIChannel(
+                        self._handle, "", self._interpreter
+                    ).ai_raw_samp_justification
+                    if justification == DataJustification.RIGHT:
+                        self._raw_sample_dtype = numpy.dtype(
+                            f"int{8 * self._in_stream.raw_data_width}"
+                        )
+            except DaqError:
+                # The channels have different justifications or are not analog input channels.
+                pass
+        return self._raw_sample_dtype
+
+    def _read_raw_by_channel(self, read_array, number_of_samples_per_channel, timeout):
+        """Read raw samples and group them by channel in the read array."""
+        number_of_channels = read_array.size // number_of_samples_per_channel
+        raw_shape = (number_of_samples_per_channel, number_of_channels)
+        raw_array = self._raw_array
+        if raw_array is None or raw_array.shape != raw_shape or raw_array.dtype != read_array.dtype:
+            raw_array = numpy.empty(raw_shape, dtype=read_array.dtype)
+            self._raw_array = raw_array
+        _, samps_per_chan_read, _ = self._interpreter.read_raw(
+            self._handle, number_of_samples_per_channel, timeout, raw_array
+        )
+        channel_arrays = read_array.reshape(number_of_channels, number_of_samples_per_channel)
+        channel_arrays[:, :samps_per_chan_read] = raw_array[:samps_per_chan_read].T
+        return read_array, samps_per_chan_read
+
+    def _get_read_array(
+        self, data, dtype, number_of_samples_per_channel, is_many_chan, is_many_samp
+    ):
+        """Verify a NumPy array and return the object to pass to the interpreter.
+
+        If the "use_trusted_buffers" property is set to True, this
+        method returns a trusted buffer for arrays that it already
+        verified.
+
+        Args:
+            data (numpy.ndarray): Specifies the NumPy array to verify.
+            dtype: Specifies the dtype that the read method requires.
+            number_of_samples_per_channel (int): Specifies the number of
+                samples per channel requested.
+            is_many_chan (bool): Specifies if the read method is a many
+                channel version.
+            is_many_samp (bool): Specifies if the read method is a many
+                samples version.
+        """
+        if not self._use_trusted_buffers:
+            self._verify_array(data, number_of_samples_per_channel, is_many_chan, is_many_samp)
+            return data
+
+        entry = self._trusted_buffers.get(id(data))
+        if entry is not None and entry[0] is data and entry[1] == number_of_samples_per_channel:
+            return entry[2]
+
+        self._verify_array(data, number_of_samples_per_channel, is_many_chan, is_many_samp)
+        trusted_buffer = self._interpreter.create_trusted_buffer(data, dtype, ("C", "W"))
+
+        if len(self._trusted_buffers) >= _MAX_TRUSTED_BUFFERS:
+            self._trusted_buffers.clear()
+        self._trusted_buffers[id(data)] = (data, number_of_samples_per_channel, trusted_buffer)
+        return trusted_buffer
+
     def _verify_array(self, data, number_of_samples_per_channel, is_many_chan, is_many_samp):
         """Verify the shape of a NumPy array.
 
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy
 from nitypes.waveform import AnalogWaveform
 
+from nidaqmx import _async
 from nidaqmx._feature_toggles import WAVEFORM_SUPPORT, requires_feature
 from nidaqmx.constants import FillMode
 from nidaqmx.stream_writers._channel_writer_base import (
@@ -49,14 +51,44 @@ class AnalogSingleChannelWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote.
         """
-        self._verify_array(data, False, True)
+        write_array = self._get_write_array(data, numpy.float64, False, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_analog_f64(
-            self._handle, data.shape[0], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[0],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
+    async def write_many_sample_async(self, data, timeout=10.0):
+        """Writes one or more floating-point samples without blocking the asyncio event loop.
+
+        This method is the awaitable counterpart of the write_many_sample
+        method. It runs the write on a dedicated thread pool with a
+        bounded number of threads, so the event loop can run other
+        coroutines while NI-DAQmx waits for space in the buffer. Do not
+        modify the data until this method returns.
+
+        Args:
+            data (numpy.ndarray): Contains a 1D NumPy array of
+                floating-point samples to write to the task. See the
+                write_many_sample method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples. See
+                the write_many_sample method.
+
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote to each channel in the task.
+        """
+        return await _async.run_blocking(self.write_many_sample, data, timeout)
+
     def write_one_sample(self, data, timeout=10):
         """Writes a single floating-point sample to a single analog output channel in a task.
 
@@ -1,3 +1,5 @@
+import numpy
+
 from nidaqmx.constants import FillMode
 from nidaqmx.stream_writers._channel_writer_base import (
     AUTO_START_UNSET,
@@ -44,12 +46,17 @@ class AnalogUnscaledWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """  # noqa: W505 - doc line too long (110 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.int16, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_binary_i16(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_int32(self, data, timeout=10.0):
@@ -88,12 +95,17 @@ class AnalogUnscaledWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """  # noqa: W505 - doc line too long (110 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.int32, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_binary_i32(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_uint16(self, data, timeout=10.0):
@@ -132,12 +144,17 @@ class AnalogUnscaledWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """  # noqa: W505 - doc line too long (119 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.uint16, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_binary_u16(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
 
     def write_uint32(self, data, timeout=10.0):
@@ -176,10 +193,15 @@ class AnalogUnscaledWriter(ChannelWriterBase):
             Specifies the actual number of samples this method
             successfully wrote to each channel in the task.
         """  # noqa: W505 - doc line too long (119 > 100 characters) (auto-generated noqa)
-        self._verify_array(data, True, True)
+        write_array = self._get_write_array(data, numpy.uint32, True, True)
 
         auto_start = self._auto_start if self._auto_start is not AUTO_START_UNSET else False
 
         return self._interpreter.write_binary_u32(
-            self._handle, data.shape[1], auto_start, timeout, FillMode.GROUP_BY_CHANNEL.value, data
+            self._handle,
+            data.shape[1],
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
         )
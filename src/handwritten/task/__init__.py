@@ -1,10 +1,16 @@
 """NI-DAQmx task and related classes."""
 
+from nidaqmx.task._block_stream import BlockStream, StreamBlock
 from nidaqmx.task._export_signals import ExportSignals
 from nidaqmx.task._in_stream import InStream
 from nidaqmx.task._out_stream import OutStream
+from nidaqmx.task._single_point_io import SinglePointIO
 from nidaqmx.task._task import Task, _TaskAlternateConstructor, _TaskEventType
+from nidaqmx.task._task_config import TaskConfig
+from nidaqmx.task._task_group import TaskGroup, TaskGroupReadResult
+from nidaqmx.task._task_pool import TaskPool, TaskPoolMetrics
 from nidaqmx.task._timing import Timing
+from nidaqmx.task._waveform_pool import WaveformPool
 
 __all__ = [
     "Task",
@@ -12,4 +18,13 @@ __all__ = [
     "OutStream",
     "ExportSignals",
     "Timing",
+    "SinglePointIO",
+    "TaskGroup",
+    "TaskGroupReadResult",
+    "BlockStream",
+    "StreamBlock",
+    "WaveformPool",
+    "TaskConfig",
+    "TaskPool",
+    "TaskPoolMetrics",
 ]
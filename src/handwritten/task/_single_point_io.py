@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+from typing import Union
+
+from nidaqmx.constants import ChannelType
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError
+
+# Maps each supported channel type to the interpreter method, the NI-DAQmx C function, and the
+# ctypes output cell type used to read one sample from a channel of that type.
+_CellType = Union[type[ctypes.c_double], type[ctypes.c_uint]]
+_READ_FUNCTIONS: dict[ChannelType, tuple[str, str, _CellType]] = {
+    ChannelType.ANALOG_INPUT: (
+        "read_analog_scalar_f64",
+        "DAQmxReadAnalogScalarF64",
+        ctypes.c_double,
+    ),
+    ChannelType.COUNTER_INPUT: (
+        "read_counter_scalar_f64",
+        "DAQmxReadCounterScalarF64",
+        ctypes.c_double,
+    ),
+    ChannelType.DIGITAL_INPUT: (
+        "read_digital_scalar_u32",
+        "DAQmxReadDigitalScalarU32",
+        ctypes.c_uint,
+    ),
+}
+
+# Maps each supported channel type to the interpreter method and the NI-DAQmx C function used to
+# write one sample to a channel of that type.
+_WRITE_FUNCTIONS = {
+    ChannelType.ANALOG_OUTPUT: ("write_analog_scalar_f64", "DAQmxWriteAnalogScalarF64"),
+    ChannelType.DIGITAL_OUTPUT: ("write_digital_scalar_u32", "DAQmxWriteDigitalScalarU32"),
+}
+
+
+class SinglePointIO:
+    """Reads or writes one sample at a time with minimal per-call overhead.
+
+    Use this class in hardware-timed single-point control loops, where the
+    time spent in each read or write call matters more than throughput.
+    A SinglePointIO object is bound to a task with exactly one analog
+    input, counter input, digital input, analog output, or digital output
+    channel. It looks up everything it needs when it is created, so each
+    call to the read or write method only calls NI-DAQmx.
+
+    When the task uses the NI-DAQmx C library, the read method reuses a
+    ctypes output cell for each thread instead of allocating a new one for
+    every sample. When the task uses gRPC, the read and write methods call
+    the interpreter directly.
+
+    The timeout and auto start settings are fixed when the object is
+    created. Create a new SinglePointIO object after adding channels to
+    the task.
+    """
+
+    __slots__ = (
+        "_task",
+        "_handle",
+        "_interpreter",
+        "_timeout",
+        "_auto_start",
+        "_read_scalar",
+        "_read_function",
+        "_cell_type",
+        "_write_scalar",
+        "_write_function",
+        "_local",
+    )
+
+    def __init__(self, task, timeout=10.0, auto_start=True):
+        """Initialize a new SinglePointIO.
+
+        Args:
+            task (nidaqmx.Task): Specifies the task to read samples from
+                or write samples to. The task must contain exactly one
+                channel.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each read or write to complete. If
+                you set timeout to nidaqmx.constants.WAIT_INFINITELY,
+                the read and write methods wait indefinitely.
+            auto_start (Optional[bool]): Specifies if the write method
+                automatically starts the task if you did not explicitly
+                start it with the DAQmx Start Task method.
+        """
+        self._task = task
+        self._handle = task._handle
+        self._interpreter = task._interpreter
+        self._timeout = timeout
+        self._auto_start = auto_start
+        self._read_scalar = self._raise_no_input_channel
+        self._read_function = None
+        self._cell_type: _CellType | None = None
+        self._write_scalar = self._raise_no_output_channel
+        self._write_function = None
+        self._local = threading.local()
+
+        number_of_channels = task.number_of_channels
+        if number_of_channels != 1:
+            raise DaqError(
+                "SinglePointIO requires a task with exactly one channel.\n\n"
+                f"Number of channels in the task: {number_of_channels}",
+                DAQmxErrors.UNKNOWN,
+                task_name=task.name,
+            )
+
+        chan_type = task.channels.chan_type
+        functions = self._get_library_functions()
+        if chan_type in _READ_FUNCTIONS:
+            method_name, function_name, self._cell_type = _READ_FUNCTIONS[chan_type]
+            self._read_scalar = getattr(self._interpreter, method_name)
+            if functions is not None:
+                self._read_function = getattr(functions, function_name)
+        elif chan_type in _WRITE_FUNCTIONS:
+            method_name, function_name = _WRITE_FUNCTIONS[chan_type]
+            self._write_scalar = getattr(self._interpreter, method_name)
+            if functions is not None:
+                self._write_function = getattr(functions, function_name)
+        else:
+            raise DaqError(
+                f"SinglePointIO does not support {chan_type.name} channels.",
+                DAQmxErrors.UNKNOWN,
+                task_name=task.name,
+            )
+
+    @property
+    def timeout(self):
+        """float: Indicates the timeout in seconds for each read or write."""
+        return self._timeout
+
+    @property
+    def auto_start(self):
+        """bool: Indicates if the write method automatically starts the task."""
+        return self._auto_start
+
+    def read(self):
+        """Reads a single sample from the channel in the task.
+
+        Returns:
+            float or int:
+
+            Indicates the sample read. Digital input channels return an
+            unsigned 32-bit integer.
+        """
+        read_function = self._read_function
+        if read_function is None:
+            return self._read_scalar(self._handle, self._timeout)
+
+        try:
+            cell, cell_ref = self._local.cell
+        except AttributeError:
+            cell, cell_ref = self._create_cell()
+
+        error_code = read_function(self._handle, self._timeout, cell_ref, None)
+        if error_code:
+            self._interpreter.check_for_error(error_code)
+        return cell.value
+
+    def write(self, value):
+        """Writes a single sample to the channel in the task.
+
+        Args:
+            value (float or int): Specifies the sample to write. Digital
+                output channels require an unsigned 32-bit integer.
+        """
+        write_function = self._write_function
+        if write_function is None:
+            self._write_scalar(self._handle, self._auto_start, self._timeout, value)
+            return
+
+        error_code = write_function(self._handle, self._auto_start, self._timeout, value, None)
+        if error_code:
+            self._interpreter.check_for_error(error_code)
+
+    def _create_cell(self):
+        """Create the output cell and its reference for the calling thread."""
+        assert self._cell_type is not None
+        cell = self._cell_type()
+        self._local.cell = (cell, ctypes.byref(cell))
+        return self._local.cell
+
+    def _get_library_functions(self):
+        """Get the prebound NI-DAQmx C functions, or None if the task does not use the library."""
+        import nidaqmx._library_interpreter
+
+        if not isinstance(self._interpreter, nidaqmx._library_interpreter.LibraryInterpreter):
+            return None
+        return nidaqmx._library_interpreter._functions
+
+    def _raise_no_input_channel(self, task, timeout):
+        raise DaqError(
+            "Read failed, because there are no channels in this task from "
+            "which data can be read.",
+            DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
+            task_name=self._task.name,
+        )
+
+    def _raise_no_output_channel(self, task, auto_start, timeout, value):
+        raise DaqError(
+            "Write failed, because there are no output channels in this task "
+            "to which data can be written.",
+            DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK,
+            task_name=self._task.name,
+        )
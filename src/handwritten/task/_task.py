@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import contextlib
 import threading
 import warnings
+import weakref
 from collections.abc import Iterable
 from enum import Enum
 from typing import Any, NoReturn, Sequence
@@ -9,7 +11,7 @@ from typing import Any, NoReturn, Sequence
 import numpy
 from nitypes.waveform import AnalogWaveform, DigitalWaveform
 
-from nidaqmx import utils
+from nidaqmx import _async, utils
 from nidaqmx._feature_toggles import WAVEFORM_SUPPORT, requires_feature
 from nidaqmx.constants import (
     READ_ALL_AVAILABLE,
@@ -17,22 +19,29 @@ from nidaqmx.constants import (
     ChannelType,
     EveryNSamplesEventType,
     FillMode,
+    ReadReturnType,
+    ReallocationPolicy,
     ShuntCalSelect,
     ShuntCalSource,
     ShuntElementLocation,
-    UsageTypeAI,
+    StreamOverflowPolicy,
     UsageTypeCI,
     UsageTypeCO,
+    WaveformAttributeMode,
     _Save,
 )
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.errors import DaqError, DaqResourceWarning
 from nidaqmx.system.device import _DeviceAlternateConstructor
+from nidaqmx.task._block_stream import BlockStream
+from nidaqmx.task._channel_index import _ChannelIndex
 from nidaqmx.task._export_signals import ExportSignals
 from nidaqmx.task._in_stream import InStream
 from nidaqmx.task._out_stream import OutStream
+from nidaqmx.task._read_plan import _create_read_plan, _ReadKind, _ReadPlan
+from nidaqmx.task._task_config import TaskConfig, apply_task_config, snapshot_task_config
 from nidaqmx.task._timing import Timing
-from nidaqmx.task.channels._channel import Channel
+from nidaqmx.task._waveform_pool import WaveformPool
 from nidaqmx.task.collections._ai_channel_collection import AIChannelCollection
 from nidaqmx.task.collections._ao_channel_collection import AOChannelCollection
 from nidaqmx.task.collections._ci_channel_collection import CIChannelCollection
@@ -40,7 +49,16 @@ from nidaqmx.task.collections._co_channel_collection import COChannelCollection
 from nidaqmx.task.collections._di_channel_collection import DIChannelCollection
 from nidaqmx.task.collections._do_channel_collection import DOChannelCollection
 from nidaqmx.task.triggering._triggers import Triggers
-from nidaqmx.types import CtrFreq, CtrTick, CtrTime, PowerMeasurement
+from nidaqmx.types import (
+    CTR_FREQ_DTYPE,
+    CTR_TICK_DTYPE,
+    CTR_TIME_DTYPE,
+    POWER_MEASUREMENT_DTYPE,
+    CtrFreq,
+    CtrTick,
+    CtrTime,
+    PowerMeasurement,
+)
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 
 __all__ = ["Task"]
@@ -83,6 +101,12 @@ class Task:
         "_triggers",
         "_out_stream",
         "_event_handler_lock",
+        "_read_plan",
+        "_channel_index",
+        "_config_state",
+        "_take_extended_properties_snapshot",
+        "_extended_properties_snapshot",
+        "_stop_listeners",
         "__weakref__",
     )
 
@@ -170,15 +194,12 @@ class Task:
     @property
     def channels(self):
         """:class:`nidaqmx.task.channels.Channel`: Specifies a channel object that represents the entire list of virtual channels in this task."""  # noqa: W505 - doc line too long (146 > 100 characters) (auto-generated noqa)
-        return Channel._factory(
-            self._handle, flatten_channel_string(self.channel_names), self._interpreter
-        )
+        return self._get_channel_index().get_channel(flatten_channel_string(self.channel_names))
 
     @property
     def channel_names(self):
         """List[str]: Indicates the names of all virtual channels in the task."""
-        val = self._interpreter.get_task_attribute_string(self._handle, 0x1273)
-        return unflatten_channel_string(val)
+        return self._get_channel_index().channel_names
 
     @property
     def number_of_channels(self):
@@ -265,12 +286,12 @@ class Task:
         # double closes.
         self._saved_name = self.name
 
-        self._ai_channels = AIChannelCollection(task_handle, interpreter)
-        self._ao_channels = AOChannelCollection(task_handle, interpreter)
-        self._ci_channels = CIChannelCollection(task_handle, interpreter)
-        self._co_channels = COChannelCollection(task_handle, interpreter)
-        self._di_channels = DIChannelCollection(task_handle, interpreter)
-        self._do_channels = DOChannelCollection(task_handle, interpreter)
+        self._ai_channels = AIChannelCollection(task_handle, interpreter, self)
+        self._ao_channels = AOChannelCollection(task_handle, interpreter, self)
+        self._ci_channels = CIChannelCollection(task_handle, interpreter, self)
+        self._co_channels = COChannelCollection(task_handle, interpreter, self)
+        self._di_channels = DIChannelCollection(task_handle, interpreter, self)
+        self._do_channels = DOChannelCollection(task_handle, interpreter, self)
         self._export_signals = ExportSignals(task_handle, interpreter)
         self._in_stream = InStream(self, interpreter)
         self._timing = Timing(task_handle, interpreter)
@@ -278,6 +299,74 @@ class Task:
         self._out_stream = OutStream(self, interpreter)
 
         self._event_handler_lock = threading.Lock()
+        self._read_plan: _ReadPlan | None = None
+        self._channel_index: _ChannelIndex | None = None
+        # The configuration that the last snapshot_config() or apply_config() left the task in.
+        self._config_state: TaskConfig | None = None
+        # The extended properties of each channel to read, captured by the first waveform
+        # read after the task starts.
+        self._take_extended_properties_snapshot = False
+        self._extended_properties_snapshot: list[dict[str, Any]] | None = None
+        # Block streams and stream readers that must let go of the task before it stops.
+        self._stop_listeners: weakref.WeakSet[Any] = weakref.WeakSet()
+
+    def _invalidate_channel_caches(self):
+        """Discards cached metadata that is derived from the channels in the task.
+
+        The channel collections and the in_stream call this method when they add channels
+        or change the channels to read.
+        """
+        self._read_plan = None
+        self._channel_index = None
+        self._config_state = None
+        self._extended_properties_snapshot = None
+
+    def _notify_stop_listeners(self):
+        """Tells the objects registered in _stop_listeners that the task is stopping.
+
+        Task.stop and Task.close call this method before they call into NI-DAQmx, so that an
+        event callback waiting on a consumer returns instead of blocking DAQmx Stop Task.
+        """
+        for listener in list(self._stop_listeners):
+            listener._on_task_stop()
+
+    def _get_waveform_attribute_mode(self) -> WaveformAttributeMode:
+        """Returns the waveform attribute mode to pass to the interpreter.
+
+        Once the extended properties of a started task are captured, the interpreter does not
+        need to get them again.
+        """
+        waveform_attribute_mode = self._in_stream.waveform_attribute_mode
+        if self._extended_properties_snapshot is not None:
+            waveform_attribute_mode &= ~WaveformAttributeMode.EXTENDED_PROPERTIES
+        return waveform_attribute_mode
+
+    def _apply_extended_properties_snapshot(self, waveforms: Sequence[Any]) -> None:
+        """Copies the captured extended properties to the waveforms, or captures them."""
+        if WaveformAttributeMode.EXTENDED_PROPERTIES not in self._in_stream.waveform_attribute_mode:
+            return
+        snapshot = self._extended_properties_snapshot
+        if snapshot is not None and len(snapshot) == len(waveforms):
+            for waveform, extended_properties in zip(waveforms, snapshot):
+                waveform.extended_properties.update(extended_properties)
+        elif self._take_extended_properties_snapshot:
+            self._extended_properties_snapshot = [
+                dict(waveform.extended_properties) for waveform in waveforms
+            ]
+
+    def _get_read_plan(self) -> _ReadPlan:
+        """Returns the cached read plan, creating it if necessary."""
+        read_plan = self._read_plan
+        if read_plan is None:
+            read_plan = self._read_plan = _create_read_plan(self)
+        return read_plan
+
+    def _get_channel_index(self) -> _ChannelIndex:
+        """Returns the cached channel index, creating it if necessary."""
+        channel_index = self._channel_index
+        if channel_index is None:
+            channel_index = self._channel_index = _ChannelIndex(self._handle, self._interpreter)
+        return channel_index
 
     def _calculate_num_samps_per_chan(self, num_samps_per_chan):
         """Calculates the actual number of samples per channel to read.
@@ -317,6 +406,7 @@ class Task:
         channels = flatten_channel_string([g._name for g in global_channels])
 
         self._interpreter.add_global_chans_to_task(self._handle, channels)
+        self._invalidate_channel_caches()
 
     def close(self):
         """Clears the task.
@@ -338,6 +428,10 @@ class Task:
             return
 
         first_exception = None
+        try:
+            self._notify_stop_listeners()
+        except Exception as ex:
+            first_exception = ex
         try:
             self._interpreter.clear_task(self._handle)
         except Exception as ex:
@@ -357,6 +451,115 @@ class Task:
         if first_exception:
             raise first_exception
 
+    @contextlib.contextmanager
+    def configuration_batch(self):
+        """Returns a context manager that sends property sets without waiting for each one.
+
+        In a gRPC session, each property set waits for a response from
+        the NI gRPC Device Server, so configuring many channels over a
+        slow network takes a long time. Within this context manager,
+        property sets return without waiting for a response, so their
+        round trips overlap. A set waits only for the previous set on
+        the same channel, or on the task itself, because NI-DAQmx may
+        coerce a value based on the values set before it.
+
+        Other calls, such as adding channels, configuring timing, or
+        getting a property, first wait for the pending sets, so they
+        see the configuration in the order you specified it. If a set
+        fails, the next call that waits for the pending sets, or the
+        end of the context manager, raises the error of the first set
+        that failed. Later sets still take effect.
+
+        The batch applies only to the property sets of this task that
+        the current thread makes. Property sets of other tasks, or of
+        other threads, wait for a response as usual.
+
+        Tasks that do not use a gRPC session call NI-DAQmx directly, so
+        this context manager has no effect on them.
+
+        Example:
+            >>> channels = list(task.ai_channels)
+            >>> with task.configuration_batch():
+            ...     for channel in channels:
+            ...         channel.ai_min = -1.0
+            ...         channel.ai_max = 1.0
+        """
+        self._interpreter.begin_batch(self._handle)
+        try:
+            yield self
+        finally:
+            self._interpreter.end_batch(self._handle)
+
+    def snapshot_config(self):
+        """Captures the configurable properties of the task.
+
+        The snapshot contains the read-write channel, timing, and
+        trigger properties that the task supports. Getting them takes
+        one driver call per property, so take a snapshot once and
+        change it with TaskConfig.set instead of taking a snapshot for
+        every reconfiguration.
+
+        The task also keeps a copy of the snapshot as its current
+        configuration, which the apply_config method compares against.
+
+        Returns:
+            nidaqmx.task.TaskConfig:
+
+            Indicates the values of the properties of the task.
+        """
+        config = snapshot_task_config(self)
+        self._config_state = TaskConfig(config._sections)
+        return config
+
+    def apply_config(self, config):
+        """Sets the properties of the task to the values in a configuration.
+
+        Only the properties whose values differ from the current
+        configuration of the task are set, so reapplying a
+        configuration with a few changed values makes a few driver
+        calls. The current configuration is the one that the last call
+        to snapshot_config or apply_config left the task in. If there
+        is none, for example because channels were added, this method
+        takes a snapshot first.
+
+        The properties are set in channel, timing, and trigger order.
+        Within each channel, timing object, or trigger, the properties
+        that select a type, mode, or units are set first. Once one of
+        those changes, the properties of the same object are read again,
+        because the driver may have reset or recomputed them, and only
+        the ones that differ from the configuration are set.
+
+        If you set properties of the task directly, call
+        snapshot_config again before you use this method, or the
+        changes may not be detected.
+
+        Example:
+            >>> config = task.snapshot_config()
+            >>> config.set("timing", "samp_quant_samp_per_chan", 2000)
+            >>> task.apply_config(config)
+            1
+
+        Args:
+            config (nidaqmx.task.TaskConfig): Specifies the
+                configuration to apply.
+        Returns:
+            int:
+
+            Indicates the number of properties that were set. The other
+            len(config) minus this number property sets were skipped
+            because the values did not change.
+        """
+        current = self._config_state
+        if current is None:
+            self.snapshot_config()
+            current = self._config_state
+            assert current is not None
+        # If a set fails, the state of the task is unknown.
+        self._config_state = None
+        property_count = apply_task_config(self, config, current)
+        self._config_state = current
+        return property_count
+
     def control(self, action):
         """Alters the state of a task according to the action you specify.
 
@@ -366,6 +569,38 @@ class Task:
         """
         self._interpreter.task_control(self._handle, action.value)
 
+    @requires_feature(WAVEFORM_SUPPORT)
+    def create_waveform_pool(self, reallocation_policy=ReallocationPolicy.TO_GROW):
+        """Returns a waveform pool that reads analog waveforms into reused waveforms.
+
+        Unlike the read_waveform method, which creates new waveforms for
+        every read, the returned pool reads each block of samples into
+        the same waveforms, so continuous acquisition loops do not
+        allocate a sample buffer per channel per read. The waveforms
+        returned by a read from the pool are valid until the next read
+        from the same pool.
+
+        Args:
+            reallocation_policy (Optional[nidaqmx.constants.ReallocationPolicy]):
+                Specifies what happens when a read requests more samples
+                than the waveforms can hold. The default is
+                ReallocationPolicy.TO_GROW, which increases the capacity
+                of the waveforms.
+
+        Returns:
+            nidaqmx.task.WaveformPool:
+
+            Indicates the waveform pool bound to this task.
+
+        Example:
+            >>> pool = task.create_waveform_pool()
+            >>> task.start()
+            >>> while acquiring:
+            ...     waveforms = pool.read_waveforms(1000)
+            ...     process(waveforms)
+        """
+        return WaveformPool(self, reallocation_policy)
+
     def is_task_done(self):
         """Queries the status of the task and indicates if it completed execution.
 
@@ -510,7 +745,7 @@ class Task:
             self._handle, channel, skip_unsupported_channels
         )
 
-    def read(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET, timeout=10.0):
+    def read(self, number_of_samples_per_channel=NUM_SAMPLES_UNSET, timeout=10.0, return_type=None):
         """Reads samples from the task or virtual channels you specify.
 
         This read method is dynamic, and is capable of inferring an appropriate
@@ -539,6 +774,14 @@ class Task:
         returns either a list (1 channel to read) or a list of lists (N
         channels to read).
 
+        If the return type is ReadReturnType.NUMPY, this method returns NumPy
+        scalars and arrays with the same dimensions instead of Python scalars
+        and lists. The returned array is the array that NI-DAQmx read the
+        samples into, trimmed to the number of samples read without copying.
+        Counter pulse and power measurements are returned as structured
+        arrays whose field names match CtrFreq, CtrTime, CtrTick, or
+        PowerMeasurement.
+
         Args:
             number_of_samples_per_channel (Optional[int]): Specifies the
                 number of samples to read. If this input is not set,
@@ -571,12 +814,17 @@ class Task:
                 indefinitely. If you set timeout to 0, the method tries
                 once to read the requested samples and returns an error
                 if it is unable to.
+            return_type (Optional[nidaqmx.constants.ReadReturnType]):
+                Specifies whether to return Python lists or NumPy arrays.
+                If this input is not set, this method uses the
+                "read_return_type" property of the in_stream.
 
         Returns:
             dynamic:
 
             The samples requested in the form of a scalar, a list, or a
-            list of lists. See method docstring for more info.
+            list of lists, or the equivalent NumPy scalar or array. See
+            method docstring for more info.
 
             NI-DAQmx scales the data to the units of the measurement,
             including any custom scaling you apply to the channels. Use a
@@ -591,9 +839,12 @@ class Task:
             >>> type(data[0])
             <type 'float'>
         """
-        channels_to_read = self.in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
-        read_chan_type = channels_to_read.chan_type
+        read_plan = self._get_read_plan()
+        number_of_channels = read_plan.number_of_channels
+
+        if return_type is None:
+            return_type = self._in_stream.read_return_type
+        return_numpy = return_type == ReadReturnType.NUMPY
 
         num_samples_not_set = number_of_samples_per_channel is NUM_SAMPLES_UNSET
 
@@ -610,72 +861,28 @@ class Task:
         else:
             array_shape = (number_of_samples_per_channel,)
 
-        if read_chan_type == ChannelType.ANALOG_INPUT:
-            if any(chan.ai_meas_type == UsageTypeAI.POWER for chan in channels_to_read):
-                return self._read_power(
-                    array_shape, number_of_channels, number_of_samples_per_channel, timeout
-                )
-            else:
-                data: numpy.typing.NDArray = numpy.zeros(array_shape, dtype=numpy.float64)
-                _, samples_read = self._interpreter.read_analog_f64(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-
-        elif (
-            read_chan_type == ChannelType.DIGITAL_INPUT
-            or read_chan_type == ChannelType.DIGITAL_OUTPUT
-        ):
-            if self.in_stream.di_num_booleans_per_chan == 1:
-                data = numpy.zeros(array_shape, dtype=bool)
-                _, samples_read, _ = self._interpreter.read_digital_lines(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-            else:
-                data = numpy.zeros(array_shape, dtype=numpy.uint32)
-                _, samples_read = self._interpreter.read_digital_u32(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-
-        elif read_chan_type == ChannelType.COUNTER_INPUT:
-            meas_type = channels_to_read.ci_meas_type
-
-            if meas_type in [
-                UsageTypeCI.PULSE_FREQ,
-                UsageTypeCI.PULSE_TIME,
-                UsageTypeCI.PULSE_TICKS,
-            ]:
-                return self._read_ctr_pulse(
-                    array_shape,
-                    meas_type,
-                    number_of_channels,
-                    number_of_samples_per_channel,
-                    num_samples_not_set,
-                    timeout,
-                )
-
-            else:
-                data = numpy.zeros(array_shape, dtype=numpy.float64)
-
-                _, samples_read = self._interpreter.read_counter_f64_ex(
-                    self._handle,
-                    number_of_samples_per_channel,
-                    timeout,
-                    FillMode.GROUP_BY_CHANNEL.value,
-                    data,
-                )
-        else:
+        read_kind = read_plan.kind
+        if read_kind == _ReadKind.POWER:
+            return self._read_power(
+                array_shape,
+                number_of_channels,
+                number_of_samples_per_channel,
+                num_samples_not_set,
+                timeout,
+                return_numpy,
+            )
+        elif read_kind == _ReadKind.COUNTER_PULSE:
+            assert read_plan.ci_meas_type is not None
+            return self._read_ctr_pulse(
+                array_shape,
+                read_plan.ci_meas_type,
+                number_of_channels,
+                number_of_samples_per_channel,
+                num_samples_not_set,
+                timeout,
+                return_numpy,
+            )
+        elif read_kind == _ReadKind.NO_INPUT_CHANNELS:
             raise DaqError(
                 "Read failed, because there are no channels in this task from "
                 "which data can be read.",
@@ -683,15 +890,26 @@ class Task:
                 task_name=self.name,
             )
 
-        if num_samples_not_set and array_shape == (1,):
-            return data.tolist()[0]
-
-        if samples_read != number_of_samples_per_channel:
-            if number_of_channels > 1:
-                return data[:, :samples_read].tolist()
-            else:
-                return data[:samples_read].tolist()
+        # Analog, digital, and non-pulse counter reads all return (data, samples_read, ...).
+        assert read_plan.read_function is not None
+        data: numpy.typing.NDArray = numpy.zeros(array_shape, dtype=read_plan.dtype)
+        samples_read = read_plan.read_function(
+            self._handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            data,
+        )[1]
 
+        data = _trim_read_data(
+            data,
+            samples_read,
+            number_of_channels,
+            number_of_samples_per_channel,
+            num_samples_not_set,
+        )
+        if return_numpy:
+            return data
         return data.tolist()
 
     def _read_ctr_pulse(
@@ -702,7 +920,17 @@ class Task:
         number_of_samples_per_channel: int,
         num_samples_not_set: bool,
         timeout: float,
-    ) -> CtrFreq | CtrTick | CtrTime | list[CtrFreq] | list[CtrTick] | list[CtrTime]:
+        return_numpy: bool = False,
+    ) -> (
+        CtrFreq
+        | CtrTick
+        | CtrTime
+        | list[CtrFreq]
+        | list[CtrTick]
+        | list[CtrTime]
+        | numpy.typing.NDArray[numpy.void]
+        | numpy.void
+    ):
         if meas_type == UsageTypeCI.PULSE_FREQ:
             frequencies = numpy.zeros(array_shape, dtype=numpy.float64)
             duty_cycles = numpy.zeros(array_shape, dtype=numpy.float64)
@@ -716,9 +944,18 @@ class Task:
                 duty_cycles,
             )
 
-            data: list[CtrFreq] | list[CtrTick] | list[CtrTime] = [
-                CtrFreq(freq=f, duty_cycle=d) for f, d in zip(frequencies, duty_cycles)
-            ]
+            if return_numpy:
+                return _trim_read_data(
+                    _create_structured_array(CTR_FREQ_DTYPE, frequencies, duty_cycles),
+                    samples_read,
+                    number_of_channels,
+                    number_of_samples_per_channel,
+                    num_samples_not_set,
+                )
+
+            data: list[CtrFreq] | list[CtrTick] | list[CtrTime] = list(
+                map(CtrFreq._make, zip(frequencies.tolist(), duty_cycles.tolist()))
+            )
 
         elif meas_type == UsageTypeCI.PULSE_TIME:
             high_times = numpy.zeros(array_shape, dtype=numpy.float64)
@@ -732,7 +969,17 @@ class Task:
                 high_times,
                 low_times,
             )
-            data = [CtrTime(high_time=h, low_time=l) for h, l in zip(high_times, low_times)]
+
+            if return_numpy:
+                return _trim_read_data(
+                    _create_structured_array(CTR_TIME_DTYPE, high_times, low_times),
+                    samples_read,
+                    number_of_channels,
+                    number_of_samples_per_channel,
+                    num_samples_not_set,
+                )
+
+            data = list(map(CtrTime._make, zip(high_times.tolist(), low_times.tolist())))
 
         elif meas_type == UsageTypeCI.PULSE_TICKS:
             high_ticks = numpy.zeros(array_shape, dtype=numpy.uint32)
@@ -746,7 +993,17 @@ class Task:
                 high_ticks,
                 low_ticks,
             )
-            data = [CtrTick(high_tick=h, low_tick=l) for h, l in zip(high_ticks, low_ticks)]
+
+            if return_numpy:
+                return _trim_read_data(
+                    _create_structured_array(CTR_TICK_DTYPE, high_ticks, low_ticks),
+                    samples_read,
+                    number_of_channels,
+                    number_of_samples_per_channel,
+                    num_samples_not_set,
+                )
+
+            data = list(map(CtrTick._make, zip(high_ticks.tolist(), low_ticks.tolist())))
 
         else:
             assert False, f"{meas_type} is not a counter pulse measurement type."
@@ -769,8 +1026,16 @@ class Task:
         array_shape: tuple[int, ...],
         number_of_channels: int,
         number_of_samples_per_channel: int,
+        num_samples_not_set: bool,
         timeout: float,
-    ) -> PowerMeasurement | list[PowerMeasurement] | list[list[PowerMeasurement]]:
+        return_numpy: bool = False,
+    ) -> (
+        PowerMeasurement
+        | list[PowerMeasurement]
+        | list[list[PowerMeasurement]]
+        | numpy.typing.NDArray[numpy.void]
+        | numpy.void
+    ):
         voltages = numpy.zeros(array_shape, dtype=numpy.float64)
         currents = numpy.zeros(array_shape, dtype=numpy.float64)
 
@@ -783,6 +1048,15 @@ class Task:
             currents,
         )
 
+        if return_numpy:
+            return _trim_read_data(
+                _create_structured_array(POWER_MEASUREMENT_DTYPE, voltages, currents),
+                samples_read,
+                number_of_channels,
+                number_of_samples_per_channel,
+                num_samples_not_set,
+            )
+
         if number_of_channels > 1:
             if number_of_samples_per_channel == 1:
                 # n channel, 1 sample
@@ -806,6 +1080,39 @@ class Task:
                     :samples_read
                 ]
 
+    async def read_async(
+        self, number_of_samples_per_channel=NUM_SAMPLES_UNSET, timeout=10.0, return_type=None
+    ):
+        """Reads samples from the task without blocking the asyncio event loop.
+
+        This method is the awaitable counterpart of the read method. It
+        runs the read on a dedicated thread pool with a bounded number of
+        threads, so the event loop can run other coroutines while NI-DAQmx
+        waits for samples.
+
+        Cancelling the coroutine does not interrupt the read. NI-DAQmx
+        finishes the read in the background when the samples become
+        available or the timeout elapses, and discards the samples.
+
+        Args:
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. See the read method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. See the
+                read method.
+            return_type (Optional[nidaqmx.constants.ReadReturnType]):
+                Specifies whether to return Python lists or NumPy arrays.
+                See the read method.
+
+        Returns:
+            dynamic:
+
+            The samples requested, as returned by the read method.
+        """
+        return await _async.run_blocking(
+            self.read, number_of_samples_per_channel, timeout, return_type
+        )
+
     @requires_feature(WAVEFORM_SUPPORT)
     def read_waveform(self, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
         """Reads samples from the task or virtual channels you specify, and returns them as waveforms.
@@ -873,15 +1180,15 @@ class Task:
             >>> type(data)
             <type 'AnalogWaveform'>
         """  # noqa: W505 - doc line too long (102 > 100 characters) (auto-generated noqa)
-        channels_to_read = self.in_stream.channels_to_read
-        number_of_channels = len(channels_to_read.channel_names)
-        read_chan_type = channels_to_read.chan_type
+        read_plan = self._get_read_plan()
+        number_of_channels = read_plan.number_of_channels
 
         number_of_samples_per_channel = self._calculate_num_samps_per_chan(
             number_of_samples_per_channel
         )
 
-        if read_chan_type == ChannelType.ANALOG_INPUT:
+        waveform_attribute_mode = self._get_waveform_attribute_mode()
+        if read_plan.kind in (_ReadKind.ANALOG, _ReadKind.POWER):
             if number_of_channels == 1:
                 analog_waveform = AnalogWaveform(number_of_samples_per_channel)
                 self._interpreter.read_analog_waveform(
@@ -889,8 +1196,9 @@ class Task:
                     number_of_samples_per_channel,
                     timeout,
                     analog_waveform,
-                    self._in_stream.waveform_attribute_mode,
+                    waveform_attribute_mode,
                 )
+                self._apply_extended_properties_snapshot((analog_waveform,))
                 return analog_waveform
             else:
                 analog_waveforms = [
@@ -901,14 +1209,12 @@ class Task:
                     number_of_samples_per_channel,
                     timeout,
                     analog_waveforms,
-                    self._in_stream.waveform_attribute_mode,
+                    waveform_attribute_mode,
                 )
+                self._apply_extended_properties_snapshot(analog_waveforms)
                 return analog_waveforms
 
-        elif (
-            read_chan_type == ChannelType.DIGITAL_INPUT
-            or read_chan_type == ChannelType.DIGITAL_OUTPUT
-        ):
+        elif read_plan.kind in (_ReadKind.DIGITAL_LINES, _ReadKind.DIGITAL_U32):
             if number_of_channels == 1:
                 digital_waveform = DigitalWaveform(
                     number_of_samples_per_channel, self.in_stream.di_num_booleans_per_chan
@@ -918,18 +1224,21 @@ class Task:
                     number_of_samples_per_channel,
                     timeout,
                     digital_waveform,
-                    self._in_stream.waveform_attribute_mode,
+                    waveform_attribute_mode,
                 )
+                self._apply_extended_properties_snapshot((digital_waveform,))
                 return digital_waveform
             else:
-                return self._interpreter.read_new_digital_waveforms(
+                digital_waveforms = self._interpreter.read_new_digital_waveforms(
                     self._handle,
                     number_of_channels,
                     number_of_samples_per_channel,
                     self.in_stream.di_num_booleans_per_chan,
                     timeout,
-                    self._in_stream.waveform_attribute_mode,
+                    waveform_attribute_mode,
                 )
+                self._apply_extended_properties_snapshot(digital_waveforms)
+                return digital_waveforms
 
         else:
             raise DaqError(
@@ -1213,6 +1522,8 @@ class Task:
         performance of the application.
         """
         self._interpreter.start_task(self._handle)
+        self._take_extended_properties_snapshot = True
+        self._extended_properties_snapshot = None
 
     def stop(self):
         """Stop the task.
@@ -1227,7 +1538,65 @@ class Task:
         repeatedly. Starting and stopping a task repeatedly reduces the
         performance of the application.
         """
+        self._notify_stop_listeners()
         self._interpreter.stop_task(self._handle)
+        self._take_extended_properties_snapshot = False
+        self._extended_properties_snapshot = None
+
+    def stream_blocks(
+        self,
+        samples_per_block,
+        queue_depth=8,
+        overflow_policy=StreamOverflowPolicy.BLOCK,
+        timeout=10.0,
+    ):
+        """Returns an iterator over blocks of samples read by an every N samples event.
+
+        This method registers an every N samples acquired into buffer
+        event whose callback reads each block of samples into a
+        preallocated buffer and adds it to a bounded queue. Iterate over
+        the returned object with a for loop or an async for loop to take
+        blocks from the queue, so your code runs on its own thread or
+        event loop instead of on the NI-DAQmx callback thread.
+
+        Call this method before you start the task. Stopping the task,
+        or leaving a for loop over the returned object, ends the stream:
+        the callback stops queueing blocks, and iteration ends after the
+        queued blocks are delivered. Close the returned object after you
+        stop the task to unregister the event. The task can have only one
+        every N samples acquired into buffer event, so do not also call
+        the register_every_n_samples_acquired_into_buffer_event method.
+
+        Args:
+            samples_per_block (int): Specifies the number of samples per
+                channel in each block.
+            queue_depth (Optional[int]): Specifies the maximum number of
+                blocks that the queue holds. The default is 8.
+            overflow_policy (Optional[nidaqmx.constants.StreamOverflowPolicy]):
+                Specifies what happens when a block is read and the queue
+                is full. The default is StreamOverflowPolicy.BLOCK, which
+                waits up to the timeout for the consumer to take a block
+                and then drops the new block.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each block to be read, and for space
+                in the queue. The default timeout is 10 seconds.
+
+        Returns:
+            nidaqmx.task.BlockStream:
+
+            Indicates the object to iterate over. Use it as a context
+            manager or call its close method to unregister the event.
+
+        Example:
+            >>> blocks = task.stream_blocks(1000)
+            >>> task.start()
+            >>> for block in blocks:
+            ...     if not process(block.data):
+            ...         break
+            >>> task.stop()
+            >>> blocks.close()
+        """
+        return BlockStream(self, samples_per_block, queue_depth, overflow_policy, timeout)
 
     def wait_for_valid_timestamp(self, timestamp_event, timeout=10.0):
         """Wait until the specified timestamp has a value.
@@ -1268,6 +1637,25 @@ class Task:
         """
         self._interpreter.wait_until_task_done(self._handle, timeout)
 
+    async def wait_until_done_async(self, timeout=10.0):
+        """Waits for the task to complete without blocking the asyncio event loop.
+
+        This method is the awaitable counterpart of the wait_until_done
+        method. It runs the wait on a dedicated thread pool with a bounded
+        number of threads. NI-DAQmx wakes the waiting thread when the task
+        completes, so this method does not poll the task.
+
+        Cancelling the coroutine does not interrupt the wait. The wait
+        continues in the background until the task completes or the
+        timeout elapses.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of time in
+                seconds to wait for the measurement or generation to complete.
+                See the wait_until_done method.
+        """
+        await _async.run_blocking(self.wait_until_done, timeout)
+
     def _raise_invalid_num_lines_error(self, num_lines_expected, num_lines_in_data) -> NoReturn:
         raise DaqError(
             "Specified read or write operation failed, because the number "
@@ -1349,6 +1737,10 @@ class Task:
         - List of CtrFreq, CtrTime, CtrTick (from nidaqmx.types):
           Multiple samples for 1 channel or 1 sample for multiple
           channels.
+        - 1D numpy.ndarray with the CTR_FREQ_DTYPE, CTR_TIME_DTYPE, or
+          CTR_TICK_DTYPE structured dtype (from nidaqmx.types): Multiple
+          samples for 1 channel. This form avoids creating a namedtuple
+          for each sample.
 
         If the task uses on-demand timing, this method returns only
         after the device generates all samples. On-demand is the default
@@ -1507,6 +1899,15 @@ class Task:
         elif write_chan_type == ChannelType.COUNTER_OUTPUT:
             output_type = channels_to_write.co_output_type
 
+            if isinstance(data, (numpy.ndarray, numpy.void)) and data.dtype.names is not None:
+                return self._write_ctr_pulse_array(
+                    output_type,
+                    numpy.atleast_1d(data),
+                    number_of_samples_per_channel,
+                    auto_start,
+                    timeout,
+                )
+
             if number_of_samples_per_channel == 1:
                 data = [data]
             elif not isinstance(data, Iterable):
@@ -1521,10 +1922,7 @@ class Task:
                 if not all(isinstance(sample, CtrFreq) for sample in data):
                     raise TypeError(f"Output type {output_type} requires samples of type CtrFreq.")
 
-                frequencies = numpy.array([sample.freq for sample in data], dtype=numpy.float64)
-                duty_cycles = numpy.array(
-                    [sample.duty_cycle for sample in data], dtype=numpy.float64
-                )
+                frequencies, duty_cycles = _get_ctr_pulse_columns(data, numpy.float64)
 
                 return self._interpreter.write_ctr_freq(
                     self._handle,
@@ -1540,8 +1938,7 @@ class Task:
                 if not all(isinstance(sample, CtrTime) for sample in data):
                     raise TypeError(f"Output type {output_type} requires samples of type CtrTime.")
 
-                high_times = numpy.array([sample.high_time for sample in data], dtype=numpy.float64)
-                low_times = numpy.array([sample.low_time for sample in data], dtype=numpy.float64)
+                high_times, low_times = _get_ctr_pulse_columns(data, numpy.float64)
 
                 return self._interpreter.write_ctr_time(
                     self._handle,
@@ -1557,8 +1954,7 @@ class Task:
                 if not all(isinstance(sample, CtrTick) for sample in data):
                     raise TypeError(f"Output type {output_type} requires samples of type CtrTick.")
 
-                high_ticks = numpy.array([sample.high_tick for sample in data], dtype=numpy.uint32)
-                low_ticks = numpy.array([sample.low_tick for sample in data], dtype=numpy.uint32)
+                high_ticks, low_ticks = _get_ctr_pulse_columns(data, numpy.uint32)
 
                 return self._interpreter.write_ctr_ticks(
                     self._handle,
@@ -1576,6 +1972,64 @@ class Task:
         else:
             self._raise_no_output_channels_error()
 
+    async def write_async(self, data, auto_start=AUTO_START_UNSET, timeout=10.0):
+        """Writes samples to the task without blocking the asyncio event loop.
+
+        This method is the awaitable counterpart of the write method. It
+        runs the write on a dedicated thread pool with a bounded number of
+        threads, so the event loop can run other coroutines while NI-DAQmx
+        waits for space in the buffer.
+
+        Do not modify the data until this method returns.
+
+        Args:
+            data (dynamic): Contains the samples to write to the task.
+                See the write method.
+            auto_start (Optional[bool]): Specifies if this method
+                automatically starts the task if you did not explicitly
+                start it with the DAQmx Start Task method. See the write
+                method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples. See
+                the write method.
+
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote.
+        """
+        return await _async.run_blocking(self.write, data, auto_start, timeout)
+
+    def _write_ctr_pulse_array(
+        self, output_type, data, number_of_samples_per_channel, auto_start, timeout
+    ):
+        """Writes counter output pulse samples from a NumPy structured array."""
+        if output_type == UsageTypeCO.PULSE_FREQUENCY:
+            dtype, write_function = CTR_FREQ_DTYPE, self._interpreter.write_ctr_freq
+        elif output_type == UsageTypeCO.PULSE_TIME:
+            dtype, write_function = CTR_TIME_DTYPE, self._interpreter.write_ctr_time
+        elif output_type == UsageTypeCO.PULSE_TICKS:
+            dtype, write_function = CTR_TICK_DTYPE, self._interpreter.write_ctr_ticks
+        else:
+            self._raise_unsupported_output_type_error(output_type)
+
+        assert dtype.names is not None
+        if data.dtype.names != dtype.names:
+            raise TypeError(
+                f"Output type {output_type} requires a structured array with the fields "
+                f"{', '.join(dtype.names)}."
+            )
+
+        return write_function(
+            self._handle,
+            number_of_samples_per_channel,
+            auto_start,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            *(numpy.ascontiguousarray(data[name], dtype=dtype[name]) for name in dtype.names),
+        )
+
     def _is_waveform_data(self, data):
         """Check if data is waveform data (single waveform or list of waveforms)."""
         if isinstance(data, (AnalogWaveform, DigitalWaveform)):
@@ -1732,6 +2186,45 @@ class _TaskAlternateConstructor(Task):
         self.__class__ = Task  # type: ignore[assignment]
 
 
+def _trim_read_data(
+    data: numpy.typing.NDArray,
+    samples_read: int,
+    number_of_channels: int,
+    number_of_samples_per_channel: int,
+    num_samples_not_set: bool,
+) -> Any:
+    """Returns a scalar or a view of the read array that only contains the samples read."""
+    if num_samples_not_set and data.shape == (1,):
+        return data[0]
+
+    if samples_read == number_of_samples_per_channel:
+        return data
+
+    if number_of_channels > 1 and data.ndim == 1:
+        # A single-sample multi-channel read has no sample axis, so add one before trimming.
+        data = data[:, numpy.newaxis]
+
+    return data[..., :samples_read]
+
+
+def _get_ctr_pulse_columns(
+    data: Iterable[tuple], dtype: type[numpy.generic]
+) -> tuple[numpy.typing.NDArray, numpy.typing.NDArray]:
+    """Splits a sequence of counter pulse namedtuples into two contiguous column arrays."""
+    samples = numpy.array(data if isinstance(data, list) else list(data), dtype=dtype)
+    first_column, second_column = samples.reshape(-1, 2).T.copy()
+    return first_column, second_column
+
+
+def _create_structured_array(dtype: numpy.dtype, *columns: numpy.typing.NDArray) -> Any:
+    """Combines same-shaped column arrays into a structured array with the given dtype."""
+    data = numpy.empty(columns[0].shape, dtype=dtype)
+    assert dtype.names is not None
+    for name, column in zip(dtype.names, columns):
+        data[name] = column
+    return data
+
+
 class _TaskEventType(Enum):
     """Internal enum for task event bookkeeping."""
 
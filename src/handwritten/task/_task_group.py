@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, NamedTuple
+
+import numpy
+import numpy.typing
+
+from nidaqmx.constants import FillMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError, DaqReadError, DaqTaskGroupReadError
+from nidaqmx.task._read_plan import _ReadKind
+
+
+class TaskGroupReadResult(NamedTuple):
+    """Represents the samples that TaskGroup.read_all read from one task."""
+
+    data: numpy.typing.NDArray
+    """A 2D view of the samples read, with one row per channel."""
+
+    samples_read: int
+    """The number of samples per channel that were read."""
+
+
+class TaskGroup:
+    """Reads from several independent input tasks at the same time.
+
+    Reading from several tasks in sequence takes as long as all of the
+    reads combined. NI-DAQmx does not hold the Python global interpreter
+    lock while it waits for samples, so a TaskGroup issues the reads on a
+    persistent pool of worker threads and waits for all of them to
+    complete. The total time is then close to the time of the slowest
+    read.
+
+    Each task must read analog, digital, or non-pulse counter samples.
+    The TaskGroup preallocates one array per task and reuses it for every
+    call to the read_all method, so the data returned by one call is
+    overwritten by the next call. Copy the data if you need to keep it.
+
+    Close the TaskGroup, or use it as a context manager, to stop the
+    worker threads. Closing the TaskGroup does not close the tasks.
+    """
+
+    __slots__ = ("_tasks", "_executor", "_arrays")
+
+    def __init__(self, tasks, max_workers=None):
+        """Initialize a new TaskGroup.
+
+        Args:
+            tasks (Iterable[nidaqmx.Task]): Specifies the tasks to read
+                from.
+            max_workers (Optional[int]): Specifies the number of worker
+                threads. By default, the TaskGroup uses one fewer worker
+                thread than there are tasks, because the calling thread
+                reads from the first task.
+        """
+        self._tasks = list(tasks)
+        if not self._tasks:
+            raise ValueError("A TaskGroup must contain at least one task.")
+
+        if max_workers is None:
+            max_workers = max(len(self._tasks) - 1, 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="nidaqmx-task-group"
+        )
+        self._arrays: list[numpy.typing.NDArray | None] = [None] * len(self._tasks)
+
+    def __enter__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return self
+
+    def __exit__(  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        self, type, value, traceback
+    ):
+        self.close()
+
+    def __repr__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        return f"TaskGroup(tasks={self._tasks})"
+
+    @property
+    def tasks(self):
+        """List[nidaqmx.Task]: Indicates the tasks in the group."""
+        return list(self._tasks)
+
+    def close(self):
+        """Stops the worker threads after any reads in progress complete."""
+        self._executor.shutdown(wait=True)
+
+    def read_all(self, number_of_samples_per_channel, timeout=10.0):
+        """Reads the same number of samples per channel from every task in the group.
+
+        This method returns when all of the reads complete. If any read
+        fails, this method waits for the other reads to complete and then
+        raises a single error that contains the error and the number of
+        samples read for each task.
+
+        Args:
+            number_of_samples_per_channel (int): Specifies the number of
+                samples to read from each channel of each task.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. The
+                timeout applies to each read, and the reads happen at the
+                same time. The default timeout is 10 seconds. If you set
+                timeout to nidaqmx.constants.WAIT_INFINITELY, the method
+                waits indefinitely.
+
+        Returns:
+            List[nidaqmx.task.TaskGroupReadResult]:
+
+            Contains the samples read and the number of samples per
+            channel read for each task, in the same order as the tasks.
+        """
+        reads = [
+            self._prepare_read(i, number_of_samples_per_channel) for i in range(len(self._tasks))
+        ]
+
+        # Read from the first task on the calling thread instead of waiting idle.
+        futures = [
+            self._executor.submit(
+                _read_task,
+                read_function,
+                task_handle,
+                array,
+                number_of_samples_per_channel,
+                timeout,
+            )
+            for read_function, task_handle, array in reads[1:]
+        ]
+        try:
+            read_function, task_handle, array = reads[0]
+            first_outcome = _read_task(
+                read_function, task_handle, array, number_of_samples_per_channel, timeout
+            )
+        finally:
+            # Do not return or raise until every read completes, because the reads fill the
+            # arrays that the next call reuses.
+            wait(futures)
+        # result() raises any error other than a DaqError, after all of the reads complete.
+        outcomes = [first_outcome]
+        outcomes.extend(future.result() for future in futures)
+
+        if any(error is not None for _, error in outcomes):
+            self._raise_read_error(outcomes)
+
+        return [
+            TaskGroupReadResult(array[:, :samples_read], samples_read)
+            for (_, _, array), (samples_read, _) in zip(reads, outcomes)
+        ]
+
+    def _prepare_read(
+        self, index: int, number_of_samples_per_channel: int
+    ) -> tuple[Callable[..., Any], object, numpy.typing.NDArray]:
+        """Get the read function, task handle, and preallocated array for one task."""
+        task = self._tasks[index]
+        read_plan = task._get_read_plan()
+        if read_plan.read_function is None:
+            if read_plan.kind == _ReadKind.NO_INPUT_CHANNELS:
+                raise DaqError(
+                    "Read failed, because there are no channels in this task from "
+                    "which data can be read.",
+                    DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
+                    task_name=task.name,
+                )
+            raise DaqError(
+                "TaskGroup does not support reading power or counter pulse "
+                "measurements. Use Task.read to read from this task.",
+                DAQmxErrors.UNKNOWN,
+                task_name=task.name,
+            )
+
+        array_shape = (read_plan.number_of_channels, number_of_samples_per_channel)
+        array = self._arrays[index]
+        if array is None or array.shape != array_shape or array.dtype != read_plan.dtype:
+            array = self._arrays[index] = numpy.zeros(array_shape, dtype=read_plan.dtype)
+
+        return read_plan.read_function, task._handle, array
+
+    def _raise_read_error(self, outcomes):
+        samps_per_chan_read = [samples_read for samples_read, _ in outcomes]
+        errors = [error for _, error in outcomes]
+        messages = [
+            f"Task Name: {task._saved_name}\n\n{error}"
+            for task, error in zip(self._tasks, errors)
+            if error is not None
+        ]
+        first_error = next(error for error in errors if error is not None)
+        raise DaqTaskGroupReadError(
+            "Read failed for {} of {} tasks in the group.\n\n{}".format(
+                len(messages), len(self._tasks), "\n\n".join(messages)
+            ),
+            first_error.error_code,
+            samps_per_chan_read,
+            errors,
+        )
+
+
+def _read_task(
+    read_function: Callable[..., Any],
+    task_handle: object,
+    array: numpy.typing.NDArray,
+    number_of_samples_per_channel: int,
+    timeout: float,
+) -> tuple[int, DaqError | None]:
+    """Read from one task and return the number of samples read and the error, if any."""
+    try:
+        samples_read = read_function(
+            task_handle,
+            number_of_samples_per_channel,
+            timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            array,
+        )[1]
+    except DaqReadError as e:
+        return e.samps_per_chan_read, e
+    except DaqError as e:
+        return 0, e
+    return samples_read, None
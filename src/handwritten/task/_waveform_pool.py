@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import numpy
+from nitypes.waveform import AnalogWaveform, Timing
+
+from nidaqmx.constants import READ_ALL_AVAILABLE, ReallocationPolicy, WaveformAttributeMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import DaqError
+from nidaqmx.task._read_plan import _ReadKind
+
+
+class WaveformPool:
+    """Reads analog waveforms into a set of waveforms that is reused for every read.
+
+    The Task.read_waveform method creates new waveforms for every read,
+    which allocates a sample buffer per channel per read. A WaveformPool
+    owns one AnalogWaveform per channel to read and reads each block of
+    samples into those waveforms instead, which avoids the allocations
+    in continuous acquisition loops.
+
+    The waveforms returned by a read are valid until the next read from
+    the same pool, when their samples, timing, and extended properties
+    are overwritten. Copy the waveforms if you need to keep them.
+
+    If a read requests more samples than a waveform can hold, the
+    reallocation policy specifies what happens.
+    ReallocationPolicy.TO_GROW increases the capacity of the waveforms.
+    ReallocationPolicy.DO_NOT_REALLOCATE raises an error.
+    """
+
+    __slots__ = ("_task", "_reallocation_policy", "_waveforms")
+
+    def __init__(self, task, reallocation_policy):
+        """Initialize a new WaveformPool.
+
+        Use the Task.create_waveform_pool method instead of creating a
+        WaveformPool directly.
+
+        Args:
+            task (nidaqmx.Task): Specifies the task to read from.
+            reallocation_policy (nidaqmx.constants.ReallocationPolicy):
+                Specifies what happens when a read requests more samples
+                than the waveforms can hold.
+        """
+        self._task = task
+        self._reallocation_policy = reallocation_policy
+        self._waveforms: list[AnalogWaveform[numpy.float64]] = []
+
+    @property
+    def reallocation_policy(self):
+        """:class:`nidaqmx.constants.ReallocationPolicy`: Indicates the reallocation policy."""
+        return self._reallocation_policy
+
+    @property
+    def capacity(self):
+        """int: Indicates the number of samples per channel that the waveforms can hold."""
+        return self._waveforms[0].capacity if self._waveforms else 0
+
+    def read_waveforms(self, number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
+        """Reads analog samples from the task into the waveforms of the pool.
+
+        Args:
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read. See the Task.read_waveform
+                method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. See the
+                Task.read_waveform method.
+
+        Returns:
+            List[nitypes.waveform.AnalogWaveform]:
+
+            Indicates one waveform per channel to read, in the order of
+            the channels to read. The waveforms are reused by the next
+            read from this pool.
+        """
+        task = self._task
+        read_plan = task._get_read_plan()
+        if read_plan.kind not in (_ReadKind.ANALOG, _ReadKind.POWER):
+            raise DaqError(
+                "Waveform pools only support reading analog input channels.",
+                DAQmxErrors.UNKNOWN,
+                task_name=task.name,
+            )
+
+        number_of_samples_per_channel = task._calculate_num_samps_per_chan(
+            number_of_samples_per_channel
+        )
+        waveforms = self._get_waveforms(read_plan.number_of_channels, number_of_samples_per_channel)
+
+        waveform_attribute_mode = task._get_waveform_attribute_mode()
+        if WaveformAttributeMode.TIMING not in waveform_attribute_mode:
+            # Do not return the timing of an earlier read.
+            for waveform in waveforms:
+                waveform.timing = Timing.empty
+
+        task._interpreter.read_analog_waveforms(
+            task._handle,
+            number_of_samples_per_channel,
+            timeout,
+            waveforms,
+            waveform_attribute_mode,
+        )
+        task._apply_extended_properties_snapshot(waveforms)
+        return list(waveforms)
+
+    def _get_waveforms(self, number_of_channels, number_of_samples_per_channel):
+        """Returns the waveforms to read into, creating or growing them if necessary."""
+        waveforms = self._waveforms
+        if len(waveforms) != number_of_channels:
+            waveforms = self._waveforms = [
+                AnalogWaveform(number_of_samples_per_channel) for _ in range(number_of_channels)
+            ]
+        elif waveforms[0].capacity < number_of_samples_per_channel:
+            if self._reallocation_policy != ReallocationPolicy.TO_GROW:
+                raise DaqError(
+                    f"The waveforms in the pool do not have enough space ({waveforms[0].capacity}) "
+                    f"to hold the requested number of samples ({number_of_samples_per_channel}). "
+                    "Use ReallocationPolicy.TO_GROW or read fewer samples.",
+                    DAQmxErrors.READ_BUFFER_TOO_SMALL,
+                    task_name=self._task.name,
+                )
+            for waveform in waveforms:
+                waveform.capacity = number_of_samples_per_channel
+        return waveforms
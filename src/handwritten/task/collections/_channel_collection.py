@@ -1,4 +1,7 @@
 from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+import numpy
 
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.errors import DaqError
@@ -6,27 +9,64 @@ from nidaqmx.task.channels._channel import Channel
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 
 
+class _ChannelAttribute(NamedTuple):
+    """A channel property that ChannelCollection.get() and set() access for all channels."""
+
+    attribute_id: int
+    value_type: str
+    enum_type: Any
+    readable: bool
+    writable: bool
+
+
+# The NumPy dtypes of the arrays that ChannelCollection.get() returns, by interpreter value type.
+# Enum properties return arrays of enum members.
+_CHANNEL_ATTRIBUTE_DTYPES = {
+    "bool": numpy.bool_,
+    "double": numpy.float64,
+    "int32": numpy.int32,
+    "string": object,
+    "uint32": numpy.uint32,
+}
+
+# Converts a value to the type that the interpreter set functions take, by interpreter value type.
+_CHANNEL_ATTRIBUTE_CONVERTERS = {
+    "bool": bool,
+    "double": float,
+    "int32": int,
+    "string": str,
+    "uint32": int,
+}
+
+
 class ChannelCollection(Sequence):
     """Contains the collection of channels for a DAQmx Task.
 
     This class defines methods that implements a container object.
     """
 
-    def __init__(self, task_handle, interpreter):
+    # The generated subclasses list the channel properties that get() and set() access.
+    _CHANNEL_ATTRIBUTES: dict[str, _ChannelAttribute] = {}
+
+    def __init__(self, task_handle, interpreter, task=None):
         """Do not construct this object directly; instead, construct a nidaqmx.Task and use the appropriate property, such as task.ai_channels."""  # noqa: W505 - doc line too long (146 > 100 characters) (auto-generated noqa)
         self._handle = task_handle
         self._interpreter = interpreter
+        self._task = task
 
     def __contains__(  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
         self, item
     ):
-        channel_names = self.channel_names
-
         if isinstance(item, str):
             items = unflatten_channel_string(item)
         elif isinstance(item, Channel):
             items = item.channel_names
 
+        channel_index = self._get_channel_index()
+        if channel_index is not None:
+            return channel_index.contains(items)
+
+        channel_names = self.channel_names
         return all([item in channel_names for item in items])
 
     def __eq__(self, other):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
@@ -55,10 +95,17 @@ class ChannelCollection(Sequence):
             Indicates a channel object representing the subset of virtual
             channels indexed.
         """
+        channel_index = self._get_channel_index()
         if isinstance(index, int):
-            channel_names = self.channel_names[index]
+            if channel_index is not None:
+                channel_names = channel_index.get_channel_name(index)
+            else:
+                channel_names = self.channel_names[index]
         elif isinstance(index, slice):
-            channel_names = flatten_channel_string(self.channel_names[index])
+            if channel_index is not None:
+                channel_names = flatten_channel_string(channel_index.get_channel_name(index))
+            else:
+                channel_names = flatten_channel_string(self.channel_names[index])
         elif isinstance(index, str):
             channel_names = index
         else:
@@ -68,7 +115,7 @@ class ChannelCollection(Sequence):
             )
 
         if channel_names:
-            return Channel._factory(self._handle, channel_names, self._interpreter)
+            return self._get_channel(channel_names)
         else:
             raise DaqError(
                 "You cannot specify an empty index when indexing channels.\n"
@@ -81,9 +128,12 @@ class ChannelCollection(Sequence):
 
     def __iter__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
         for channel_name in self.channel_names:
-            yield Channel._factory(self._handle, channel_name, self._interpreter)
+            yield self._get_channel(channel_name)
 
     def __len__(self):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
+        channel_index = self._get_channel_index()
+        if channel_index is not None:
+            return len(channel_index)
         return len(self.channel_names)
 
     def __ne__(self, other):  # noqa: D105 - Missing docstring in magic method (auto-generated noqa)
@@ -94,16 +144,258 @@ class ChannelCollection(Sequence):
         channel_names.reverse()
 
         for channel_name in channel_names:
-            yield Channel._factory(self._handle, channel_name, self._interpreter)
+            yield self._get_channel(channel_name)
+
+    def add_chans(self, add_chan_method, channels):
+        """Creates many virtual channels with as few driver calls as possible.
+
+        Each row of **channels** specifies the arguments of one call to
+        **add_chan_method**. Adjacent rows whose arguments differ only in
+        **physical_channel** are combined into one call, so a table of
+        channels that share a configuration is created by one driver call.
+
+        Example:
+            >>> task.ai_channels.add_chans(
+            ...     "add_ai_voltage_chan",
+            ...     [{"physical_channel": f"Dev1/ai{i}", "max_val": 5.0} for i in range(256)],
+            ... )
+
+        Args:
+            add_chan_method (str): Specifies the name of the channel
+                creation method of this collection to call, such as
+                "add_ai_voltage_chan". You can also pass the bound
+                method itself.
+            channels: Specifies the arguments of each channel, either
+                as a list of dictionaries with one dictionary per
+                channel, or as a dictionary of columns with one list of
+                values per argument. Each row must specify
+                **physical_channel**.
+        Returns:
+            nidaqmx.task.channels.Channel:
+
+            Indicates a channel object that represents all of the
+            created channels. Its type matches the type of the channel
+            that **add_chan_method** returns.
+        """
+        add_chan = self._get_add_chan_method(add_chan_method)
+        rows = _get_channel_table_rows(channels)
+
+        virtual_channel_names: list[str] = []
+        channel_type = None
+        for physical_channels, names, kwargs in _merge_channel_table_rows(rows):
+            if names:
+                kwargs["name_to_assign_to_channel"] = flatten_channel_string(names)
+            channel = add_chan(flatten_channel_string(physical_channels), **kwargs)
+            # Combined named rows create one channel per name, so their names are known.
+            virtual_channel_names.extend(names if len(names) > 1 else [channel._name])
+            channel_type = type(channel)
+
+        if channel_type is None:
+            raise DaqError("You must specify at least one channel to create.", DAQmxErrors.UNKNOWN)
+        return channel_type(
+            self._handle, flatten_channel_string(virtual_channel_names), self._interpreter
+        )
+
+    def get(self, property_name):
+        """Gets a channel property of every channel in the collection.
+
+        The channel values are requested together where the interpreter
+        supports it, such as over gRPC.
+
+        Example:
+            >>> ranges = task.ai_channels.get("ai_rng_high")
+
+        Args:
+            property_name (str): Specifies the name of the channel
+                property to get, such as "ai_max".
+        Returns:
+            numpy.ndarray:
+
+            Indicates the value of the property for each channel, in
+            the order of **channel_names**. String properties and
+            enum properties return an array of objects.
+        """
+        attribute = self._get_channel_attribute(property_name, "readable")
+        values = self._interpreter.get_chan_attributes(
+            self._handle, self.channel_names, attribute.attribute_id, attribute.value_type
+        )
+        if attribute.enum_type is not None:
+            return numpy.array([attribute.enum_type(value) for value in values], dtype=object)
+        return numpy.array(values, dtype=_CHANNEL_ATTRIBUTE_DTYPES[attribute.value_type])
+
+    def set(self, property_name, values):
+        """Sets a channel property of every channel in the collection.
+
+        Channels that are set to the same value are set with one driver
+        call, and the calls are batched where the interpreter supports
+        it, such as over gRPC.
+
+        Example:
+            >>> task.ai_channels.set("ai_max", numpy.linspace(1.0, 10.0, len(task.ai_channels)))
+
+        Args:
+            property_name (str): Specifies the name of the channel
+                property to set, such as "ai_max".
+            values: Specifies one value for all channels, or a sequence
+                or NumPy array with one value per channel, in the order
+                of **channel_names**.
+        """
+        attribute = self._get_channel_attribute(property_name, "writable")
+        channel_names = self.channel_names
+        if numpy.ndim(values) == 0:
+            values = [values] * len(channel_names)
+        elif len(values) != len(channel_names):
+            raise DaqError(
+                f"The number of values ({len(values)}) does not match the number of channels "
+                f"({len(channel_names)}).",
+                DAQmxErrors.UNKNOWN,
+            )
+
+        convert = _CHANNEL_ATTRIBUTE_CONVERTERS[attribute.value_type]
+        channel_names_by_value: dict[Any, list[str]] = {}
+        for channel_name, value in zip(channel_names, values):
+            if attribute.enum_type is not None:
+                value = value.value
+            channel_names_by_value.setdefault(convert(value), []).append(channel_name)
+
+        set_chan_attribute = getattr(
+            self._interpreter, f"set_chan_attribute_{attribute.value_type}"
+        )
+        self._interpreter.begin_batch(self._handle)
+        try:
+            for value, value_channel_names in channel_names_by_value.items():
+                set_chan_attribute(
+                    self._handle,
+                    flatten_channel_string(value_channel_names),
+                    attribute.attribute_id,
+                    value,
+                )
+        finally:
+            self._interpreter.end_batch(self._handle)
+
+    def _get_channel_attribute(self, property_name, access):
+        """Returns the channel attribute of the property, checking that it has the access."""
+        attribute = self._CHANNEL_ATTRIBUTES.get(property_name)
+        if attribute is None or not getattr(attribute, access):
+            raise DaqError(
+                f'"{property_name}" is not a {access} channel property that '
+                f"{type(self).__name__} can access for all channels.",
+                DAQmxErrors.UNKNOWN,
+            )
+        return attribute
+
+    def _get_add_chan_method(self, add_chan_method):
+        """Returns the bound channel creation method with the specified name."""
+        name = getattr(add_chan_method, "__name__", add_chan_method)
+        method = getattr(self, name, None) if isinstance(name, str) else None
+        if not callable(method) or not name.startswith("add_"):
+            raise DaqError(
+                f'"{add_chan_method}" is not a channel creation method of '
+                f"{type(self).__name__}.",
+                DAQmxErrors.UNKNOWN,
+            )
+        return method
+
+    def _get_channel_index(self):
+        """Returns the channel index of the owning task, or None if there is no owning task."""
+        if self._task is None:
+            return None
+        return self._task._get_channel_index()
+
+    def _get_channel(self, virtual_or_physical_name):
+        """Returns a channel object for the flattened name, reusing the cached one if possible."""
+        channel_index = self._get_channel_index()
+        if channel_index is not None:
+            return channel_index.get_channel(virtual_or_physical_name)
+        return Channel._factory(self._handle, virtual_or_physical_name, self._interpreter)
+
+    def _notify_channels_changed(self):
+        """Tells the owning task to discard metadata derived from its channels."""
+        if self._task is not None:
+            self._task._invalidate_channel_caches()
 
     @property
     def all(self):
         """:class:`nidaqmx.task.channels.Channel`: Specifies a channel object that represents the entire list of virtual channels on this channel collection."""  # noqa: W505 - doc line too long (160 > 100 characters) (auto-generated noqa)
         # Passing a blank string means all channels.
-        return Channel._factory(self._handle, "", self._interpreter)
+        return self._get_channel("")
 
     @property
     def channel_names(self):
         """List[str]: Specifies the entire list of virtual channels on this channel collection."""
+        channel_index = self._get_channel_index()
+        if channel_index is not None:
+            return channel_index.channel_names
         val = self._interpreter.get_task_attribute_string(self._handle, 0x1273)
         return unflatten_channel_string(val)
+
+
+def _get_channel_table_rows(channels):
+    """Returns the rows of a channel table that is a list of rows or a dictionary of columns."""
+    if isinstance(channels, dict):
+        columns = list(channels.values())
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise DaqError(
+                "The columns of the channel table must have the same length.",
+                DAQmxErrors.UNKNOWN,
+            )
+        return [dict(zip(channels.keys(), values)) for values in zip(*columns)]
+    return [dict(row) for row in channels]
+
+
+def _merge_channel_table_rows(rows):
+    """Yields the physical channels, names, and other arguments of each run of mergeable rows."""
+    physical_channels = []
+    names = []
+    kwargs = None
+    for row in rows:
+        try:
+            physical_channel = row.pop("physical_channel")
+        except KeyError:
+            raise DaqError(
+                "Each row of the channel table must specify physical_channel.",
+                DAQmxErrors.UNKNOWN,
+            ) from None
+        name = row.pop("name_to_assign_to_channel", "")
+        # A name is assigned to a single channel only if the row creates a single channel, so
+        # only combine named rows that do.
+        mergeable = not name or len(unflatten_channel_string(physical_channel)) == 1
+        if (
+            kwargs is not None
+            and mergeable
+            and bool(name) == bool(names)
+            and _arguments_equal(kwargs, row)
+        ):
+            physical_channels.append(physical_channel)
+            if name:
+                names.append(name)
+            continue
+        if kwargs is not None:
+            yield physical_channels, names, kwargs
+        physical_channels = [physical_channel]
+        names = [name] if name else []
+        kwargs = row
+        if not mergeable:
+            # Do not combine later rows with this one.
+            yield physical_channels, [name], kwargs
+            kwargs = None
+    if kwargs is not None:
+        yield physical_channels, names, kwargs
+
+
+def _arguments_equal(left, right):
+    """Returns whether two rows of a channel table specify the same arguments."""
+    if left.keys() != right.keys():
+        return False
+    for key, value in left.items():
+        other = right[key]
+        if value is other:
+            continue
+        try:
+            if not bool(value == other):
+                return False
+        except ValueError:
+            # Arrays with more than one element are ambiguous in a boolean context.
+            return False
+    return True
@@ -3,6 +3,8 @@
 import collections
 import typing
 
+import numpy
+
 # region Task Counter IO namedtuples
 
 CtrFreq = collections.namedtuple("CtrFreq", ["freq", "duty_cycle"])
@@ -19,6 +21,21 @@ PowerMeasurement = collections.namedtuple("PowerMeasurement", ["voltage", "curre
 
 # endregion
 
+# region Structured NumPy dtypes
+
+# These dtypes use the same field names as the corresponding namedtuples, so a record of a
+# structured array can be accessed the same way as a namedtuple, e.g. data[0]["freq"].
+
+CTR_FREQ_DTYPE = numpy.dtype([("freq", numpy.float64), ("duty_cycle", numpy.float64)])
+
+CTR_TICK_DTYPE = numpy.dtype([("high_tick", numpy.uint32), ("low_tick", numpy.uint32)])
+
+CTR_TIME_DTYPE = numpy.dtype([("high_time", numpy.float64), ("low_time", numpy.float64)])
+
+POWER_MEASUREMENT_DTYPE = numpy.dtype([("voltage", numpy.float64), ("current", numpy.float64)])
+
+# endregion
+
 # region Watchdog namedtuples
 
 AOExpirationState = collections.namedtuple(
@@ -0,0 +1,358 @@
+"""In-process stand-in for the NI gRPC Device Server."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import google.protobuf.message
+import grpc
+import numpy
+
+from nidaqmx._stubs import data_moniker_pb2, data_moniker_pb2_grpc, nidaqmx_pb2, nidaqmx_pb2_grpc
+from nidaqmx.constants import DataJustification
+
+STAND_IN_ERROR_STRING = "Stand-in error."
+STAND_IN_TASK_NAME = "MyTask"
+
+# Benchmarks send and receive messages that are larger than the default 4 MB limit.
+STAND_IN_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+
+class StandInNiDAQmxServicer(nidaqmx_pb2_grpc.NiDAQmxServicer):
+    """Implements the NiDAQmx RPCs that the interpreter tests use, without a driver.
+
+    Each read returns samples that are equal to the number of reads that the servicer has handled,
+    including the reads for data monikers. Set "read_array" to return specific samples instead,
+    and set "read_status" to make the reads return an error or warning. Each write writes all of
+    the samples in the request.
+
+    ReadRaw returns the samples of "num_chans" channels, interleaved by scan, with
+    "raw_data_width" bytes per sample. Set "raw_data_width" to None to make ReadRaw unimplemented.
+
+    SetChanAttributeDouble waits for "set_gate" and returns the error in "set_errors" for the
+    channel, if any.
+
+    RegisterEveryNSamplesEvent sends "event_count" events and ends the event stream, or returns
+    the error in "register_error", if any.
+
+    ReadDigitalLines returns the low bit of each sample as a line state, with "num_lines" lines
+    per sample. GetTimingAttributeDouble returns "samp_clk_rate" for every timing attribute, or
+    returns an error if "samp_clk_rate" is None.
+    """
+
+    def __init__(self):
+        """Initialize a new StandInNiDAQmxServicer."""
+        self.read_status = 0
+        self.read_count = 0
+        self.read_array: list[float] | None = None
+        self.read_response_bytes = 0
+        self.num_chans = 1
+        self.raw_data_width: int | None = 2
+        self.raw_samp_justification = DataJustification.RIGHT
+        self.num_lines = 1
+        self.samp_clk_rate: float | None = 1000.0
+        self.chan_attributes: dict[tuple[str, int], float] = {}
+        self.set_errors: dict[str, int] = {}
+        self.set_gate = threading.Event()
+        self.set_gate.set()
+        self.event_count = 3
+        self.register_error: int | None = None
+        # Only keep the latest requests, so that benchmarks do not accumulate large requests.
+        self.requests: deque[Any] = deque(maxlen=16)
+        self._monikers: dict[int, nidaqmx_pb2.BeginReadAnalogF64Request] = {}
+        self._lock = threading.Lock()
+
+    def GetErrorString(self, request, context):  # noqa: N802 - function name 'GetErrorString' should be lowercase (auto-generated noqa)
+        """Returns the same error string for every error code."""
+        return nidaqmx_pb2.GetErrorStringResponse(error_string=STAND_IN_ERROR_STRING)
+
+    def GetTaskAttributeString(self, request, context):  # noqa: N802 - function name 'GetTaskAttributeString' should be lowercase (auto-generated noqa)
+        """Returns the stand-in task name for every task attribute."""
+        return nidaqmx_pb2.GetTaskAttributeStringResponse(status=0, value=STAND_IN_TASK_NAME)
+
+    def GetReadAttributeUInt32(self, request, context):  # noqa: N802 - function name 'GetReadAttributeUInt32' should be lowercase (auto-generated noqa)
+        """Returns the number of channels or the raw data width."""
+        values = {0x217A: self.raw_data_width or 0, 0x217B: self.num_chans}
+        return nidaqmx_pb2.GetReadAttributeUInt32Response(
+            status=0, value=values.get(request.attribute_raw, 0)
+        )
+
+    def GetTimingAttributeDouble(self, request, context):  # noqa: N802 - function name 'GetTimingAttributeDouble' should be lowercase (auto-generated noqa)
+        """Returns the sample clock rate for every timing attribute."""
+        if self.samp_clk_rate is not None:
+            return nidaqmx_pb2.GetTimingAttributeDoubleResponse(status=0, value=self.samp_clk_rate)
+        context.set_trailing_metadata((("ni-error", "-200452"),))
+        context.abort(grpc.StatusCode.UNKNOWN, STAND_IN_ERROR_STRING)
+
+    def GetChanAttributeInt32(self, request, context):  # noqa: N802 - function name 'GetChanAttributeInt32' should be lowercase (auto-generated noqa)
+        """Returns the raw sample justification for every channel attribute."""
+        return nidaqmx_pb2.GetChanAttributeInt32Response(
+            status=0, value_raw=self.raw_samp_justification.value
+        )
+
+    def GetChanAttributeDouble(self, request, context):  # noqa: N802 - function name 'GetChanAttributeDouble' should be lowercase (auto-generated noqa)
+        """Returns the value that SetChanAttributeDouble set."""
+        value = self.chan_attributes.get((request.channel, request.attribute_raw), 0.0)
+        return nidaqmx_pb2.GetChanAttributeDoubleResponse(status=0, value=value)
+
+    def SetChanAttributeDouble(self, request, context):  # noqa: N802 - function name 'SetChanAttributeDouble' should be lowercase (auto-generated noqa)
+        """Sets a stand-in channel attribute."""
+        self.set_gate.wait(timeout=10.0)
+        self.requests.append(request)
+        error_code = self.set_errors.get(request.channel)
+        if error_code is not None:
+            context.set_trailing_metadata((("ni-error", str(error_code)),))
+            context.abort(grpc.StatusCode.UNKNOWN, STAND_IN_ERROR_STRING)
+        self.chan_attributes[(request.channel, request.attribute_raw)] = request.value
+        return nidaqmx_pb2.SetChanAttributeDoubleResponse(status=0)
+
+    def ReadAnalogF64(self, request, context):  # noqa: N802 - function name 'ReadAnalogF64' should be lowercase (auto-generated noqa)
+        """Reads stand-in analog samples."""
+        self.requests.append(request)
+        return self._respond(
+            nidaqmx_pb2.ReadAnalogF64Response(**self._read(request, request.array_size_in_samps))
+        )
+
+    def ReadBinaryI16(self, request, context):  # noqa: N802 - function name 'ReadBinaryI16' should be lowercase (auto-generated noqa)
+        """Reads stand-in unscaled samples."""
+        self.requests.append(request)
+        return self._respond(
+            nidaqmx_pb2.ReadBinaryI16Response(**self._read(request, request.array_size_in_samps))
+        )
+
+    def ReadRaw(self, request, context):  # noqa: N802 - function name 'ReadRaw' should be lowercase (auto-generated noqa)
+        """Reads stand-in unscaled samples as raw samples."""
+        if self.raw_data_width is None:
+            return super().ReadRaw(request, context)
+        self.requests.append(request)
+        values = self._read(request, request.array_size_in_bytes // self.raw_data_width)
+        samples = numpy.array(values["read_array"], dtype=f"<i{self.raw_data_width}")
+        num_samps_per_chan = request.num_samps_per_chan
+        scans = samples[: self.num_chans * num_samps_per_chan].reshape(self.num_chans, -1).T
+        return self._respond(
+            nidaqmx_pb2.ReadRawResponse(
+                status=values["status"],
+                read_array=scans.tobytes(),
+                samps_read=num_samps_per_chan,
+                num_bytes_per_samp=self.raw_data_width,
+            )
+        )
+
+    def ReadDigitalLines(self, request, context):  # noqa: N802 - function name 'ReadDigitalLines' should be lowercase (auto-generated noqa)
+        """Reads stand-in line states."""
+        self.requests.append(request)
+        values = self._read(request, request.array_size_in_bytes)
+        line_states = numpy.asarray(values["read_array"], dtype=numpy.int64) & 1
+        return self._respond(
+            nidaqmx_pb2.ReadDigitalLinesResponse(
+                status=values["status"],
+                read_array=line_states.astype(numpy.uint8).tobytes(),
+                samps_per_chan_read=values["samps_per_chan_read"],
+                num_bytes_per_samp=self.num_lines,
+            )
+        )
+
+    def WriteAnalogF64(self, request, context):  # noqa: N802 - function name 'WriteAnalogF64' should be lowercase (auto-generated noqa)
+        """Writes analog samples."""
+        self.requests.append(request)
+        return nidaqmx_pb2.WriteAnalogF64Response(
+            status=0, samps_per_chan_written=request.num_samps_per_chan
+        )
+
+    def WriteDigitalLines(self, request, context):  # noqa: N802 - function name 'WriteDigitalLines' should be lowercase (auto-generated noqa)
+        """Writes line states."""
+        self.requests.append(request)
+        return nidaqmx_pb2.WriteDigitalLinesResponse(
+            status=0, samps_per_chan_written=request.num_samps_per_chan
+        )
+
+    def WriteBinaryI16(self, request, context):  # noqa: N802 - function name 'WriteBinaryI16' should be lowercase (auto-generated noqa)
+        """Writes unscaled samples."""
+        self.requests.append(request)
+        return nidaqmx_pb2.WriteBinaryI16Response(
+            status=0, samps_per_chan_written=request.num_samps_per_chan
+        )
+
+    def RegisterEveryNSamplesEvent(self, request, context):  # noqa: N802 - function name 'RegisterEveryNSamplesEvent' should be lowercase (auto-generated noqa)
+        """Sends stand-in every N samples events."""
+        self.requests.append(request)
+        if self.register_error is not None:
+            context.set_trailing_metadata((("ni-error", str(self.register_error)),))
+            context.abort(grpc.StatusCode.UNKNOWN, STAND_IN_ERROR_STRING)
+        context.send_initial_metadata(())
+        for _ in range(self.event_count):
+            yield nidaqmx_pb2.RegisterEveryNSamplesEventResponse(
+                status=0,
+                every_n_samples_event_type_raw=request.every_n_samples_event_type_raw,
+                n_samples=request.n_samples,
+            )
+
+    def BeginReadAnalogF64(self, request, context):  # noqa: N802 - function name 'BeginReadAnalogF64' should be lowercase (auto-generated noqa)
+        """Creates a data moniker that reads stand-in analog samples."""
+        self.requests.append(request)
+        with self._lock:
+            data_instance = len(self._monikers) + 1
+            self._monikers[data_instance] = request
+        return nidaqmx_pb2.BeginReadAnalogF64Response(
+            status=0, moniker=data_moniker_pb2.Moniker(data_instance=data_instance)
+        )
+
+    def read_moniker(self, moniker: data_moniker_pb2.Moniker) -> google.protobuf.message.Message:
+        """Read the samples for a data moniker that BeginReadAnalogF64 created."""
+        with self._lock:
+            request = self._monikers[moniker.data_instance]
+        return nidaqmx_pb2.MonikerReadAnalogF64Response(
+            **self._read(request, request.array_size_in_samps)
+        )
+
+    def _read(self, request, array_size_in_samps):
+        with self._lock:
+            self.read_count += 1
+            read_count = self.read_count
+        read_array = self.read_array
+        if read_array is None:
+            read_array = [read_count] * array_size_in_samps
+        return dict(
+            status=self.read_status,
+            read_array=read_array,
+            samps_per_chan_read=request.num_samps_per_chan,
+        )
+
+    def _respond(self, response):
+        with self._lock:
+            self.read_response_bytes += response.ByteSize()
+        return response
+
+
+class StandInDataMonikerServicer(data_moniker_pb2_grpc.DataMonikerServicer):
+    """Implements DataMoniker.StreamReadWrite for the monikers of a StandInNiDAQmxServicer."""
+
+    def __init__(self, nidaqmx_servicer: StandInNiDAQmxServicer):
+        """Initialize a new StandInDataMonikerServicer."""
+        self.stream_count = 0
+        self._nidaqmx_servicer = nidaqmx_servicer
+
+    def StreamReadWrite(self, request_iterator, context):  # noqa: N802 - function name 'StreamReadWrite' should be lowercase (auto-generated noqa)
+        """Reads each read moniker once for each request after the first."""
+        self.stream_count += 1
+        read_monikers = next(request_iterator).monikers.read_monikers
+        for _ in request_iterator:
+            values = data_moniker_pb2.MonikerValues()
+            for moniker in read_monikers:
+                values.values.add().Pack(self._nidaqmx_servicer.read_moniker(moniker))
+            yield data_moniker_pb2.MonikerReadResponse(data=values)
+
+
+class StandInAioNiDAQmxServicer(StandInNiDAQmxServicer):
+    """Implements the reads, writes, and waits of StandInNiDAQmxServicer as coroutines.
+
+    Each read, write, and wait waits for "operation_delay" seconds without blocking the event
+    loop of the server, like a driver call that waits for samples. "max_active_operations" is the
+    largest number of these calls that the servicer has handled at the same time.
+    """
+
+    def __init__(self):
+        """Initialize a new StandInAioNiDAQmxServicer."""
+        super().__init__()
+        self.operation_delay = 0.0
+        self.active_operations = 0
+        self.max_active_operations = 0
+
+    async def GetErrorString(self, request, context):  # noqa: N802 - function name 'GetErrorString' should be lowercase (auto-generated noqa)
+        """Returns the same error string for every error code."""
+        return super().GetErrorString(request, context)
+
+    async def ReadAnalogF64(self, request, context):  # noqa: N802 - function name 'ReadAnalogF64' should be lowercase (auto-generated noqa)
+        """Reads stand-in analog samples after the operation delay."""
+        await self._wait()
+        return super().ReadAnalogF64(request, context)
+
+    async def WriteBinaryI16(self, request, context):  # noqa: N802 - function name 'WriteBinaryI16' should be lowercase (auto-generated noqa)
+        """Writes unscaled samples after the operation delay."""
+        await self._wait()
+        return super().WriteBinaryI16(request, context)
+
+    async def WaitUntilTaskDone(self, request, context):  # noqa: N802 - function name 'WaitUntilTaskDone' should be lowercase (auto-generated noqa)
+        """Waits for the operation delay."""
+        self.requests.append(request)
+        await self._wait()
+        return nidaqmx_pb2.WaitUntilTaskDoneResponse(status=0)
+
+    async def _wait(self):
+        self.active_operations += 1
+        self.max_active_operations = max(self.max_active_operations, self.active_operations)
+        try:
+            await asyncio.sleep(self.operation_delay)
+        finally:
+            self.active_operations -= 1
+
+
+class StandInAioGrpcServer:
+    """Hosts a StandInAioNiDAQmxServicer on a grpc.aio server in the test process.
+
+    The server runs on its own event loop thread, so that synchronous and grpc.aio clients can
+    call it from any thread or event loop.
+    """
+
+    def __init__(self):
+        """Start a new StandInAioGrpcServer."""
+        self.nidaqmx_servicer = StandInAioNiDAQmxServicer()  # type: ignore[abstract]
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="stand-in grpc.aio server", daemon=True
+        )
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    def __enter__(self):
+        """Returns the StandInAioGrpcServer instance."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stops the StandInAioGrpcServer instance."""
+        asyncio.run_coroutine_threadsafe(self._server.stop(grace=None), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _start(self):
+        server = grpc.aio.server(options=STAND_IN_CHANNEL_OPTIONS)
+        nidaqmx_pb2_grpc.add_NiDAQmxServicer_to_server(self.nidaqmx_servicer, server)
+        self.server_port = server.add_insecure_port("localhost:0")
+        await server.start()
+        return server
+
+
+class StandInGrpcServer:
+    """Hosts stand-in servicers on a local port in the test process."""
+
+    def __init__(self):
+        """Start a new StandInGrpcServer."""
+        self.nidaqmx_servicer = StandInNiDAQmxServicer()  # type: ignore[abstract]
+        self.data_moniker_servicer = StandInDataMonikerServicer(  # type: ignore[abstract]
+            self.nidaqmx_servicer
+        )
+        self._server = grpc.server(
+            ThreadPoolExecutor(max_workers=4), options=STAND_IN_CHANNEL_OPTIONS
+        )
+        nidaqmx_pb2_grpc.add_NiDAQmxServicer_to_server(self.nidaqmx_servicer, self._server)
+        data_moniker_pb2_grpc.add_DataMonikerServicer_to_server(
+            self.data_moniker_servicer, self._server
+        )
+        self.server_port = self._server.add_insecure_port("localhost:0")
+        self._server.start()
+
+    def __enter__(self):
+        """Returns the StandInGrpcServer instance."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stops the StandInGrpcServer instance."""
+        self._server.stop(grace=None)
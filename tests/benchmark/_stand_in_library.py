@@ -0,0 +1,107 @@
+"""Stand-in for the NI-DAQmx C library, used to benchmark interpreter overhead."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Each function has the same signature as the NI-DAQmx C function with the same name and returns
+# immediately, so benchmarks that call it measure only the Python and ctypes overhead.
+_STAND_IN_LIBRARY_SOURCE = r"""
+#include <stdarg.h>
+#include <stdint.h>
+#include <string.h>
+
+typedef void* TaskHandle;
+typedef uint32_t bool32;
+
+int32_t DAQmxIsTaskDone(TaskHandle task, bool32* isTaskDone)
+{
+    *isTaskDone = 1;
+    return 0;
+}
+
+int32_t DAQmxGetTaskAttribute(TaskHandle task, int32_t attribute, void* value, ...)
+{
+    /* Task objects get the task name when they are created. This is the only task attribute
+       that the benchmarks get, so every attribute returns it. */
+    static const char name[] = "StandInTask";
+    va_list args;
+    uint32_t size;
+
+    va_start(args, value);
+    size = va_arg(args, uint32_t);
+    va_end(args);
+
+    if (size == 0)
+        return (int32_t)sizeof(name);
+    strncpy((char*)value, name, size);
+    ((char*)value)[size - 1] = '\0';
+    return 0;
+}
+
+int32_t DAQmxInternalReadAnalogWaveformPerChan(
+    TaskHandle task, int32_t numSampsPerChan, double timeout, int64_t t0Array[],
+    int64_t dtArray[], uint32_t timingArraySize, void* setWfmAttrCallback,
+    void* setWfmAttrCallbackData, double* readArrays[], uint32_t readArraysCount,
+    uint32_t arraySizeInSampsPerChan, int32_t* sampsPerChanRead, bool32* reserved)
+{
+    uint32_t i;
+    for (i = 0; t0Array != NULL && i < timingArraySize; i++)
+        t0Array[i] = 0;
+    for (i = 0; dtArray != NULL && i < timingArraySize; i++)
+        dtArray[i] = 1;
+    *sampsPerChanRead = numSampsPerChan;
+    return 0;
+}
+
+int32_t DAQmxReadAnalogF64(
+    TaskHandle task, int32_t numSampsPerChan, double timeout, int32_t fillMode,
+    double readArray[], uint32_t arraySizeInSamps, int32_t* sampsPerChanRead, bool32* reserved)
+{
+    *sampsPerChanRead = numSampsPerChan;
+    return 0;
+}
+
+int32_t DAQmxReadAnalogScalarF64(TaskHandle task, double timeout, double* value, bool32* reserved)
+{
+    *value = 0.0;
+    return 0;
+}
+
+int32_t DAQmxWriteAnalogF64(
+    TaskHandle task, int32_t numSampsPerChan, bool32 autoStart, double timeout,
+    int32_t dataLayout, const double writeArray[], int32_t* sampsPerChanWritten,
+    bool32* reserved)
+{
+    *sampsPerChanWritten = numSampsPerChan;
+    return 0;
+}
+
+int32_t DAQmxWriteAnalogScalarF64(
+    TaskHandle task, bool32 autoStart, double timeout, double value, bool32* reserved)
+{
+    return 0;
+}
+"""
+
+
+def build_stand_in_library(directory: Path) -> Path | None:
+    """Compile the stand-in library into the given directory.
+
+    Returns None if this platform does not have a C compiler that can build it.
+    """
+    compiler = shutil.which("cc") or shutil.which("gcc") or shutil.which("clang")
+    if compiler is None or not sys.platform.startswith("linux"):
+        return None
+
+    source_path = directory / "nidaqmx_stand_in.c"
+    library_path = directory / "libnidaqmx_stand_in.so"
+    source_path.write_text(_STAND_IN_LIBRARY_SOURCE)
+    subprocess.run(
+        [compiler, "-shared", "-fPIC", "-O2", "-o", str(library_path), str(source_path)],
+        check=True,
+    )
+    return library_path
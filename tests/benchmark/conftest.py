@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import ctypes
+from pathlib import Path
+
 import pytest
 
+import nidaqmx._library_interpreter
 from nidaqmx import Task
+from nidaqmx._lib import DaqFunctionImporter, DaqLibImporter
+from nidaqmx._library_interpreter import LibraryInterpreter, _LibraryFunctionTable
 from nidaqmx.constants import (
     AcquisitionType,
     Edge,
@@ -14,6 +20,7 @@ from nidaqmx.constants import (
     WaveformAttributeMode,
 )
 from nidaqmx.system import Device, System
+from tests.benchmark._stand_in_library import build_stand_in_library
 from tests.conftest import DeviceType, _device_by_product_type
 
 
@@ -200,3 +207,33 @@ def do_port32_benchmark_task(
     _commit_output_task(task, 1, num_samples)
 
     return task
+
+
+@pytest.fixture(scope="session")
+def stand_in_library_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a stand-in for the NI-DAQmx C library."""
+    library_path = build_stand_in_library(tmp_path_factory.mktemp("stand_in_library"))
+    if library_path is None:
+        pytest.skip("Building the stand-in library requires a C compiler on Linux.")
+    return library_path
+
+
+@pytest.fixture
+def stand_in_lib_importer(
+    stand_in_library_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> DaqLibImporter:
+    """Make the library interpreter call the stand-in library instead of NI-DAQmx."""
+    library = ctypes.cdll.LoadLibrary(str(stand_in_library_path))
+    importer = DaqLibImporter()
+    importer._windll = DaqFunctionImporter(library)
+    importer._cdll = DaqFunctionImporter(library)
+    importer._encoding = "utf-8"
+    monkeypatch.setattr(nidaqmx._library_interpreter, "lib_importer", importer)
+    monkeypatch.setattr(nidaqmx._library_interpreter, "_functions", _LibraryFunctionTable())
+    return importer
+
+
+@pytest.fixture
+def stand_in_library_interpreter(stand_in_lib_importer: DaqLibImporter) -> LibraryInterpreter:
+    """Create a library interpreter that calls the stand-in library."""
+    return LibraryInterpreter()
@@ -44,7 +44,6 @@ def test___analog_single_channel_reader___read_many_sample(
 @pytest.mark.parametrize(
     "waveform_attribute_mode", _WAVEFORM_BENCHMARK_MODES, ids=_WAVEFORM_BENCHMARK_MODE_IDS
 )
-@pytest.mark.grpc_skip(reason="read_analog_waveform not implemented in GRPC")
 def test___analog_single_channel_reader___read_waveform(
     benchmark: BenchmarkFixture,
     ai_benchmark_task: Task,
@@ -72,10 +71,16 @@ def test___analog_multi_channel_reader___read_one_sample(
 @pytest.mark.benchmark(group="analog_readers")
 @pytest.mark.parametrize("num_channels", [1, 2, 8])
 @pytest.mark.parametrize("num_samples", [1, 1000])
+@pytest.mark.parametrize("use_trusted_buffers", [False, True])
 def test___analog_multi_channel_reader___read_many_sample(
-    benchmark: BenchmarkFixture, ai_benchmark_task: Task, num_channels: int, num_samples: int
+    benchmark: BenchmarkFixture,
+    ai_benchmark_task: Task,
+    num_channels: int,
+    num_samples: int,
+    use_trusted_buffers: bool,
 ) -> None:
     reader = AnalogMultiChannelReader(ai_benchmark_task.in_stream)
+    reader.use_trusted_buffers = use_trusted_buffers
     data = numpy.full((num_channels, num_samples), math.inf, dtype=numpy.float64)
 
     benchmark(reader.read_many_sample, data, num_samples)
@@ -87,7 +92,6 @@ def test___analog_multi_channel_reader___read_many_sample(
 @pytest.mark.parametrize(
     "waveform_attribute_mode", _WAVEFORM_BENCHMARK_MODES, ids=_WAVEFORM_BENCHMARK_MODE_IDS
 )
-@pytest.mark.grpc_skip(reason="read_analog_waveforms not implemented in GRPC")
 def test___analog_multi_channel_reader___read_waveform(
     benchmark: BenchmarkFixture,
     ai_benchmark_task: Task,
@@ -37,7 +37,6 @@ def test___analog_single_channel_writer___write_many_sample(
 
 @pytest.mark.benchmark(group="analog_writers")
 @pytest.mark.parametrize("num_samples", [1, 1000])
-@pytest.mark.grpc_skip(reason="write_analog_waveform not implemented in GRPC")
 def test___analog_single_channel_writer___write_waveform(
     benchmark: BenchmarkFixture,
     ao_benchmark_task: nidaqmx.Task,
@@ -65,13 +64,16 @@ def test___analog_multi_channel_writer___write_one_sample(
 @pytest.mark.benchmark(group="analog_writers")
 @pytest.mark.parametrize("num_channels", [1, 2])
 @pytest.mark.parametrize("num_samples", [1, 1000])
+@pytest.mark.parametrize("use_trusted_buffers", [False, True])
 def test___analog_multi_channel_writer___write_many_sample(
     benchmark: BenchmarkFixture,
     ao_benchmark_task: nidaqmx.Task,
     num_channels: int,
     num_samples: int,
+    use_trusted_buffers: bool,
 ) -> None:
     writer = AnalogMultiChannelWriter(ao_benchmark_task.out_stream, auto_start=False)
+    writer.use_trusted_buffers = use_trusted_buffers
     data = numpy.full((num_channels, num_samples), 1.0, dtype=numpy.float64)
 
     benchmark(writer.write_many_sample, data)
@@ -80,7 +82,6 @@ def test___analog_multi_channel_writer___write_many_sample(
 @pytest.mark.benchmark(group="analog_writers")
 @pytest.mark.parametrize("num_channels", [1, 2])
 @pytest.mark.parametrize("num_samples", [1, 1000])
-@pytest.mark.grpc_skip(reason="write_analog_waveform not implemented in GRPC")
 def test___analog_multi_channel_writer___write_waveform(
     benchmark: BenchmarkFixture,
     ao_benchmark_task: nidaqmx.Task,
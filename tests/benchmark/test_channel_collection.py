@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_mock import MockerFixture
+
+from nidaqmx import Task
+from nidaqmx._base_interpreter import BaseInterpreter
+from nidaqmx.constants import ChannelType
+from nidaqmx.task import _TaskAlternateConstructor
+
+_NUM_CHANNELS = 256
+
+
+@pytest.fixture
+def mock_interpreter(mocker: MockerFixture) -> Mock:
+    """Create a mock interpreter that counts driver calls."""
+    interpreter = mocker.create_autospec(BaseInterpreter)
+    interpreter.internal_get_last_created_chan.side_effect = NotImplementedError
+    interpreter.get_task_attribute_string.return_value = f"Dev1/ai0:{_NUM_CHANNELS - 1}"
+    interpreter.get_chan_attribute_int32.return_value = ChannelType.ANALOG_INPUT.value
+    return interpreter
+
+
+@pytest.fixture
+def mock_task(mock_interpreter: Mock) -> Task:
+    """Create a task that uses the mock interpreter."""
+    return _TaskAlternateConstructor(object(), mock_interpreter, close_on_exit=False)
+
+
+def _count_driver_calls(interpreter: Mock) -> int:
+    return len(interpreter.method_calls)
+
+
+@pytest.mark.benchmark(group="channel_creation")
+def test___ai_channel_collection___add_ai_voltage_chan_per_channel(
+    benchmark: BenchmarkFixture, mock_task: Task, mock_interpreter: Mock
+) -> None:
+    def add_channels():
+        mock_interpreter.reset_mock()
+        for i in range(_NUM_CHANNELS):
+            mock_task.ai_channels.add_ai_voltage_chan(f"Dev1/ai{i}", max_val=5.0)
+
+    benchmark(add_channels)
+
+    assert _count_driver_calls(mock_interpreter) == 2 * _NUM_CHANNELS
+
+
+@pytest.mark.benchmark(group="channel_creation")
+def test___ai_channel_collection___add_chans(
+    benchmark: BenchmarkFixture, mock_task: Task, mock_interpreter: Mock
+) -> None:
+    rows = [{"physical_channel": f"Dev1/ai{i}", "max_val": 5.0} for i in range(_NUM_CHANNELS)]
+
+    def add_channels():
+        mock_interpreter.reset_mock()
+        mock_task.ai_channels.add_chans("add_ai_voltage_chan", rows)
+
+    benchmark(add_channels)
+
+    assert _count_driver_calls(mock_interpreter) == 2
+
+
+@pytest.mark.benchmark(group="channel_iteration")
+def test___ai_channel_collection___set_property_per_channel(
+    benchmark: BenchmarkFixture, mock_task: Task, mock_interpreter: Mock
+) -> None:
+    def set_property_per_channel():
+        mock_interpreter.reset_mock()
+        for channel in mock_task.ai_channels:
+            channel.ai_max = 5.0
+
+    benchmark(set_property_per_channel)
+    set_property_per_channel()
+
+    # The channel index is reused, so each channel only costs the property set.
+    assert _count_driver_calls(mock_interpreter) == _NUM_CHANNELS
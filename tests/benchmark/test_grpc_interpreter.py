@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nidaqmx
+from nidaqmx.constants import FillMode
+from nidaqmx.stream_readers import AnalogUnscaledReader
+
+if TYPE_CHECKING:
+    from tests._grpc_stand_in_server import StandInAioGrpcServer, StandInGrpcServer
+
+try:
+    import grpc
+    import session_pb2
+
+    from nidaqmx._grpc_aio_interpreter import GrpcAioStubInterpreter
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from nidaqmx._stubs import nidaqmx_pb2_grpc as nidaqmx_grpc
+    from nidaqmx.task import _TaskAlternateConstructor
+    from tests._grpc_stand_in_server import STAND_IN_CHANNEL_OPTIONS
+except ImportError:
+    grpc = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+
+_NUM_SAMPLES = 1_000_000
+_NUM_CHANNELS = 8
+_NUM_TASKS = 50
+_NUM_TASK_SAMPLES = 1000
+# Each read waits this long on the server, like a driver read that waits for samples.
+_OPERATION_DELAY = 0.01
+
+
+def _read_analog_f64_with_protobuf(
+    client: nidaqmx_grpc.NiDAQmxStub,
+    task,
+    num_samps_per_chan,
+    timeout,
+    fill_mode,
+    read_array,
+):
+    """Read analog samples the way GrpcStubInterpreter did before it decoded arrays with NumPy."""
+    response = client.ReadAnalogF64(
+        grpc_types.ReadAnalogF64Request(
+            task=task,
+            num_samps_per_chan=num_samps_per_chan,
+            fill_mode_raw=fill_mode,
+            timeout=timeout,
+            array_size_in_samps=read_array.size,
+        )
+    )
+    read_array.flat[: len(response.read_array)] = response.read_array
+    return read_array, response.samps_per_chan_read
+
+
+def _write_analog_f64_with_protobuf(
+    client: nidaqmx_grpc.NiDAQmxStub,
+    task,
+    num_samps_per_chan,
+    auto_start,
+    timeout,
+    data_layout,
+    write_array,
+):
+    """Write analog samples the way GrpcStubInterpreter did before it encoded arrays with NumPy."""
+    response = client.WriteAnalogF64(
+        grpc_types.WriteAnalogF64Request(
+            task=task,
+            num_samps_per_chan=num_samps_per_chan,
+            auto_start=auto_start,
+            timeout=timeout,
+            data_layout_raw=data_layout,
+            write_array=write_array.flat,
+        )
+    )
+    return response.samps_per_chan_written
+
+
+@pytest.fixture
+def read_array(stand_in_server: StandInGrpcServer) -> numpy.typing.NDArray[numpy.float64]:
+    """Gets a read array and makes the stand-in server return that many samples."""
+    stand_in_server.nidaqmx_servicer.read_array = numpy.linspace(-10.0, 10.0, _NUM_SAMPLES).tolist()
+    return numpy.zeros(_NUM_SAMPLES, dtype=numpy.float64)
+
+
+@pytest.mark.benchmark(group="grpc_interpreter")
+def test___grpc_interpreter___read_analog_f64(
+    benchmark: BenchmarkFixture,
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_task_session: object,
+    read_array: numpy.typing.NDArray[numpy.float64],
+) -> None:
+    benchmark(
+        stand_in_grpc_interpreter.read_analog_f64,
+        stand_in_task_session,
+        _NUM_SAMPLES,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        read_array,
+    )
+
+
+@pytest.mark.benchmark(group="grpc_interpreter")
+def test___grpc_interpreter___read_analog_f64_with_protobuf(
+    benchmark: BenchmarkFixture,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+    read_array: numpy.typing.NDArray[numpy.float64],
+) -> None:
+    with grpc.insecure_channel(
+        f"localhost:{stand_in_server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+    ) as channel:
+        benchmark(
+            _read_analog_f64_with_protobuf,
+            nidaqmx_grpc.NiDAQmxStub(channel),
+            stand_in_task_session,
+            _NUM_SAMPLES,
+            10.0,
+            FillMode.GROUP_BY_CHANNEL.value,
+            read_array,
+        )
+
+
+@pytest.mark.benchmark(group="grpc_interpreter")
+def test___grpc_interpreter___write_analog_f64(
+    benchmark: BenchmarkFixture,
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_task_session: object,
+) -> None:
+    write_array = numpy.linspace(-10.0, 10.0, _NUM_SAMPLES)
+
+    benchmark(
+        stand_in_grpc_interpreter.write_analog_f64,
+        stand_in_task_session,
+        _NUM_SAMPLES,
+        False,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        write_array,
+    )
+
+
+@pytest.mark.benchmark(group="grpc_interpreter")
+def test___grpc_interpreter___write_analog_f64_with_protobuf(
+    benchmark: BenchmarkFixture,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    write_array = numpy.linspace(-10.0, 10.0, _NUM_SAMPLES)
+
+    with grpc.insecure_channel(
+        f"localhost:{stand_in_server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+    ) as channel:
+        benchmark(
+            _write_analog_f64_with_protobuf,
+            nidaqmx_grpc.NiDAQmxStub(channel),
+            stand_in_task_session,
+            _NUM_SAMPLES,
+            False,
+            10.0,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
+        )
+
+
+@pytest.mark.benchmark(group="grpc_interpreter")
+@pytest.mark.parametrize("raw_data_width", [2, None], ids=["read_raw", "read_binary_i16"])
+def test___analog_unscaled_reader___read_int16(
+    benchmark: BenchmarkFixture,
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+    raw_data_width: int | None,
+) -> None:
+    num_samples = _NUM_SAMPLES // _NUM_CHANNELS
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.num_chans = _NUM_CHANNELS
+    servicer.raw_data_width = raw_data_width
+    servicer.read_array = [(i % 2**16) - 2**15 for i in range(_NUM_SAMPLES)]
+    task = _TaskAlternateConstructor(
+        stand_in_task_session, stand_in_grpc_interpreter, close_on_exit=False
+    )
+    reader = AnalogUnscaledReader(task.in_stream)
+    reader.verify_array_shape = False
+    data = numpy.zeros((_NUM_CHANNELS, num_samples), dtype=numpy.int16)
+
+    benchmark(reader.read_int16, data, num_samples)
+
+
+async def _create_aio_channel(port: int) -> grpc.aio.Channel:
+    return grpc.aio.insecure_channel(f"localhost:{port}", options=STAND_IN_CHANNEL_OPTIONS)
+
+
+@pytest.mark.benchmark(group="grpc_interpreter_concurrency")
+def test___grpc_aio_interpreter___read_analog_f64_on_50_tasks(
+    benchmark: BenchmarkFixture, stand_in_aio_server: StandInAioGrpcServer
+) -> None:
+    stand_in_aio_server.nidaqmx_servicer.operation_delay = _OPERATION_DELAY
+    sessions = [session_pb2.Session(name=f"Task{i}") for i in range(_NUM_TASKS)]
+    read_arrays = [numpy.zeros(_NUM_TASK_SAMPLES, dtype=numpy.float64) for _ in sessions]
+    loop = asyncio.new_event_loop()
+    try:
+        channel = loop.run_until_complete(_create_aio_channel(stand_in_aio_server.server_port))
+        interpreter = GrpcAioStubInterpreter(nidaqmx.GrpcSessionOptions(channel, ""))
+
+        async def _read_all() -> None:
+            await asyncio.gather(
+                *(
+                    interpreter.read_analog_f64(
+                        session,
+                        _NUM_TASK_SAMPLES,
+                        10.0,
+                        FillMode.GROUP_BY_CHANNEL.value,
+                        read_array,
+                    )
+                    for session, read_array in zip(sessions, read_arrays)
+                )
+            )
+
+        benchmark(lambda: loop.run_until_complete(_read_all()))
+        loop.run_until_complete(channel.close())
+    finally:
+        loop.close()
+
+
+@pytest.mark.benchmark(group="grpc_interpreter_concurrency")
+def test___grpc_interpreter___read_analog_f64_on_50_tasks_with_threads(
+    benchmark: BenchmarkFixture, stand_in_aio_server: StandInAioGrpcServer
+) -> None:
+    stand_in_aio_server.nidaqmx_servicer.operation_delay = _OPERATION_DELAY
+    sessions = [session_pb2.Session(name=f"Task{i}") for i in range(_NUM_TASKS)]
+    read_arrays = [numpy.zeros(_NUM_TASK_SAMPLES, dtype=numpy.float64) for _ in sessions]
+    with grpc.insecure_channel(
+        f"localhost:{stand_in_aio_server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+    ) as channel, ThreadPoolExecutor(max_workers=_NUM_TASKS) as executor:
+        interpreter = GrpcStubInterpreter(nidaqmx.GrpcSessionOptions(channel, ""))
+
+        def _read_all() -> None:
+            futures = [
+                executor.submit(
+                    interpreter.read_analog_f64,
+                    session,
+                    _NUM_TASK_SAMPLES,
+                    10.0,
+                    FillMode.GROUP_BY_CHANNEL.value,
+                    read_array,
+                )
+                for session, read_array in zip(sessions, read_arrays)
+            ]
+            for future in futures:
+                future.result()
+
+        benchmark(_read_all)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import ctypes
+import math
+
+import numpy
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from nidaqmx._lib import DaqLibImporter, c_bool32, wrapped_ndpointer
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.constants import FillMode
+
+_TASK_HANDLE = 1
+
+
+def _read_analog_f64_resolved_per_call(
+    importer: DaqLibImporter,
+    interpreter: LibraryInterpreter,
+    task,
+    num_samps_per_chan,
+    timeout,
+    fill_mode,
+    read_array,
+):
+    """Read analog samples the way LibraryInterpreter did before it had a function table."""
+    samps_per_chan_read = ctypes.c_int()
+
+    cfunc = importer.windll.DAQmxReadAnalogF64
+    if cfunc.argtypes is None:
+        with cfunc.arglock:
+            if cfunc.argtypes is None:
+                cfunc.argtypes = [
+                    importer.task_handle,
+                    ctypes.c_int,
+                    ctypes.c_double,
+                    ctypes.c_int,
+                    wrapped_ndpointer(dtype=numpy.float64, flags=("C", "W")),
+                    ctypes.c_uint,
+                    ctypes.POINTER(ctypes.c_int),
+                    ctypes.POINTER(c_bool32),
+                ]
+
+    error_code = cfunc(
+        task,
+        num_samps_per_chan,
+        timeout,
+        fill_mode,
+        read_array,
+        read_array.size,
+        ctypes.byref(samps_per_chan_read),
+        None,
+    )
+    interpreter.check_for_error(error_code, samps_per_chan_read=samps_per_chan_read.value)
+    return read_array, samps_per_chan_read.value
+
+
+@pytest.mark.benchmark(group="library_interpreter")
+@pytest.mark.parametrize("num_samples", [1, 1000])
+def test___library_interpreter___read_analog_f64(
+    benchmark: BenchmarkFixture,
+    stand_in_library_interpreter: LibraryInterpreter,
+    num_samples: int,
+) -> None:
+    data = numpy.full(num_samples, math.inf, dtype=numpy.float64)
+
+    benchmark(
+        stand_in_library_interpreter.read_analog_f64,
+        _TASK_HANDLE,
+        num_samples,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        data,
+    )
+
+
+@pytest.mark.benchmark(group="library_interpreter")
+@pytest.mark.parametrize("num_samples", [1, 1000])
+def test___library_interpreter___read_analog_f64_resolved_per_call(
+    benchmark: BenchmarkFixture,
+    stand_in_lib_importer: DaqLibImporter,
+    stand_in_library_interpreter: LibraryInterpreter,
+    num_samples: int,
+) -> None:
+    data = numpy.full(num_samples, math.inf, dtype=numpy.float64)
+
+    benchmark(
+        _read_analog_f64_resolved_per_call,
+        stand_in_lib_importer,
+        stand_in_library_interpreter,
+        _TASK_HANDLE,
+        num_samples,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        data,
+    )
+
+
+@pytest.mark.benchmark(group="library_interpreter")
+@pytest.mark.parametrize("num_samples", [1, 1000])
+def test___library_interpreter___read_analog_f64_trusted_buffer(
+    benchmark: BenchmarkFixture,
+    stand_in_library_interpreter: LibraryInterpreter,
+    num_samples: int,
+) -> None:
+    data = numpy.full(num_samples, math.inf, dtype=numpy.float64)
+    trusted_buffer = stand_in_library_interpreter.create_trusted_buffer(
+        data, numpy.float64, ("C", "W")
+    )
+
+    benchmark(
+        stand_in_library_interpreter.read_analog_f64,
+        _TASK_HANDLE,
+        num_samples,
+        10.0,
+        FillMode.GROUP_BY_CHANNEL.value,
+        trusted_buffer,
+    )
+
+
+@pytest.mark.benchmark(group="library_interpreter")
+def test___library_interpreter___read_analog_scalar_f64(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    benchmark(stand_in_library_interpreter.read_analog_scalar_f64, _TASK_HANDLE, 10.0)
+
+
+@pytest.mark.benchmark(group="library_interpreter")
+def test___library_interpreter___write_analog_scalar_f64(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    benchmark(stand_in_library_interpreter.write_analog_scalar_f64, _TASK_HANDLE, True, 10.0, 0.0)
+
+
+@pytest.mark.benchmark(group="library_interpreter")
+def test___library_interpreter___is_task_done(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    benchmark(stand_in_library_interpreter.is_task_done, _TASK_HANDLE)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import numpy
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.constants import ChannelType
+from nidaqmx.task import SinglePointIO
+
+_TASK_HANDLE = 1
+_LATENCY_ITERATIONS = 100000
+
+
+def _create_stand_in_task(interpreter: LibraryInterpreter, chan_type: ChannelType) -> Any:
+    """Create an object with the task members that SinglePointIO uses.
+
+    The stand-in library does not implement task or channel attributes.
+    """
+    return SimpleNamespace(
+        _handle=_TASK_HANDLE,
+        _interpreter=interpreter,
+        name="StandInTask",
+        number_of_channels=1,
+        channels=SimpleNamespace(chan_type=chan_type),
+    )
+
+
+def _record_latency(benchmark: BenchmarkFixture, function: Callable[..., Any], *args: Any) -> None:
+    """Time individual calls and record latency percentiles and a histogram in extra_info.
+
+    The histogram has one bucket per power of two, so bucket "k" counts the calls that took
+    between 2**k and 2**(k+1) nanoseconds.
+    """
+    perf_counter_ns = time.perf_counter_ns
+    latencies = numpy.empty(_LATENCY_ITERATIONS, dtype=numpy.int64)
+    for i in range(_LATENCY_ITERATIONS):
+        start = perf_counter_ns()
+        function(*args)
+        latencies[i] = perf_counter_ns() - start
+
+    p50, p99, p999 = numpy.percentile(latencies, [50.0, 99.0, 99.9])
+    buckets = numpy.bincount(numpy.log2(numpy.maximum(latencies, 1)).astype(numpy.int64))
+    benchmark.extra_info["latency_p50_ns"] = float(p50)
+    benchmark.extra_info["latency_p99_ns"] = float(p99)
+    benchmark.extra_info["latency_p99.9_ns"] = float(p999)
+    benchmark.extra_info["latency_max_ns"] = int(latencies.max())
+    benchmark.extra_info["latency_histogram_log2_ns"] = {
+        str(k): int(count) for k, count in enumerate(buckets) if count
+    }
+
+
+@pytest.mark.benchmark(group="single_point_io")
+def test___single_point_io___read(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    single_point_io = SinglePointIO(
+        _create_stand_in_task(stand_in_library_interpreter, ChannelType.ANALOG_INPUT)
+    )
+
+    _record_latency(benchmark, single_point_io.read)
+    benchmark(single_point_io.read)
+
+
+@pytest.mark.benchmark(group="single_point_io")
+def test___single_point_io___write(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    single_point_io = SinglePointIO(
+        _create_stand_in_task(stand_in_library_interpreter, ChannelType.ANALOG_OUTPUT)
+    )
+
+    _record_latency(benchmark, single_point_io.write, 0.0)
+    benchmark(single_point_io.write, 0.0)
+
+
+@pytest.mark.benchmark(group="single_point_io")
+def test___library_interpreter___read_analog_scalar_f64(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    _record_latency(
+        benchmark, stand_in_library_interpreter.read_analog_scalar_f64, _TASK_HANDLE, 10.0
+    )
+    benchmark(stand_in_library_interpreter.read_analog_scalar_f64, _TASK_HANDLE, 10.0)
+
+
+@pytest.mark.benchmark(group="single_point_io")
+def test___library_interpreter___write_analog_scalar_f64(
+    benchmark: BenchmarkFixture, stand_in_library_interpreter: LibraryInterpreter
+) -> None:
+    _record_latency(
+        benchmark,
+        stand_in_library_interpreter.write_analog_scalar_f64,
+        _TASK_HANDLE,
+        True,
+        10.0,
+        0.0,
+    )
+    benchmark(stand_in_library_interpreter.write_analog_scalar_f64, _TASK_HANDLE, True, 10.0, 0.0)
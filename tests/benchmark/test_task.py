@@ -49,13 +49,27 @@ def test___task___read_analog(
     benchmark(ai_benchmark_task.read, num_samples)
 
 
+@pytest.mark.benchmark(group="analog_readers")
+@pytest.mark.parametrize("num_channels", [1, 2, 8])
+@pytest.mark.parametrize("num_samples", [1, 1000])
+def test___task___read_analog_without_read_plan(
+    benchmark: BenchmarkFixture, ai_benchmark_task: Task, num_channels: int, num_samples: int
+) -> None:
+    # Discarding the read plan before every call measures the per-call metadata queries that the
+    # cached read plan avoids. Compare with test___task___read_analog.
+    def read_without_read_plan():
+        ai_benchmark_task._invalidate_channel_caches()
+        return ai_benchmark_task.read(num_samples)
+
+    benchmark(read_without_read_plan)
+
+
 @pytest.mark.benchmark(group="analog_readers")
 @pytest.mark.parametrize("num_channels", [1, 2, 8])
 @pytest.mark.parametrize("num_samples", [1, 1000])
 @pytest.mark.parametrize(
     "waveform_attribute_mode", _WAVEFORM_BENCHMARK_MODES, ids=_WAVEFORM_BENCHMARK_MODE_IDS
 )
-@pytest.mark.grpc_skip(reason="read_analog_waveforms not implemented in GRPC")
 def test___task___read_analog_waveform(
     benchmark: BenchmarkFixture,
     ai_benchmark_task: Task,
@@ -84,7 +98,6 @@ def test___task___write_analog(
 @pytest.mark.benchmark(group="analog_writers")
 @pytest.mark.parametrize("num_channels", [1, 2])
 @pytest.mark.parametrize("num_samples", [1, 1000])
-@pytest.mark.grpc_skip(reason="write_analog_waveform not implemented in GRPC")
 def test___task___write_analog_waveform(
     benchmark: BenchmarkFixture,
     ao_benchmark_task: Task,
@@ -124,7 +137,6 @@ def test___task___read_digital_port(
 @pytest.mark.parametrize("num_channels", [1, 2])
 @pytest.mark.parametrize("num_samples", [1, 100])
 @pytest.mark.parametrize("num_lines", [1, 2, 8])
-@pytest.mark.grpc_skip(reason="read_digital_waveform not implemented in GRPC")
 def test___task___read_digital_lines_waveform(
     benchmark: BenchmarkFixture,
     di_lines_benchmark_task: Task,
@@ -137,7 +149,6 @@ def test___task___read_digital_lines_waveform(
 
 @pytest.mark.benchmark(group="digital_readers")
 @pytest.mark.parametrize("num_samples", [1, 100])
-@pytest.mark.grpc_skip(reason="read_digital_waveform not implemented in GRPC")
 def test___task___read_digital_port_waveform(
     benchmark: BenchmarkFixture,
     di_port32_benchmark_task: Task,
@@ -176,7 +187,6 @@ def test___task___write_digital_port(
 @pytest.mark.parametrize("num_channels", [1, 2])
 @pytest.mark.parametrize("num_samples", [1, 100])
 @pytest.mark.parametrize("num_lines", [1, 2, 8])
-@pytest.mark.grpc_skip(reason="write_digital_waveform not implemented in GRPC")
 def test___task___write_digital_lines_waveform(
     benchmark: BenchmarkFixture,
     do_lines_benchmark_task: Task,
@@ -190,7 +200,6 @@ def test___task___write_digital_lines_waveform(
 
 @pytest.mark.benchmark(group="digital_writers")
 @pytest.mark.parametrize("num_samples", [1, 100])
-@pytest.mark.grpc_skip(reason="write_digital_waveform not implemented in GRPC")
 def test___task___write_digital_port_waveform(
     benchmark: BenchmarkFixture,
     do_port32_benchmark_task: Task,
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from nidaqmx import Task
+from nidaqmx._lib import TaskHandle
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.constants import WaveformAttributeMode
+from nidaqmx.task import _TaskAlternateConstructor
+from nidaqmx.task._read_plan import _ReadKind, _ReadPlan
+
+_NUM_CHANNELS = 64
+_NUM_SAMPLES = 1000
+
+_WAVEFORM_POOL_BENCHMARK_MODES = [WaveformAttributeMode.NONE, WaveformAttributeMode.TIMING]
+_WAVEFORM_POOL_BENCHMARK_MODE_IDS = ["NONE", "TIMING"]
+
+
+@pytest.fixture
+def stand_in_ai_task(
+    stand_in_library_interpreter: LibraryInterpreter, request: pytest.FixtureRequest
+) -> Task:
+    """Create a 64-channel AI task that reads from the stand-in library."""
+    task = _TaskAlternateConstructor(
+        TaskHandle(1), stand_in_library_interpreter, close_on_exit=False
+    )
+    # The stand-in library does not implement the channel queries, so provide the read plan
+    # that they would produce.
+    task._read_plan = _ReadPlan(
+        _NUM_CHANNELS,
+        _ReadKind.ANALOG,
+        numpy.float64,
+        stand_in_library_interpreter.read_analog_f64,
+    )
+    task.in_stream.waveform_attribute_mode = request.node.callspec.params["waveform_attribute_mode"]
+    return task
+
+
+@pytest.mark.benchmark(group="waveform_pool")
+@pytest.mark.parametrize(
+    "waveform_attribute_mode",
+    _WAVEFORM_POOL_BENCHMARK_MODES,
+    ids=_WAVEFORM_POOL_BENCHMARK_MODE_IDS,
+)
+def test___task___read_waveform(
+    benchmark: BenchmarkFixture,
+    stand_in_ai_task: Task,
+    waveform_attribute_mode: WaveformAttributeMode,
+) -> None:
+    benchmark(stand_in_ai_task.read_waveform, _NUM_SAMPLES)
+
+
+@pytest.mark.benchmark(group="waveform_pool")
+@pytest.mark.parametrize(
+    "waveform_attribute_mode",
+    _WAVEFORM_POOL_BENCHMARK_MODES,
+    ids=_WAVEFORM_POOL_BENCHMARK_MODE_IDS,
+)
+def test___waveform_pool___read_waveforms(
+    benchmark: BenchmarkFixture,
+    stand_in_ai_task: Task,
+    waveform_attribute_mode: WaveformAttributeMode,
+) -> None:
+    waveform_pool = stand_in_ai_task.create_waveform_pool()
+
+    benchmark(waveform_pool.read_waveforms, _NUM_SAMPLES)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx.stream_readers import ContinuousReader
+from tests.component._analog_utils import (
+    AI_VOLTAGE_EPSILON,
+    _get_voltage_offset_for_chan,
+)
+
+
+def test___continuous_reader___read_past_capacity___returns_valid_samples(
+    ai_multi_channel_task: nidaqmx.Task,
+) -> None:
+    reader = ContinuousReader(ai_multi_channel_task.in_stream, 25)
+    num_channels = ai_multi_channel_task.number_of_channels
+    samples_to_read = 10
+
+    blocks = [reader.read(samples_to_read) for _ in range(4)]
+
+    assert [block.first_sample_index for block in blocks] == [0, 10, 20, 30]
+    assert [reader.is_block_valid(block) for block in blocks] == [False, False, True, True]
+    expected_vals = [
+        [_get_voltage_offset_for_chan(chan_index)] * samples_to_read
+        for chan_index in range(num_channels)
+    ]
+    for block in blocks[2:]:
+        assert block.data.shape == (num_channels, samples_to_read)
+        assert block.data == pytest.approx(expected_vals, abs=AI_VOLTAGE_EPSILON)
+        assert numpy.shares_memory(block.data, reader._buffer)
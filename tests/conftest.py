@@ -22,6 +22,11 @@ from nidaqmx.constants import ProductCategory, UsageTypeAI
 try:
     import grpc
 
+    from tests._grpc_stand_in_server import (
+        STAND_IN_CHANNEL_OPTIONS,
+        StandInAioGrpcServer,
+        StandInGrpcServer,
+    )
     from tests._grpc_utils import GrpcServerProcess
 except ImportError:
     grpc = None  # type: ignore
@@ -30,6 +35,8 @@ if TYPE_CHECKING:
     # Not public yet: https://github.com/pytest-dev/pytest/issues/7469
     import _pytest.mark.structures  # noqa: I300
 
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+
 
 class Error(Exception):
     """Base error class."""
@@ -452,6 +459,45 @@ def temporary_grpc_channel(
         yield channel
 
 
+@pytest.fixture(scope="function")
+def stand_in_server() -> Generator[StandInGrpcServer]:
+    """Gets an in-process stand-in for the NI gRPC Device Server."""
+    if grpc is None:
+        pytest.skip("The grpc module is not available.")
+    with StandInGrpcServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def stand_in_aio_server() -> Generator[StandInAioGrpcServer]:
+    """Gets an in-process stand-in for the NI gRPC Device Server that uses grpc.aio."""
+    if grpc is None:
+        pytest.skip("The grpc module is not available.")
+    with StandInAioGrpcServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def stand_in_grpc_interpreter(
+    stand_in_server: StandInGrpcServer,
+) -> Generator[GrpcStubInterpreter]:
+    """Gets a gRPC interpreter that is connected to the stand-in server."""
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+
+    with grpc.insecure_channel(
+        f"localhost:{stand_in_server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+    ) as channel:
+        yield GrpcStubInterpreter(nidaqmx.GrpcSessionOptions(channel, ""))
+
+
+@pytest.fixture(scope="function")
+def stand_in_task_session(stand_in_server: StandInGrpcServer) -> object:
+    """Gets the gRPC session message for a task on the stand-in server."""
+    import session_pb2
+
+    return session_pb2.Session(name="MyTask")
+
+
 @pytest.fixture(scope="function")
 def grpc_init_kwargs(request: pytest.FixtureRequest, grpc_channel: grpc.Channel) -> dict:
     """Gets the keyword arguments required for creating the gRPC interpreter."""
@@ -9,6 +9,7 @@ from pytest_mock import MockerFixture
 
 from nidaqmx import Task
 from nidaqmx._base_interpreter import BaseEventHandler
+from nidaqmx.constants import ChannelType, UsageTypeAI, UsageTypeCI, UsageTypeCO
 from nidaqmx.task import _TaskEventType
 
 
@@ -50,3 +51,66 @@ def register_event_handlers(
     return {
         event_type: register_event_handler(mocker, task, event_type) for event_type in event_types
     }
+
+
+def expect_read_analog_channels(
+    interpreter: Mock, channels_to_read: str, samples_read: int | None = None
+):
+    """Expect the driver queries that Task.read uses for analog voltage channels."""
+    channel_attributes = {
+        0x187F: ChannelType.ANALOG_INPUT.value,  # chan_type
+        0x695: UsageTypeAI.VOLTAGE.value,  # ai_meas_type
+    }
+    interpreter.get_read_attribute_string.return_value = channels_to_read
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task_handle, channel, attribute_id: channel_attributes[attribute_id]
+    )
+    interpreter.read_analog_f64.side_effect = (
+        lambda task_handle, num_samps_per_chan, timeout, fill_mode, read_array: (
+            read_array,
+            num_samps_per_chan if samples_read is None else samples_read,
+        )
+    )
+
+
+def expect_read_ci_pulse_freq_channel(interpreter: Mock, channels_to_read: str):
+    """Expect the driver queries that Task.read uses for a CI pulse frequency channel."""
+    channel_attributes = {
+        0x187F: ChannelType.COUNTER_INPUT.value,  # chan_type
+        0x18A0: UsageTypeCI.PULSE_FREQ.value,  # ci_meas_type
+    }
+    interpreter.get_read_attribute_string.return_value = channels_to_read
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task_handle, channel, attribute_id: channel_attributes[attribute_id]
+    )
+
+    def _read_ctr_freq(
+        task_handle, num_samps_per_chan, timeout, interleaved, frequencies, duty_cycles
+    ):
+        frequencies[:] = 1000.0
+        duty_cycles[:] = 0.5
+        return frequencies, duty_cycles, num_samps_per_chan
+
+    interpreter.read_ctr_freq.side_effect = _read_ctr_freq
+
+
+def expect_write_co_pulse_channel(
+    interpreter: Mock, output_type: UsageTypeCO, channel_names: list[str] | None = None
+):
+    """Expect the driver queries that Task.write uses for CO pulse channels."""
+    channel_attributes = {
+        0x187F: ChannelType.COUNTER_OUTPUT.value,  # chan_type
+        0x18B5: output_type.value,  # co_output_type
+    }
+    interpreter.get_chan_attribute_int32.side_effect = (
+        lambda task_handle, channel, attribute_id: channel_attributes[attribute_id]
+    )
+    if channel_names is None:
+        interpreter.get_write_attribute_uint32.return_value = 1  # num_chans
+    else:
+        task_name = interpreter.get_task_attribute_string.return_value
+        task_attributes = {0x1273: ", ".join(channel_names)}  # channel_names
+        interpreter.get_task_attribute_string.side_effect = (
+            lambda task_handle, attribute_id: task_attributes.get(attribute_id, task_name)
+        )
+        interpreter.get_write_attribute_uint32.return_value = len(channel_names)  # num_chans
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import GrpcSessionOptions, Task
+from nidaqmx._lib import TrustedBuffer
+from nidaqmx.constants import DataJustification, FillMode
+from nidaqmx.errors import RpcError
+from nidaqmx.stream_readers import AnalogUnscaledReader
+from tests.unit._task_utils import expect_create_task, expect_get_task_name
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+try:
+    import grpc
+
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+    from nidaqmx.task import _TaskAlternateConstructor
+except ImportError:
+    grpc = None  # type: ignore
+
+_NUM_SAMPLES = 4
+
+
+@pytest.fixture
+def grpc_task(interpreter: Mock) -> Generator[Task]:
+    """Create a DAQmx task that uses a mock interpreter as if it used a gRPC session."""
+    expect_create_task(interpreter)
+    expect_get_task_name(interpreter, "MyTask")
+
+    with Task("MyTask", grpc_options=GrpcSessionOptions(Mock(), "")) as task:
+        yield task
+
+
+def _expect_raw_samples(
+    interpreter: Mock,
+    raw_data_width: int = 2,
+    justification: DataJustification = DataJustification.RIGHT,
+    number_of_devices: int = 1,
+) -> None:
+    """Expect reads of two channels whose samples are the channel index times 100 plus the scan."""
+    interpreter.get_task_attribute_uint32.return_value = number_of_devices
+    read_attributes = {0x217A: raw_data_width, 0x217B: 2}  # raw_data_width, num_chans
+    interpreter.get_read_attribute_uint32.side_effect = (
+        lambda task_handle, attribute_id: read_attributes[attribute_id]
+    )
+    interpreter.get_chan_attribute_int32.return_value = justification.value
+
+    def _read_raw(task_handle, num_samps_per_chan, timeout, read_array):
+        read_array[:] = numpy.arange(num_samps_per_chan)[:, numpy.newaxis] + [0, 100]
+        return read_array, num_samps_per_chan, raw_data_width
+
+    interpreter.read_raw.side_effect = _read_raw
+    interpreter.read_binary_i16.side_effect = (
+        lambda task_handle, num_samps_per_chan, timeout, fill_mode, read_array: (
+            read_array,
+            num_samps_per_chan,
+        )
+    )
+
+
+def test___grpc_task___read_int16___reads_raw_samples_by_channel(
+    grpc_task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter)
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    samples_read = reader.read_int16(data, _NUM_SAMPLES)
+
+    assert samples_read == _NUM_SAMPLES
+    assert data.tolist() == [[0, 1, 2, 3], [100, 101, 102, 103]]
+    interpreter.read_raw.assert_called_once()
+    interpreter.read_binary_i16.assert_not_called()
+
+
+def test___library_task___read_int16___reads_binary_samples(task: Task, interpreter: Mock) -> None:
+    _expect_raw_samples(interpreter)
+    reader = AnalogUnscaledReader(task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    interpreter.read_binary_i16.assert_called_once_with(
+        task._handle, _NUM_SAMPLES, 10.0, FillMode.GROUP_BY_CHANNEL.value, data
+    )
+    interpreter.read_raw.assert_not_called()
+
+
+def test___library_task_with_trusted_buffers___read_int16___reads_binary_samples(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter)
+    interpreter.create_trusted_buffer.side_effect = TrustedBuffer
+    reader = AnalogUnscaledReader(task.in_stream)
+    reader.use_raw_samples = True
+    reader.use_trusted_buffers = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    assert interpreter.read_binary_i16.call_count == 2
+    read_array = interpreter.read_binary_i16.call_args.args[4]
+    assert isinstance(read_array, TrustedBuffer)
+    assert read_array.array is data
+    interpreter.read_raw.assert_not_called()
+
+
+def test___grpc_task_without_raw_samples___read_int16___reads_binary_samples(
+    grpc_task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter)
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    interpreter.read_binary_i16.assert_called_once()
+    interpreter.read_raw.assert_not_called()
+
+
+def test___multi_device_grpc_task___read_int16___reads_binary_samples(
+    grpc_task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter, number_of_devices=2)
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    interpreter.read_binary_i16.assert_called_once()
+    interpreter.read_raw.assert_not_called()
+
+
+def test___grpc_task___read_uint16___reads_binary_samples(
+    grpc_task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter)
+    interpreter.read_binary_u16.side_effect = (
+        lambda task_handle, num_samps_per_chan, timeout, fill_mode, read_array: (
+            read_array,
+            num_samps_per_chan,
+        )
+    )
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.uint16)
+
+    reader.read_uint16(data, _NUM_SAMPLES)
+
+    interpreter.read_binary_u16.assert_called_once()
+    interpreter.read_raw.assert_not_called()
+
+
+def test___grpc_task___read_int16_twice___reuses_raw_array(
+    grpc_task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter)
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    first_raw_array = interpreter.read_raw.call_args_list[0].args[3]
+    second_raw_array = interpreter.read_raw.call_args_list[1].args[3]
+    assert second_raw_array is first_raw_array
+    assert data.tolist() == [[0, 1, 2, 3], [100, 101, 102, 103]]
+
+
+@pytest.mark.parametrize(
+    "raw_data_width, justification",
+    [(4, DataJustification.RIGHT), (2, DataJustification.LEFT)],
+)
+def test___raw_samples_differ_from_binary_samples___read_int16___reads_binary_samples(
+    grpc_task: Task,
+    interpreter: Mock,
+    raw_data_width: int,
+    justification: DataJustification,
+) -> None:
+    _expect_raw_samples(interpreter, raw_data_width, justification)
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    interpreter.read_binary_i16.assert_called_once()
+    interpreter.read_raw.assert_not_called()
+
+
+@pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+def test___read_raw_unimplemented___read_int16___falls_back_to_binary_samples(
+    grpc_task: Task, interpreter: Mock
+) -> None:
+    _expect_raw_samples(interpreter)
+    interpreter.read_raw.side_effect = RpcError(grpc.StatusCode.UNIMPLEMENTED, "Unimplemented.")
+    reader = AnalogUnscaledReader(grpc_task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    interpreter.read_raw.assert_called_once()
+    assert interpreter.read_binary_i16.call_count == 2
+
+
+@pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+@pytest.mark.parametrize("raw_data_width", [2, None])
+def test___stand_in_server___read_int16___reads_samples_by_channel(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+    raw_data_width: int | None,
+) -> None:
+    stand_in_server.nidaqmx_servicer.num_chans = 2
+    stand_in_server.nidaqmx_servicer.raw_data_width = raw_data_width
+    stand_in_server.nidaqmx_servicer.read_array = [-32768, -1, 0, 32767, 1, 2, 3, 4]
+    task = _TaskAlternateConstructor(
+        stand_in_task_session, stand_in_grpc_interpreter, close_on_exit=False
+    )
+    reader = AnalogUnscaledReader(task.in_stream)
+    reader.use_raw_samples = True
+    data = numpy.zeros((2, _NUM_SAMPLES), dtype=numpy.int16)
+
+    reader.read_int16(data, _NUM_SAMPLES)
+
+    assert data.tolist() == [[-32768, -1, 0, 32767], [1, 2, 3, 4]]
+    (read_request,) = stand_in_server.nidaqmx_servicer.requests
+    if raw_data_width is None:
+        assert isinstance(read_request, grpc_types.ReadBinaryI16Request)
+    else:
+        assert isinstance(read_request, grpc_types.ReadRawRequest)
+
+
+@pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+def test___stand_in_server___read_int16___raw_samples_transfer_fewer_bytes(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    num_samples = 10_000
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.num_chans = 8
+    servicer.read_array = [(i % 2**16) - 2**15 for i in range(8 * num_samples)]
+    data = numpy.zeros((8, num_samples), dtype=numpy.int16)
+    task = _TaskAlternateConstructor(
+        stand_in_task_session, stand_in_grpc_interpreter, close_on_exit=False
+    )
+
+    reader = AnalogUnscaledReader(task.in_stream)
+    reader.use_raw_samples = True
+    reader.read_int16(data, num_samples)
+    raw_response_bytes = servicer.read_response_bytes
+    reader.use_raw_samples = False
+    reader.read_int16(data, num_samples)
+    binary_response_bytes = servicer.read_response_bytes - raw_response_bytes
+
+    assert raw_response_bytes <= 2 * 8 * num_samples + 32
+    assert binary_response_bytes > 2 * raw_response_bytes
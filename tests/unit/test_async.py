@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import numpy
+
+from nidaqmx import Task
+from nidaqmx.stream_readers import AnalogMultiChannelReader
+from nidaqmx.stream_writers import AnalogMultiChannelWriter
+from tests.unit._task_utils import expect_read_analog_channels
+
+
+def test___task___read_async___returns_samples(task: Task, interpreter: Mock) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0:1")
+
+    data = asyncio.run(task.read_async(5, timeout=2.0))
+
+    assert data == [[0.0] * 5, [0.0] * 5]
+    assert interpreter.read_analog_f64.call_args.args[:3] == (task._handle, 5, 2.0)
+
+
+def test___task___read_async___does_not_block_event_loop(task: Task, interpreter: Mock) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    samples_available = threading.Event()
+    read_threads = []
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_threads.append(threading.current_thread().name)
+        # The event loop sets this event while the read is waiting, so this only returns True if
+        # the read does not block the event loop.
+        assert samples_available.wait(timeout=10.0)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    async def _make_samples_available() -> None:
+        await asyncio.sleep(0)
+        samples_available.set()
+
+    async def _main():
+        return await asyncio.gather(task.read_async(1), _make_samples_available())
+
+    data, _ = asyncio.run(_main())
+
+    assert data == [0.0]
+    assert read_threads[0].startswith("nidaqmx-async")
+
+
+def test___task___wait_until_done_async___waits_for_task(task: Task, interpreter: Mock) -> None:
+    asyncio.run(task.wait_until_done_async(timeout=2.0))
+
+    interpreter.wait_until_task_done.assert_called_once_with(task._handle, 2.0)
+
+
+def test___analog_multi_channel_reader___read_many_sample_async___reads_into_array(
+    task: Task, interpreter: Mock
+) -> None:
+    interpreter.get_read_attribute_uint32.return_value = 2  # num_chans
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[:] = 1.5
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+    reader = AnalogMultiChannelReader(task.in_stream)
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    samples_read = asyncio.run(reader.read_many_sample_async(data, 10))
+
+    assert samples_read == 10
+    assert data.tolist() == numpy.full((2, 10), 1.5).tolist()
+
+
+def test___analog_multi_channel_writer___write_many_sample_async___writes_array(
+    task: Task, interpreter: Mock
+) -> None:
+    interpreter.get_write_attribute_uint32.return_value = 2  # num_chans
+    interpreter.write_analog_f64.return_value = 10
+    writer = AnalogMultiChannelWriter(task.out_stream)
+    data = numpy.ones((2, 10), dtype=numpy.float64)
+
+    samples_written = asyncio.run(writer.write_many_sample_async(data, timeout=2.0))
+
+    assert samples_written == 10
+    assert interpreter.write_analog_f64.call_args.args[3] == 2.0
+    assert interpreter.write_analog_f64.call_args.args[5] is data
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Callable
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import DaqError, DaqReadError, Task
+from nidaqmx.constants import StreamOverflowPolicy
+from nidaqmx.task import BlockStream
+from tests.unit._task_utils import expect_read_analog_channels
+
+_SAMPLES_PER_BLOCK = 4
+
+
+def _expect_read_blocks(interpreter: Mock) -> None:
+    """Expect analog reads that fill each block with the number of the read."""
+    expect_read_analog_channels(interpreter, "Dev1/ai0:1")
+    read_count = 0
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        nonlocal read_count
+        read_array[:] = read_count
+        read_count += 1
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def _get_callback(interpreter: Mock) -> Callable[[], int]:
+    """Get a function that simulates the every N samples acquired into buffer event."""
+    callback = interpreter.register_every_n_samples_event.call_args.args[4]
+    return lambda: callback("SomeTaskHandle", 1, _SAMPLES_PER_BLOCK, None)
+
+
+def test___block_stream___iterate___returns_blocks_in_order(task: Task, interpreter: Mock) -> None:
+    _expect_read_blocks(interpreter)
+    with task.stream_blocks(_SAMPLES_PER_BLOCK) as stream:
+        fire_event = _get_callback(interpreter)
+        fire_event()
+        fire_event()
+
+        first = next(stream)
+        assert first.first_sample_index == 0
+        assert first.data.shape == (2, _SAMPLES_PER_BLOCK)
+        assert first.data.tolist() == [[0.0] * _SAMPLES_PER_BLOCK] * 2
+        second = next(stream)
+        assert second.first_sample_index == _SAMPLES_PER_BLOCK
+        assert second.data.tolist() == [[1.0] * _SAMPLES_PER_BLOCK] * 2
+
+
+def test___block_stream___close___unregisters_event_and_ends_iteration(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_read_blocks(interpreter)
+    stream = task.stream_blocks(_SAMPLES_PER_BLOCK)
+    _get_callback(interpreter)()
+
+    stream.close()
+
+    assert [block.first_sample_index for block in stream] == [0]
+    interpreter.unregister_every_n_samples_event.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "overflow_policy, expected_sample_indices",
+    [
+        (StreamOverflowPolicy.DROP_OLDEST, [_SAMPLES_PER_BLOCK, 2 * _SAMPLES_PER_BLOCK]),
+        (StreamOverflowPolicy.DROP_NEWEST, [0, _SAMPLES_PER_BLOCK]),
+    ],
+)
+def test___queue_full___fire_event___drops_block(
+    task: Task,
+    interpreter: Mock,
+    overflow_policy: StreamOverflowPolicy,
+    expected_sample_indices: list[int],
+) -> None:
+    _expect_read_blocks(interpreter)
+    stream = task.stream_blocks(_SAMPLES_PER_BLOCK, queue_depth=2, overflow_policy=overflow_policy)
+    fire_event = _get_callback(interpreter)
+    for _ in range(3):
+        fire_event()
+    stream.close()
+
+    assert stream.received_blocks == 3
+    assert stream.dropped_blocks == 1
+    assert stream.max_queued_blocks == 2
+    assert [block.first_sample_index for block in stream] == expected_sample_indices
+
+
+def test___queue_full_with_block_policy___fire_event___waits_for_consumer(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_read_blocks(interpreter)
+    with task.stream_blocks(_SAMPLES_PER_BLOCK, queue_depth=1) as stream:
+        fire_event = _get_callback(interpreter)
+        fire_event()
+        producer = threading.Thread(target=fire_event)
+        producer.start()
+        producer.join(timeout=0.1)
+        assert producer.is_alive()
+        assert stream.queued_blocks == 1
+
+        assert next(stream).first_sample_index == 0
+        producer.join(timeout=10.0)
+
+        assert not producer.is_alive()
+        assert stream.dropped_blocks == 0
+        assert next(stream).first_sample_index == _SAMPLES_PER_BLOCK
+
+
+def test___queue_full_with_block_policy___consumer_leaves_loop___callback_returns(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_read_blocks(interpreter)
+    with task.stream_blocks(_SAMPLES_PER_BLOCK, queue_depth=1) as stream:
+        fire_event = _get_callback(interpreter)
+        fire_event()
+        for block in stream:
+            fire_event()
+            producer = threading.Thread(target=fire_event)
+            producer.start()
+            producer.join(timeout=0.1)
+            assert producer.is_alive()
+            break
+
+        producer.join(timeout=10.0)
+
+        assert not producer.is_alive()
+        assert stream.received_blocks == 3
+
+
+def test___queue_full_with_block_policy___stop_task___callback_returns(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_read_blocks(interpreter)
+    with task.stream_blocks(_SAMPLES_PER_BLOCK, queue_depth=1) as stream:
+        fire_event = _get_callback(interpreter)
+        fire_event()
+        producer = threading.Thread(target=fire_event)
+        producer.start()
+        producer.join(timeout=0.1)
+        assert producer.is_alive()
+
+        task.stop()
+        producer.join(timeout=10.0)
+
+        assert not producer.is_alive()
+        interpreter.stop_task.assert_called_once()
+        assert [block.first_sample_index for block in stream] == [0]
+
+
+def test___queue_full_with_block_policy___consumer_times_out___drops_block(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_read_blocks(interpreter)
+    with task.stream_blocks(_SAMPLES_PER_BLOCK, queue_depth=1, timeout=0.01) as stream:
+        fire_event = _get_callback(interpreter)
+        fire_event()
+        fire_event()
+
+        assert stream.dropped_blocks == 1
+        assert next(stream).first_sample_index == 0
+
+
+def test___block_stream___async_iterate___returns_blocks_from_callback_thread(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_read_blocks(interpreter)
+    stream = task.stream_blocks(_SAMPLES_PER_BLOCK)
+    fire_event = _get_callback(interpreter)
+
+    def _produce() -> None:
+        fire_event()
+        fire_event()
+        stream.close()
+
+    async def _consume() -> list[int]:
+        producer = threading.Thread(target=_produce)
+        producer.start()
+        sample_indices = [block.first_sample_index async for block in stream]
+        producer.join()
+        return sample_indices
+
+    assert asyncio.run(_consume()) == [0, _SAMPLES_PER_BLOCK]
+
+
+def test___read_fails___iterate___raises_read_error(task: Task, interpreter: Mock) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    read_error = DaqReadError("Samples are no longer available.", -200279, 0)
+    interpreter.read_analog_f64.side_effect = read_error
+    with task.stream_blocks(_SAMPLES_PER_BLOCK) as stream:
+        _get_callback(interpreter)()
+
+        with pytest.raises(DaqReadError) as exc_info:
+            next(stream)
+
+    assert exc_info.value is read_error
+
+
+def test___block_stream___create___is_block_stream(task: Task, interpreter: Mock) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+
+    with task.stream_blocks(_SAMPLES_PER_BLOCK, queue_depth=3) as stream:
+        assert isinstance(stream, BlockStream)
+        assert stream.samples_per_block == _SAMPLES_PER_BLOCK
+        assert stream.queue_depth == 3
+        assert stream.overflow_policy == StreamOverflowPolicy.BLOCK
+
+
+def test___async_iterate_cancelled___waiter_removed(task: Task, interpreter: Mock) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+
+    async def _cancel_anext(stream: BlockStream) -> None:
+        waiting = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    with task.stream_blocks(_SAMPLES_PER_BLOCK) as stream:
+        asyncio.run(_cancel_anext(stream))
+
+        assert stream._async_waiters == []
+
+
+def test___register_event_fails___create___does_not_keep_stop_listener(
+    task: Task, interpreter: Mock
+) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    register_error = DaqError("Register failed.", -200960)
+    interpreter.register_every_n_samples_event.side_effect = register_error
+
+    with pytest.raises(DaqError) as exc_info:
+        task.stream_blocks(_SAMPLES_PER_BLOCK)
+
+    assert exc_info.value is register_error
+    assert len(task._stop_listeners) == 0
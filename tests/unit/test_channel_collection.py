@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import ANY, Mock, call
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import ChannelType, TerminalConfiguration, UsageTypeAI
+from nidaqmx.task.channels import AIChannel
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+try:
+    import grpc
+except ImportError:
+    grpc = None  # type: ignore
+
+_CHANNEL_NAMES = 0x1273
+_AI_MAX = 0x17DD
+_AI_MEAS_TYPE = 0x695
+_AI_TERM_CFG = 0x1097
+
+
+@pytest.fixture(autouse=True)
+def _last_created_chan_not_supported(interpreter: Mock) -> None:
+    interpreter.internal_get_last_created_chan.side_effect = NotImplementedError
+
+
+def _expect_ai_channels(interpreter: Mock, channel_names: str) -> None:
+    interpreter.get_task_attribute_string.return_value = channel_names
+    interpreter.get_chan_attribute_int32.return_value = ChannelType.ANALOG_INPUT.value
+
+
+def _count_channel_name_queries(interpreter: Mock) -> int:
+    return [c.args[1] for c in interpreter.get_task_attribute_string.call_args_list].count(
+        _CHANNEL_NAMES
+    )
+
+
+def test___ai_channels___iterate_twice___queries_channels_once(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:2")
+
+    first = list(task.ai_channels)
+    second = list(task.ai_channels)
+
+    assert [channel.name for channel in second] == ["Dev1/ai0", "Dev1/ai1", "Dev1/ai2"]
+    assert all(isinstance(channel, AIChannel) for channel in second)
+    assert [id(channel) for channel in second] == [id(channel) for channel in first]
+    assert _count_channel_name_queries(interpreter) == 1
+    assert interpreter.get_chan_attribute_int32.call_count == 3
+
+
+def test___ai_channels___index_contains_and_len___use_channel_index(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:2")
+
+    assert len(task.ai_channels) == 3
+    assert task.ai_channels[1].name == "Dev1/ai1"
+    assert task.ai_channels[1:].name == "Dev1/ai1:2"
+    assert "Dev1/ai0:1" in task.ai_channels
+    assert "Dev1/ai3" not in task.ai_channels
+    assert _count_channel_name_queries(interpreter) == 1
+
+
+def test___add_channel___channel_names___refreshes_channel_index(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0")
+    assert task.ai_channels.channel_names == ["Dev1/ai0"]
+    interpreter.get_task_attribute_string.return_value = "Dev1/ai0:1"
+
+    task.ai_channels.add_ai_voltage_chan("Dev1/ai1")
+
+    assert task.ai_channels.channel_names == ["Dev1/ai0", "Dev1/ai1"]
+    assert task.channel_names == ["Dev1/ai0", "Dev1/ai1"]
+
+
+def test___same_arguments___add_chans___creates_channels_with_one_call(
+    task: Task, interpreter: Mock
+) -> None:
+    rows = [{"physical_channel": f"Dev1/ai{i}", "max_val": 5.0} for i in range(256)]
+
+    channel = task.ai_channels.add_chans("add_ai_voltage_chan", rows)
+
+    assert isinstance(channel, AIChannel)
+    assert channel.name == "Dev1/ai0:255"
+    interpreter.create_ai_voltage_chan.assert_called_once_with(
+        ANY, "Dev1/ai0:255", "", ANY, -5.0, 5.0, ANY, ""
+    )
+
+
+def test___different_arguments___add_chans___creates_channels_in_order(
+    task: Task, interpreter: Mock
+) -> None:
+    columns = {
+        "physical_channel": ["Dev1/ai0", "Dev1/ai1", "Dev1/ai2", "Dev1/ai3"],
+        "terminal_config": [
+            TerminalConfiguration.RSE,
+            TerminalConfiguration.RSE,
+            TerminalConfiguration.DIFF,
+            TerminalConfiguration.RSE,
+        ],
+    }
+
+    channel = task.ai_channels.add_chans(task.ai_channels.add_ai_voltage_chan, columns)
+
+    assert channel.name == "Dev1/ai0:3"
+    assert [c.args[1:4] for c in interpreter.create_ai_voltage_chan.call_args_list] == [
+        ("Dev1/ai0:1", "", TerminalConfiguration.RSE.value),
+        ("Dev1/ai2", "", TerminalConfiguration.DIFF.value),
+        ("Dev1/ai3", "", TerminalConfiguration.RSE.value),
+    ]
+
+
+def test___named_channels___add_chans___assigns_names(task: Task, interpreter: Mock) -> None:
+    rows = [
+        {"physical_channel": "Dev1/ai0", "name_to_assign_to_channel": "Temperature"},
+        {"physical_channel": "Dev1/ai1", "name_to_assign_to_channel": "Pressure"},
+        {"physical_channel": "Dev1/ai2:3", "name_to_assign_to_channel": "Strain"},
+    ]
+
+    channel = task.ai_channels.add_chans("add_ai_voltage_chan", rows)
+
+    assert channel.name == "Temperature,Pressure,Strain0:1"
+    assert interpreter.create_ai_voltage_chan.call_args_list == [
+        call(ANY, "Dev1/ai0:1", "Temperature,Pressure", ANY, ANY, ANY, ANY, ANY),
+        call(ANY, "Dev1/ai2:3", "Strain", ANY, ANY, ANY, ANY, ANY),
+    ]
+
+
+def test___invalid_method___add_chans___raises_error(task: Task, interpreter: Mock) -> None:
+    with pytest.raises(DaqError) as exc_info:
+        task.ai_channels.add_chans("channel_names", [{"physical_channel": "Dev1/ai0"}])
+
+    assert "is not a channel creation method" in exc_info.value.args[0]
+    interpreter.create_ai_voltage_chan.assert_not_called()
+
+
+def test___ai_channels___get___returns_array_in_channel_order(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:2")
+    interpreter.get_chan_attributes.return_value = [1.0, 2.0, 3.0]
+
+    values = task.ai_channels.get("ai_max")
+
+    assert values.dtype == numpy.float64
+    assert values.tolist() == [1.0, 2.0, 3.0]
+    interpreter.get_chan_attributes.assert_called_once_with(
+        ANY, ["Dev1/ai0", "Dev1/ai1", "Dev1/ai2"], _AI_MAX, "double"
+    )
+
+
+def test___ai_channels___get_enum___returns_enum_members(task: Task, interpreter: Mock) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:1")
+    interpreter.get_chan_attributes.return_value = [
+        UsageTypeAI.VOLTAGE.value,
+        UsageTypeAI.CURRENT.value,
+    ]
+
+    values = task.ai_channels.get("ai_meas_type")
+
+    assert values.tolist() == [UsageTypeAI.VOLTAGE, UsageTypeAI.CURRENT]
+
+
+def test___ai_channels___set___sets_each_distinct_value_once(task: Task, interpreter: Mock) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:3")
+
+    task.ai_channels.set("ai_max", numpy.array([5.0, 10.0, 5.0, 5.0]))
+
+    assert interpreter.set_chan_attribute_double.call_args_list == [
+        call(ANY, "Dev1/ai0,Dev1/ai2:3", _AI_MAX, 5.0),
+        call(ANY, "Dev1/ai1", _AI_MAX, 10.0),
+    ]
+    interpreter.begin_batch.assert_called_once_with(task._handle)
+    interpreter.end_batch.assert_called_once_with(task._handle)
+
+
+def test___ai_channels___set_scalar_enum___sets_all_channels_once(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:3")
+
+    task.ai_channels.set("ai_term_cfg", TerminalConfiguration.RSE)
+
+    interpreter.set_chan_attribute_int32.assert_called_once_with(
+        ANY, "Dev1/ai0:3", _AI_TERM_CFG, TerminalConfiguration.RSE.value
+    )
+
+
+def test___read_only_property___set___raises_error(task: Task, interpreter: Mock) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0")
+
+    with pytest.raises(DaqError) as exc_info:
+        task.ai_channels.set("ai_meas_type", UsageTypeAI.VOLTAGE)
+
+    assert "is not a writable channel property" in exc_info.value.args[0]
+    interpreter.set_chan_attribute_int32.assert_not_called()
+
+
+def test___wrong_number_of_values___set___raises_error(task: Task, interpreter: Mock) -> None:
+    _expect_ai_channels(interpreter, "Dev1/ai0:1")
+
+    with pytest.raises(DaqError) as exc_info:
+        task.ai_channels.set("ai_max", [5.0, 5.0, 5.0])
+
+    assert "does not match the number of channels" in exc_info.value.args[0]
+    interpreter.set_chan_attribute_double.assert_not_called()
+
+
+@pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+def test___grpc_interpreter___get_chan_attributes___returns_values_in_channel_order(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    channels = [f"ai{i}" for i in range(8)]
+    stand_in_server.nidaqmx_servicer.chan_attributes.update(
+        {(channel, _AI_MAX): float(i) for i, channel in enumerate(channels)}
+    )
+
+    values = stand_in_grpc_interpreter.get_chan_attributes(
+        stand_in_task_session, channels, _AI_MAX, "double"
+    )
+
+    assert values == [float(i) for i in range(8)]
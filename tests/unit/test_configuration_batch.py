@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import DaqError, Task
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+_AI_MAX = 0x17DD
+
+
+def test___configuration_batch___exit___ends_batch(task: Task, interpreter: Mock) -> None:
+    with task.configuration_batch():
+        interpreter.begin_batch.assert_called_once_with(task._handle)
+        interpreter.end_batch.assert_not_called()
+
+    interpreter.end_batch.assert_called_once_with(task._handle)
+
+
+def test___configuration_batch___raise___ends_batch(task: Task, interpreter: Mock) -> None:
+    with pytest.raises(ValueError):
+        with task.configuration_batch():
+            raise ValueError()
+
+    interpreter.end_batch.assert_called_once_with(task._handle)
+
+
+def test___batch___set_chan_attributes___does_not_wait_for_responses(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.set_gate.clear()
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    try:
+        # Without a batch, each set would wait for the gate.
+        for channel in ("ai0", "ai1", "ai2"):
+            stand_in_grpc_interpreter.set_chan_attribute_double(
+                stand_in_task_session, channel, _AI_MAX, 5.0
+            )
+        assert len(servicer.requests) == 0
+    finally:
+        servicer.set_gate.set()
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    assert servicer.chan_attributes == {
+        ("ai0", _AI_MAX): 5.0,
+        ("ai1", _AI_MAX): 5.0,
+        ("ai2", _AI_MAX): 5.0,
+    }
+
+
+def test___batch___set_same_chan_attribute___sets_values_in_order(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    for value in range(10):
+        stand_in_grpc_interpreter.set_chan_attribute_double(
+            stand_in_task_session, "ai0", _AI_MAX, float(value)
+        )
+    stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    assert [request.value for request in stand_in_server.nidaqmx_servicer.requests] == [
+        float(value) for value in range(10)
+    ]
+
+
+def test___batch___set_overlapping_channels___waits_for_overlapping_set(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.set_gate.clear()
+    open_gate = threading.Timer(0.1, servicer.set_gate.set)
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    try:
+        stand_in_grpc_interpreter.set_chan_attribute_double(
+            stand_in_task_session, "Dev1/ai0:3", _AI_MAX, 5.0
+        )
+        open_gate.start()
+        # "Dev1/AI0" is one of the channels in "Dev1/ai0:3", so this set waits for that set.
+        stand_in_grpc_interpreter.set_chan_attribute_double(
+            stand_in_task_session, "Dev1/AI0", _AI_MAX, 10.0
+        )
+        assert servicer.requests[0].channel == "Dev1/ai0:3"
+    finally:
+        open_gate.cancel()
+        servicer.set_gate.set()
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    assert [request.channel for request in servicer.requests] == ["Dev1/ai0:3", "Dev1/AI0"]
+
+
+def test___batch___set_disjoint_channel_ranges___does_not_wait_for_responses(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.set_gate.clear()
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    try:
+        for channel in ("Dev1/ai0:1", "Dev1/ai2, Dev1/ai3"):
+            stand_in_grpc_interpreter.set_chan_attribute_double(
+                stand_in_task_session, channel, _AI_MAX, 5.0
+            )
+        assert len(servicer.requests) == 0
+    finally:
+        servicer.set_gate.set()
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    assert len(servicer.requests) == 2
+
+
+def test___batched_sets_fail___end_batch___raises_first_error(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.set_errors = {"ai1": -200077, "ai2": -200078}
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    for channel in ("ai0", "ai1", "ai2", "ai3"):
+        stand_in_grpc_interpreter.set_chan_attribute_double(
+            stand_in_task_session, channel, _AI_MAX, 5.0
+        )
+    with pytest.raises(DaqError) as exc_info:
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    assert exc_info.value.error_code == -200077
+    assert set(stand_in_server.nidaqmx_servicer.chan_attributes) == {
+        ("ai0", _AI_MAX),
+        ("ai3", _AI_MAX),
+    }
+
+
+def test___batched_set_fails___get_chan_attribute___raises_error_before_get(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.set_errors = {"ai1": -200077}
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    try:
+        stand_in_grpc_interpreter.set_chan_attribute_double(
+            stand_in_task_session, "ai0", _AI_MAX, 5.0
+        )
+        stand_in_grpc_interpreter.set_chan_attribute_double(
+            stand_in_task_session, "ai1", _AI_MAX, 5.0
+        )
+        with pytest.raises(DaqError) as exc_info:
+            stand_in_grpc_interpreter.get_chan_attribute_double(
+                stand_in_task_session, "ai0", _AI_MAX
+            )
+        value = stand_in_grpc_interpreter.get_chan_attribute_double(
+            stand_in_task_session, "ai0", _AI_MAX
+        )
+    finally:
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    assert exc_info.value.error_code == -200077
+    assert value == 5.0
+
+
+def test___nested_batches___end_inner_batch___does_not_flush(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.set_errors = {"ai0": -200077}
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    stand_in_grpc_interpreter.set_chan_attribute_double(stand_in_task_session, "ai0", _AI_MAX, 5.0)
+    stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+    with pytest.raises(DaqError):
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+
+def test___batch___set_chan_attribute_of_other_task___waits_for_response(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    import session_pb2
+
+    other_task_session = session_pb2.Session(name="OtherTask")
+    servicer = stand_in_server.nidaqmx_servicer
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    try:
+        stand_in_grpc_interpreter.set_chan_attribute_double(other_task_session, "ai0", _AI_MAX, 5.0)
+        assert len(servicer.requests) == 1
+    finally:
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
+
+
+def test___batch___set_chan_attribute_from_other_thread___waits_for_response(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    servicer = stand_in_server.nidaqmx_servicer
+
+    stand_in_grpc_interpreter.begin_batch(stand_in_task_session)
+    try:
+        thread = threading.Thread(
+            target=stand_in_grpc_interpreter.set_chan_attribute_double,
+            args=(stand_in_task_session, "ai0", _AI_MAX, 5.0),
+        )
+        thread.start()
+        thread.join()
+        assert len(servicer.requests) == 1
+    finally:
+        stand_in_grpc_interpreter.end_batch(stand_in_task_session)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.stream_readers import ContinuousReader
+
+
+def _expect_read_analog_ramp(interpreter: Mock, number_of_channels: int) -> None:
+    """Expect interleaved reads that return sample index * 10 + channel index."""
+    next_sample_index = 0
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        nonlocal next_sample_index
+        sample_indices = numpy.arange(next_sample_index, next_sample_index + num_samps_per_chan)
+        read_array[:] = sample_indices[:, None] * 10 + numpy.arange(number_of_channels)
+        next_sample_index += num_samps_per_chan
+        return read_array, num_samps_per_chan
+
+    interpreter.get_read_attribute_uint32.return_value = number_of_channels
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def _expected_block(first_sample_index: int, number_of_samples: int, number_of_channels: int):
+    sample_indices = numpy.arange(first_sample_index, first_sample_index + number_of_samples)
+    return (sample_indices[:, None] * 10 + numpy.arange(number_of_channels)).T
+
+
+def test___continuous_reader___read___returns_read_only_channel_major_view(
+    task: Task, interpreter: Mock
+):
+    _expect_read_analog_ramp(interpreter, 2)
+    reader = ContinuousReader(task.in_stream, 10)
+
+    block = reader.read(4)
+
+    assert block.first_sample_index == 0
+    assert block.data.shape == (2, 4)
+    assert block.data.tolist() == _expected_block(0, 4, 2).tolist()
+    assert not block.data.flags.writeable
+    assert numpy.shares_memory(block.data, reader._buffer)
+
+
+def test___continuous_reader___read_multiple_blocks___sample_index_increases(
+    task: Task, interpreter: Mock
+):
+    _expect_read_analog_ramp(interpreter, 2)
+    reader = ContinuousReader(task.in_stream, 10)
+
+    blocks = [reader.read(3) for _ in range(5)]
+
+    assert [block.first_sample_index for block in blocks] == [0, 3, 6, 9, 12]
+    assert reader.next_sample_index == 15
+    assert blocks[-1].data.tolist() == _expected_block(12, 3, 2).tolist()
+
+
+def test___continuous_reader___read_past_end___wraps_around_to_contiguous_block(
+    task: Task, interpreter: Mock
+):
+    _expect_read_analog_ramp(interpreter, 3)
+    reader = ContinuousReader(task.in_stream, 10)
+    reader.read(4)
+    reader.read(4)
+
+    block = reader.read(4)
+
+    assert block.first_sample_index == 8
+    assert block.data.tolist() == _expected_block(8, 4, 3).tolist()
+    assert numpy.shares_memory(block.data, reader._buffer[0:4])
+
+
+def test___continuous_reader___block_overwritten___block_is_invalid(task: Task, interpreter: Mock):
+    _expect_read_analog_ramp(interpreter, 1)
+    reader = ContinuousReader(task.in_stream, 10)
+    first = reader.read(4)
+    second = reader.read(4)
+
+    third = reader.read(4)
+
+    assert not reader.is_block_valid(first)
+    assert reader.is_block_valid(second)
+    assert reader.is_block_valid(third)
+    assert reader.oldest_sample_index == 4
+
+
+def test___continuous_reader___read_more_than_capacity___raises_error(
+    task: Task, interpreter: Mock
+):
+    _expect_read_analog_ramp(interpreter, 1)
+    reader = ContinuousReader(task.in_stream, 10)
+
+    with pytest.raises(DaqError) as exc_info:
+        reader.read(11)
+
+    assert "capacity" in exc_info.value.args[0]
+    interpreter.read_analog_f64.assert_not_called()
+
+
+def test___continuous_reader___number_of_channels_changed___raises_error(
+    task: Task, interpreter: Mock
+):
+    _expect_read_analog_ramp(interpreter, 2)
+    reader = ContinuousReader(task.in_stream, 10)
+    interpreter.get_read_attribute_uint32.return_value = 3
+
+    with pytest.raises(DaqError) as exc_info:
+        reader.read(4)
+
+    assert "number of channels" in exc_info.value.args[0]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import Task
+from nidaqmx.constants import FillMode, UsageTypeCO
+from nidaqmx.stream_readers import CounterReader
+from nidaqmx.stream_writers import CounterWriter
+from nidaqmx.types import CTR_FREQ_DTYPE, CTR_TICK_DTYPE, CTR_TIME_DTYPE, CtrFreq
+from tests.unit._task_utils import (
+    expect_read_ci_pulse_freq_channel,
+    expect_write_co_pulse_channel,
+)
+
+
+def _get_written_columns(write_function: Mock) -> list[list]:
+    return [column.tolist() for column in write_function.call_args.args[5:]]
+
+
+def test___ci_pulse_freq_channel___read___returns_ctr_freq_list(task: Task, interpreter: Mock):
+    expect_read_ci_pulse_freq_channel(interpreter, "Dev1/ctr0")
+
+    data = task.read(3)
+
+    assert data == [CtrFreq(freq=1000.0, duty_cycle=0.5)] * 3
+    assert all(isinstance(sample, CtrFreq) for sample in data)
+
+
+def test___ctr_freq_list___write___writes_columns(task: Task, interpreter: Mock):
+    expect_write_co_pulse_channel(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+
+    task.write([CtrFreq(freq=1000.0, duty_cycle=0.25), CtrFreq(freq=2000.0, duty_cycle=0.75)])
+
+    assert _get_written_columns(interpreter.write_ctr_freq) == [[1000.0, 2000.0], [0.25, 0.75]]
+
+
+@pytest.mark.parametrize(
+    "output_type, dtype, write_function_name",
+    [
+        (UsageTypeCO.PULSE_FREQUENCY, CTR_FREQ_DTYPE, "write_ctr_freq"),
+        (UsageTypeCO.PULSE_TIME, CTR_TIME_DTYPE, "write_ctr_time"),
+        (UsageTypeCO.PULSE_TICKS, CTR_TICK_DTYPE, "write_ctr_ticks"),
+    ],
+)
+def test___structured_array___write___writes_columns(
+    task: Task,
+    interpreter: Mock,
+    output_type: UsageTypeCO,
+    dtype: numpy.dtype,
+    write_function_name: str,
+):
+    expect_write_co_pulse_channel(interpreter, output_type)
+    data = numpy.array([(100, 1), (200, 2), (300, 3)], dtype=dtype)
+
+    task.write(data)
+
+    write_function = getattr(interpreter, write_function_name)
+    assert write_function.call_args.args[1:5] == (3, False, 10.0, FillMode.GROUP_BY_CHANNEL.value)
+    assert _get_written_columns(write_function) == [[100, 200, 300], [1, 2, 3]]
+    assert all(column.flags.c_contiguous for column in write_function.call_args.args[5:])
+
+
+def test___structured_scalar___write___writes_one_sample(task: Task, interpreter: Mock):
+    expect_write_co_pulse_channel(interpreter, UsageTypeCO.PULSE_TICKS)
+    data = numpy.array([(100, 1)], dtype=CTR_TICK_DTYPE)
+
+    task.write(data[0])
+
+    assert interpreter.write_ctr_ticks.call_args.args[1:3] == (1, True)
+    assert _get_written_columns(interpreter.write_ctr_ticks) == [[100], [1]]
+
+
+def test___multi_channel_1d_structured_array___write___writes_one_sample_per_channel(
+    task: Task, interpreter: Mock
+):
+    expect_write_co_pulse_channel(
+        interpreter, UsageTypeCO.PULSE_FREQUENCY, ["Dev1/ctr0", "Dev1/ctr1"]
+    )
+    data = numpy.array([(1000.0, 0.25), (2000.0, 0.75)], dtype=CTR_FREQ_DTYPE)
+
+    task.write(data)
+
+    assert interpreter.write_ctr_freq.call_args.args[1:3] == (1, True)
+    assert _get_written_columns(interpreter.write_ctr_freq) == [[1000.0, 2000.0], [0.25, 0.75]]
+
+
+def test___multi_channel_2d_structured_array___write___writes_samples_per_channel(
+    task: Task, interpreter: Mock
+):
+    expect_write_co_pulse_channel(interpreter, UsageTypeCO.PULSE_TICKS, ["Dev1/ctr0", "Dev1/ctr1"])
+    data = numpy.array(
+        [[(10, 1), (20, 2), (30, 3)], [(40, 4), (50, 5), (60, 6)]], dtype=CTR_TICK_DTYPE
+    )
+
+    task.write(data)
+
+    assert interpreter.write_ctr_ticks.call_args.args[1:3] == (3, False)
+    assert _get_written_columns(interpreter.write_ctr_ticks) == [
+        [[10, 20, 30], [40, 50, 60]],
+        [[1, 2, 3], [4, 5, 6]],
+    ]
+
+
+def test___mismatched_structured_array___write___raises_type_error(task: Task, interpreter: Mock):
+    expect_write_co_pulse_channel(interpreter, UsageTypeCO.PULSE_FREQUENCY)
+    data = numpy.zeros(3, dtype=CTR_TICK_DTYPE)
+
+    with pytest.raises(TypeError, match="freq, duty_cycle"):
+        task.write(data)
+
+    interpreter.write_ctr_freq.assert_not_called()
+
+
+def test___counter_reader___read_many_sample_pulse___fills_structured_array(
+    task: Task, interpreter: Mock
+):
+    def _read_ctr_ticks(task_handle, num_samps_per_chan, timeout, fill_mode, high_ticks, low_ticks):
+        high_ticks[:] = [10, 20, 30, 40]
+        low_ticks[:] = [1, 2, 3, 4]
+        return high_ticks, low_ticks, 3
+
+    interpreter.read_ctr_ticks.side_effect = _read_ctr_ticks
+    reader = CounterReader(task.in_stream)
+    reader.verify_array_shape = False
+    data = numpy.zeros(4, dtype=CTR_TICK_DTYPE)
+
+    samples_read = reader.read_many_sample_pulse(data, 4)
+
+    assert samples_read == 3
+    assert data["high_tick"].tolist() == [10, 20, 30, 0]
+    assert data["low_tick"].tolist() == [1, 2, 3, 0]
+
+
+def test___counter_writer___write_many_sample_pulse___writes_columns(task: Task, interpreter: Mock):
+    expect_write_co_pulse_channel(interpreter, UsageTypeCO.PULSE_TIME)
+    writer = CounterWriter(task.out_stream)
+    data = numpy.array([(0.001, 0.002), (0.003, 0.004)], dtype=CTR_TIME_DTYPE)
+
+    writer.write_many_sample_pulse(data)
+
+    assert interpreter.write_ctr_time.call_args.args[1] == 2
+    assert _get_written_columns(interpreter.write_ctr_time) == [[0.001, 0.003], [0.002, 0.004]]
+
+
+def test___counter_writer___write_many_sample_pulse_with_plain_array___raises_type_error(
+    task: Task, interpreter: Mock
+):
+    writer = CounterWriter(task.out_stream)
+
+    with pytest.raises(TypeError, match="structured dtype"):
+        writer.write_many_sample_pulse(numpy.zeros(2, dtype=numpy.float64))
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqReadError, Task
+from nidaqmx.constants import FillMode
+from nidaqmx.stream_readers import AnalogMultiChannelReader
+from tests.unit._task_utils import expect_create_task, expect_get_task_name
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+
+def test___read_stream___read___reads_over_one_stream(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    read_array = numpy.zeros((2, 5), dtype=numpy.float64)
+
+    stream = stand_in_grpc_interpreter.begin_read_analog_f64_stream(
+        stand_in_task_session, 5, 2.0, FillMode.GROUP_BY_CHANNEL.value, read_array.size
+    )
+    try:
+        results = [stream.read(read_array)[1] for _ in range(3)]
+    finally:
+        stream.close()
+
+    assert results == [5, 5, 5]
+    assert read_array.tolist() == numpy.full((2, 5), 3.0).tolist()
+    assert stand_in_server.data_moniker_servicer.stream_count == 1
+    (begin_request,) = stand_in_server.nidaqmx_servicer.requests
+    assert (begin_request.num_samps_per_chan, begin_request.timeout) == (5, 2.0)
+    assert begin_request.array_size_in_samps == 10
+
+
+def test___read_stream___read_fails___raises_read_error(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.read_status = -200279
+    read_array = numpy.zeros(5, dtype=numpy.float64)
+    stream = stand_in_grpc_interpreter.begin_read_analog_f64_stream(
+        stand_in_task_session, 5, 2.0, FillMode.GROUP_BY_CHANNEL.value, read_array.size
+    )
+
+    try:
+        with pytest.raises(DaqReadError) as exc_info:
+            stream.read(read_array)
+    finally:
+        stream.close()
+
+    assert exc_info.value.error_code == -200279
+    assert exc_info.value.samps_per_chan_read == 5
+
+
+def test___reader_uses_data_moniker_stream___read_many_sample___reuses_stream(
+    task: Task, interpreter: Mock
+) -> None:
+    interpreter.get_read_attribute_uint32.return_value = 2  # num_chans
+    stream = interpreter.begin_read_analog_f64_stream.return_value
+    stream.read.side_effect = lambda read_array: (read_array, 10)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    reader.use_data_moniker_stream = True
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    samples_read = [reader.read_many_sample(data, 10, timeout=2.0) for _ in range(3)]
+
+    assert samples_read == [10, 10, 10]
+    interpreter.begin_read_analog_f64_stream.assert_called_once_with(
+        task._handle, 10, 2.0, FillMode.GROUP_BY_CHANNEL.value, 20
+    )
+    assert stream.read.call_count == 3
+    interpreter.read_analog_f64.assert_not_called()
+
+
+def test___reader_uses_data_moniker_stream___read_with_different_timeout___begins_new_stream(
+    task: Task, interpreter: Mock
+) -> None:
+    interpreter.get_read_attribute_uint32.return_value = 1  # num_chans
+    first_stream, second_stream = Mock(), Mock()
+    for stream in (first_stream, second_stream):
+        stream.read.side_effect = lambda read_array: (read_array, 10)
+    interpreter.begin_read_analog_f64_stream.side_effect = [first_stream, second_stream]
+    reader = AnalogMultiChannelReader(task.in_stream)
+    reader.use_data_moniker_stream = True
+    data = numpy.zeros((1, 10), dtype=numpy.float64)
+
+    reader.read_many_sample(data, 10, timeout=2.0)
+    reader.read_many_sample(data, 10, timeout=5.0)
+    reader.use_data_moniker_stream = False
+
+    assert interpreter.begin_read_analog_f64_stream.call_count == 2
+    first_stream.close.assert_called_once()
+    second_stream.close.assert_called_once()
+
+
+def test___reader_uses_data_moniker_stream___stop_task___closes_stream(
+    task: Task, interpreter: Mock
+) -> None:
+    interpreter.get_read_attribute_uint32.return_value = 1  # num_chans
+    stream = interpreter.begin_read_analog_f64_stream.return_value
+    stream.read.side_effect = lambda read_array: (read_array, 10)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    reader.use_data_moniker_stream = True
+    data = numpy.zeros((1, 10), dtype=numpy.float64)
+    reader.read_many_sample(data, 10, timeout=2.0)
+
+    task.stop()
+
+    stream.close.assert_called_once()
+    reader.read_many_sample(data, 10, timeout=2.0)
+    assert interpreter.begin_read_analog_f64_stream.call_count == 2
+
+
+def test___reader_uses_data_moniker_stream___close_task___closes_stream(
+    interpreter: Mock,
+) -> None:
+    expect_create_task(interpreter)
+    expect_get_task_name(interpreter, "MyTask")
+    task = Task("MyTask")
+    interpreter.get_read_attribute_uint32.return_value = 1  # num_chans
+    stream = interpreter.begin_read_analog_f64_stream.return_value
+    stream.read.side_effect = lambda read_array: (read_array, 10)
+    reader = AnalogMultiChannelReader(task.in_stream)
+    reader.use_data_moniker_stream = True
+    reader.read_many_sample(numpy.zeros((1, 10), dtype=numpy.float64), 10, timeout=2.0)
+
+    task.close()
+
+    stream.close.assert_called_once()
+    interpreter.clear_task.assert_called_once()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import warnings
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqWarning
+from nidaqmx._error_strings import ErrorStringCache, WarningCoalescer, add_occurrence_count
+from nidaqmx.constants import FillMode
+from nidaqmx.error_codes import DAQmxErrors
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+try:
+    import grpc
+except ImportError:
+    grpc = None  # type: ignore
+
+_WARNING_CODE = 200010
+
+
+def test___error_string_cache___get_or_add___gets_error_string_once() -> None:
+    cache = ErrorStringCache()
+    get_error_string = Mock(return_value="Stand-in error.")
+
+    error_strings = [cache.get_or_add(-200088, get_error_string) for _ in range(3)]
+
+    assert error_strings == ["Stand-in error."] * 3
+    get_error_string.assert_called_once_with(-200088)
+
+
+def test___error_string_cache___get_or_add_async___gets_error_string_once() -> None:
+    cache = ErrorStringCache()
+    get_error_string = AsyncMock(return_value="Stand-in error.")
+
+    async def _main() -> list[str]:
+        return [await cache.get_or_add_async(-200088, get_error_string) for _ in range(3)]
+
+    error_strings = asyncio.run(_main())
+
+    assert error_strings == ["Stand-in error."] * 3
+    get_error_string.assert_awaited_once_with(-200088)
+
+
+def test___initial_error_strings_by_enum___get___returns_error_string() -> None:
+    cache = ErrorStringCache(initial={DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE: "Not available."})
+
+    assert cache.get(DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE.value) == "Not available."
+
+
+def test___full_error_string_cache___add___evicts_least_recently_used() -> None:
+    cache = ErrorStringCache(maxsize=2, initial={-1: "Initial error."})
+    cache.add(1, "One")
+    cache.add(2, "Two")
+    cache.get(1)
+
+    cache.add(3, "Three")
+
+    assert cache.get(1) == "One"
+    assert cache.get(2) is None
+    assert cache.get(3) == "Three"
+    assert cache.get(-1) == "Initial error."
+
+
+def test___error_string_cache___add_failed_lookup___does_not_cache() -> None:
+    cache = ErrorStringCache()
+
+    cache.add(-200088, "Failed to retrieve error description.")
+
+    assert cache.get(-200088) is None
+
+
+def test___warning_coalescer___repeated_warning___reports_count_after_interval() -> None:
+    coalescer = WarningCoalescer(interval=60.0)
+
+    counts = [coalescer.coalesce(_WARNING_CODE) for _ in range(4)]
+    coalescer.interval = 0.0
+    counts.append(coalescer.coalesce(_WARNING_CODE))
+
+    assert counts == [1, 0, 0, 0, 4]
+    assert coalescer.coalesce(_WARNING_CODE + 1) == 1
+
+
+def test___default_warning_coalescer___repeated_warning___reports_every_warning() -> None:
+    coalescer = WarningCoalescer()
+
+    counts = [coalescer.coalesce(_WARNING_CODE) for _ in range(3)]
+
+    assert counts == [1, 1, 1]
+
+
+def test___warning_coalescer_with_unreported_warnings___flush___reports_count() -> None:
+    coalescer = WarningCoalescer(interval=60.0)
+    for _ in range(3):
+        coalescer.coalesce(_WARNING_CODE)
+    coalescer.coalesce(_WARNING_CODE + 1)
+
+    with pytest.warns(DaqWarning) as caught:
+        coalescer.flush()
+
+    assert [cast(DaqWarning, warning.message).error_code for warning in caught] == [_WARNING_CODE]
+    assert "occurred 2 more times" in str(caught[0].message)
+    assert coalescer.coalesce(_WARNING_CODE) == 1
+
+
+def test___occurrence_count___add_occurrence_count___appends_count_to_repeated_warning() -> None:
+    assert add_occurrence_count("Warning.", 1) == "Warning."
+    assert add_occurrence_count("Warning.", 3).endswith(
+        "This warning occurred 3 times since it was last reported."
+    )
+
+
+@pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+def test___grpc_interpreter___repeated_read_warning___reports_warning_once(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "nidaqmx._grpc_interpreter.warning_coalescer", WarningCoalescer(interval=60.0)
+    )
+    stand_in_server.nidaqmx_servicer.read_status = _WARNING_CODE
+    read_array = numpy.zeros(4, dtype=numpy.float64)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            stand_in_grpc_interpreter.read_analog_f64(
+                stand_in_task_session, 4, 10.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+            )
+
+    assert [type(warning.message) for warning in caught] == [DaqWarning]
+    assert isinstance(caught[0].message, DaqWarning)
+    assert caught[0].message.error_code == _WARNING_CODE
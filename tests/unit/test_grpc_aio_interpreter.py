@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+import numpy
+import pytest
+
+import nidaqmx
+from nidaqmx import DaqReadError
+from nidaqmx.constants import FillMode
+
+if TYPE_CHECKING:
+    from tests._grpc_stand_in_server import StandInAioGrpcServer
+
+try:
+    import grpc
+    import session_pb2
+
+    from nidaqmx._grpc_aio_interpreter import GrpcAioStubInterpreter
+    from nidaqmx.errors import RpcError
+    from tests._grpc_stand_in_server import STAND_IN_CHANNEL_OPTIONS
+except ImportError:
+    grpc = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+
+_NUM_TASKS = 50
+
+
+def _run_with_interpreter(
+    server: StandInAioGrpcServer,
+    function: Callable[[GrpcAioStubInterpreter], Awaitable[Any]],
+) -> Any:
+    """Run a coroutine function with a GrpcAioStubInterpreter connected to the stand-in server."""
+
+    async def _main() -> Any:
+        async with grpc.aio.insecure_channel(
+            f"localhost:{server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+        ) as channel:
+            return await function(GrpcAioStubInterpreter(nidaqmx.GrpcSessionOptions(channel, "")))
+
+    return asyncio.run(_main())
+
+
+def test___aio_interpreter___read_analog_f64___reads_samples(
+    stand_in_aio_server: StandInAioGrpcServer,
+) -> None:
+    stand_in_aio_server.nidaqmx_servicer.read_array = [float(i) for i in range(10)]
+    read_array = numpy.zeros((2, 5), dtype=numpy.float64)
+
+    _, samps_per_chan_read = _run_with_interpreter(
+        stand_in_aio_server,
+        lambda interpreter: interpreter.read_analog_f64(
+            session_pb2.Session(name="MyTask"), 5, 2.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+        ),
+    )
+
+    assert samps_per_chan_read == 5
+    assert read_array.tolist() == [[0.0, 1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0, 9.0]]
+
+
+def test___aio_interpreter___read_fails___raises_read_error(
+    stand_in_aio_server: StandInAioGrpcServer,
+) -> None:
+    stand_in_aio_server.nidaqmx_servicer.read_status = -200279
+    read_array = numpy.zeros(5, dtype=numpy.float64)
+
+    with pytest.raises(DaqReadError) as exc_info:
+        _run_with_interpreter(
+            stand_in_aio_server,
+            lambda interpreter: interpreter.read_analog_f64(
+                session_pb2.Session(name="MyTask"),
+                5,
+                2.0,
+                FillMode.GROUP_BY_CHANNEL.value,
+                read_array,
+            ),
+        )
+
+    assert exc_info.value.error_code == -200279
+    assert exc_info.value.samps_per_chan_read == 5
+
+
+def test___aio_interpreter___write_binary_i16___writes_samples(
+    stand_in_aio_server: StandInAioGrpcServer,
+) -> None:
+    write_array = numpy.array([[-32768, -1], [0, 32767]], dtype=numpy.int16)
+
+    samps_per_chan_written = _run_with_interpreter(
+        stand_in_aio_server,
+        lambda interpreter: interpreter.write_binary_i16(
+            session_pb2.Session(name="MyTask"),
+            2,
+            False,
+            2.0,
+            FillMode.GROUP_BY_CHANNEL.value,
+            write_array,
+        ),
+    )
+
+    assert samps_per_chan_written == 2
+    (write_request,) = stand_in_aio_server.nidaqmx_servicer.requests
+    assert list(write_request.write_array) == [-32768, -1, 0, 32767]
+
+
+def test___aio_interpreter___unimplemented_function___raises_rpc_error(
+    stand_in_aio_server: StandInAioGrpcServer,
+) -> None:
+    with pytest.raises(RpcError) as exc_info:
+        _run_with_interpreter(
+            stand_in_aio_server,
+            lambda interpreter: interpreter.start_task(session_pb2.Session(name="MyTask")),
+        )
+
+    assert exc_info.value.rpc_code == grpc.StatusCode.UNIMPLEMENTED
+
+
+def test___aio_interpreter___wait_on_many_tasks___waits_concurrently(
+    stand_in_aio_server: StandInAioGrpcServer,
+) -> None:
+    servicer = stand_in_aio_server.nidaqmx_servicer
+    servicer.operation_delay = 0.5
+
+    async def _wait_until_done(interpreter: GrpcAioStubInterpreter) -> None:
+        await asyncio.gather(
+            *(
+                interpreter.wait_until_task_done(session_pb2.Session(name=f"Task{i}"), 10.0)
+                for i in range(_NUM_TASKS)
+            )
+        )
+
+    _run_with_interpreter(stand_in_aio_server, _wait_until_done)
+
+    assert servicer.max_active_operations == _NUM_TASKS
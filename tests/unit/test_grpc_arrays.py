@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy
+import pytest
+
+from nidaqmx.constants import FillMode
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+try:
+    from nidaqmx._grpc_arrays import (
+        ArrayResponseDecoder,
+        PackedArrayRequest,
+        decode_varints,
+        encode_varints,
+        serialize_request,
+    )
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+except ImportError:
+    grpc_types = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(grpc_types is None, reason="The grpc module is not available.")
+
+_INT32_VALUES = [0, 1, -1, 127, 128, -32768, 32767, 2**31 - 1, -(2**31)]
+_UINT32_VALUES = [0, 1, 127, 128, 16383, 16384, 2**32 - 1]
+
+
+def test___varints___encode_and_decode___round_trips() -> None:
+    values = numpy.array(_INT32_VALUES, dtype=numpy.int32)
+
+    decoded = decode_varints(encode_varints(values))
+
+    assert decoded.view(numpy.int64).astype(numpy.int32).tolist() == _INT32_VALUES
+
+
+def test___varints___encode___matches_protobuf_encoding() -> None:
+    message = grpc_types.WriteBinaryI32Request(write_array=_INT32_VALUES)
+
+    request = PackedArrayRequest(
+        grpc_types.WriteBinaryI32Request(), {"write_array": numpy.array(_INT32_VALUES)}
+    )
+
+    assert serialize_request(request) == message.SerializeToString()
+
+
+@pytest.mark.parametrize(
+    "response_type_name, read_array",
+    [
+        ("ReadAnalogF64Response", [0.0, -1.5, 1e300, float("inf")]),
+        ("ReadBinaryI16Response", _INT32_VALUES),
+        ("ReadBinaryU32Response", _UINT32_VALUES),
+    ],
+)
+def test___serialized_response___decode___returns_numpy_array(
+    response_type_name: str, read_array: list
+) -> None:
+    response_type = getattr(grpc_types, response_type_name)
+    message = response_type(status=-200279, read_array=read_array, samps_per_chan_read=3)
+    decoder = ArrayResponseDecoder(response_type)
+
+    response = decoder(message.SerializeToString())
+
+    assert isinstance(response.read_array, numpy.ndarray)
+    assert response.read_array.tolist() == read_array
+    assert response.status == -200279
+    assert response.samps_per_chan_read == 3
+
+
+def test___empty_response___decode___returns_default_values() -> None:
+    decoder = ArrayResponseDecoder(grpc_types.ReadAnalogF64Response)
+
+    response = decoder(b"")
+
+    assert response.read_array.tolist() == []
+    assert (response.status, response.samps_per_chan_read) == (0, 0)
+
+
+def test___unpacked_repeated_field___decode___falls_back_to_protobuf() -> None:
+    # Field 2 (read_array) with wire type 1 (64-bit) is the unpacked encoding of one double.
+    data = b"\x08\x00" + b"\x11" + numpy.array([2.5], dtype="<f8").tobytes()
+    decoder = ArrayResponseDecoder(grpc_types.ReadAnalogF64Response)
+
+    response = decoder(data)
+
+    assert isinstance(response, grpc_types.ReadAnalogF64Response)
+    assert list(response.read_array) == [2.5]
+
+
+def test___unknown_field___decode___ignores_field() -> None:
+    message = grpc_types.ReadAnalogF64Response(read_array=[1.0, 2.0], samps_per_chan_read=2)
+    # Field 15 with wire type 0 (varint).
+    data = message.SerializeToString() + b"\x78\x05"
+    decoder = ArrayResponseDecoder(grpc_types.ReadAnalogF64Response)
+
+    response = decoder(data)
+
+    assert response.read_array.tolist() == [1.0, 2.0]
+
+
+def test___packed_array_request___serialize___parses_as_request() -> None:
+    write_array = numpy.arange(12, dtype=numpy.float64).reshape(3, 4)
+    message = grpc_types.WriteAnalogF64Request(num_samps_per_chan=4, timeout=2.0)
+
+    data = serialize_request(PackedArrayRequest(message, {"write_array": write_array.T}))
+
+    parsed = grpc_types.WriteAnalogF64Request.FromString(data)
+    assert (parsed.num_samps_per_chan, parsed.timeout) == (4, 2.0)
+    assert list(parsed.write_array) == write_array.T.flatten().tolist()
+
+
+def test___grpc_interpreter___read_analog_f64___reads_samples(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.read_array = [float(i) for i in range(10)]
+    read_array = numpy.zeros((2, 5), dtype=numpy.float64)
+
+    _, samps_per_chan_read = stand_in_grpc_interpreter.read_analog_f64(
+        stand_in_task_session, 5, 2.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+    )
+
+    assert samps_per_chan_read == 5
+    assert read_array.tolist() == [[0.0, 1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0, 9.0]]
+
+
+def test___grpc_interpreter___read_binary_i16___reads_negative_samples(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.read_array = [-32768, -1, 0, 32767]
+    read_array = numpy.zeros(4, dtype=numpy.int16)
+
+    stand_in_grpc_interpreter.read_binary_i16(
+        stand_in_task_session, 4, 2.0, FillMode.GROUP_BY_CHANNEL.value, read_array
+    )
+
+    assert read_array.tolist() == [-32768, -1, 0, 32767]
+
+
+def test___grpc_interpreter___write_binary_i16___writes_samples(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    write_array = numpy.array([[-32768, -1], [0, 32767]], dtype=numpy.int16)
+
+    samps_per_chan_written = stand_in_grpc_interpreter.write_binary_i16(
+        stand_in_task_session, 2, False, 2.0, FillMode.GROUP_BY_CHANNEL.value, write_array
+    )
+
+    assert samps_per_chan_written == 2
+    (write_request,) = stand_in_server.nidaqmx_servicer.requests
+    assert list(write_request.write_array) == [-32768, -1, 0, 32767]
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Generator
+
+import pytest
+
+import nidaqmx
+from nidaqmx import DaqError
+from nidaqmx.constants import EveryNSamplesEventType
+
+if TYPE_CHECKING:
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+try:
+    import grpc
+
+    from nidaqmx._grpc_interpreter import GrpcEventHandler, GrpcStubInterpreter
+    from nidaqmx.grpc_event_dispatcher import GrpcEventDispatcher
+    from tests._grpc_stand_in_server import STAND_IN_CHANNEL_OPTIONS
+except ImportError:
+    grpc = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+
+_N_SAMPLES = 100
+
+
+class _EventRecorder:
+    """Records the threads that event callbacks run on."""
+
+    def __init__(self, expected_count: int) -> None:
+        self.thread_names: list[str] = []
+        self._expected_count = expected_count
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def callback(self, task_handle, every_n_samples_event_type, n_samples, callback_data) -> int:
+        with self._lock:
+            self.thread_names.append(threading.current_thread().name)
+            if len(self.thread_names) == self._expected_count:
+                self._done.set()
+        return 0
+
+    def wait(self) -> None:
+        assert self._done.wait(timeout=10.0)
+
+
+@pytest.fixture
+def dispatcher(stand_in_server: StandInGrpcServer) -> Generator[GrpcEventDispatcher]:
+    with GrpcEventDispatcher(
+        f"localhost:{stand_in_server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+    ) as dispatcher:
+        yield dispatcher
+
+
+@pytest.fixture
+def dispatched_interpreter(
+    stand_in_server: StandInGrpcServer, dispatcher: GrpcEventDispatcher
+) -> Generator[GrpcStubInterpreter]:
+    with grpc.insecure_channel(
+        f"localhost:{stand_in_server.server_port}", options=STAND_IN_CHANNEL_OPTIONS
+    ) as channel:
+        yield GrpcStubInterpreter(
+            nidaqmx.GrpcSessionOptions(channel, "", event_dispatcher=dispatcher)
+        )
+
+
+def _register_every_n_samples_event(
+    interpreter: GrpcStubInterpreter, task_session: object, recorder: _EventRecorder
+):
+    return interpreter.register_every_n_samples_event(
+        task_session,
+        EveryNSamplesEventType.ACQUIRED_INTO_BUFFER.value,
+        _N_SAMPLES,
+        0,
+        recorder.callback,
+        None,
+    )
+
+
+def test___dispatcher___register_events___runs_callbacks_on_one_callback_thread(
+    dispatched_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    recorder = _EventRecorder(expected_count=3 * stand_in_server.nidaqmx_servicer.event_count)
+
+    handlers = [
+        _register_every_n_samples_event(dispatched_interpreter, stand_in_task_session, recorder)
+        for _ in range(3)
+    ]
+    recorder.wait()
+    for handler in handlers:
+        handler.close()
+
+    assert len(set(recorder.thread_names)) == 1
+    assert recorder.thread_names[0].startswith("nidaqmx event callback")
+    assert not any(
+        thread.name.startswith("nidaqmx every n samples event") for thread in threading.enumerate()
+    )
+
+
+def test___dispatcher_with_executor___register_event___runs_callbacks_on_executor(
+    stand_in_server: StandInGrpcServer, stand_in_task_session: object
+) -> None:
+    recorder = _EventRecorder(expected_count=stand_in_server.nidaqmx_servicer.event_count)
+    with ThreadPoolExecutor(thread_name_prefix="application") as executor, GrpcEventDispatcher(
+        f"localhost:{stand_in_server.server_port}", executor=executor
+    ) as dispatcher, grpc.insecure_channel(f"localhost:{stand_in_server.server_port}") as channel:
+        interpreter = GrpcStubInterpreter(
+            nidaqmx.GrpcSessionOptions(channel, "", event_dispatcher=dispatcher)
+        )
+
+        handler = _register_every_n_samples_event(interpreter, stand_in_task_session, recorder)
+        recorder.wait()
+        handler.close()
+
+    assert all(name.startswith("application") for name in recorder.thread_names)
+
+
+def test___dispatcher___register_event___counts_events_per_stream(
+    dispatched_interpreter: GrpcStubInterpreter,
+    dispatcher: GrpcEventDispatcher,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    event_count = stand_in_server.nidaqmx_servicer.event_count
+    recorder = _EventRecorder(expected_count=event_count)
+
+    handler = _register_every_n_samples_event(
+        dispatched_interpreter, stand_in_task_session, recorder
+    )
+    recorder.wait()
+    (statistics,) = dispatcher.stream_statistics
+    handler.close()
+
+    assert statistics.event_name == "every n samples event"
+    assert statistics.event_count == event_count
+    assert 0.0 <= statistics.max_dispatch_latency <= statistics.total_dispatch_latency
+    assert dispatcher.stream_statistics == []
+
+
+def test___dispatcher___register_event_fails___raises_daq_error(
+    dispatched_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.register_error = -200088
+
+    with pytest.raises(DaqError) as exc_info:
+        _register_every_n_samples_event(
+            dispatched_interpreter, stand_in_task_session, _EventRecorder(expected_count=1)
+        )
+
+    assert exc_info.value.error_code == -200088
+
+
+def test___dispatcher_closed___close_handler___does_not_raise(
+    dispatched_interpreter: GrpcStubInterpreter,
+    dispatcher: GrpcEventDispatcher,
+    stand_in_task_session: object,
+) -> None:
+    handler = _register_every_n_samples_event(
+        dispatched_interpreter, stand_in_task_session, _EventRecorder(expected_count=1)
+    )
+
+    dispatcher.close()
+    handler.close()
+
+    with pytest.raises(DaqError):
+        _register_every_n_samples_event(
+            dispatched_interpreter, stand_in_task_session, _EventRecorder(expected_count=1)
+        )
+
+
+def test___no_dispatcher___register_event___uses_event_thread(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    recorder = _EventRecorder(expected_count=stand_in_server.nidaqmx_servicer.event_count)
+
+    handler = _register_every_n_samples_event(
+        stand_in_grpc_interpreter, stand_in_task_session, recorder
+    )
+    recorder.wait()
+    handler.close()
+
+    assert isinstance(handler, GrpcEventHandler)
+    assert recorder.thread_names[0] == "nidaqmx every n samples event thread"
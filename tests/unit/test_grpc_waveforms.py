@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy
+import pytest
+from hightime import timedelta as ht_timedelta
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, SampleIntervalMode
+
+from nidaqmx import DaqReadError
+from nidaqmx.constants import FillMode, WaveformAttributeMode
+
+if TYPE_CHECKING:
+    from nidaqmx._grpc_interpreter import GrpcStubInterpreter
+    from tests._grpc_stand_in_server import StandInGrpcServer
+
+try:
+    import grpc
+
+    from nidaqmx._stubs import nidaqmx_pb2 as grpc_types
+except ImportError:
+    grpc = None  # type: ignore
+
+pytestmark = pytest.mark.skipif(grpc is None, reason="The grpc module is not available.")
+
+_NUM_SAMPLES = 4
+
+
+def _get_requests(stand_in_server: StandInGrpcServer, request_type: type) -> list:
+    return [
+        request
+        for request in stand_in_server.nidaqmx_servicer.requests
+        if isinstance(request, request_type)
+    ]
+
+
+def test___analog_waveform___read_analog_waveform___fills_raw_data_and_timing(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.read_array = [0.0, 1.0, 2.0, 3.0]
+    waveform = AnalogWaveform(_NUM_SAMPLES)
+
+    samples_read = stand_in_grpc_interpreter.read_analog_waveform(
+        stand_in_task_session, _NUM_SAMPLES, 10.0, waveform, WaveformAttributeMode.TIMING
+    )
+
+    assert samples_read == _NUM_SAMPLES
+    assert waveform.raw_data.tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert waveform.timing.sample_interval_mode == SampleIntervalMode.REGULAR
+    assert waveform.timing.sample_interval == ht_timedelta(seconds=1 / 1000)
+    assert not waveform.timing.has_timestamp
+    (read_request,) = _get_requests(stand_in_server, grpc_types.ReadAnalogF64Request)
+    assert read_request.fill_mode_raw == FillMode.GROUP_BY_CHANNEL.value
+
+
+def test___analog_waveforms___read_analog_waveforms___fills_each_channel(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    # The samples are grouped by scan number.
+    stand_in_server.nidaqmx_servicer.read_array = [0.0, 10.0, 1.0, 11.0, 2.0, 12.0, 3.0, 13.0]
+    waveforms = [AnalogWaveform(_NUM_SAMPLES) for _ in range(2)]
+
+    samples_read = stand_in_grpc_interpreter.read_analog_waveforms(
+        stand_in_task_session, _NUM_SAMPLES, 10.0, waveforms, WaveformAttributeMode.TIMING
+    )
+
+    assert samples_read == _NUM_SAMPLES
+    assert [waveform.raw_data.tolist() for waveform in waveforms] == [
+        [0.0, 1.0, 2.0, 3.0],
+        [10.0, 11.0, 12.0, 13.0],
+    ]
+    assert waveforms[0].timing == waveforms[1].timing
+
+
+def test___no_timing___read_analog_waveform___does_not_get_sample_clock_rate(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    waveform = AnalogWaveform(_NUM_SAMPLES)
+
+    stand_in_grpc_interpreter.read_analog_waveform(
+        stand_in_task_session, _NUM_SAMPLES, 10.0, waveform, WaveformAttributeMode.NONE
+    )
+
+    assert waveform.timing.sample_interval_mode == SampleIntervalMode.NONE
+    assert _get_requests(stand_in_server, grpc_types.GetTimingAttributeDoubleRequest) == []
+
+
+def test___no_sample_clock___read_analog_waveform___has_no_sample_interval(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.samp_clk_rate = None
+    waveform = AnalogWaveform(_NUM_SAMPLES)
+
+    stand_in_grpc_interpreter.read_analog_waveform(
+        stand_in_task_session, _NUM_SAMPLES, 10.0, waveform, WaveformAttributeMode.TIMING
+    )
+
+    assert waveform.timing.sample_interval_mode == SampleIntervalMode.NONE
+
+
+def test___extended_properties___read_analog_waveform___raises_not_implemented_error(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    waveform = AnalogWaveform(_NUM_SAMPLES)
+
+    with pytest.raises(NotImplementedError):
+        stand_in_grpc_interpreter.read_analog_waveform(
+            stand_in_task_session,
+            _NUM_SAMPLES,
+            10.0,
+            waveform,
+            WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES,
+        )
+
+    assert _get_requests(stand_in_server, grpc_types.ReadAnalogF64Request) == []
+
+
+def test___read_fails___read_analog_waveform___raises_read_error_after_filling_waveform(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    stand_in_server.nidaqmx_servicer.read_array = [0.0, 1.0, 2.0, 3.0]
+    stand_in_server.nidaqmx_servicer.read_status = -200279
+    waveform = AnalogWaveform(_NUM_SAMPLES)
+
+    with pytest.raises(DaqReadError) as exc_info:
+        stand_in_grpc_interpreter.read_analog_waveform(
+            stand_in_task_session, _NUM_SAMPLES, 10.0, waveform, WaveformAttributeMode.TIMING
+        )
+
+    assert exc_info.value.error_code == -200279
+    assert waveform.raw_data.tolist() == [0.0, 1.0, 2.0, 3.0]
+
+
+def test___digital_waveforms___read_digital_waveforms___fills_lines_of_each_channel(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.num_lines = 2
+    # Each scan has two lines for each of the two channels. The second channel has one line.
+    servicer.read_array = [1, 0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 0, 0, 0, 1, 0]
+    waveforms = [DigitalWaveform(_NUM_SAMPLES, 2), DigitalWaveform(_NUM_SAMPLES, 1)]
+
+    samples_read = stand_in_grpc_interpreter.read_digital_waveforms(
+        stand_in_task_session, 2, _NUM_SAMPLES, 2, 10.0, waveforms, WaveformAttributeMode.NONE
+    )
+
+    assert samples_read == _NUM_SAMPLES
+    assert waveforms[0].data.tolist() == [[1, 0], [0, 1], [1, 1], [0, 0]]
+    assert waveforms[1].data.tolist() == [[0], [1], [0], [1]]
+
+
+def test___digital_port___read_new_digital_waveforms___returns_waveform_per_channel(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    servicer = stand_in_server.nidaqmx_servicer
+    servicer.num_lines = 2
+    servicer.read_array = [1, 0, 0, 1, 0, 1, 1, 0]
+
+    waveforms = stand_in_grpc_interpreter.read_new_digital_waveforms(
+        stand_in_task_session, 2, 2, 2, 10.0, WaveformAttributeMode.TIMING
+    )
+
+    assert [waveform.data.tolist() for waveform in waveforms] == [
+        [[1, 0], [0, 1]],
+        [[0, 1], [1, 0]],
+    ]
+    assert all(waveform.data.flags.writeable for waveform in waveforms)
+    assert waveforms[0].timing.sample_interval == ht_timedelta(seconds=1 / 1000)
+
+
+def test___analog_waveforms___write_analog_waveforms___writes_samples_by_channel(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    waveforms = [
+        AnalogWaveform.from_array_1d(numpy.array([0.0, 1.0]), dtype=numpy.float64),
+        AnalogWaveform.from_array_1d(numpy.array([10.0, 11.0]), dtype=numpy.float64),
+    ]
+
+    samples_written = stand_in_grpc_interpreter.write_analog_waveforms(
+        stand_in_task_session, waveforms, False, 10.0
+    )
+
+    assert samples_written == 2
+    (write_request,) = _get_requests(stand_in_server, grpc_types.WriteAnalogF64Request)
+    assert write_request.data_layout_raw == FillMode.GROUP_BY_CHANNEL.value
+    assert list(write_request.write_array) == [0.0, 1.0, 10.0, 11.0]
+
+
+def test___digital_waveforms___write_digital_waveforms___pads_channels_with_fewer_lines(
+    stand_in_grpc_interpreter: GrpcStubInterpreter,
+    stand_in_server: StandInGrpcServer,
+    stand_in_task_session: object,
+) -> None:
+    waveforms = [
+        DigitalWaveform.from_lines(numpy.array([[1, 0], [0, 1]], dtype=numpy.uint8)),
+        DigitalWaveform.from_lines(numpy.array([[1], [1]], dtype=numpy.uint8)),
+    ]
+
+    samples_written = stand_in_grpc_interpreter.write_digital_waveforms(
+        stand_in_task_session, waveforms, False, 10.0
+    )
+
+    assert samples_written == 2
+    (write_request,) = _get_requests(stand_in_server, grpc_types.WriteDigitalLinesRequest)
+    assert list(write_request.write_array) == [1, 0, 0, 1, 1, 0, 1, 0]
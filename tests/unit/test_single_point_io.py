@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+import nidaqmx._library_interpreter
+from nidaqmx import DaqError, Task
+from nidaqmx._library_interpreter import LibraryInterpreter
+from nidaqmx.constants import ChannelType
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.task import SinglePointIO
+from tests.unit._task_utils import expect_create_task, expect_get_task_name
+
+
+def _expect_single_channel(interpreter: Mock, chan_type: ChannelType) -> None:
+    interpreter.get_task_attribute_uint32.return_value = 1  # number_of_channels
+    interpreter.get_chan_attribute_int32.return_value = chan_type.value
+
+
+@pytest.fixture
+def library_functions(mocker: MockerFixture) -> Mock:
+    """Replace the prebound NI-DAQmx C functions with mocks that succeed."""
+    functions = Mock()
+    functions.DAQmxReadAnalogScalarF64.return_value = 0
+    functions.DAQmxWriteAnalogScalarF64.return_value = 0
+    mocker.patch.object(nidaqmx._library_interpreter, "_functions", functions)
+    return functions
+
+
+@pytest.fixture
+def library_interpreter(interpreter: Mock, mocker: MockerFixture) -> Mock:
+    """Make the task fixture use a mock interpreter that is a LibraryInterpreter."""
+    library_interpreter = mocker.create_autospec(LibraryInterpreter)
+    expect_create_task(library_interpreter)
+    expect_get_task_name(library_interpreter, "MyTask")
+    mocker.patch("nidaqmx.utils._select_interpreter", return_value=library_interpreter)
+    return library_interpreter
+
+
+@pytest.mark.parametrize(
+    "chan_type, method_name, value",
+    [
+        (ChannelType.ANALOG_INPUT, "read_analog_scalar_f64", 1.5),
+        (ChannelType.COUNTER_INPUT, "read_counter_scalar_f64", 1000.0),
+        (ChannelType.DIGITAL_INPUT, "read_digital_scalar_u32", 0x5A),
+    ],
+)
+def test___input_channel___read___calls_interpreter_scalar_read(
+    task: Task, interpreter: Mock, chan_type: ChannelType, method_name: str, value: float
+) -> None:
+    _expect_single_channel(interpreter, chan_type)
+    getattr(interpreter, method_name).return_value = value
+    single_point_io = SinglePointIO(task, timeout=2.0)
+
+    assert single_point_io.read() == value
+
+    getattr(interpreter, method_name).assert_called_once_with(task._handle, 2.0)
+
+
+@pytest.mark.parametrize(
+    "chan_type, method_name, value",
+    [
+        (ChannelType.ANALOG_OUTPUT, "write_analog_scalar_f64", 1.5),
+        (ChannelType.DIGITAL_OUTPUT, "write_digital_scalar_u32", 0x5A),
+    ],
+)
+def test___output_channel___write___calls_interpreter_scalar_write(
+    task: Task, interpreter: Mock, chan_type: ChannelType, method_name: str, value: float
+) -> None:
+    _expect_single_channel(interpreter, chan_type)
+    single_point_io = SinglePointIO(task, timeout=2.0, auto_start=False)
+
+    single_point_io.write(value)
+
+    getattr(interpreter, method_name).assert_called_once_with(task._handle, False, 2.0, value)
+
+
+def test___output_channel___read___raises_no_input_channels_error(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_single_channel(interpreter, ChannelType.ANALOG_OUTPUT)
+    single_point_io = SinglePointIO(task)
+
+    with pytest.raises(DaqError) as exc_info:
+        single_point_io.read()
+
+    assert exc_info.value.error_code == DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK
+
+
+def test___input_channel___write___raises_no_output_channels_error(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_single_channel(interpreter, ChannelType.ANALOG_INPUT)
+    single_point_io = SinglePointIO(task)
+
+    with pytest.raises(DaqError) as exc_info:
+        single_point_io.write(1.0)
+
+    assert exc_info.value.error_code == DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK
+
+
+def test___multiple_channels___create___raises_error(task: Task, interpreter: Mock) -> None:
+    interpreter.get_task_attribute_uint32.return_value = 2  # number_of_channels
+
+    with pytest.raises(DaqError) as exc_info:
+        SinglePointIO(task)
+
+    assert "exactly one channel" in exc_info.value.args[0]
+
+
+def test___counter_output_channel___create___raises_error(task: Task, interpreter: Mock) -> None:
+    _expect_single_channel(interpreter, ChannelType.COUNTER_OUTPUT)
+
+    with pytest.raises(DaqError) as exc_info:
+        SinglePointIO(task)
+
+    assert "COUNTER_OUTPUT" in exc_info.value.args[0]
+
+
+def test___library_interpreter___read_twice___reuses_output_cell(
+    library_interpreter: Mock, library_functions: Mock, task: Task
+) -> None:
+    _expect_single_channel(library_interpreter, ChannelType.ANALOG_INPUT)
+    single_point_io = SinglePointIO(task, timeout=2.0)
+
+    single_point_io.read()
+    single_point_io.read()
+
+    calls = library_functions.DAQmxReadAnalogScalarF64.call_args_list
+    assert len(calls) == 2
+    assert calls[0].args[:2] == (task._handle, 2.0)
+    assert calls[0].args[2] is calls[1].args[2]
+    library_interpreter.read_analog_scalar_f64.assert_not_called()
+    library_interpreter.check_for_error.assert_not_called()
+
+
+def test___library_interpreter___read_from_two_threads___uses_output_cell_per_thread(
+    library_interpreter: Mock, library_functions: Mock, task: Task
+) -> None:
+    _expect_single_channel(library_interpreter, ChannelType.ANALOG_INPUT)
+    single_point_io = SinglePointIO(task)
+
+    single_point_io.read()
+    thread = threading.Thread(target=single_point_io.read)
+    thread.start()
+    thread.join()
+
+    calls = library_functions.DAQmxReadAnalogScalarF64.call_args_list
+    assert calls[0].args[2] is not calls[1].args[2]
+
+
+def test___library_interpreter___write_with_warning___checks_for_error(
+    library_interpreter: Mock, library_functions: Mock, task: Task
+) -> None:
+    _expect_single_channel(library_interpreter, ChannelType.ANALOG_OUTPUT)
+    library_functions.DAQmxWriteAnalogScalarF64.return_value = 200015
+    single_point_io = SinglePointIO(task)
+
+    single_point_io.write(1.5)
+
+    library_functions.DAQmxWriteAnalogScalarF64.assert_called_once_with(
+        task._handle, True, 10.0, 1.5, None
+    )
+    library_interpreter.check_for_error.assert_called_once_with(200015)
+    library_interpreter.write_analog_scalar_f64.assert_not_called()
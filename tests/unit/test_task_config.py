@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import pickle
+from unittest.mock import ANY, Mock, call
+
+import pytest
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import AcquisitionType, ChannelType, TriggerType
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.errors import RpcError
+
+_CHANNEL_NAMES = 0x1273
+_CHAN_TYPE = 0x187F
+_AI_MAX = 0x17DD
+_SAMP_QUANT_SAMP_MODE = 0x1300
+_SAMP_QUANT_SAMP_PER_CHAN = 0x1310
+_START_TRIG_TYPE = 0x1393
+_DIG_EDGE_START_TRIG_SRC = 0x1407
+
+
+def _expect_config_attributes(interpreter: Mock) -> None:
+    """Expect a task with one AI channel that supports a few configurable properties.
+
+    Setting a supported property changes the value that getting it returns.
+    """
+    values = {
+        ("get_task_attribute_string", _CHANNEL_NAMES): "Dev1/ai0",
+        ("get_chan_attribute_int32", _CHAN_TYPE): ChannelType.ANALOG_INPUT.value,
+        ("get_chan_attribute_double", _AI_MAX): 10.0,
+        ("get_timing_attribute_int32", _SAMP_QUANT_SAMP_MODE): AcquisitionType.FINITE.value,
+        ("get_timing_attribute_uint64", _SAMP_QUANT_SAMP_PER_CHAN): 1000,
+        ("get_trig_attribute_int32", _START_TRIG_TYPE): TriggerType.NONE.value,
+        ("get_trig_attribute_string", _DIG_EDGE_START_TRIG_SRC): "",
+    }
+
+    def _expect_getter(name: str) -> None:
+        def _get(*args):
+            try:
+                return values[(name, args[-1])]
+            except KeyError:
+                raise DaqError("Unsupported property.", DAQmxErrors.UNKNOWN) from None
+
+        getattr(interpreter, name).side_effect = _get
+
+    def _expect_setter(name: str) -> None:
+        getter_name = name.replace("set_", "get_", 1)
+
+        def _set(*args):
+            values[(getter_name, args[-2])] = args[-1]
+
+        getattr(interpreter, name).side_effect = _set
+
+    for name in {name for name, _ in values} | {
+        "get_chan_attribute_bool",
+        "get_chan_attribute_string",
+        "get_chan_attribute_uint32",
+        "get_timing_attribute_bool",
+        "get_timing_attribute_double",
+        "get_timing_attribute_string",
+        "get_timing_attribute_uint32",
+        "get_trig_attribute_bool",
+        "get_trig_attribute_double",
+        "get_trig_attribute_uint32",
+    }:
+        _expect_getter(name)
+    for name in {name for name, _ in values if name != "get_task_attribute_string"}:
+        _expect_setter(name.replace("get_", "set_", 1))
+
+
+def test___task___snapshot_config___captures_supported_properties(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+
+    config = task.snapshot_config()
+
+    assert config.to_dict() == {
+        "channels/Dev1/ai0": {"ai_max": 10.0},
+        "timing": {
+            "samp_quant_samp_mode": AcquisitionType.FINITE,
+            "samp_quant_samp_per_chan": 1000,
+        },
+        "triggers": {},
+        "triggers.start_trigger": {"trig_type": TriggerType.NONE, "dig_edge_src": ""},
+        "triggers.reference_trigger": {},
+        "triggers.pause_trigger": {},
+        "triggers.arm_start_trigger": {},
+        "triggers.handshake_trigger": {},
+    }
+    assert len(config) == 5
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def test___unreadable_property_over_grpc___snapshot_config___skips_property(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+    interpreter.get_trig_attribute_string.side_effect = RpcError(
+        "StatusCode.UNIMPLEMENTED", "Unimplemented."
+    )
+
+    config = task.snapshot_config()
+
+    assert config.to_dict()["triggers.start_trigger"] == {"trig_type": TriggerType.NONE}
+
+
+def test___unchanged_config___apply_config___sets_nothing(task: Task, interpreter: Mock) -> None:
+    _expect_config_attributes(interpreter)
+    config = task.snapshot_config()
+
+    assert task.apply_config(config) == 0
+
+    interpreter.set_timing_attribute_uint64.assert_not_called()
+    interpreter.set_chan_attribute_double.assert_not_called()
+
+
+def test___changed_value___apply_config___sets_only_changed_value(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+    config = task.snapshot_config()
+    config.set("timing", "samp_quant_samp_per_chan", 2000)
+    config.set("triggers.start_trigger", "dig_edge_src", "PFI0")
+
+    assert task.apply_config(config) == 2
+    assert task.apply_config(config) == 0
+
+    interpreter.set_timing_attribute_uint64.assert_called_once_with(
+        ANY, _SAMP_QUANT_SAMP_PER_CHAN, 2000
+    )
+    interpreter.set_trig_attribute_string.assert_called_once_with(
+        ANY, _DIG_EDGE_START_TRIG_SRC, "PFI0"
+    )
+    interpreter.begin_batch.assert_called()
+
+
+def test___changed_selector___apply_config___sets_selector_first(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+    config = task.snapshot_config()
+    config.set("triggers.start_trigger", "trig_type", TriggerType.DIGITAL_EDGE)
+    config.set("triggers.start_trigger", "dig_edge_src", "PFI0")
+
+    assert task.apply_config(config) == 2
+
+    assert [c for c in interpreter.method_calls if c[0].startswith("set_")] == [
+        call.set_trig_attribute_int32(ANY, _START_TRIG_TYPE, TriggerType.DIGITAL_EDGE.value),
+        call.set_trig_attribute_string(ANY, _DIG_EDGE_START_TRIG_SRC, "PFI0"),
+    ]
+
+
+def test___changed_selector___apply_config___rereads_section_and_sets_only_differences(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+    config = task.snapshot_config()
+    config.set("timing", "samp_quant_samp_mode", AcquisitionType.CONTINUOUS)
+    interpreter.get_timing_attribute_uint64.reset_mock()
+
+    assert task.apply_config(config) == 1
+
+    interpreter.set_timing_attribute_int32.assert_called_once_with(
+        ANY, _SAMP_QUANT_SAMP_MODE, AcquisitionType.CONTINUOUS.value
+    )
+    interpreter.get_timing_attribute_uint64.assert_called_once_with(ANY, _SAMP_QUANT_SAMP_PER_CHAN)
+    interpreter.set_timing_attribute_uint64.assert_not_called()
+
+
+def test___selector_change_resets_property___apply_config___sets_reset_property(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+    config = task.snapshot_config()
+    config.set("timing", "samp_quant_samp_mode", AcquisitionType.CONTINUOUS)
+
+    def _set_samp_mode(task_handle, attribute_id, value):
+        # Changing the sample mode resets the number of samples per channel.
+        interpreter.get_timing_attribute_uint64.side_effect = None
+        interpreter.get_timing_attribute_uint64.return_value = 2
+
+    interpreter.set_timing_attribute_int32.side_effect = _set_samp_mode
+
+    assert task.apply_config(config) == 2
+
+    interpreter.set_timing_attribute_uint64.assert_called_once_with(
+        ANY, _SAMP_QUANT_SAMP_PER_CHAN, 1000
+    )
+
+
+def test___failed_set___apply_config___takes_new_snapshot_next_time(
+    task: Task, interpreter: Mock
+) -> None:
+    _expect_config_attributes(interpreter)
+    config = task.snapshot_config()
+    config.set("channels/Dev1/ai0", "ai_max", 5.0)
+    interpreter.set_chan_attribute_double.side_effect = DaqError("Set failed.", -1)
+    with pytest.raises(DaqError):
+        task.apply_config(config)
+    interpreter.get_chan_attribute_double.reset_mock()
+    interpreter.set_chan_attribute_double.side_effect = None
+
+    assert task.apply_config(config) == 1
+
+    interpreter.get_chan_attribute_double.assert_called()
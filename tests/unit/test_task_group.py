@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Generator
+from unittest.mock import Mock
+
+import numpy
+import pytest
+
+from nidaqmx import DaqError, DaqReadError, DaqTaskGroupReadError, Task
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.task import TaskGroup
+from tests.unit._task_utils import (
+    expect_create_task,
+    expect_get_task_name,
+    expect_read_analog_channels,
+    expect_read_ci_pulse_freq_channel,
+)
+
+
+@pytest.fixture
+def tasks(interpreter: Mock) -> Generator[list[Task]]:
+    """Create two DAQmx tasks with different task handles."""
+    expect_create_task(interpreter, task_handle="FirstTaskHandle")
+    expect_get_task_name(interpreter, "FirstTask")
+    first = Task("FirstTask")
+    expect_create_task(interpreter, task_handle="SecondTaskHandle")
+    expect_get_task_name(interpreter, "SecondTask")
+    second = Task("SecondTask")
+    with first, second:
+        yield [first, second]
+
+
+def _expect_read_task_handle(interpreter: Mock) -> None:
+    """Expect analog reads that fill each array with the task handle's length."""
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        read_array[:] = len(task_handle)
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+
+def test___task_group___read_all___returns_data_for_each_task(
+    tasks: list[Task], interpreter: Mock
+) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0:1")
+    _expect_read_task_handle(interpreter)
+
+    with TaskGroup(tasks) as task_group:
+        results = task_group.read_all(5)
+
+    assert [result.samples_read for result in results] == [5, 5]
+    assert results[0].data.tolist() == numpy.full((2, 5), len("FirstTaskHandle")).tolist()
+    assert results[1].data.tolist() == numpy.full((2, 5), len("SecondTaskHandle")).tolist()
+
+
+def test___task_group___read_all_twice___reuses_arrays(
+    tasks: list[Task], interpreter: Mock
+) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+
+    with TaskGroup(tasks) as task_group:
+        first_results = task_group.read_all(5)
+        second_results = task_group.read_all(5)
+
+    for first_result, second_result in zip(first_results, second_results):
+        assert numpy.shares_memory(first_result.data, second_result.data)
+
+
+def test___task_group___read_all___reads_tasks_at_the_same_time(
+    tasks: list[Task], interpreter: Mock
+) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    barrier = threading.Barrier(len(tasks), timeout=10.0)
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        # Each read waits for the other read to start, so this fails if the reads are sequential.
+        barrier.wait()
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    with TaskGroup(tasks) as task_group:
+        results = task_group.read_all(5)
+
+    assert [result.samples_read for result in results] == [5, 5]
+
+
+def test___task_group___read_fails_for_one_task___raises_error_with_results_for_each_task(
+    tasks: list[Task], interpreter: Mock
+) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    read_error = DaqReadError("Samples are no longer available.", -200279, 3)
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        if task_handle == "SecondTaskHandle":
+            raise read_error
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    with TaskGroup(tasks) as task_group:
+        with pytest.raises(DaqTaskGroupReadError) as exc_info:
+            task_group.read_all(5)
+
+    assert exc_info.value.error_code == -200279
+    assert exc_info.value.samps_per_chan_read == [5, 3]
+    assert exc_info.value.errors == [None, read_error]
+    assert "SecondTask" in exc_info.value.args[0]
+    assert interpreter.read_analog_f64.call_count == 2
+
+
+def test___first_read_raises_other_error___read_all___waits_for_other_reads(
+    tasks: list[Task], interpreter: Mock
+) -> None:
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    second_read_done = threading.Event()
+
+    def _read_analog_f64(task_handle, num_samps_per_chan, timeout, fill_mode, read_array):
+        if task_handle == "FirstTaskHandle":
+            raise KeyboardInterrupt()
+        time.sleep(0.1)
+        second_read_done.set()
+        return read_array, num_samps_per_chan
+
+    interpreter.read_analog_f64.side_effect = _read_analog_f64
+
+    with TaskGroup(tasks) as task_group:
+        with pytest.raises(KeyboardInterrupt):
+            task_group.read_all(5)
+
+        assert second_read_done.is_set()
+
+
+def test___counter_pulse_task___read_all___raises_error_without_reading(
+    tasks: list[Task], interpreter: Mock
+) -> None:
+    expect_read_ci_pulse_freq_channel(interpreter, "Dev1/ctr0")
+
+    with TaskGroup(tasks) as task_group:
+        with pytest.raises(DaqError) as exc_info:
+            task_group.read_all(5)
+
+    assert exc_info.value.error_code == DAQmxErrors.UNKNOWN
+    interpreter.read_ctr_freq.assert_not_called()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from nidaqmx import DaqError
+from nidaqmx.constants import TaskMode
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.task import TaskPool
+from tests.unit._task_utils import expect_get_task_name
+
+
+@pytest.fixture
+def pool_interpreter(interpreter: Mock) -> Mock:
+    """Expect tasks with a new task handle each time one is created."""
+    task_handles = iter(f"TaskHandle{index}" for index in range(100))
+    interpreter.create_task.side_effect = lambda name: (next(task_handles), True)
+    expect_get_task_name(interpreter, "_unnamedTask<0>")
+    return interpreter
+
+
+def test___empty_pool___acquire___creates_configures_and_commits_task(
+    pool_interpreter: Mock,
+) -> None:
+    configure = Mock()
+
+    with TaskPool() as pool:
+        with pool.acquire("counter", configure) as task:
+            pass
+
+        configure.assert_called_once_with(task)
+        pool_interpreter.task_control.assert_called_once_with(
+            "TaskHandle0", TaskMode.TASK_COMMIT.value
+        )
+        assert pool.metrics.hits == 0
+        assert pool.metrics.misses == 1
+        assert pool.idle_task_count == 1
+
+
+def test___released_task___acquire___reuses_task_without_setup(pool_interpreter: Mock) -> None:
+    configure = Mock()
+
+    with TaskPool() as pool:
+        with pool.acquire("counter", configure) as first_task:
+            pass
+        with pool.acquire("counter", configure) as second_task:
+            pass
+
+        assert second_task is first_task
+        configure.assert_called_once()
+        pool_interpreter.create_task.assert_called_once()
+        pool_interpreter.task_control.assert_called_once()
+        assert pool_interpreter.stop_task.call_count == 2
+        metrics = pool.metrics
+        assert (metrics.hits, metrics.misses, metrics.hit_rate) == (1, 1, 0.5)
+        assert metrics.avoided_setup_time == pytest.approx(metrics.setup_time)
+
+
+def test___different_templates___acquire___creates_task_per_template(
+    pool_interpreter: Mock,
+) -> None:
+    with TaskPool() as pool:
+        with pool.acquire("counter", Mock()) as first_task:
+            pass
+        with pool.acquire(("analog", 1000.0), Mock()) as second_task:
+            pass
+
+        assert second_task is not first_task
+        assert pool.metrics.misses == 2
+        assert pool.idle_task_count == 2
+
+
+def test___concurrent_acquires___release___keeps_max_idle_tasks(pool_interpreter: Mock) -> None:
+    with TaskPool(max_idle_tasks=1) as pool:
+        with pool.acquire("counter", Mock()), pool.acquire("counter", Mock()):
+            pass
+
+        assert pool.idle_task_count == 1
+        pool_interpreter.clear_task.assert_called_once_with("TaskHandle0")
+
+    assert pool_interpreter.clear_task.call_count == 2
+
+
+def test___exception_in_body___acquire___closes_task(pool_interpreter: Mock) -> None:
+    with TaskPool() as pool:
+        with pytest.raises(ValueError):
+            with pool.acquire("counter", Mock()):
+                raise ValueError()
+
+        pool_interpreter.clear_task.assert_called_once_with("TaskHandle0")
+        assert pool.idle_task_count == 0
+
+
+def test___configure_fails___acquire___closes_task_and_raises(pool_interpreter: Mock) -> None:
+    configure = Mock(side_effect=DaqError("Invalid channel.", DAQmxErrors.UNKNOWN))
+
+    with TaskPool() as pool:
+        with pytest.raises(DaqError):
+            with pool.acquire("counter", configure):
+                pass
+
+        pool_interpreter.clear_task.assert_called_once_with("TaskHandle0")
+        assert pool.metrics.misses == 0
+
+
+def test___closed_pool___release___closes_task(pool_interpreter: Mock) -> None:
+    pool = TaskPool()
+
+    with pool.acquire("counter", Mock()):
+        pool.close()
+
+    pool_interpreter.clear_task.assert_called_once_with("TaskHandle0")
+    assert pool.idle_task_count == 0
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import numpy
+
+from nidaqmx import Task
+from nidaqmx.constants import ReadReturnType
+from nidaqmx.types import CTR_FREQ_DTYPE
+from tests.unit._task_utils import (
+    expect_read_analog_channels,
+    expect_read_ci_pulse_freq_channel,
+)
+
+
+def test___analog_task___read_twice___read_plan_created_once(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+
+    first = task.read(10)
+    second = task.read(10)
+
+    assert len(first) == len(second) == 2
+    interpreter.get_read_attribute_string.assert_called_once()
+    assert interpreter.read_analog_f64.call_count == 2
+
+
+def test___analog_task___read_one_sample___returns_scalar(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+
+    data = task.read()
+
+    assert data == 0.0
+
+
+def test___read_plan_cached___add_channel___read_plan_recreated(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    task.read()
+
+    task.ai_channels.add_ai_voltage_chan("Dev1/ai1")
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+    data = task.read()
+
+    assert data == [0.0, 0.0]
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def test___read_plan_cached___set_channels_to_read___read_plan_recreated(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+    task.read()
+
+    task.in_stream.channels_to_read = task.ai_channels["Dev1/ai1"]
+    expect_read_analog_channels(interpreter, "Dev1/ai1")
+    data = task.read()
+
+    assert data == 0.0
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def test___read_plan_cached___reset_channels_to_read___read_plan_recreated(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai1")
+    task.read()
+
+    del task.in_stream.channels_to_read
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+    data = task.read()
+
+    assert data == [0.0, 0.0]
+    assert interpreter.get_read_attribute_string.call_count == 2
+
+
+def test___numpy_return_type___read___returns_array(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+
+    data = task.read(10, return_type=ReadReturnType.NUMPY)
+
+    assert isinstance(data, numpy.ndarray)
+    assert data.shape == (2, 10)
+    assert data.dtype == numpy.float64
+
+
+def test___numpy_return_type___read_one_sample___returns_numpy_scalar(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+
+    data = task.read(return_type=ReadReturnType.NUMPY)
+
+    assert isinstance(data, numpy.float64)
+
+
+def test___numpy_return_type___short_read___returns_trimmed_view(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1", samples_read=4)
+
+    data = task.read(10, return_type=ReadReturnType.NUMPY)
+
+    assert data.shape == (2, 4)
+    assert data.base is not None
+
+
+def test___numpy_return_type___multi_channel_read_zero_samples___returns_empty_per_channel(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1", samples_read=0)
+
+    data = task.read(return_type=ReadReturnType.NUMPY)
+
+    assert data.shape == (2, 0)
+
+
+def test___numpy_return_type___multi_channel_short_read_zero_samples___returns_empty_per_channel(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1", samples_read=0)
+
+    data = task.read(10, return_type=ReadReturnType.NUMPY)
+
+    assert data.shape == (2, 0)
+
+
+def test___multi_channel_read_zero_samples___returns_empty_list_per_channel(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1", samples_read=0)
+
+    data = task.read()
+
+    assert data == [[], []]
+
+
+def test___multi_channel_short_read_zero_samples___returns_empty_list_per_channel(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1", samples_read=0)
+
+    data = task.read(10)
+
+    assert data == [[], []]
+
+
+def test___in_stream_read_return_type_numpy___read___returns_array(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    task.in_stream.read_return_type = ReadReturnType.NUMPY
+
+    data = task.read(10)
+
+    assert isinstance(data, numpy.ndarray)
+    assert data.shape == (10,)
+
+
+def test___numpy_return_type___read_ci_pulse_freq___returns_structured_array(
+    task: Task, interpreter: Mock
+):
+    expect_read_ci_pulse_freq_channel(interpreter, "Dev1/ctr0")
+
+    data = task.read(5, return_type=ReadReturnType.NUMPY)
+
+    assert data.dtype == CTR_FREQ_DTYPE
+    assert data.shape == (5,)
+    assert data["freq"].tolist() == [1000.0] * 5
+    assert data["duty_cycle"].tolist() == [0.5] * 5
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import numpy
+import numpy.typing
+import pytest
+
+from nidaqmx import Task
+from nidaqmx._lib import TrustedBuffer
+from nidaqmx.stream_readers import AnalogMultiChannelReader
+from nidaqmx.stream_writers import AnalogMultiChannelWriter
+
+
+@pytest.fixture
+def reader(task: Task, interpreter: Mock) -> AnalogMultiChannelReader:
+    interpreter.get_read_attribute_uint32.return_value = 2  # num_chans
+    interpreter.read_analog_f64.side_effect = (
+        lambda task_handle, num_samps_per_chan, timeout, fill_mode, read_array: (
+            read_array,
+            num_samps_per_chan,
+        )
+    )
+    return AnalogMultiChannelReader(task.in_stream)
+
+
+@pytest.fixture
+def writer(task: Task, interpreter: Mock) -> AnalogMultiChannelWriter:
+    interpreter.get_write_attribute_uint32.return_value = 2  # num_chans
+    interpreter.write_analog_f64.side_effect = (
+        lambda task_handle, num_samps_per_chan, auto_start, timeout, data_layout, write_array: (
+            num_samps_per_chan
+        )
+    )
+    return AnalogMultiChannelWriter(task.out_stream)
+
+
+def test___trusted_buffer___create___has_array_attributes() -> None:
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    trusted_buffer = TrustedBuffer(data, numpy.float64, ("C", "W"))
+
+    assert trusted_buffer.value == data.ctypes.data
+    assert trusted_buffer.size == 20
+    assert trusted_buffer.shape == (2, 10)
+    assert trusted_buffer.array is data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        numpy.zeros(10, dtype=numpy.float32),
+        numpy.zeros((10, 2), dtype=numpy.float64).T,
+    ],
+)
+def test___invalid_array___create_trusted_buffer___raises_type_error(
+    data: numpy.typing.NDArray,
+) -> None:
+    with pytest.raises(TypeError):
+        TrustedBuffer(data, numpy.float64, ("C", "W"))
+
+
+def test___trusted_buffers_disabled___read_twice___verifies_array_each_time(
+    reader: AnalogMultiChannelReader, interpreter: Mock
+) -> None:
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    reader.read_many_sample(data, 10)
+    reader.read_many_sample(data, 10)
+
+    interpreter.create_trusted_buffer.assert_not_called()
+    assert interpreter.get_read_attribute_uint32.call_count == 2
+    assert interpreter.read_analog_f64.call_args.args[4] is data
+
+
+def test___trusted_buffers_enabled___read_twice___verifies_array_once(
+    reader: AnalogMultiChannelReader, interpreter: Mock
+) -> None:
+    reader.use_trusted_buffers = True
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    reader.read_many_sample(data, 10)
+    reader.read_many_sample(data, 10)
+
+    interpreter.create_trusted_buffer.assert_called_once_with(data, numpy.float64, ("C", "W"))
+    assert interpreter.get_read_attribute_uint32.call_count == 1
+    trusted_buffer = interpreter.create_trusted_buffer.return_value
+    assert [call.args[4] for call in interpreter.read_analog_f64.call_args_list] == [
+        trusted_buffer,
+        trusted_buffer,
+    ]
+
+
+def test___trusted_buffers_enabled___read_different_arrays___verifies_each_array(
+    reader: AnalogMultiChannelReader, interpreter: Mock
+) -> None:
+    reader.use_trusted_buffers = True
+    first = numpy.zeros((2, 10), dtype=numpy.float64)
+    second = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    reader.read_many_sample(first, 10)
+    reader.read_many_sample(second, 10)
+    reader.read_many_sample(first, 10)
+
+    assert interpreter.create_trusted_buffer.call_count == 2
+
+
+def test___trusted_buffers_enabled___read_different_number_of_samples___verifies_array_again(
+    reader: AnalogMultiChannelReader, interpreter: Mock
+) -> None:
+    reader.use_trusted_buffers = True
+    reader.verify_array_shape = False
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    reader.read_many_sample(data, 10)
+    reader.read_many_sample(data, 5)
+
+    assert interpreter.create_trusted_buffer.call_count == 2
+
+
+def test___trusted_buffers_enabled___write_twice___verifies_array_once(
+    writer: AnalogMultiChannelWriter, interpreter: Mock
+) -> None:
+    writer.use_trusted_buffers = True
+    data = numpy.zeros((2, 10), dtype=numpy.float64)
+
+    writer.write_many_sample(data)
+    writer.write_many_sample(data)
+
+    interpreter.create_trusted_buffer.assert_called_once_with(data, numpy.float64, ("C",))
+    assert interpreter.get_write_attribute_uint32.call_count == 1
+    assert interpreter.write_analog_f64.call_args.args[5] is (
+        interpreter.create_trusted_buffer.return_value
+    )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from nitypes.waveform import Timing
+
+from nidaqmx import DaqError, Task
+from nidaqmx.constants import ReallocationPolicy, WaveformAttributeMode
+from nidaqmx.error_codes import DAQmxErrors
+from tests.unit._task_utils import expect_read_analog_channels
+
+
+def _expect_read_analog_waveforms(interpreter: Mock) -> None:
+    """Expect waveform reads whose samples are the read count times 10 plus the channel index."""
+    read_count = 0
+
+    def _read_analog_waveforms(
+        task_handle, number_of_samples_per_channel, timeout, waveforms, waveform_attribute_mode
+    ):
+        nonlocal read_count
+        read_count += 1
+        for i, waveform in enumerate(waveforms):
+            waveform.sample_count = number_of_samples_per_channel
+            waveform.raw_data[:] = read_count * 10 + i
+            if WaveformAttributeMode.EXTENDED_PROPERTIES in waveform_attribute_mode:
+                waveform.extended_properties["NI_ChannelName"] = f"ai{i}"
+        return number_of_samples_per_channel
+
+    interpreter.read_analog_waveforms.side_effect = _read_analog_waveforms
+
+
+def test___waveform_pool___read_twice___reuses_waveforms(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+    _expect_read_analog_waveforms(interpreter)
+    waveform_pool = task.create_waveform_pool()
+
+    first = waveform_pool.read_waveforms(4)
+    first_raw_data = [waveform.raw_data for waveform in first]
+    second = waveform_pool.read_waveforms(4)
+
+    assert [id(waveform) for waveform in second] == [id(waveform) for waveform in first]
+    # The second read overwrote the samples of the first read.
+    assert [raw_data.tolist() for raw_data in first_raw_data] == [[20.0] * 4, [21.0] * 4]
+    interpreter.get_read_attribute_string.assert_called_once()
+
+
+def test___waveform_pool___read_more_samples___grows_waveforms(task: Task, interpreter: Mock):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    _expect_read_analog_waveforms(interpreter)
+    waveform_pool = task.create_waveform_pool()
+    waveform_pool.read_waveforms(4)
+
+    (waveform,) = waveform_pool.read_waveforms(8)
+
+    assert waveform.sample_count == 8
+    assert waveform_pool.capacity == 8
+
+
+def test___do_not_reallocate_waveform_pool___read_more_samples___raises_buffer_too_small(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    _expect_read_analog_waveforms(interpreter)
+    waveform_pool = task.create_waveform_pool(ReallocationPolicy.DO_NOT_REALLOCATE)
+    waveform_pool.read_waveforms(4)
+
+    with pytest.raises(DaqError) as exc_info:
+        waveform_pool.read_waveforms(8)
+
+    assert exc_info.value.error_code == DAQmxErrors.READ_BUFFER_TOO_SMALL
+    assert interpreter.read_analog_waveforms.call_count == 1
+
+
+def test___waveform_pool_without_timing___read___clears_timing_of_earlier_read(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    _expect_read_analog_waveforms(interpreter)
+    waveform_pool = task.create_waveform_pool()
+    (waveform,) = waveform_pool.read_waveforms(4)
+    waveform.timing = Timing.create_with_no_interval()
+    task.in_stream.waveform_attribute_mode = WaveformAttributeMode.NONE
+
+    waveform_pool.read_waveforms(4)
+
+    assert waveform.timing is Timing.empty
+
+
+def test___started_task___read_waveform_twice___gets_extended_properties_once(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0, Dev1/ai1")
+    _expect_read_analog_waveforms(interpreter)
+    task.start()
+
+    task.read_waveform(4)
+    waveforms = task.read_waveform(4)
+
+    modes = [call.args[4] for call in interpreter.read_analog_waveforms.call_args_list]
+    assert modes == [
+        WaveformAttributeMode.TIMING | WaveformAttributeMode.EXTENDED_PROPERTIES,
+        WaveformAttributeMode.TIMING,
+    ]
+    assert [waveform.extended_properties["NI_ChannelName"] for waveform in waveforms] == [
+        "ai0",
+        "ai1",
+    ]
+
+
+def test___restarted_task___read_waveforms___gets_extended_properties_again(
+    task: Task, interpreter: Mock
+):
+    expect_read_analog_channels(interpreter, "Dev1/ai0")
+    _expect_read_analog_waveforms(interpreter)
+    waveform_pool = task.create_waveform_pool()
+    task.start()
+    waveform_pool.read_waveforms(4)
+    task.stop()
+    task.start()
+
+    waveform_pool.read_waveforms(4)
+
+    modes = [call.args[4] for call in interpreter.read_analog_waveforms.call_args_list]
+    assert all(WaveformAttributeMode.EXTENDED_PROPERTIES in mode for mode in modes)